@@ -31,9 +31,9 @@ Testing:
 """
 
 from functools import lru_cache
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
-from fastapi import Depends, Header
+from fastapi import Depends, Header, HTTPException
 from supabase import Client, create_client
 
 # Protocol types (interfaces)
@@ -70,6 +70,7 @@ from backend.core.exercise_matcher import ExerciseMatchingService
 
 # Progression service (AMA-299 Phase 3)
 from backend.core.progression_service import ProgressionService
+from backend.core.personal_records import get_personal_records_cache
 
 # Export service (AMA-610)
 from backend.services.export_service import ExportService
@@ -77,6 +78,12 @@ from backend.services.export_service import ExportService
 # Export queue (AMA-612)
 from backend.services.export_queue import ExportQueue
 
+# AI rate limits
+from backend.services.rate_limiter import RateLimiter
+
+# Fire-and-forget work
+from backend.services.background_tasks import BackgroundTaskRunner
+
 # Settings from Phase 0
 from backend.settings import Settings, get_settings as _get_settings
 
@@ -384,6 +391,7 @@ def get_progression_service(
     return ProgressionService(
         progression_repo=progression_repo,
         exercises_repo=exercises_repo,
+        records_cache=get_personal_records_cache(),
     )
 
 
@@ -404,7 +412,6 @@ def get_export_service() -> ExportService:
     return ExportService()
 
 
-@lru_cache
 def get_export_queue() -> ExportQueue:
     """
     Get ExportQueue for managing background export jobs.
@@ -417,9 +424,22 @@ def get_export_queue() -> ExportQueue:
     Part of AMA-612: Wire ExportQueue into workouts router push endpoints
 
     Returns:
-        ExportQueue: Queue for managing export jobs
+        ExportQueue: Process-wide queue whose workers run in the app lifespan
+    """
+    from backend.services.export_queue import get_export_queue as _get_export_queue
+    return _get_export_queue()
+
+
+def get_background_runner() -> BackgroundTaskRunner:
+    """
+    Get the runner for fire-and-forget work (audit logs, popularity counters).
+
+    Returns:
+        BackgroundTaskRunner: Process-wide bounded worker pool, drained by
+        the app lifespan on shutdown
     """
-    return ExportQueue()
+    from backend.services.background_tasks import get_background_runner as _get_background_runner
+    return _get_background_runner()
 
 
 # =============================================================================
@@ -472,6 +492,52 @@ def get_embedding_service() -> Optional[EmbeddingService]:
     )
 
 
+# =============================================================================
+# Rate Limit Providers
+# =============================================================================
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the per-user, per-feature limiter for AI-backed endpoints.
+
+    Returns:
+        RateLimiter: Process-wide limiter (state may be shared across nodes
+        through the configured backend)
+    """
+    from backend.services.rate_limiter import get_rate_limiter as _get_rate_limiter
+    return _get_rate_limiter()
+
+
+def rate_limit(feature: str) -> Callable[..., Any]:
+    """
+    Build a dependency that takes one request from the user's budget.
+
+    Usage:
+        @router.post("/ingest", dependencies=[Depends(rate_limit(FEATURE_CLASSIFICATION))])
+
+    Raises:
+        HTTPException: 429 with a Retry-After header when the budget is spent
+    """
+    def _check(
+        user_id: str = Depends(get_current_user),
+        limiter: RateLimiter = Depends(get_rate_limiter),
+    ) -> None:
+        decision = limiter.check(user_id, feature)
+        if not decision.allowed:
+            raise HTTPException(
+                status_code=429,
+                detail={
+                    "error": "rate_limit_exceeded",
+                    "message": "Rate limit exceeded. Please try again later.",
+                    "retry_after": int(decision.retry_after_header),
+                },
+                headers={"Retry-After": decision.retry_after_header},
+            )
+
+    return _check
+
+
 # =============================================================================
 # Use Case Providers
 # =============================================================================
@@ -511,6 +577,7 @@ def get_get_workout_use_case(
 
 def get_patch_workout_use_case(
     workout_repo: WorkoutRepository = Depends(get_workout_repo),
+    task_runner: BackgroundTaskRunner = Depends(get_background_runner),
 ) -> PatchWorkoutUseCase:
     """
     Get PatchWorkoutUseCase with injected dependencies.
@@ -519,11 +586,12 @@ def get_patch_workout_use_case(
 
     Args:
         workout_repo: Workout repository (injected)
+        task_runner: Background runner for the audit trail write (injected)
 
     Returns:
         PatchWorkoutUseCase: Use case for patching workouts
     """
-    return PatchWorkoutUseCase(workout_repo=workout_repo)
+    return PatchWorkoutUseCase(workout_repo=workout_repo, task_runner=task_runner)
 
 
 def get_export_workout_use_case(
@@ -749,23 +817,31 @@ def update_workout_android_companion_sync(workout_id: str, profile_id: str):
     return _update(workout_id, profile_id)
 
 
-def get_ios_companion_pending_workouts(profile_id: str):
+def get_ios_companion_pending_workouts(profile_id: str, limit: int = 50, exclude_completed: bool = True):
     """
     Get pending workouts for iOS companion.
 
     Part of AMA-365: Create FastAPI deps providers
     """
     from backend.database import get_ios_companion_pending_workouts as _get
-    return _get(profile_id)
+    return _get(profile_id, limit=limit, exclude_completed=exclude_completed)
 
 
-def get_android_companion_pending_workouts(profile_id: str):
+def get_android_companion_pending_workouts(profile_id: str, limit: int = 50, exclude_completed: bool = True):
     """
     Get pending workouts for Android companion.
 
     Part of AMA-365: Create FastAPI deps providers
     """
     from backend.database import get_android_companion_pending_workouts as _get
+    return _get(profile_id, limit=limit, exclude_completed=exclude_completed)
+
+
+def get_user_sync_version(profile_id: str):
+    """
+    Get the user's sync version counter for conditional polling.
+    """
+    from backend.database import get_user_sync_version as _get
     return _get(profile_id)
 
 
@@ -1027,8 +1103,13 @@ __all__ = [
     "get_export_service",
     # Export Queue (AMA-612)
     "get_export_queue",
+    # Background tasks
+    "get_background_runner",
     # Search (AMA-432)
     "get_embedding_service",
+    # Rate limits
+    "get_rate_limiter",
+    "rate_limit",
     # Use Cases
     "get_save_workout_use_case",
     "get_get_workout_use_case",
@@ -1056,6 +1137,7 @@ __all__ = [
     "update_workout_android_companion_sync",
     "get_ios_companion_pending_workouts",
     "get_android_companion_pending_workouts",
+    "get_user_sync_version",
     "queue_workout_sync",
     "get_pending_syncs",
     "confirm_sync",
@@ -16,9 +16,10 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
-from api.deps import get_current_user
+from api.deps import get_current_user, get_rate_limiter
 from api.schemas.chat import ChatStreamRequest, format_sse_event
-from backend.services.chat_service import create_chat_service, RateLimiter
+from backend.services.chat_service import create_chat_service
+from backend.services.rate_limiter import FEATURE_CHAT, RateLimiter
 from backend.services.tool_executor import create_tool_executor
 
 logger = logging.getLogger(__name__)
@@ -27,15 +28,13 @@ router = APIRouter(
     tags=["Chat"],
 )
 
-# Initialize rate limiter
-rate_limiter = RateLimiter()
-
 
 @router.post("/chat/stream")
 async def chat_stream_endpoint(
     request: ChatStreamRequest,
     http_request: Request,
     user_id: str = Depends(get_current_user),
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
 ) -> StreamingResponse:
     """
     Stream chat responses from Claude AI with SSE.
@@ -62,31 +61,37 @@ async def chat_stream_endpoint(
         - message_end: {message_id}
         - error: {error_type, message, retry_after?}
 
+    When the user's chat budget is spent the response is a 429 carrying a
+    single rate_limit_exceeded error event and a Retry-After header.
+
     Args:
         request: Chat request with session_id, message, and context
         http_request: FastAPI request object
         user_id: Authenticated user ID (from Clerk JWT)
+        rate_limiter: Per-user AI rate limiter (injected)
 
     Returns:
         StreamingResponse with SSE format
     """
-    # Check rate limit before processing
-    is_allowed, retry_after = rate_limiter.check_rate_limit(user_id)
-    if not is_allowed:
+    # Check rate limit before processing (takes one message from the budget)
+    decision = rate_limiter.check(user_id, FEATURE_CHAT)
+    if not decision.allowed:
         # Return error event for rate limit exceeded
         async def rate_limit_error_stream():
             yield format_sse_event("error", {
                 "error_type": "rate_limit_exceeded",
                 "message": "Rate limit exceeded. Please try again later.",
-                "retry_after": retry_after or 60,
+                "retry_after": int(decision.retry_after_header),
             })
         
         return StreamingResponse(
             rate_limit_error_stream(),
+            status_code=429,
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "Retry-After": decision.retry_after_header,
             }
         )
 
@@ -130,9 +135,6 @@ async def chat_stream_endpoint(
             ):
                 yield format_sse_event(event_type, event_data)
             
-            # Increment rate limit on success
-            rate_limiter.increment_rate_limit(user_id)
-            
             logger.info(f"Chat stream completed for user {user_id}")
             
         except Exception as e:
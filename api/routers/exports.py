@@ -15,16 +15,25 @@ This router contains endpoints for:
 - /map/to-fit - Convert blocks JSON to Garmin FIT file
 - /map/fit-metadata - Get FIT export metadata
 - /map/preview-steps - Get preview steps for FIT export
+- /map/to-fit/jobs, /map/to-fit-zip/jobs - Queue FIT / FIT ZIP exports (AMA-611)
+- /export/jobs/{job_id} - Export job status and download
 """
 
+import base64
 import logging
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, Field
 
-from api.deps import get_current_user, get_export_workout_use_case, get_export_service
+from api.deps import (
+    get_current_user,
+    get_export_queue,
+    get_export_service,
+    get_export_workout_use_case,
+)
 from application.use_cases import ExportWorkoutUseCase
+from backend.services.export_queue import ExportJob, ExportQueue, ExportStatus
 from backend.services.export_service import ExportService
 
 logger = logging.getLogger(__name__)
@@ -44,6 +53,12 @@ class BlocksPayload(BaseModel):
     blocks_json: Dict[str, Any]
 
 
+class FitZipPayload(BaseModel):
+    """Payload for a ZIP archive of FIT files, one per workout."""
+    workouts: List[Dict[str, Any]] = Field(..., min_length=1)
+    filename: Optional[str] = None
+
+
 # =============================================================================
 # Database Export Endpoints (via Use Case)
 # =============================================================================
@@ -199,3 +214,109 @@ def map_preview_steps(
     The UI should call this endpoint instead of doing local mapping.
     """
     return export_service.get_preview_steps(p.blocks_json, use_lap_button=use_lap_button)
+
+
+# =============================================================================
+# Background Export Jobs (AMA-611)
+# =============================================================================
+
+
+def _job_accepted(job_id: str, export_queue: ExportQueue) -> Dict[str, Any]:
+    status = export_queue.get_status(job_id)
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status": status["status"] if status else ExportStatus.PENDING.value,
+    }
+
+
+def _get_owned_job(job_id: str, user_id: str, export_queue: ExportQueue) -> ExportJob:
+    job = export_queue.get_job(job_id)
+    if job is None or (job.user_id is not None and job.user_id != user_id):
+        raise HTTPException(status_code=404, detail="Export job not found")
+    return job
+
+
+@router.post("/map/to-fit/jobs", status_code=202)
+def queue_fit_export(
+    p: BlocksPayload,
+    sport_type: Optional[Literal["strength", "cardio", "running"]] = Query(None),
+    use_lap_button: bool = Query(False),
+    user_id: str = Depends(get_current_user),
+    export_queue: ExportQueue = Depends(get_export_queue),
+):
+    """Queue a FIT export; poll /export/jobs/{job_id} and download when completed.
+
+    Identical requests return the job that is already queued or finished.
+    """
+    job_id = export_queue.enqueue(
+        kind="fit",
+        user_id=user_id,
+        payload={
+            "blocks_json": p.blocks_json,
+            "sport_type": sport_type,
+            "use_lap_button": use_lap_button,
+        },
+    )
+    return _job_accepted(job_id, export_queue)
+
+
+@router.post("/map/to-fit-zip/jobs", status_code=202)
+def queue_fit_zip_export(
+    p: FitZipPayload,
+    sport_type: Optional[Literal["strength", "cardio", "running"]] = Query(None),
+    use_lap_button: bool = Query(False),
+    user_id: str = Depends(get_current_user),
+    export_queue: ExportQueue = Depends(get_export_queue),
+):
+    """Queue a ZIP archive with one FIT file per workout."""
+    job_id = export_queue.enqueue(
+        kind="fit_zip",
+        user_id=user_id,
+        payload={
+            "workouts": p.workouts,
+            "filename": p.filename,
+            "sport_type": sport_type,
+            "use_lap_button": use_lap_button,
+        },
+    )
+    return _job_accepted(job_id, export_queue)
+
+
+@router.get("/export/jobs/{job_id}")
+def get_export_job(
+    job_id: str,
+    user_id: str = Depends(get_current_user),
+    export_queue: ExportQueue = Depends(get_export_queue),
+):
+    """Status of an export job. File contents are served by the download endpoint."""
+    job = _get_owned_job(job_id, user_id, export_queue)
+    status = export_queue.get_status(job.id) or {}
+    result = status.get("result")
+    if isinstance(result, dict) and "content_base64" in result:
+        status["result"] = {k: v for k, v in result.items() if k != "content_base64"}
+        status["download_url"] = f"/export/jobs/{job.id}/download"
+    return status
+
+
+@router.get("/export/jobs/{job_id}/download")
+def download_export_job(
+    job_id: str,
+    user_id: str = Depends(get_current_user),
+    export_queue: ExportQueue = Depends(get_export_queue),
+):
+    """Download the file produced by a completed export job."""
+    job = _get_owned_job(job_id, user_id, export_queue)
+    if job.status != ExportStatus.COMPLETED:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": f"Export job is {job.status.value}", "error": job.error},
+        )
+    result = job.result if isinstance(job.result, dict) else {}
+    if "content_base64" not in result:
+        raise HTTPException(status_code=404, detail="Export job has no file")
+    return Response(
+        content=base64.b64decode(result["content_base64"]),
+        media_type=result.get("media_type", "application/octet-stream"),
+        headers={"Content-Disposition": f'attachment; filename="{result.get("filename", "export")}"'},
+    )
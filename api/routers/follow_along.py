@@ -28,7 +28,7 @@ from typing import Any, Dict, List, Literal, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
-from api.deps import get_current_user
+from api.deps import get_current_user, rate_limit
 from api.deps import (
     save_follow_along_workout,
     get_follow_along_workouts,
@@ -43,6 +43,7 @@ from backend.services.content_classifier import (
     ContentCategory,
     ClassificationConfidence,
 )
+from backend.services.rate_limiter import FEATURE_CLASSIFICATION
 
 logger = logging.getLogger(__name__)
 
@@ -295,6 +296,7 @@ def create_follow_along(
     response_model=FollowAlongWorkoutResponse,
     summary="Ingest follow-along from video URL",
     description="Ingest a follow-along workout from a video URL (Instagram, YouTube, TikTok, Vimeo)",
+    dependencies=[Depends(rate_limit(FEATURE_CLASSIFICATION))],
 )
 async def ingest_follow_along(
     request: IngestFollowAlongRequest,
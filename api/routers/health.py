@@ -8,14 +8,21 @@ This router provides health check endpoints for monitoring and load balancers,
 as well as debug and testing endpoints.
 """
 
+import hmac
 import json
 import logging
 from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
 
 from backend.auth import get_current_user
+from backend.core.export_trace import get_export_tracer
+from backend.core.spans import get_span_recorder
+from backend.services.background_tasks import get_background_runner
+from backend.services.http_clients import get_http_client_registry
 from backend.settings import Settings, get_settings
 from api.deps import reset_user_data
 
@@ -98,6 +105,91 @@ def test_garmin_debug(settings: Settings = Depends(get_settings)):
         }
 
 
+class ExportTraceConfigRequest(BaseModel):
+    """Runtime export trace settings; omitted fields are left unchanged."""
+    level: Optional[str] = Field(None, description="off, warning, info or debug")
+    sample_rate: Optional[float] = Field(None, ge=0.0, le=1.0)
+
+
+def require_trace_admin(
+    x_admin_secret: Optional[str] = Header(None, alias="X-Admin-Secret"),
+    settings: Settings = Depends(get_settings),
+) -> None:
+    """Allow export trace access in development, or with the admin secret elsewhere."""
+    if settings.is_development:
+        return
+    secret = settings.export_trace_admin_secret
+    if not secret or not x_admin_secret or not hmac.compare_digest(x_admin_secret, secret):
+        raise HTTPException(
+            status_code=403,
+            detail="Export traces require a valid X-Admin-Secret header"
+        )
+
+
+@router.get("/debug/export-traces", dependencies=[Depends(require_trace_admin)])
+def list_export_traces(
+    limit: int = Query(50, ge=1, le=1000),
+    kind: Optional[str] = Query(None, description="Filter by export kind, e.g. hyrox_yaml"),
+):
+    """
+    Recent export traces (mapping decisions and per-stage timings), newest first.
+
+    Tracing is off unless EXPORT_TRACE_LEVEL or GARMIN_EXPORT_DEBUG is set,
+    or it is enabled at runtime via PUT /debug/export-traces/config.
+    """
+    tracer = get_export_tracer()
+    return {"config": tracer.config(), "traces": tracer.recent(limit=limit, kind=kind)}
+
+
+@router.put("/debug/export-traces/config", dependencies=[Depends(require_trace_admin)])
+def configure_export_traces(request: ExportTraceConfigRequest):
+    """Change the export trace level and sample rate for this process."""
+    tracer = get_export_tracer()
+    try:
+        tracer.configure(level=request.level, sample_rate=request.sample_rate)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return tracer.config()
+
+
+@router.delete("/debug/export-traces", dependencies=[Depends(require_trace_admin)])
+def clear_export_traces():
+    """Drop all buffered export traces."""
+    tracer = get_export_tracer()
+    tracer.clear()
+    return tracer.config()
+
+
+@router.get("/debug/http-clients", dependencies=[Depends(require_trace_admin)])
+def http_client_metrics():
+    """
+    Per-upstream pool metrics: requests, failures, new vs reused connections
+    and circuit breaker state.
+    """
+    return {"upstreams": get_http_client_registry().metrics()}
+
+
+@router.get("/debug/background-tasks", dependencies=[Depends(require_trace_admin)])
+def background_task_metrics():
+    """
+    Background runner metrics: queue depth, scheduling lag, retries,
+    failures (per task name) and tasks dropped because the queue was full.
+    """
+    return get_background_runner().metrics()
+
+
+@router.get("/metrics", dependencies=[Depends(require_trace_admin)], response_class=PlainTextResponse)
+def span_metrics():
+    """
+    Per-stage latency (normalize, match, db, llm, export) in the Prometheus
+    text format: a histogram, HDR quantiles and error counts per span.
+    """
+    return PlainTextResponse(
+        get_span_recorder().render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 # =============================================================================
 # Testing Endpoints (AMA-597)
 # =============================================================================
@@ -23,8 +23,8 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
-from api.deps import get_exercise_match_repo, get_global_mapping_repo, get_map_workout_use_case, get_current_user, get_export_service
-from application.ports import ExerciseMatchRepository, GlobalMappingRepository
+from api.deps import get_background_runner, get_exercise_match_repo, get_global_mapping_repo, get_map_workout_use_case, get_current_user, get_export_service
+from application.ports import ExerciseMatchRepository, GlobalMappingRepository, TaskPriority, TaskRunner
 from application.use_cases import MapWorkoutUseCase
 from backend.parsers.models import ParsedWorkout
 from backend.services.export_service import ExportService
@@ -373,13 +373,24 @@ async def match_exercises_batch(
 
 
 @router.post("/mappings/add")
-def save_mapping(p: UserMappingRequest):
+def save_mapping(
+    p: UserMappingRequest,
+    task_runner: TaskRunner = Depends(get_background_runner),
+):
     """Save a user-defined mapping: exercise_name -> garmin_name.
 
-    Also records global popularity.
+    Also records global popularity (in the background; inline if the
+    background queue is full).
     """
     result = add_user_mapping(p.exercise_name, p.garmin_name)
-    record_mapping_choice(p.exercise_name, p.garmin_name)
+    if not task_runner.submit(
+        "record_mapping_choice",
+        record_mapping_choice,
+        p.exercise_name,
+        p.garmin_name,
+        priority=TaskPriority.LOW,
+    ):
+        record_mapping_choice(p.exercise_name, p.garmin_name)
     return {
         "message": "Mapping saved successfully (also recorded for global popularity)",
         "mapping": result
@@ -6,6 +6,7 @@ Phase 3 - Progression Features
 
 This router provides endpoints for:
 - Exercise history with set details and 1RM calculations
+- Estimated 1RM trend per exercise
 - Personal records (1RM, max weight, max reps)
 - "Use Last Weight" for companion apps
 - Volume analytics by muscle group
@@ -25,6 +26,7 @@ from backend.core.progression_service import (
     PersonalRecordResponse,
     LastWeightResponse,
     VolumeAnalyticsResponse,
+    OneRepMaxTrendResponse,
 )
 
 router = APIRouter(
@@ -103,6 +105,32 @@ class LastWeightApiResponse(BaseModel):
     completion_id: str
 
 
+class LastWeightsApiResponse(BaseModel):
+    """Response model for batch last weight endpoint."""
+    last_weights: List[LastWeightApiResponse]
+    missing: List[str] = Field(
+        default_factory=list,
+        description="Requested exercises with no weight history",
+    )
+
+
+class OneRepMaxTrendPoint(BaseModel):
+    """Best estimated 1RM in one period."""
+    period: str
+    estimated_1rm: float
+
+
+class OneRepMaxTrendApiResponse(BaseModel):
+    """Response model for the 1RM trend endpoint."""
+    exercise_id: str
+    exercise_name: str
+    supports_1rm: bool = False
+    one_rm_formula: str = "brzycki"
+    data: List[OneRepMaxTrendPoint]
+    period: dict
+    granularity: str
+
+
 class VolumeDataPoint(BaseModel):
     """A single volume data point."""
     period: str
@@ -235,6 +263,49 @@ async def get_exercise_history(
     )
 
 
+@router.get("/exercises/{exercise_id}/1rm-trend", response_model=OneRepMaxTrendApiResponse)
+async def get_1rm_trend(
+    exercise_id: str = Path(..., description="Canonical exercise ID"),
+    start_date: Optional[date] = Query(None, description="Start of date range (default: 90 days ago)"),
+    end_date: Optional[date] = Query(None, description="End of date range (default: today)"),
+    granularity: str = Query(
+        "weekly",
+        description="Time granularity",
+        enum=["daily", "weekly", "monthly"],
+    ),
+    user_id: str = Depends(get_current_user),
+    service: ProgressionService = Depends(get_progression_service),
+) -> OneRepMaxTrendApiResponse:
+    """
+    Get the estimated 1RM trend of a specific exercise.
+
+    Returns the best estimated 1RM for each period with completed sets,
+    oldest first. Empty for exercises that do not support 1RM.
+    """
+    _validate_exercise_id(exercise_id)
+
+    result = service.get_1rm_trend(
+        user_id,
+        exercise_id,
+        start_date=start_date,
+        end_date=end_date,
+        granularity=granularity,
+    )
+
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Exercise '{exercise_id}' not found")
+
+    return OneRepMaxTrendApiResponse(
+        exercise_id=result.exercise_id,
+        exercise_name=result.exercise_name,
+        supports_1rm=result.supports_1rm,
+        one_rm_formula=result.one_rm_formula,
+        data=[OneRepMaxTrendPoint(**d) for d in result.data],
+        period=result.period,
+        granularity=result.granularity,
+    )
+
+
 @router.get("/exercises/{exercise_id}/last-weight", response_model=LastWeightApiResponse)
 async def get_last_weight(
     exercise_id: str = Path(..., description="Canonical exercise ID"),
@@ -268,6 +339,42 @@ async def get_last_weight(
     )
 
 
+# Upper bound on exercises per batch last-weight request
+MAX_LAST_WEIGHT_EXERCISES = 100
+
+
+@router.get("/last-weights", response_model=LastWeightsApiResponse)
+async def get_last_weights(
+    exercise_ids: List[str] = Query(
+        ...,
+        description="Canonical exercise IDs (repeat the parameter for each exercise)",
+    ),
+    user_id: str = Depends(get_current_user),
+    service: ProgressionService = Depends(get_progression_service),
+) -> LastWeightsApiResponse:
+    """
+    Get the last weight used for every exercise in a workout.
+
+    Batch form of /exercises/{exercise_id}/last-weight so companion apps can
+    prefill a whole workout with one request when it starts.
+    """
+    if len(exercise_ids) > MAX_LAST_WEIGHT_EXERCISES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_LAST_WEIGHT_EXERCISES} exercise_ids per request",
+        )
+    for exercise_id in exercise_ids:
+        _validate_exercise_id(exercise_id)
+
+    results = service.get_last_weights(user_id, exercise_ids)
+    found = {r.exercise_id for r in results}
+
+    return LastWeightsApiResponse(
+        last_weights=[LastWeightApiResponse(**asdict(r)) for r in results],
+        missing=[e for e in dict.fromkeys(exercise_ids) if e not in found],
+    )
+
+
 @router.get("/records", response_model=PersonalRecordsApiResponse)
 async def get_personal_records(
     record_type: Optional[str] = Query(
@@ -15,6 +15,7 @@ This router contains endpoints for:
 - /sync/confirm - Confirm device received workout
 - /sync/failed - Mark sync as failed
 - /workouts/{workout_id}/sync-status - Get sync status for workout
+- /sync/events - Server-sent stream of sync-queue events
 
 Note: Endpoints support iOS, Android, and Garmin devices with proper authentication.
 Implements AMA-307 sync queue pattern for proper state tracking.
@@ -29,8 +30,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any, List
 
-import httpx
-from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi import APIRouter, Query, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from starlette.concurrency import run_in_threadpool
 
@@ -42,14 +43,22 @@ from api.deps import (
     update_workout_android_companion_sync,
     get_ios_companion_pending_workouts,
     get_android_companion_pending_workouts,
+    get_user_sync_version,
     queue_workout_sync,
     get_pending_syncs,
     confirm_sync,
     report_sync_failed,
     get_workout_sync_status,
 )
+from backend.services.companion_feed import (
+    build_companion_feed,
+    etag_matches,
+    feed_etag,
+    get_companion_payload_cache,
+)
 from backend.services.export_queue import ExportQueue
-from backend.adapters.blocks_to_workoutkit import to_workoutkit
+from backend.services.http_clients import get_upstream_client
+from backend.services.sync_events import get_sync_event_hub, stream_sync_events
 from backend.adapters.blocks_to_hyrox_yaml import map_exercise_to_garmin
 from backend.core.exercise_categories import add_category_to_exercise_name
 from backend.settings import get_settings
@@ -323,7 +332,12 @@ async def push_workout_to_ios_companion_endpoint(
         await run_in_threadpool(update_workout_ios_companion_sync, workout_id, user_id)
 
         # Enqueue export job using ExportQueue (AMA-612)
-        task_id = export_queue.enqueue(job_id=workout_id)
+        task_id = await run_in_threadpool(
+            export_queue.enqueue,
+            job_id=workout_id,
+            user_id=user_id,
+            payload={"workout_id": workout_id, "device": "ios"},
+        )
 
         logger.info(f"Pushed iOS Companion workout {workout_id} for user {user_id}")
 
@@ -344,9 +358,12 @@ async def push_workout_to_ios_companion_endpoint(
 
 @router.get("/ios-companion/pending")
 async def get_ios_companion_pending_endpoint(
+    response: Response,
     user_id: str = Depends(get_current_user),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of workouts"),
-    exclude_completed: bool = Query(True, description="Exclude workouts that have been completed")
+    exclude_completed: bool = Query(True, description="Exclude workouts that have been completed"),
+    since: Optional[str] = Query(None, description="Cursor from a previous response; only changes after it are returned"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get workouts pending sync to iOS Companion App.
@@ -355,63 +372,35 @@ async def get_ios_companion_pending_endpoint(
     Returns workouts where ios_companion_synced_at is set, ordered by most recently pushed.
     By default excludes completed workouts.
 
+    Answers 304 when If-None-Match carries the current ETag; with a ``since``
+    cursor only changed workouts are returned, plus the IDs still pending.
+
     Args:
         user_id: Authenticated user ID from JWT
         limit: Maximum number of workouts to return (1-100)
         exclude_completed: Whether to exclude completed workouts
+        since: Delta cursor from a previous response
+        if_none_match: ETag from a previous response
 
     Returns:
         List of pending iOS Companion workouts with interval data
     """
     try:
-        workouts = await run_in_threadpool(get_ios_companion_pending_workouts, user_id, limit=limit, exclude_completed=exclude_completed)
+        # Read the version before the feed so a concurrent change is never masked
+        version = await run_in_threadpool(get_user_sync_version, user_id)
+        etag = feed_etag(user_id, version, "ios", limit, exclude_completed, since or "")
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-        # Transform each workout to iOS companion format
-        transformed = []
-        for workout_record in workouts:
-            workout_data = workout_record.get("workout_data", {})
-            title = workout_record.get("title") or workout_data.get("title", "Workout")
+        workouts = await run_in_threadpool(get_ios_companion_pending_workouts, user_id, limit=limit, exclude_completed=exclude_completed)
 
-            # Use to_workoutkit to properly transform intervals
-            # This handles warmup, sets as RepeatInterval, and default rest
-            try:
-                workoutkit_dto = to_workoutkit(workout_data)
-                intervals = [interval.model_dump() for interval in workoutkit_dto.intervals]
-                sport = workoutkit_dto.sportType
-            except (ValueError, KeyError, AttributeError, TypeError) as e:
-                logger.warning(f"Failed to transform workout {workout_record.get('id')}: {e}")
-                # Fallback to simple transformation
-                intervals = []
-                sport = "strengthTraining"
-                try:
-                    for block in workout_data.get("blocks", []):
-                        for exercise in block.get("exercises", []):
-                            intervals.append(convert_exercise_to_interval(exercise))
-                except (KeyError, AttributeError, TypeError) as fallback_err:
-                    logger.warning(f"Fallback transformation also failed for {workout_record.get('id')}: {fallback_err}")
-
-            # Calculate total duration from intervals
-            total_duration = calculate_intervals_duration(intervals)
-
-            transformed.append({
-                "id": workout_record.get("id"),
-                "name": title,
-                "sport": sport,
-                "duration": total_duration,
-                "source": "amakaflow",
-                "sourceUrl": None,
-                "intervals": intervals,
-                "pushedAt": workout_record.get("ios_companion_synced_at"),
-                "createdAt": workout_record.get("created_at"),
-            })
+        feed = build_companion_feed(workouts, "ios_companion_synced_at", since=since)
 
-        logger.info(f"Retrieved {len(transformed)} pending iOS Companion workouts for user {user_id}")
+        logger.info(f"Retrieved {feed['count']} pending iOS Companion workouts for user {user_id}")
 
-        return {
-            "success": True,
-            "workouts": transformed,
-            "count": len(transformed)
-        }
+        if etag:
+            response.headers["ETag"] = etag
+        return feed
     except HTTPException:
         raise
     except (ValueError, KeyError, AttributeError, TypeError) as e:
@@ -472,7 +461,12 @@ async def push_workout_to_android_companion_endpoint(
         await run_in_threadpool(update_workout_android_companion_sync, workout_id, user_id)
 
         # Enqueue export job using ExportQueue (AMA-612)
-        task_id = export_queue.enqueue(job_id=workout_id)
+        task_id = await run_in_threadpool(
+            export_queue.enqueue,
+            job_id=workout_id,
+            user_id=user_id,
+            payload={"workout_id": workout_id, "device": "android"},
+        )
 
         logger.info(f"Pushed Android Companion workout {workout_id} for user {user_id}")
 
@@ -493,9 +487,12 @@ async def push_workout_to_android_companion_endpoint(
 
 @router.get("/android-companion/pending")
 async def get_android_companion_pending_endpoint(
+    response: Response,
     user_id: str = Depends(get_current_user),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of workouts"),
-    exclude_completed: bool = Query(True, description="Exclude workouts that have been completed")
+    exclude_completed: bool = Query(True, description="Exclude workouts that have been completed"),
+    since: Optional[str] = Query(None, description="Cursor from a previous response; only changes after it are returned"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get workouts pending sync to Android Companion App.
@@ -505,62 +502,35 @@ async def get_android_companion_pending_endpoint(
     android_companion_synced_at is set, ordered by most recently pushed.
     By default excludes completed workouts.
 
+    Answers 304 when If-None-Match carries the current ETag; with a ``since``
+    cursor only changed workouts are returned, plus the IDs still pending.
+
     Args:
         user_id: Authenticated user ID from JWT
         limit: Maximum number of workouts to return (1-100)
         exclude_completed: Whether to exclude completed workouts
+        since: Delta cursor from a previous response
+        if_none_match: ETag from a previous response
 
     Returns:
         List of pending Android Companion workouts with interval data
     """
     try:
-        workouts = await run_in_threadpool(get_android_companion_pending_workouts, user_id, limit=limit, exclude_completed=exclude_completed)
+        # Read the version before the feed so a concurrent change is never masked
+        version = await run_in_threadpool(get_user_sync_version, user_id)
+        etag = feed_etag(user_id, version, "android", limit, exclude_completed, since or "")
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
 
-        # Transform each workout to companion format
-        transformed = []
-        for workout_record in workouts:
-            workout_data = workout_record.get("workout_data", {})
-            title = workout_record.get("title") or workout_data.get("title", "Workout")
+        workouts = await run_in_threadpool(get_android_companion_pending_workouts, user_id, limit=limit, exclude_completed=exclude_completed)
 
-            # Use to_workoutkit to properly transform intervals
-            try:
-                workoutkit_dto = to_workoutkit(workout_data)
-                intervals = [interval.model_dump() for interval in workoutkit_dto.intervals]
-                sport = workoutkit_dto.sportType
-            except (ValueError, KeyError, AttributeError, TypeError) as e:
-                logger.warning(f"Failed to transform workout {workout_record.get('id')}: {e}")
-                # Fallback to simple transformation
-                intervals = []
-                sport = "strengthTraining"
-                try:
-                    for block in workout_data.get("blocks", []):
-                        for exercise in block.get("exercises", []):
-                            intervals.append(convert_exercise_to_interval(exercise))
-                except (KeyError, AttributeError, TypeError) as fallback_err:
-                    logger.warning(f"Fallback transformation also failed for {workout_record.get('id')}: {fallback_err}")
-
-            # Calculate total duration from intervals
-            total_duration = calculate_intervals_duration(intervals)
-
-            transformed.append({
-                "id": workout_record.get("id"),
-                "name": title,
-                "sport": sport,
-                "duration": total_duration,
-                "source": "amakaflow",
-                "sourceUrl": None,
-                "intervals": intervals,
-                "pushedAt": workout_record.get("android_companion_synced_at"),
-                "createdAt": workout_record.get("created_at"),
-            })
+        feed = build_companion_feed(workouts, "android_companion_synced_at", since=since)
 
-        logger.info(f"Retrieved {len(transformed)} pending Android Companion workouts for user {user_id}")
+        logger.info(f"Retrieved {feed['count']} pending Android Companion workouts for user {user_id}")
 
-        return {
-            "success": True,
-            "workouts": transformed,
-            "count": len(transformed)
-        }
+        if etag:
+            response.headers["ETag"] = etag
+        return feed
     except HTTPException:
         raise
     except (ValueError, KeyError, AttributeError, TypeError) as e:
@@ -743,26 +713,27 @@ async def sync_workout_to_garmin(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Import workout
-            logger.info("GARMIN_SYNC_IMPORT payload=%s", json.dumps(garmin_payload, indent=2))
-            response = await client.post(f"{garmin_url}/workouts/import", json=garmin_payload)
-            response.raise_for_status()
-
-            # Optionally schedule the workout
-            if schedule_date:
-                schedule_payload = {
-                    "email": garmin_email,
-                    "password": garmin_password,
-                    "start_from": schedule_date,
-                    "workouts": [workout_title],
-                }
-                logger.info("GARMIN_SYNC_SCHEDULE payload=%s", json.dumps(schedule_payload, indent=2))
-                schedule_response = await client.post(
-                    f"{garmin_url}/workouts/schedule",
-                    json=schedule_payload,
-                )
-                schedule_response.raise_for_status()
+        client = get_upstream_client("garmin")
+
+        # Import workout
+        logger.info("GARMIN_SYNC_IMPORT payload=%s", json.dumps(garmin_payload, indent=2))
+        response = await client.post(f"{garmin_url}/workouts/import", json=garmin_payload)
+        response.raise_for_status()
+
+        # Optionally schedule the workout
+        if schedule_date:
+            schedule_payload = {
+                "email": garmin_email,
+                "password": garmin_password,
+                "start_from": schedule_date,
+                "workouts": [workout_title],
+            }
+            logger.info("GARMIN_SYNC_SCHEDULE payload=%s", json.dumps(schedule_payload, indent=2))
+            schedule_response = await client.post(
+                f"{garmin_url}/workouts/schedule",
+                json=schedule_payload,
+            )
+            schedule_response.raise_for_status()
 
         logger.info(f"Synced workout to Garmin: {workout_title}")
 
@@ -836,6 +807,71 @@ async def queue_workout_sync_endpoint(
     }
 
 
+@router.get("/sync/events")
+async def stream_sync_events_endpoint(
+    request: Request,
+    device_type: Optional[str] = Query(None, description="Only stream events for this device type"),
+    last_event_id: Optional[str] = Header(None),
+    user_id: str = Depends(get_current_user),
+):
+    """
+    Stream sync-queue events for the user as server-sent events.
+
+    Replaces polling /sync/pending: devices keep this connection open and
+    re-fetch only when a sync_queued event arrives. Events:
+    - sync_queued: {workout_id, device_type, device_id, queued_at}
+    - sync_confirmed: {workout_id, device_type, device_id, synced_at}
+    - sync_failed: {workout_id, device_type, device_id, failed_at, error_message}
+    - resync: events were missed; fetch /sync/pending once
+
+    Reconnecting clients send Last-Event-ID (EventSource does this
+    automatically) and receive the events they missed. A heartbeat comment
+    is sent while the stream is idle.
+
+    Args:
+        request: Incoming request (used to detect disconnects)
+        device_type: Optional device type filter (ios, android, or garmin)
+        last_event_id: Last event ID the client received
+        user_id: Authenticated user ID from JWT
+
+    Returns:
+        StreamingResponse with SSE format
+    """
+    if device_type is not None and device_type not in {e.value for e in DeviceType}:
+        raise HTTPException(status_code=400, detail="Invalid device_type")
+
+    resume_from = None
+    if last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            resume_from = 0  # unknown position: replay what we have and resync
+
+    hub = get_sync_event_hub()
+    subscription = hub.subscribe(user_id, last_event_id=resume_from, device_type=device_type)
+
+    async def event_stream():
+        try:
+            async for chunk in stream_sync_events(
+                subscription,
+                heartbeat_seconds=_settings.sync_events_heartbeat_seconds,
+                is_disconnected=request.is_disconnected,
+            ):
+                yield chunk
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
 @router.get("/sync/pending")
 async def get_pending_syncs_endpoint(
     device_type: str = Query(..., description="Device type: ios, android, or garmin"),
@@ -879,34 +915,17 @@ async def get_pending_syncs_endpoint(
             workout_data = workout_record.get("workout_data", {})
             title = workout_record.get("title") or workout_data.get("title", "Workout")
 
-            # Use to_workoutkit to properly transform intervals
-            try:
-                workoutkit_dto = to_workoutkit(workout_data)
-                intervals = [interval.model_dump() for interval in workoutkit_dto.intervals]
-                sport = workoutkit_dto.sportType
-            except (ValueError, KeyError, AttributeError, TypeError) as e:
-                logger.warning(f"Failed to transform workout {entry.get('workout_id')}: {e}")
-                # Fallback to simple transformation
-                intervals = []
-                sport = "strengthTraining"
-                try:
-                    for block in workout_data.get("blocks", []):
-                        for exercise in block.get("exercises", []):
-                            intervals.append(convert_exercise_to_interval(exercise))
-                except (KeyError, AttributeError, TypeError) as fallback_err:
-                    logger.warning(f"Fallback transformation failed for {entry.get('workout_id')}: {fallback_err}")
-
-            # Calculate total duration from intervals
-            total_duration = calculate_intervals_duration(intervals)
+            # Cached per workout_data hash; to_workoutkit only runs on new content
+            payload = get_companion_payload_cache().get_payload(workout_data, entry.get("workout_id"))
 
             workouts.append({
                 "id": entry.get("workout_id"),
                 "name": title,
-                "sport": sport,
-                "duration": total_duration,
+                "sport": payload["sport"],
+                "duration": payload["duration"],
                 "source": "amakaflow",
                 "sourceUrl": None,
-                "intervals": intervals,
+                "intervals": payload["intervals"],
                 "queued_at": entry.get("queued_at"),
                 "created_at": workout_record.get("created_at"),
             })
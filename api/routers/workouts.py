@@ -9,6 +9,7 @@ Updated in AMA-433: Add PATCH /workouts/{id} endpoint for JSON Patch operations
 
 This router contains endpoints for:
 - /workouts/save - Save workout to database
+- /workouts/save-batch - Save many workouts (e.g. a program) in batched writes
 - /workouts - List user workouts
 - /workouts/incoming - Get incoming (pending) workouts
 - /workouts/{workout_id} - Get, delete, patch workout
@@ -26,8 +27,8 @@ import logging
 import time
 from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Query, Depends, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Query, Depends, Header, HTTPException, Response
+from pydantic import BaseModel, Field, field_validator
 
 from api.deps import (
     get_current_user,
@@ -37,16 +38,17 @@ from api.deps import (
     get_search_repo,
     get_embedding_service,
     get_export_queue,
+    get_rate_limiter,
 )
 from application.ports import SearchRepository, EmbeddingService
 from application.use_cases import SaveWorkoutUseCase, GetWorkoutUseCase
 from application.use_cases.patch_workout import PatchWorkoutUseCase
 from domain.models.patch_operation import PatchOperation
-from backend.adapters.blocks_to_workoutkit import to_workoutkit
 from domain.converters.blocks_to_workout import blocks_to_workout
 from domain.models import WorkoutMetadata, WorkoutSource
+from backend.services.companion_feed import build_companion_feed, etag_matches, feed_etag
 from backend.services.export_queue import ExportQueue
-from backend.utils.intervals import calculate_intervals_duration, convert_exercise_to_interval
+from backend.services.rate_limiter import FEATURE_EMBEDDINGS, RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +75,22 @@ class SaveWorkoutRequest(BaseModel):
     workout_id: Optional[str] = None  # Optional: for explicit updates to existing workouts
 
 
+# Most workouts accepted by one /workouts/save-batch request
+MAX_SAVE_BATCH = 500
+
+
+class SaveWorkoutsBatchRequest(BaseModel):
+    """Request for saving several workouts (e.g. a whole program) at once."""
+    workouts: List[SaveWorkoutRequest] = Field(..., min_length=1, max_length=MAX_SAVE_BATCH)
+
+    @field_validator("workouts")
+    @classmethod
+    def _one_device(cls, workouts: List[SaveWorkoutRequest]) -> List[SaveWorkoutRequest]:
+        if len({w.device for w in workouts}) > 1:
+            raise ValueError("all workouts in a batch must target the same device")
+        return workouts
+
+
 class WorkoutData(BaseModel):
     """Schema validation for workout_data structure.
 
@@ -228,6 +246,37 @@ class WorkoutOperationResponse(BaseModel):
 # =============================================================================
 
 
+def _request_to_workout(request: SaveWorkoutRequest):
+    """Convert a save request to a domain Workout (raises ValueError if invalid)."""
+    workout_data = request.workout_data.model_dump(exclude_none=True)
+
+    # Apply title/description overrides if provided
+    if request.title:
+        workout_data["title"] = request.title
+    if request.description:
+        workout_data["description"] = request.description
+
+    # Parse sources to WorkoutSource enum
+    sources = []
+    for src in request.sources:
+        try:
+            sources.append(WorkoutSource(src))
+        except ValueError:
+            pass
+
+    # Add metadata to workout_data for converter
+    workout_data["metadata"] = workout_data.get("metadata", {})
+    workout_data["metadata"]["sources"] = [s.value for s in sources]
+
+    # Convert to domain Workout
+    workout = blocks_to_workout(workout_data)
+
+    # Set workout ID if updating existing workout
+    if request.workout_id:
+        workout = workout.model_copy(update={"id": request.workout_id})
+    return workout
+
+
 @router.post("/workouts/save")
 def save_workout_endpoint(
     request: SaveWorkoutRequest,
@@ -244,32 +293,7 @@ def save_workout_endpoint(
     """
     try:
         # Step 1: Convert HTTP request to domain model
-        workout_data = request.workout_data.copy()
-
-        # Apply title/description overrides if provided
-        if request.title:
-            workout_data["title"] = request.title
-        if request.description:
-            workout_data["description"] = request.description
-
-        # Parse sources to WorkoutSource enum
-        sources = []
-        for src in request.sources:
-            try:
-                sources.append(WorkoutSource(src))
-            except ValueError:
-                pass
-
-        # Add metadata to workout_data for converter
-        workout_data["metadata"] = workout_data.get("metadata", {})
-        workout_data["metadata"]["sources"] = [s.value for s in sources]
-
-        # Convert to domain Workout
-        workout = blocks_to_workout(workout_data)
-
-        # Set workout ID if updating existing workout
-        if request.workout_id:
-            workout = workout.model_copy(update={"id": request.workout_id})
+        workout = _request_to_workout(request)
 
         # Step 2: Execute use case
         result = save_workout_use_case.execute(
@@ -281,10 +305,12 @@ def save_workout_endpoint(
         # Step 3: Queue workout for export if save was successful
         if result.success and result.workout_id:
             export_queue.enqueue(
-                workout_id=result.workout_id,
                 user_id=user_id,
-                device=request.device,
-                export_formats=request.exports or {},
+                payload={
+                    "workout_id": result.workout_id,
+                    "device": request.device,
+                    "export_formats": request.exports or {},
+                },
             )
 
         # Step 4: Convert use case result to HTTP response
@@ -323,6 +349,65 @@ def save_workout_endpoint(
         }
 
 
+@router.post("/workouts/save-batch")
+def save_workouts_batch_endpoint(
+    request: SaveWorkoutsBatchRequest,
+    user_id: str = Depends(get_current_user),
+    save_workout_use_case: SaveWorkoutUseCase = Depends(get_save_workout_use_case),
+    export_queue: ExportQueue = Depends(get_export_queue),
+):
+    """Save many workouts (e.g. every workout of a program) in one call.
+
+    Same deduplication as /workouts/save, but persisted with batched writes
+    (SaveWorkoutUseCase.execute_many): a few requests per 50 workouts instead
+    of two per workout. Workouts are validated first; if any is invalid,
+    none are saved.
+    """
+    workouts = []
+    for index, item in enumerate(request.workouts):
+        try:
+            workouts.append(_request_to_workout(item))
+        except ValueError as e:
+            logger.warning(f"Failed to convert workout {index} in batch: {e}")
+            return {
+                "success": False,
+                "message": f"Invalid workout data at index {index}: {str(e)}",
+            }
+
+    results = save_workout_use_case.execute_many(
+        workouts=workouts,
+        user_id=user_id,
+        device=request.workouts[0].device,
+    )
+
+    for item, result in zip(request.workouts, results):
+        if result.success and result.workout_id:
+            export_queue.enqueue(
+                user_id=user_id,
+                payload={
+                    "workout_id": result.workout_id,
+                    "device": item.device,
+                    "export_formats": item.exports or {},
+                },
+            )
+
+    saved = sum(1 for result in results if result.success)
+    return {
+        "success": saved == len(results),
+        "saved": saved,
+        "results": [
+            {
+                "success": result.success,
+                "workout_id": result.workout_id,
+                "is_update": result.is_update,
+                "message": None if result.success else result.error,
+                "validation_errors": result.validation_errors,
+            }
+            for result in results
+        ],
+    }
+
+
 @router.get("/workouts", response_model=WorkoutListResponse)
 def get_workouts_endpoint(
     user_id: str = Depends(get_current_user),
@@ -357,13 +442,15 @@ def search_workouts_endpoint(
     user_id: str = Depends(get_current_user),
     search_repo: SearchRepository = Depends(get_search_repo),
     embedding_service: Optional[EmbeddingService] = Depends(get_embedding_service),
+    rate_limiter: RateLimiter = Depends(get_rate_limiter),
 ):
     """
     Search workouts using semantic similarity or keyword fallback.
 
     Generates an embedding for the query via OpenAI and performs cosine similarity
     search against workout embeddings. Falls back to keyword search (ILIKE) if
-    OpenAI is unavailable or embedding generation fails.
+    OpenAI is unavailable, embedding generation fails, or the user's embeddings
+    budget is spent.
 
     Part of AMA-432: Semantic Search Endpoint
     """
@@ -373,7 +460,9 @@ def search_workouts_endpoint(
         query_embedding = None
 
         # Try semantic search first
-        if embedding_service is not None:
+        if embedding_service is not None and not rate_limiter.check(user_id, FEATURE_EMBEDDINGS).allowed:
+            logger.info("Embeddings budget spent, using keyword search")
+        elif embedding_service is not None:
             try:
                 t0 = time.perf_counter()
                 query_embedding = embedding_service.generate_query_embedding(q)
@@ -476,9 +565,12 @@ def _matches_duration(row: dict, min_duration: Optional[int], max_duration: Opti
 
 @router.get("/workouts/incoming")
 def get_incoming_workouts_endpoint(
+    response: Response,
     user_id: str = Depends(get_current_user),
     get_workout_use_case: GetWorkoutUseCase = Depends(get_get_workout_use_case),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of workouts"),
+    since: Optional[str] = Query(None, description="Cursor from a previous response; only changes after it are returned"),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get incoming workouts that haven't been completed yet (AMA-236).
@@ -489,54 +581,32 @@ def get_incoming_workouts_endpoint(
     Use this instead of /workouts to get a filtered list of workouts
     that still need to be done.
 
+    Polling clients should send the returned ETag as If-None-Match (answered
+    with 304 while nothing changed) and the returned cursor as ``since`` to
+    receive only changed workouts plus the IDs still pending.
+
     Args:
         user_id: Authenticated user ID (from Clerk JWT)
         limit: Maximum number of workouts to return
+        since: Delta cursor from a previous response
+        if_none_match: ETag from a previous response
 
     Returns:
         List of pending workouts in iOS Companion format
     """
-    result = get_workout_use_case.get_incoming_workouts(user_id, limit=limit)
-
-    # Transform each workout to iOS companion format (same as /ios-companion/pending)
-    transformed = []
-    for workout_record in result.workouts:
-        workout_data = workout_record.get("workout_data", {})
-        title = workout_record.get("title") or workout_data.get("title", "Workout")
+    # Read the version before the feed so a concurrent change is never masked
+    version = get_workout_use_case.get_incoming_version(user_id)
+    etag = feed_etag(user_id, version, "incoming", limit, since or "")
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
-        # Use to_workoutkit to properly transform intervals
-        try:
-            workoutkit_dto = to_workoutkit(workout_data)
-            intervals = [interval.model_dump() for interval in workoutkit_dto.intervals]
-            sport = workoutkit_dto.sportType
-        except Exception as e:
-            logger.warning(f"Failed to transform workout {workout_record.get('id')}: {e}")
-            intervals = []
-            sport = "strengthTraining"
-            for block in workout_data.get("blocks", []):
-                for exercise in block.get("exercises", []):
-                    intervals.append(convert_exercise_to_interval(exercise))
-
-        # Calculate total duration from intervals
-        total_duration = calculate_intervals_duration(intervals)
-
-        transformed.append({
-            "id": workout_record.get("id"),
-            "name": title,
-            "sport": sport,
-            "duration": total_duration,
-            "source": "amakaflow",
-            "sourceUrl": None,
-            "intervals": intervals,
-            "pushedAt": workout_record.get("ios_companion_synced_at"),
-            "createdAt": workout_record.get("created_at"),
-        })
+    result = get_workout_use_case.get_incoming_workouts(user_id, limit=limit)
 
-    return {
-        "success": True,
-        "workouts": transformed,
-        "count": len(transformed)
-    }
+    # Same format as /ios-companion/pending
+    feed = build_companion_feed(result.workouts, "ios_companion_synced_at", since=since)
+    if etag:
+        response.headers["ETag"] = etag
+    return feed
 
 
 # =============================================================================
@@ -590,9 +660,11 @@ def update_workout_export_endpoint(
     # Queue export job if marking as exported
     if request.is_exported:
         export_queue.enqueue(
-            workout_id=workout_id,
             user_id=user_id,
-            device=request.exported_to_device or "unknown",
+            payload={
+                "workout_id": workout_id,
+                "device": request.exported_to_device or "unknown",
+            },
         )
 
     return {
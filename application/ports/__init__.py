@@ -63,6 +63,9 @@ from application.ports.progression_repository import (
 from application.ports.search_repository import SearchRepository
 from application.ports.embedding_service import EmbeddingService
 
+# Background work
+from application.ports.task_runner import TaskPriority, TaskRunner
+
 __all__ = [
     # Workout
     "WorkoutRepository",
@@ -89,4 +92,7 @@ __all__ = [
     # Search (AMA-432)
     "SearchRepository",
     "EmbeddingService",
+    # Background work
+    "TaskPriority",
+    "TaskRunner",
 ]
@@ -42,6 +42,18 @@ class ExercisesRepository(Protocol):
         """
         ...
 
+    def get_by_ids(self, exercise_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several exercises by canonical ID in one lookup.
+
+        Args:
+            exercise_ids: Exercise slugs
+
+        Returns:
+            Exercise dictionaries keyed by ID; unknown IDs are omitted
+        """
+        ...
+
     def find_by_exact_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Find an exercise by exact name match (case-insensitive).
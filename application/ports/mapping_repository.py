@@ -7,7 +7,7 @@ Phase 2 - Dependency Injection
 This module defines the abstract interface for exercise mapping persistence.
 Handles user-defined mappings and global/crowd-sourced popularity data.
 """
-from typing import Protocol, Optional, List, Dict, Any, Tuple
+from typing import Protocol, Optional, List, Dict, Any, Tuple, Iterable
 
 
 class UserMappingRepository(Protocol):
@@ -65,6 +65,24 @@ class UserMappingRepository(Protocol):
         """
         ...
 
+    def get_many(
+        self,
+        exercise_names: Iterable[str],
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get the mapped Garmin names for several exercises at once.
+
+        Implementations should resolve the whole batch without a round trip
+        per name.
+
+        Args:
+            exercise_names: Exercise names to look up
+
+        Returns:
+            Dict of exercise_name (as given) -> Garmin name or None
+        """
+        ...
+
     def get_all(self) -> Dict[str, str]:
         """
         Get all user-defined mappings.
@@ -160,6 +178,25 @@ class ExerciseMatchRepository(Protocol):
         """
         ...
 
+    def find_matches(
+        self,
+        exercise_names: Iterable[str],
+        *,
+        threshold: float = 0.3,
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """
+        Find the best matching Garmin exercise for several names at once.
+
+        Args:
+            exercise_names: Exercise names to match
+            threshold: Minimum confidence threshold (0-1)
+
+        Returns:
+            Dict of exercise_name -> (matched_name, confidence), with
+            (None, 0) for names below the threshold
+        """
+        ...
+
     def get_suggestions(
         self,
         exercise_name: str,
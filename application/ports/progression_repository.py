@@ -150,6 +150,27 @@ class ProgressionRepository(Protocol):
         """
         ...
 
+    def get_last_weights(
+        self,
+        user_id: str,
+        exercise_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the last weight used for several exercises in one call.
+
+        Used when a workout starts on a companion app, to prefill every
+        exercise without a lookup per exercise.
+
+        Args:
+            user_id: User ID
+            exercise_ids: Canonical exercise IDs
+
+        Returns:
+            Map of exercise_id to the get_last_weight_used dict; exercises
+            without weight history are omitted
+        """
+        ...
+
     def get_volume_by_muscle_group(
         self,
         user_id: str,
@@ -180,6 +201,35 @@ class ProgressionRepository(Protocol):
         """
         ...
 
+    def get_1rm_trend(
+        self,
+        user_id: str,
+        exercise_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        granularity: str = "weekly",  # "daily", "weekly", "monthly"
+        formula: str = "brzycki",
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the estimated 1RM trend for an exercise.
+
+        Takes the best estimated 1RM of each period from completed sets
+        with a weight and reps.
+
+        Args:
+            user_id: User ID
+            exercise_id: Canonical exercise ID
+            start_date: Start of date range (defaults to 90 days ago)
+            end_date: End of date range (defaults to today)
+            granularity: How to group data ("daily", "weekly", "monthly")
+            formula: 1RM formula ("brzycki" or "epley")
+
+        Returns:
+            List of {"period", "estimated_1rm"} dicts, oldest period first
+        """
+        ...
+
     def get_exercises_with_history(
         self,
         user_id: str,
@@ -200,3 +250,22 @@ class ProgressionRepository(Protocol):
             List of exercise dicts with id, name, and session count
         """
         ...
+
+    def get_all_sets(
+        self,
+        user_id: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every logged set for a user as flat rows, for one-pass analytics.
+
+        Rows are ordered newest workout first, then in the order the sets
+        were performed.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of set dicts with exercise_id, exercise_name, completion_id,
+            workout_date, weight, weight_unit, reps_completed and status
+        """
+        ...
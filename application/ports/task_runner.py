@@ -0,0 +1,47 @@
+"""
+Background Task Runner Interface (Port).
+
+Defines the interface use cases use to hand off fire-and-forget work
+(audit logging, popularity counters, ...) so request handlers can return
+without waiting for it. Implementations run the work on a bounded,
+process-level worker pool.
+"""
+
+from enum import IntEnum
+from typing import Any, Callable, Optional, Protocol
+
+
+class TaskPriority(IntEnum):
+    """Run order for background tasks; higher runs first."""
+
+    LOW = 0
+    NORMAL = 5
+    HIGH = 10
+
+
+class TaskRunner(Protocol):
+    """Abstract interface for running work off the request path."""
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        priority: int = TaskPriority.NORMAL,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Queue fn(*args, **kwargs) to run in the background.
+
+        Args:
+            name: Task name, used for logs and metrics
+            fn: Callable to run; exceptions are retried, then logged
+            key: Fairness key (usually the user ID)
+            priority: Run order (see TaskPriority)
+
+        Returns:
+            False if the task was rejected (queue full or shutting down);
+            the caller decides whether to run it inline or drop it
+        """
+        ...
@@ -56,6 +56,29 @@ class WorkoutRepository(Protocol):
         """
         ...
 
+    def save_many(
+        self,
+        profile_id: str,
+        workouts: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Save several workouts for one user in as few round trips as possible.
+
+        Each item holds the arguments of save() for one workout
+        (workout_data, sources, device and optionally exports, validation,
+        title, description, workout_id) and is deduplicated the same way.
+        Items with the same title and device collapse into one workout,
+        the last one winning.
+
+        Args:
+            profile_id: User profile ID (Clerk user ID)
+            workouts: Workouts to save
+
+        Returns:
+            Saved workout records in input order, None where a save failed
+        """
+        ...
+
     def get(
         self,
         workout_id: str,
@@ -209,6 +232,21 @@ class WorkoutRepository(Protocol):
         """
         ...
 
+    def get_sync_version(self, profile_id: str) -> Optional[int]:
+        """
+        Get the user's sync version counter.
+
+        The counter changes whenever the user's workouts or completions
+        change, so pollers can answer "nothing new" without reading them.
+
+        Args:
+            profile_id: User profile ID
+
+        Returns:
+            Current version, or None if unavailable
+        """
+        ...
+
     def get_sync_status(
         self,
         workout_id: str,
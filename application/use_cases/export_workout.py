@@ -14,7 +14,7 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 from application.ports import WorkoutRepository
-from domain.converters.db_converters import db_row_to_workout, _workout_to_blocks_format
+from domain.converters.db_converters import db_row_to_record, _workout_to_blocks_format
 from domain.models import Workout
 
 logger = logging.getLogger(__name__)
@@ -127,9 +127,10 @@ class ExportWorkoutUseCase:
                     error="Workout not found",
                 )
 
-            # Step 2: Convert DB row to domain Workout
-            logger.debug("Converting DB row to domain Workout")
-            workout = db_row_to_workout(workout_row)
+            # Step 2: Convert DB row to a workout record (the stored data is
+            # only serialized again, so the validated model is not needed)
+            logger.debug("Converting DB row to workout record")
+            workout = db_row_to_record(workout_row)
 
             # Step 3: Convert Workout to blocks format for exporters
             blocks_json = _workout_to_blocks_format(workout)
@@ -152,6 +152,18 @@ class GetWorkoutUseCase:
             count=len(workouts),
         )
 
+    def get_incoming_version(self, user_id: str) -> Optional[int]:
+        """
+        Get the version of the user's incoming workouts feed.
+
+        Args:
+            user_id: Current user ID
+
+        Returns:
+            Sync version counter, or None if unavailable
+        """
+        return self._workout_repo.get_sync_version(user_id)
+
     def delete_workout(
         self,
         workout_id: str,
@@ -10,7 +10,7 @@ to a canonical Workout domain model with exercise matching.
 
 import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from application.ports import (
     ExerciseMatchRepository,
@@ -19,7 +19,8 @@ from application.ports import (
 )
 from backend.parsers.models import ParsedWorkout
 from domain.converters.ingest_to_workout import ingest_to_workout
-from domain.models import Block, Exercise, Workout
+from domain.models import Workout
+from domain.models.workout_record import WorkoutRecord
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +154,8 @@ class MapWorkoutUseCase:
         """
         Map all exercises in the workout to canonical names.
 
-        First checks user-defined mappings, then falls back to fuzzy matching.
+        All names are resolved in one pass before the workout is rebuilt
+        (see _resolve_exercise_names).
 
         Args:
             workout: Workout with exercises to map
@@ -164,94 +166,68 @@ class MapWorkoutUseCase:
         mapped_count = 0
         unmapped_count = 0
 
-        # Build new blocks with mapped exercises
-        mapped_blocks: list[Block] = []
-
-        for block in workout.blocks:
-            mapped_exercises: list[Exercise] = []
+        resolved = self._resolve_exercise_names(
+            exercise.name for block in workout.blocks for exercise in block.exercises
+        )
 
+        # Set canonical names on a record view of the validated workout and
+        # convert back without re-validating every exercise
+        record = WorkoutRecord.from_workout(workout)
+        for block in record.blocks:
             for exercise in block.exercises:
-                canonical_name = self._resolve_exercise_name(exercise.name)
+                canonical_name = resolved.get(exercise.name)
 
                 if canonical_name:
-                    # Create new exercise with canonical_name set
-                    mapped_exercise = Exercise(
-                        name=exercise.name,
-                        canonical_name=canonical_name,
-                        sets=exercise.sets,
-                        reps=exercise.reps,
-                        duration_seconds=exercise.duration_seconds,
-                        load=exercise.load,
-                        rest_seconds=exercise.rest_seconds,
-                        equipment=exercise.equipment,
-                        modifiers=exercise.modifiers,
-                        tempo=exercise.tempo,
-                        side=exercise.side,
-                        notes=exercise.notes,
-                    )
-                    mapped_exercises.append(mapped_exercise)
+                    exercise.canonical_name = canonical_name
                     mapped_count += 1
                     logger.debug(f"Mapped '{exercise.name}' -> '{canonical_name}'")
                 else:
                     # Keep exercise without canonical_name
-                    mapped_exercises.append(exercise)
                     unmapped_count += 1
                     logger.debug(f"No mapping found for '{exercise.name}'")
 
-            # Create new block with mapped exercises
-            mapped_block = Block(
-                label=block.label,
-                type=block.type,
-                rounds=block.rounds,
-                exercises=mapped_exercises,
-            )
-            mapped_blocks.append(mapped_block)
-
-        # Create new workout with mapped blocks
-        return (
-            Workout(
-                id=workout.id,
-                title=workout.title,
-                description=workout.description,
-                blocks=mapped_blocks,
-                notes=workout.notes,
-                tags=workout.tags,
-                metadata=workout.metadata,
-            ),
-            mapped_count,
-            unmapped_count,
-        )
+        return record.to_workout(validate=False), mapped_count, unmapped_count
 
-    def _resolve_exercise_name(self, exercise_name: str) -> Optional[str]:
+    def _resolve_exercise_names(
+        self, exercise_names: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
         """
-        Resolve an exercise name to its canonical (Garmin) name.
+        Resolve exercise names to their canonical (Garmin) names.
 
         Priority:
-        1. User-defined mapping (exact match)
-        2. Fuzzy matching against Garmin exercise database
+        1. User-defined mapping (exact match), looked up in one get_many call
+        2. Fuzzy matching against Garmin exercise database, batched for the
+           names without a user mapping
 
         Args:
-            exercise_name: Original exercise name to resolve
+            exercise_names: Original exercise names to resolve
 
         Returns:
-            Canonical name if found, None otherwise
+            Dict of exercise name -> canonical name (None if unresolved)
         """
+        names = list(dict.fromkeys(exercise_names))
+        if not names:
+            return {}
+
         # First, check user-defined mappings
-        user_mapping = self._user_mapping_repo.get(exercise_name)
-        if user_mapping:
-            logger.debug(f"Found user mapping for '{exercise_name}'")
-            return user_mapping
+        resolved = self._user_mapping_repo.get_many(names)
+        misses = []
+        for name in names:
+            if resolved.get(name):
+                logger.debug(f"Found user mapping for '{name}'")
+            else:
+                misses.append(name)
 
         # Fall back to fuzzy matching
-        matched_name, confidence = self._exercise_match_repo.find_match(
-            exercise_name, threshold=0.5
-        )
-
-        if matched_name:
-            logger.debug(
-                f"Fuzzy matched '{exercise_name}' -> '{matched_name}' "
-                f"(confidence: {confidence:.2f})"
-            )
-            return matched_name
+        if misses:
+            matches = self._exercise_match_repo.find_matches(misses, threshold=0.5)
+            for name in misses:
+                matched_name, confidence = matches.get(name, (None, 0.0))
+                if matched_name:
+                    logger.debug(
+                        f"Fuzzy matched '{name}' -> '{matched_name}' "
+                        f"(confidence: {confidence:.2f})"
+                    )
+                resolved[name] = matched_name
 
-        return None
+        return resolved
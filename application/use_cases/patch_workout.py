@@ -9,20 +9,26 @@ operations for chat-driven workout editing.
 Workflow:
 1. Fetch workout via repository
 2. Validate patch operations (including length limits)
-3. Apply patch operations to dict representation
-4. Re-validate via domain model
+3. Apply patch operations copy-on-write (only the touched path is copied)
+4. Re-validate the touched blocks via domain model
 5. Persist and clear embedding hash (single atomic update)
-6. Log to audit trail (best-effort, non-blocking)
+6. Log to audit trail (best-effort, queued on the task runner if given)
 7. Return PatchWorkoutResult
+
+Patches to the same workout that arrive while an earlier one is being
+written (rapid inline edits from the web editor) are applied in arrival
+order on one fetched copy and persisted with a single write; each request
+still gets its own result once its changes are stored.
 """
 
 import copy
 import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from application.ports import WorkoutRepository
+from application.ports import TaskPriority, TaskRunner, WorkoutRepository
 from domain.converters.blocks_to_workout import blocks_to_workout
 from domain.models import Workout
 from domain.models.patch_operation import (
@@ -68,6 +74,108 @@ class PatchWorkoutResult:
     validation_errors: List[str] = field(default_factory=list)
 
 
+class _CopyOnWrite:
+    """
+    Copy-on-write view of a workout_data document.
+
+    A container is shallow-copied the first time an operation writes
+    through it, so a patch copies the spine from the root to what it
+    touches and shares every other block and exercise with the original.
+    Also records which blocks were touched, for incremental validation.
+    """
+
+    def __init__(self, root: Dict[str, Any]):
+        # Keep references to owned copies so their ids stay unique
+        self._owned: Dict[int, Any] = {}
+        self.root = self._own(root)
+        self.touched_blocks: Optional[Set[int]] = set()
+
+    def _own(self, container: Any) -> Any:
+        copied = copy.copy(container)
+        self._owned[id(copied)] = copied
+        return copied
+
+    def mutable(self, *keys: Any) -> Any:
+        """Return the container at keys, copying it and its parents if shared."""
+        node = self.root
+        for key in keys:
+            child = node[key]
+            if self._owned.get(id(child)) is not child:
+                child = self._own(child)
+                node[key] = child
+            node = child
+        return node
+
+    def touch_block(self, index: int) -> None:
+        if self.touched_blocks is not None:
+            if index < 0:
+                # Negative (from-the-end) index: don't guess which block it hit
+                self.touched_blocks = None
+            else:
+                self.touched_blocks.add(index)
+
+    def touch_all_blocks(self) -> None:
+        """Block indexes shifted: validate every block."""
+        self.touched_blocks = None
+
+
+def _block_has_exercises(block: Dict[str, Any]) -> bool:
+    if block.get("exercises"):
+        return True
+    return any(superset.get("exercises") for superset in block.get("supersets") or [])
+
+
+@dataclass
+class _PendingPatch:
+    """One request's operations waiting in a workout's write lane."""
+
+    operations: List[PatchOperation]
+    ready: threading.Event = field(default_factory=threading.Event)
+    result: Optional[PatchWorkoutResult] = None
+
+
+class _PatchWriteCoalescer:
+    """
+    Group commit for patches to the same workout.
+
+    The first request for a workout leads: it takes every queued request,
+    applies them in order and writes once. Requests that arrive meanwhile
+    queue up; when the leader is done, the oldest of them leads the next
+    batch. A lone edit is written immediately, with no added wait.
+    """
+
+    def __init__(self):
+        self._lanes: Dict[Tuple[str, str], List[_PendingPatch]] = {}
+        self._busy: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def join(self, key: Tuple[str, str], entry: _PendingPatch) -> bool:
+        """Queue a request; True if the caller should lead a batch now."""
+        with self._lock:
+            self._lanes.setdefault(key, []).append(entry)
+            if key in self._busy:
+                return False
+            self._busy.add(key)
+            return True
+
+    def take(self, key: Tuple[str, str]) -> List[_PendingPatch]:
+        with self._lock:
+            return self._lanes.pop(key, [])
+
+    def finish(self, key: Tuple[str, str]) -> None:
+        """Hand the lane to the oldest waiting request, or release it."""
+        with self._lock:
+            waiting = self._lanes.get(key)
+            if not waiting:
+                self._busy.discard(key)
+                return
+        # Still marked busy: the woken request (result None) leads next
+        waiting[0].ready.set()
+
+
+_write_coalescer = _PatchWriteCoalescer()
+
+
 class PatchWorkoutUseCase:
     """
     Use case for patching workouts with JSON Patch operations.
@@ -96,14 +204,21 @@ class PatchWorkoutUseCase:
         ...     print(f"Applied {result.changes_applied} changes")
     """
 
-    def __init__(self, workout_repo: WorkoutRepository) -> None:
+    def __init__(
+        self,
+        workout_repo: WorkoutRepository,
+        task_runner: Optional[TaskRunner] = None,
+    ) -> None:
         """
         Initialize the use case with required dependencies.
 
         Args:
             workout_repo: Repository for workout persistence operations
+            task_runner: Optional runner for the audit trail write; without
+                one it runs inline
         """
         self._workout_repo = workout_repo
+        self._task_runner = task_runner
 
     def execute(
         self,
@@ -122,130 +237,240 @@ class PatchWorkoutUseCase:
         Returns:
             PatchWorkoutResult with success status and updated workout
         """
-        try:
-            # Step 1: Fetch workout via repository
-            workout_row = self._workout_repo.get_workout_by_id(workout_id, user_id)
-            if workout_row is None:
-                return PatchWorkoutResult(
-                    success=False,
-                    error="Workout not found or not owned by user",
-                )
+        key = (user_id, workout_id)
+        entry = _PendingPatch(operations=operations)
 
-            # Step 2: Validate all operations upfront
-            validation_errors = self._validate_operations(operations, workout_row)
-            if validation_errors:
-                return PatchWorkoutResult(
-                    success=False,
-                    error="Patch operation validation failed",
-                    validation_errors=validation_errors,
-                )
+        if not _write_coalescer.join(key, entry):
+            # Another request for this workout is writing; it will apply ours
+            # too, or hand us the lead for the next batch
+            entry.ready.wait()
+            if entry.result is not None:
+                return entry.result
 
-            # Step 3: Apply patches to workout_data
-            workout_data = copy.deepcopy(workout_row.get("workout_data", {}))
+        batch = _write_coalescer.take(key)
+        try:
+            self._execute_batch(workout_id, user_id, batch)
+        finally:
+            for pending in batch:
+                if pending.result is None:
+                    pending.result = PatchWorkoutResult(
+                        success=False, error="Patch was not applied"
+                    )
+                if pending is not entry:
+                    pending.ready.set()
+            _write_coalescer.finish(key)
 
-            # Also track top-level fields that might change
-            title = workout_row.get("title") or workout_data.get("title")
-            description = workout_row.get("description") or workout_data.get("description")
-            tags = workout_row.get("tags") or workout_data.get("tags", [])
+        return entry.result
 
-            changes_applied = 0
-            for op in operations:
-                try:
-                    workout_data, title, description, tags, changed = self._apply_operation(
-                        op, workout_data, title, description, tags
-                    )
-                    if changed:
-                        changes_applied += 1
-                    else:
-                        # Log when operation doesn't result in change
-                        logger.debug(
-                            f"Operation {op.op} on {op.path} did not result in change "
-                            f"(possibly non-existent index or no-op)"
-                        )
-                except Exception as e:
-                    logger.warning(f"Failed to apply operation {op}: {e}")
-                    return PatchWorkoutResult(
+    def _execute_batch(
+        self,
+        workout_id: str,
+        user_id: str,
+        batch: List[_PendingPatch],
+    ) -> None:
+        """Apply queued requests in order and persist them with one write."""
+        try:
+            # Step 1: Fetch workout via repository
+            workout_row = self._workout_repo.get_workout_by_id(workout_id, user_id)
+            if workout_row is None:
+                for pending in batch:
+                    pending.result = PatchWorkoutResult(
                         success=False,
-                        error=f"Failed to apply operation: {str(e)}",
-                        validation_errors=[str(e)],
+                        error="Workout not found or not owned by user",
                     )
+                return
 
-            # Sync title/description/tags back into workout_data
-            if title:
-                workout_data["title"] = title
-            if description:
-                workout_data["description"] = description
-            if tags is not None:
-                workout_data["tags"] = tags
+            # Steps 2-4 per request; a failed request leaves the document as it was
+            applied: List[Tuple[_PendingPatch, int]] = []
+            for pending in batch:
+                staged = self._stage(pending.operations, workout_row)
+                if isinstance(staged, PatchWorkoutResult):
+                    pending.result = staged
+                    continue
+                workout_row, changes_applied = staged
+                applied.append((pending, changes_applied))
 
-            # Step 4: Re-validate via domain model
-            try:
-                workout = blocks_to_workout(workout_data)
-            except Exception as e:
-                logger.warning(f"Workout validation failed after patch: {e}")
-                return PatchWorkoutResult(
-                    success=False,
-                    error="Workout validation failed after applying patches",
-                    validation_errors=[str(e)],
-                )
-
-            # Additional business validation
-            biz_errors = self._validate_workout_business_rules(workout)
-            if biz_errors:
-                return PatchWorkoutResult(
-                    success=False,
-                    error="Business validation failed",
-                    validation_errors=biz_errors,
-                )
+            if not applied:
+                return
 
             # Step 5: Persist updated workout with cleared embedding hash (atomic)
             updated_row = self._workout_repo.update_workout_data(
                 workout_id=workout_id,
                 profile_id=user_id,
-                workout_data=workout_data,
-                title=title,
-                description=description,
-                tags=tags,
+                workout_data=workout_row["workout_data"],
+                title=workout_row.get("title"),
+                description=workout_row.get("description"),
+                tags=workout_row.get("tags"),
                 clear_embedding=True,  # Clear embedding hash to trigger regeneration
             )
 
             if updated_row is None:
-                return PatchWorkoutResult(
-                    success=False,
-                    error="Failed to persist workout update",
+                for pending, _ in applied:
+                    pending.result = PatchWorkoutResult(
+                        success=False,
+                        error="Failed to persist workout update",
+                    )
+                return
+
+            if len(batch) > 1:
+                logger.info(f"Coalesced {len(batch)} patches to workout {workout_id} into one write")
+
+            for pending, changes_applied in applied:
+                # Step 6: Log to audit trail (best-effort, non-blocking)
+                self._log_audit_trail(
+                    workout_id=workout_id,
+                    user_id=user_id,
+                    operations=pending.operations,
+                    changes_applied=changes_applied,
                 )
 
-            # Step 6: Log to audit trail (best-effort, non-blocking)
-            self._log_audit_trail(
-                workout_id=workout_id,
-                user_id=user_id,
-                operations=operations,
-                changes_applied=changes_applied,
-            )
-
-            # Step 7: Return result
-            return PatchWorkoutResult(
-                success=True,
-                workout=updated_row,
-                changes_applied=changes_applied,
-                embedding_regeneration="queued",
-            )
+                # Step 7: Return result
+                pending.result = PatchWorkoutResult(
+                    success=True,
+                    workout=updated_row,
+                    changes_applied=changes_applied,
+                    embedding_regeneration="queued",
+                )
 
         except PatchValidationError as e:
             logger.warning(f"Patch validation error: {e}")
+            for pending in batch:
+                if pending.result is None:
+                    pending.result = PatchWorkoutResult(
+                        success=False,
+                        error=e.message,
+                        validation_errors=e.errors,
+                    )
+
+        except Exception as e:
+            logger.exception(f"PatchWorkout use case failed: {e}")
+            for pending in batch:
+                if pending.result is None:
+                    pending.result = PatchWorkoutResult(
+                        success=False,
+                        error=str(e),
+                    )
+
+    def _stage(
+        self,
+        operations: List[PatchOperation],
+        workout_row: Dict[str, Any],
+    ) -> Any:
+        """
+        Validate and apply one request's operations to a workout row.
+
+        Returns:
+            (patched row, changes_applied), or a failed PatchWorkoutResult
+        """
+        # Step 2: Validate all operations upfront
+        validation_errors = self._validate_operations(operations, workout_row)
+        if validation_errors:
             return PatchWorkoutResult(
                 success=False,
-                error=e.message,
-                validation_errors=e.errors,
+                error="Patch operation validation failed",
+                validation_errors=validation_errors,
             )
 
+        # Step 3: Apply patches copy-on-write; the fetched row is never modified
+        cow = _CopyOnWrite(workout_row.get("workout_data") or {})
+        workout_data = cow.root
+
+        # Also track top-level fields that might change
+        title = workout_row.get("title") or workout_data.get("title")
+        description = workout_row.get("description") or workout_data.get("description")
+        tags = workout_row.get("tags") or workout_data.get("tags", [])
+
+        changes_applied = 0
+        for op in operations:
+            try:
+                workout_data, title, description, tags, changed = self._apply_operation(
+                    op, workout_data, title, description, tags, cow=cow
+                )
+                if changed:
+                    changes_applied += 1
+                else:
+                    # Log when operation doesn't result in change
+                    logger.debug(
+                        f"Operation {op.op} on {op.path} did not result in change "
+                        f"(possibly non-existent index or no-op)"
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to apply operation {op}: {e}")
+                return PatchWorkoutResult(
+                    success=False,
+                    error=f"Failed to apply operation: {str(e)}",
+                    validation_errors=[str(e)],
+                )
+
+        # Sync title/description/tags back into workout_data
+        if title:
+            workout_data["title"] = title
+        if description:
+            workout_data["description"] = description
+        if tags is not None:
+            workout_data["tags"] = tags
+
+        # Step 4: Re-validate the touched blocks via domain model
+        failure = self._validate_patched(workout_data, cow.touched_blocks)
+        if failure:
+            return failure
+
+        patched_row = {
+            **workout_row,
+            "workout_data": workout_data,
+            "title": title,
+            "description": description,
+            "tags": tags,
+        }
+        return patched_row, changes_applied
+
+    def _validate_patched(
+        self,
+        workout_data: Dict[str, Any],
+        touched_blocks: Optional[Set[int]],
+    ) -> Optional[PatchWorkoutResult]:
+        """
+        Validate a patched document, converting only the blocks it touched.
+
+        Untouched blocks are the stored ones and are not converted again;
+        top-level fields are always checked. ``touched_blocks`` of None
+        means every block is validated.
+        """
+        blocks = workout_data.get("blocks") or []
+        if touched_blocks is not None and isinstance(blocks, list):
+            sample = [
+                blocks[i] for i in sorted(touched_blocks)
+                if i < len(blocks)
+                and (not isinstance(blocks[i], dict) or _block_has_exercises(blocks[i]))
+            ]
+            if not sample:
+                # Only top-level fields changed (or touched blocks are now
+                # empty): one stored block stands in for the rest
+                sample = [
+                    b for b in blocks if isinstance(b, dict) and _block_has_exercises(b)
+                ][:1]
+            workout_data = {**workout_data, "blocks": sample}
+
+        try:
+            workout = blocks_to_workout(workout_data)
         except Exception as e:
-            logger.exception(f"PatchWorkout use case failed: {e}")
+            logger.warning(f"Workout validation failed after patch: {e}")
             return PatchWorkoutResult(
                 success=False,
-                error=str(e),
+                error="Workout validation failed after applying patches",
+                validation_errors=[str(e)],
             )
 
+        # Additional business validation
+        biz_errors = self._validate_workout_business_rules(workout)
+        if biz_errors:
+            return PatchWorkoutResult(
+                success=False,
+                error="Business validation failed",
+                validation_errors=biz_errors,
+            )
+        return None
+
     def _validate_operations(
         self, operations: List[PatchOperation], workout_row: Dict[str, Any]
     ) -> List[str]:
@@ -451,13 +676,22 @@ class PatchWorkoutUseCase:
         title: Optional[str],
         description: Optional[str],
         tags: Optional[List[str]],
+        *,
+        cow: Optional[_CopyOnWrite] = None,
     ) -> tuple[Dict[str, Any], Optional[str], Optional[str], Optional[List[str]], bool]:
         """
         Apply a single patch operation.
 
+        Writes go through ``cow`` so shared containers are copied before they
+        change; without one, workout_data is copied on write and left as is.
+
         Returns:
             Tuple of (workout_data, title, description, tags, changed)
         """
+        if cow is None:
+            cow = _CopyOnWrite(workout_data)
+        workout_data = cow.root
+
         segments = parse_path(op.path)
         root = segments[0]
         changed = False
@@ -527,13 +761,12 @@ class PatchWorkoutUseCase:
 
         # Handle exercises shorthand (first block)
         elif root == "exercises":
-            blocks = workout_data.get("blocks", [])
-            if not blocks:
-                blocks = [{"exercises": []}]
-                workout_data["blocks"] = blocks
-
-            first_block = blocks[0]
-            exercises = first_block.get("exercises", [])
+            if not workout_data.get("blocks", []):
+                workout_data["blocks"] = [{"exercises": []}]
+            first_block = cow.mutable("blocks", 0)
+            first_block["exercises"] = first_block.get("exercises", [])
+            exercises = cow.mutable("blocks", 0, "exercises")
+            cow.touch_block(0)
 
             if segments[1] == "-":
                 if op.op == "add":
@@ -556,24 +789,25 @@ class PatchWorkoutUseCase:
                         # Modify exercise field
                         field = segments[2]
                         if 0 <= ex_idx < len(exercises):
+                            exercise = cow.mutable("blocks", 0, "exercises", ex_idx)
                             if op.op == "replace":
-                                exercises[ex_idx][field] = op.value
+                                exercise[field] = op.value
                                 changed = True
                             elif op.op == "remove":
-                                exercises[ex_idx].pop(field, None)
+                                exercise.pop(field, None)
                                 changed = True
                 except ValueError:
                     pass
 
-            first_block["exercises"] = exercises
-
         # Handle blocks
         elif root == "blocks":
-            blocks = workout_data.get("blocks", [])
+            workout_data["blocks"] = workout_data.get("blocks", [])
+            blocks = cow.mutable("blocks")
 
             if segments[1] == "-":
                 if op.op == "add":
                     blocks.append(op.value)
+                    cow.touch_block(len(blocks) - 1)
                     changed = True
             else:
                 try:
@@ -583,14 +817,18 @@ class PatchWorkoutUseCase:
                         if op.op == "replace":
                             if 0 <= block_idx < len(blocks):
                                 blocks[block_idx] = op.value
+                                cow.touch_block(block_idx)
                                 changed = True
                         elif op.op == "remove":
                             if 0 <= block_idx < len(blocks):
                                 blocks.pop(block_idx)
+                                cow.touch_all_blocks()
                                 changed = True
                     elif segments[2] == "exercises":
-                        block = blocks[block_idx]
-                        block_exercises = block.get("exercises", [])
+                        block = cow.mutable("blocks", block_idx)
+                        block["exercises"] = block.get("exercises", [])
+                        block_exercises = cow.mutable("blocks", block_idx, "exercises")
+                        cow.touch_block(block_idx)
 
                         if len(segments) == 3:
                             # Cannot replace entire exercises array
@@ -614,29 +852,28 @@ class PatchWorkoutUseCase:
                                 # Exercise field
                                 field = segments[4]
                                 if 0 <= ex_idx < len(block_exercises):
+                                    exercise = cow.mutable("blocks", block_idx, "exercises", ex_idx)
                                     if op.op == "replace":
-                                        block_exercises[ex_idx][field] = op.value
+                                        exercise[field] = op.value
                                         changed = True
                                     elif op.op == "remove":
-                                        block_exercises[ex_idx].pop(field, None)
+                                        exercise.pop(field, None)
                                         changed = True
-
-                        block["exercises"] = block_exercises
                     else:
                         # Block field
                         field = segments[2]
                         if 0 <= block_idx < len(blocks):
+                            block = cow.mutable("blocks", block_idx)
+                            cow.touch_block(block_idx)
                             if op.op == "replace":
-                                blocks[block_idx][field] = op.value
+                                block[field] = op.value
                                 changed = True
                             elif op.op == "remove":
-                                blocks[block_idx].pop(field, None)
+                                block.pop(field, None)
                                 changed = True
                 except (ValueError, IndexError):
                     pass
 
-            workout_data["blocks"] = blocks
-
         return workout_data, title, description, tags, changed
 
     def _validate_workout_business_rules(self, workout: Workout) -> List[str]:
@@ -677,23 +914,49 @@ class PatchWorkoutUseCase:
         Note: This is a best-effort operation. If it fails, the patch
         operation still succeeds. Audit logging failures are logged
         but do not affect the main workflow.
-        """
-        try:
-            operations_data = [
-                {"op": op.op, "path": op.path, "value": op.value}
-                for op in operations
-            ]
 
-            self._workout_repo.log_patch_audit(
-                workout_id=workout_id,
-                user_id=user_id,
-                operations=operations_data,
-                changes_applied=changes_applied,
-            )
+        With a task runner the write is queued (and retried there) so the
+        patch response doesn't wait for it; it runs inline when there is
+        no runner or its queue is full.
+        """
+        operations_data = [
+            {"op": op.op, "path": op.path, "value": op.value}
+            for op in operations
+        ]
+
+        if self._task_runner is not None and self._task_runner.submit(
+            "patch_audit",
+            self._write_audit_trail,
+            workout_id,
+            user_id,
+            operations_data,
+            changes_applied,
+            key=user_id,
+            priority=TaskPriority.LOW,
+        ):
+            return
 
-            logger.info(
-                f"Logged {changes_applied} changes to audit trail for workout {workout_id}"
-            )
+        try:
+            self._write_audit_trail(workout_id, user_id, operations_data, changes_applied)
         except Exception as e:
             # Don't fail the operation if audit logging fails
             logger.warning(f"Failed to log audit trail for {workout_id}: {e}")
+
+    def _write_audit_trail(
+        self,
+        workout_id: str,
+        user_id: str,
+        operations_data: List[Dict[str, Any]],
+        changes_applied: int,
+    ) -> None:
+        """Write one audit trail entry (raises on failure)."""
+        self._workout_repo.log_patch_audit(
+            workout_id=workout_id,
+            user_id=user_id,
+            operations=operations_data,
+            changes_applied=changes_applied,
+        )
+
+        logger.info(
+            f"Logged {changes_applied} changes to audit trail for workout {workout_id}"
+        )
@@ -18,6 +18,9 @@ from domain.models import Workout
 
 logger = logging.getLogger(__name__)
 
+# Workouts per repository save_many() call in execute_many()
+DEFAULT_BATCH_SIZE = 100
+
 
 class WorkoutValidationError(Exception):
     """Raised when workout validation fails."""
@@ -51,6 +54,9 @@ class SaveWorkoutUseCase:
     4. Persist via repository
     5. Return saved workout with generated ID
 
+    execute_many() runs the same workflow for a list of workouts, validating
+    all of them first and persisting them in batches.
+
     Dependencies are injected via constructor for testability.
 
     Usage:
@@ -97,30 +103,10 @@ class SaveWorkoutUseCase:
             SaveWorkoutResult with success status and saved workout
         """
         try:
-            # Defense-in-depth: always reject workouts with 0 exercises,
-            # even when validate=False (AMA-561)
-            if workout.total_exercises == 0:
-                logger.warning(
-                    "Rejecting empty workout '%s': 0 exercises across %d blocks",
-                    workout.title,
-                    len(workout.blocks),
-                )
-                return SaveWorkoutResult(
-                    success=False,
-                    error="Workout must contain at least one exercise",
-                    validation_errors=["Workout has 0 exercises"],
-                )
-
-            # Step 1: Validate workout if requested
-            if validate:
-                validation_errors = self._validate_workout(workout)
-                if validation_errors:
-                    logger.warning(f"Workout validation failed: {validation_errors}")
-                    return SaveWorkoutResult(
-                        success=False,
-                        error="Workout validation failed",
-                        validation_errors=validation_errors,
-                    )
+            # Step 1: Validate workout
+            rejection = self._reject(workout, validate)
+            if rejection:
+                return rejection
 
             # Step 2: Determine create vs update
             is_update = workout.id is not None
@@ -177,6 +163,123 @@ class SaveWorkoutUseCase:
                 error=str(e),
             )
 
+    def execute_many(
+        self,
+        workouts: List[Workout],
+        user_id: str,
+        device: str,
+        *,
+        validate: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List[SaveWorkoutResult]:
+        """
+        Save many workouts (e.g. a whole program) with batched writes.
+
+        Every workout is validated before anything is written; if any is
+        rejected, none are saved. Valid batches are then persisted with
+        one repository save_many() call per ``batch_size`` workouts.
+
+        Args:
+            workouts: Domain Workout models to save
+            user_id: User profile ID for authorization
+            device: Target device type (garmin, apple, ios_companion)
+            validate: Whether to perform business validation (default True)
+            batch_size: Workouts per repository call
+
+        Returns:
+            One SaveWorkoutResult per workout, in input order
+        """
+        # Step 1: Validate everything up front
+        rejections = [self._reject(workout, validate) for workout in workouts]
+        if any(rejections):
+            skipped = SaveWorkoutResult(
+                success=False,
+                error="Not saved: another workout in the batch failed validation",
+            )
+            return [rejection or skipped for rejection in rejections]
+
+        logger.info(f"Saving {len(workouts)} workouts in batches of {batch_size}")
+        results: List[SaveWorkoutResult] = []
+
+        for start in range(0, len(workouts), batch_size):
+            chunk = workouts[start:start + batch_size]
+            try:
+                # Step 2: Convert domain models to repository format
+                items = [
+                    {
+                        "workout_data": _workout_to_blocks_format(workout),
+                        "sources": [src.value for src in workout.metadata.sources],
+                        "device": device,
+                        "title": workout.title,
+                        "description": workout.description,
+                        "workout_id": workout.id,
+                    }
+                    for workout in chunk
+                ]
+
+                # Step 3: Persist the chunk in one repository call
+                saved_rows = self._workout_repo.save_many(profile_id=user_id, workouts=items)
+            except Exception as e:
+                logger.exception(f"SaveWorkout batch failed: {e}")
+                results.extend(SaveWorkoutResult(success=False, error=str(e)) for _ in chunk)
+                continue
+
+            # Step 4: Build results
+            for workout, saved in zip(chunk, saved_rows):
+                is_update = workout.id is not None
+                if not saved:
+                    results.append(SaveWorkoutResult(
+                        success=False,
+                        error="Failed to save workout",
+                        is_update=is_update,
+                    ))
+                    continue
+                saved_id = saved.get("id")
+                results.append(SaveWorkoutResult(
+                    success=True,
+                    workout=workout.with_id(saved_id) if not workout.id else workout,
+                    workout_id=saved_id,
+                    is_update=is_update,
+                ))
+
+        return results
+
+    def _reject(self, workout: Workout, validate: bool) -> Optional[SaveWorkoutResult]:
+        """
+        Return a failed result if the workout must not be saved.
+
+        Args:
+            workout: Workout to check
+            validate: Whether to apply business validation
+
+        Returns:
+            Failed SaveWorkoutResult, or None if the workout can be saved
+        """
+        # Defense-in-depth: always reject workouts with 0 exercises,
+        # even when validate=False (AMA-561)
+        if workout.total_exercises == 0:
+            logger.warning(
+                "Rejecting empty workout '%s': 0 exercises across %d blocks",
+                workout.title,
+                len(workout.blocks),
+            )
+            return SaveWorkoutResult(
+                success=False,
+                error="Workout must contain at least one exercise",
+                validation_errors=["Workout has 0 exercises"],
+            )
+
+        if validate:
+            validation_errors = self._validate_workout(workout)
+            if validation_errors:
+                logger.warning(f"Workout validation failed: {validation_errors}")
+                return SaveWorkoutResult(
+                    success=False,
+                    error="Workout validation failed",
+                    validation_errors=validation_errors,
+                )
+        return None
+
     def _validate_workout(self, workout: Workout) -> List[str]:
         """
         Validate workout business rules.
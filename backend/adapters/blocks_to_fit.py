@@ -23,9 +23,13 @@ except ImportError:
 
 try:
     from backend.adapters.garmin_lookup import GarminExerciseLookup
+    from backend.core.exercise_name import split_exercise_name
+    from backend.core.spans import span
     LOOKUP_PATH = Path(__file__).parent.parent.parent / "shared" / "dictionaries" / "garmin_exercises.json"
 except ImportError:
     from garmin_lookup import GarminExerciseLookup
+    from exercise_name import split_exercise_name
+    from spans import span
     LOOKUP_PATH = Path(__file__).parent / "garmin_exercises.json"
 
 _lookup = None
@@ -98,12 +102,14 @@ def _is_user_confirmed_name(name):
     if not name or len(name) < 2:
         return False
 
+    parts = split_exercise_name(name)
+
     # Check for distance prefix (e.g., "500m Run", "1km Row")
-    if re.match(r'^[\d.]+\s*(m|km|mi)\s+', name, re.IGNORECASE):
+    if parts.has_distance_prefix:
         return False
 
     # Check for rep/set counts (e.g., "Push Up x10", "Squat 3x10")
-    if re.search(r'\s*\d*x\d+', name, re.IGNORECASE):
+    if parts.has_rep_count:
         return False
 
     # Check if it looks like Title Case (first letter of most words capitalized)
@@ -573,6 +579,7 @@ def detect_sport_type(category_ids):
     return 10, 20, "strength", warnings
 
 
+@span("export.fit")
 def to_fit(blocks_json, force_sport_type=None, use_lap_button=False):
     """
     Convert blocks JSON to Garmin FIT binary format.
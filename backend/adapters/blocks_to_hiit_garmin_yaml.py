@@ -11,6 +11,9 @@ from backend.adapters.blocks_to_hyrox_yaml import (
     map_exercise_to_garmin,
     add_category_to_exercise_name
 )
+from backend.core.exercise_name import split_exercise_name
+from backend.core.export_trace import export_trace, trace_stage
+from backend.core.spans import span
 
 
 def is_hiit_workout(blocks_json: dict) -> bool:
@@ -38,6 +41,7 @@ def is_hiit_workout(blocks_json: dict) -> bool:
     return False
 
 
+@span("export.hiit_yaml")
 def to_hiit_garmin_yaml(blocks_json: dict) -> str:
     """
     Convert blocks JSON format to Garmin Planner HIIT workout YAML format.
@@ -57,6 +61,11 @@ def to_hiit_garmin_yaml(blocks_json: dict) -> str:
       workouts:
         - "Workout Name"
     """
+    with export_trace("hiit_yaml", title=blocks_json.get("title")):
+        return _to_hiit_garmin_yaml(blocks_json)
+
+
+def _to_hiit_garmin_yaml(blocks_json: dict) -> str:
     settings = {"deleteSameNameWorkout": True}
     workouts = {}
 
@@ -127,7 +136,8 @@ def to_hiit_garmin_yaml(blocks_json: dict) -> str:
         "schedulePlan": schedule_plan
     }
 
-    return yaml.safe_dump(doc, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    with trace_stage("yaml_dump"):
+        return yaml.safe_dump(doc, sort_keys=False, default_flow_style=False, allow_unicode=True)
 
 
 def _exercise_to_garmin_planner_step(ex: dict) -> dict:
@@ -148,9 +158,8 @@ def _exercise_to_garmin_planner_step(ex: dict) -> dict:
     is_running = "run" in normalized_name and distance_m is not None
 
     # Build notes/description from original exercise name and details
-    original_clean = ex_name.strip()
     # Remove prefixes like "A1:", "B2:", etc.
-    original_clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', original_clean, flags=re.IGNORECASE).strip()
+    original_clean = split_exercise_name(ex_name).name
 
     # Check if reps/distance are already in the name to avoid duplication
     has_reps_in_name = bool(re.search(r'\b\d+\s+reps?\b', original_clean, re.IGNORECASE))
@@ -1,14 +1,21 @@
+import logging
 import yaml
 import re
 import pathlib
 from datetime import datetime, timedelta
+from functools import lru_cache
 from backend.core.normalize import normalize
+from backend.core.exercise_name import PARSE_CACHE_SIZE, split_exercise_name
 from backend.core.match import classify
 from backend.core.garmin_matcher import fuzzy_match_garmin, find_garmin_exercise
 from backend.core.user_mappings import get_user_mapping
 from backend.core.exercise_categories import add_category_to_exercise_name
-from backend.adapters.cir_to_garmin_yaml import GARMIN
+from backend.core.dictionary_snapshot import load_dictionary
 from backend.adapters.garmin_lookup import GarminExerciseLookup
+from backend.core.export_trace import current_trace, export_trace, trace_stage
+from backend.core.spans import span
+
+logger = logging.getLogger(__name__)
 
 # Singleton instance for Garmin exercise lookup
 _garmin_lookup = None
@@ -67,6 +74,26 @@ def load_user_defaults():
     }
 
 
+# parse_exercise_name / clean_exercise_name patterns
+_NAME_SEPARATORS = re.compile(r'[/:]')
+_DESC_EQUIPMENT_PREFIX = re.compile(r'^(KB|DB|OB|TRX)\s+', re.IGNORECASE)
+_DISTANCE_IN_NAME = re.compile(r'(\d+)\s*[Mm]\s+(.+)', re.IGNORECASE)
+_TRAILING_WEIGHT_SPEC = re.compile(r'\s*\([^)]+\)\s*$')
+_WEIGHT_SPEC = re.compile(r'\s*\([^)]+\)\s*')
+_REPS_TAIL = re.compile(r'\s+X\d+.*$', re.IGNORECASE)
+_REP_RANGE_TAIL = re.compile(r'\s+X[0-9-]+\s+[a-z0-9]+\s*$', re.IGNORECASE)
+_SPECIAL_CHARS = re.compile(r'[§©®™]')
+_TRAILING_CHAR = re.compile(r'\s+[0-9a-z]\s*$', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+_REPS_WORD = re.compile(r'\d+\s+reps?', re.IGNORECASE)
+
+
+def _title_words(name: str) -> str:
+    """Title case word by word, keeping "into" lowercase."""
+    return ' '.join(w.capitalize() for w in name.split()).replace(' Into ', ' into ')
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_exercise_name(ex_name: str) -> tuple[str, str, str]:
     """
     Parse exercise name to extract base name, reps description, and original description.
@@ -76,99 +103,53 @@ def parse_exercise_name(ex_name: str) -> tuple[str, str, str]:
     - "B1: DB INCLINE BENCH PRESS X8" -> ("DB INCLINE BENCH PRESS", "x8", "8 reps")
     - "D2: 200M SKI" -> ("SKI", "", "200m")
     """
-    original = ex_name
-    # Remove prefix like "A1;", "A1:", "B1:", etc.
-    ex_name = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
-
-    reps_desc = ""
-    original_desc = ""
-
-    # Try to extract X10, X8 pattern at the end with "EACH SIDE"
-    match = re.search(r'\s+X\s*(\d+)\s+EACH\s+SIDE$', ex_name, re.IGNORECASE)
-    if match:
-        reps_desc = f"x{match.group(1)} each side"
-        base_name = ex_name[:match.start()].strip()
-        # Extract core exercise name
-        parts = re.split(r'[/:]', base_name)
-        if len(parts) > 1:
-            desc_name = parts[-1].strip()
-        else:
-            desc_name = base_name
+    parts = split_exercise_name(ex_name)
+    base_name = parts.name_without_reps
 
-        # Remove equipment prefixes
-        desc_name = re.sub(r'^(KB|DB|OB|TRX)\s+', '', desc_name, flags=re.IGNORECASE).strip()
-
-        # Title case
-        words = desc_name.split()
-        desc_name = ' '.join(w.capitalize() for w in words)
-        desc_name = desc_name.replace(' Into ', ' into ')
-        original_desc = f"{desc_name} x{match.group(1)} each side"
-        return base_name, reps_desc, original_desc
-
-    # Try to extract X10, X8 pattern at the end
-    match = re.search(r'\s+X\s*(\d+)$', ex_name, re.IGNORECASE)
-    if match:
-        reps_desc = f"x{match.group(1)}"
-        base_name = ex_name[:match.start()].strip()
-
-        # Extract core exercise name (remove equipment prefixes like CABLE/BAND, KB, DB, etc.)
-        # Split by common separators and take the main part
-        parts = re.split(r'[/:]', base_name)
-        if len(parts) > 1:
-            # Take the last meaningful part (usually the exercise name)
-            desc_name = parts[-1].strip()
-        else:
-            desc_name = base_name
+    if parts.reps_style == "each_side":
+        # Extract core exercise name and remove equipment prefixes
+        desc_name = _NAME_SEPARATORS.split(base_name)[-1].strip()
+        desc_name = _DESC_EQUIPMENT_PREFIX.sub('', desc_name).strip()
+        original_desc = f"{_title_words(desc_name)} x{parts.reps} each side"
+        return base_name, f"x{parts.reps} each side", original_desc
 
+    if parts.reps_style == "x":
         # Use the full base_name for description to preserve KB/DB/etc prefixes
-        desc_name = base_name
-
-        # Title case with proper capitalization (first letter uppercase, rest lowercase)
-        words = desc_name.split()
-        desc_name = ' '.join(w.capitalize() for w in words)
-        # Fix common terms - "Into" not "INTO"
-        desc_name = desc_name.replace(' Into ', ' into ')
-        original_desc = f"{desc_name} x{match.group(1)}"
-        return base_name, reps_desc, original_desc
-
-    # Check for Xi2 pattern
-    match = re.search(r'\s+Xi(\d+)$', ex_name, re.IGNORECASE)
-    if match:
-        reps_desc = f"x{match.group(1)}"
-        base_name = ex_name[:match.start()].strip()
+        original_desc = f"{_title_words(base_name)} x{parts.reps}"
+        return base_name, f"x{parts.reps}", original_desc
+
+    if parts.reps_style == "xi":
         desc_name = base_name.replace('/', ' ').title()
-        original_desc = f"{desc_name} x{match.group(1)}"
-        return base_name, reps_desc, original_desc
+        return base_name, f"x{parts.reps}", f"{desc_name} x{parts.reps}"
 
     # Check for distance pattern like "200M SKI" or "100 m KB Farmers (32/24kg)"
-    distance_match = re.search(r'(\d+)\s*[Mm]\s+(.+)', ex_name, re.IGNORECASE)
+    distance_match = _DISTANCE_IN_NAME.search(parts.name)
     if distance_match:
         distance = f"{distance_match.group(1)}m"
-        base_name = distance_match.group(2).strip()
         # Remove weight specifications in parentheses like "(32/24kg)"
-        base_name = re.sub(r'\s*\([^)]+\)\s*$', '', base_name, flags=re.IGNORECASE).strip()
-        original_desc = distance
-        return base_name, "", original_desc
+        base_name = _TRAILING_WEIGHT_SPEC.sub('', distance_match.group(2).strip()).strip()
+        return base_name, "", distance
 
-    return ex_name, "", ""
+    return parts.name, "", ""
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def clean_exercise_name(ex_name: str) -> str:
     """Clean exercise name for matching."""
     # Remove common prefixes and suffixes
     ex_name = ex_name.strip()
     # Remove weight specifications in parentheses like "(32/24kg)" or "(9/6kg)"
-    ex_name = re.sub(r'\s*\([^)]+\)\s*', ' ', ex_name, flags=re.IGNORECASE)
+    ex_name = _WEIGHT_SPEC.sub(' ', ex_name)
     # Remove "X10", "X8" etc if still there (but keep words before numbers)
-    ex_name = re.sub(r'\s+X\d+.*$', '', ex_name, flags=re.IGNORECASE)
+    ex_name = _REPS_TAIL.sub('', ex_name)
     # Remove patterns like "X4 wb", "X6-10 0"
-    ex_name = re.sub(r'\s+X[0-9-]+\s+[a-z0-9]+\s*$', '', ex_name, flags=re.IGNORECASE)
+    ex_name = _REP_RANGE_TAIL.sub('', ex_name)
     # Remove special characters like §
-    ex_name = re.sub(r'[§©®™]', '', ex_name)
+    ex_name = _SPECIAL_CHARS.sub('', ex_name)
     # Remove trailing single characters/numbers
-    ex_name = re.sub(r'\s+[0-9a-z]\s*$', '', ex_name, flags=re.IGNORECASE)
+    ex_name = _TRAILING_CHAR.sub('', ex_name)
     # Clean up extra spaces
-    ex_name = re.sub(r'\s+', ' ', ex_name).strip()
+    ex_name = _WHITESPACE.sub(' ', ex_name).strip()
     return ex_name.strip()
 
 
@@ -178,6 +159,25 @@ def map_exercise_to_garmin(ex_name: str, ex_reps=None, ex_distance_m=None, use_u
     Returns (garmin_name, description, mapping_info)
     mapping_info contains: {source, confidence, original_name}
     """
+    with trace_stage("map_exercise"):
+        garmin_name, description, mapping_info = _map_exercise_to_garmin(
+            ex_name, ex_reps=ex_reps, ex_distance_m=ex_distance_m, use_user_mappings=use_user_mappings
+        )
+
+    trace = current_trace()
+    if trace is not None:
+        trace.event(
+            "exercise_mapped",
+            original_name=ex_name,
+            garmin_name=garmin_name,
+            source=mapping_info.get("source"),
+            method=mapping_info.get("method"),
+            confidence=mapping_info.get("confidence"),
+        )
+    return garmin_name, description, mapping_info
+
+
+def _map_exercise_to_garmin(ex_name: str, ex_reps=None, ex_distance_m=None, use_user_mappings: bool = True) -> tuple[str, str, dict]:
     mapping_info = {
         "original_name": ex_name,
         "source": None,
@@ -386,7 +386,7 @@ def map_exercise_to_garmin(ex_name: str, ex_reps=None, ex_distance_m=None, use_u
         result = classify(clean_name)
         canonical = result["canonical"] if result["status"] != "unknown" else None
         if canonical:
-            garmin_map = GARMIN.get(canonical)
+            garmin_map = load_dictionary("garmin_map").get(canonical)
             if garmin_map:
                 garmin_name = garmin_map["name"]
                 mapping_info["source"] = "canonical_mapping"
@@ -455,6 +455,16 @@ def map_exercise_to_garmin(ex_name: str, ex_reps=None, ex_distance_m=None, use_u
                 "GARMIN_EXPORT_FALLBACK generic step used for %r (original=%r mapped=%r candidates=%r conf=%r)",
                 ex_name, ex_name, mapped_name, candidate_names, final_confidence
             )
+            trace = current_trace()
+            if trace is not None:
+                trace.event(
+                    "generic_fallback",
+                    logging.WARNING,
+                    original_name=ex_name,
+                    mapped_name=mapped_name,
+                    candidates=candidate_names,
+                    confidence=final_confidence,
+                )
 
 
         if ex_distance_m:
@@ -509,15 +519,13 @@ def map_exercise_to_garmin(ex_name: str, ex_reps=None, ex_distance_m=None, use_u
     mapping_info["garmin_name"] = garmin_name
 
     # Build description from original exercise name with details
-    original_with_details = ex_name.strip()
-    # Clean up the original name but keep reps/details
-    # Remove prefixes like "A1:", "B2:", etc.
-    original_with_details = re.sub(r'^[A-Z]\d+[:\s;]+', '', original_with_details, flags=re.IGNORECASE)
-    original_with_details = original_with_details.strip()
+    # Clean up the original name but keep reps/details (drops "A1:", "B2:", etc.)
+    parts = split_exercise_name(ex_name)
+    original_with_details = parts.name
 
     # Check if reps are already in the name (like "X10", "x5", etc.)
-    has_reps_in_name = bool(re.search(r'[Xx]\d+', original_with_details))
-    has_reps_word = bool(re.search(r'\d+\s+reps?', original_with_details, re.IGNORECASE))
+    has_reps_in_name = parts.has_rep_count
+    has_reps_word = bool(_REPS_WORD.search(original_with_details))
 
     # Check if the rep number from ex_reps is already represented in the name
     rep_number_already_in_name = False
@@ -574,10 +582,16 @@ def workout_name_from_title(title: str) -> str:
     return name or "workout"
 
 
+@span("export.hyrox_yaml")
 def to_hyrox_yaml(blocks_json: dict) -> str:
     """
     Convert blocks JSON format to Hyrox YAML format.
     """
+    with export_trace("hyrox_yaml", title=blocks_json.get("title")):
+        return _to_hyrox_yaml(blocks_json)
+
+
+def _to_hyrox_yaml(blocks_json: dict) -> str:
     settings = {"deleteSameNameWorkout": True}
     workouts = {}
 
@@ -690,7 +704,7 @@ def to_hyrox_yaml(blocks_json: dict) -> str:
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"x{reps}", ex_notes)
                     else:
                         # Build description with mapping reason
-                        original_clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
+                        original_clean = split_exercise_name(ex_name).name
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"{original_clean} x{reps} ({reason})", ex_notes)
                 elif reps_range:
                     # reps_range specified (e.g., "6-8") - use upper bound for YAML
@@ -702,7 +716,7 @@ def to_hyrox_yaml(blocks_json: dict) -> str:
                     if not reason:
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"x{upper_reps}", ex_notes)
                     else:
-                        original_clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
+                        original_clean = split_exercise_name(ex_name).name
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"{original_clean} x{upper_reps} ({reason})", ex_notes)
                 else:
                     # No reps specified - use "lap" (press lap button when done)
@@ -813,7 +827,7 @@ def to_hyrox_yaml(blocks_json: dict) -> str:
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"x{reps}", ex_notes)
                     else:
                         # Build description with mapping reason
-                        original_clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
+                        original_clean = split_exercise_name(ex_name).name
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"{original_clean} x{reps} ({reason})", ex_notes)
                 elif reps_range:
                     # reps_range specified (e.g., "6-8") - use upper bound for YAML
@@ -825,7 +839,7 @@ def to_hyrox_yaml(blocks_json: dict) -> str:
                     if not reason:
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"x{upper_reps}", ex_notes)
                     else:
-                        original_clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
+                        original_clean = split_exercise_name(ex_name).name
                         ex_entry[garmin_name_with_category] = format_exercise_value(f"{original_clean} x{upper_reps} ({reason})", ex_notes)
                 else:
                     # No reps specified - use "lap" (press lap button when done)
@@ -928,7 +942,8 @@ def to_hyrox_yaml(blocks_json: dict) -> str:
         "schedulePlan": schedule_plan
     }
 
-    result = yaml.safe_dump(doc, sort_keys=False, default_flow_style=False, allow_unicode=True)
+    with trace_stage("yaml_dump"):
+        result = yaml.safe_dump(doc, sort_keys=False, default_flow_style=False, allow_unicode=True)
 
     # Clean up
     if hasattr(to_hyrox_yaml, '_mapping_notes'):
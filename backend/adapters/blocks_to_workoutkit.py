@@ -1,6 +1,8 @@
 """Converter from blocks JSON format to Apple WorkoutKit DTO format."""
 import re
 from typing import List, Optional
+from backend.core.exercise_name import split_exercise_name
+from backend.core.spans import span
 from backend.adapters.workoutkit_schemas import (
     WKPlanDTO,
     WKIntervalDTO,
@@ -24,12 +26,7 @@ def parse_exercise_name(ex_name: str) -> str:
     """Extract clean exercise name from formatted name like 'A1: EXERCISE X10'."""
     if not ex_name:
         return ""
-    # Remove prefix like "A1:", "B2:", etc.
-    clean = re.sub(r'^[A-Z]\d+[:\s;]+', '', ex_name, flags=re.IGNORECASE).strip()
-    # Remove trailing patterns like "X10", "X5", "wb", etc.
-    clean = re.sub(r'\s+X\s*\d+.*$', '', clean, flags=re.IGNORECASE).strip()
-    clean = re.sub(r'\s+wb$', '', clean, flags=re.IGNORECASE).strip()
-    return clean
+    return split_exercise_name(ex_name).base_name
 
 
 def exercise_to_step(exercise: dict, default_rest_sec: Optional[int] = None) -> Optional[WKStepDTO]:
@@ -49,21 +46,16 @@ def exercise_to_step(exercise: dict, default_rest_sec: Optional[int] = None) ->
     )
 
     # Use the clean exercise name for display (AMA-243: preserve original name)
-    clean_name = parse_exercise_name(ex_name)
+    name_parts = split_exercise_name(ex_name)
+    clean_name = name_parts.base_name
     # For reps steps, use Garmin name if available; for time/distance steps, use clean name
     garmin_exercise_name = garmin_name if garmin_name else clean_name
     display_name = clean_name  # Use original name for iOS display (AMA-243)
 
     # Check for "EACH SIDE" pattern and extract reps if present
-    each_side_match = re.search(r'X\s*(\d+)\s+EACH\s+SIDE', ex_name, re.IGNORECASE)
-    if each_side_match and reps is None:
-        # If exercise has "X § EACH SIDE" or similar, use a default rep count
+    if name_parts.each_side_reps is not None and reps is None:
         # For single-arm exercises, typically we do both sides
-        reps_from_name = each_side_match.group(1)
-        if reps_from_name.isdigit():
-            reps = int(reps_from_name) * 2  # Both sides
-        else:
-            reps = 10  # Default for "EACH SIDE" without number
+        reps = name_parts.each_side_reps * 2
 
     # Priority: time > distance > reps
     if duration_sec is not None:
@@ -121,7 +113,7 @@ def exercise_to_step(exercise: dict, default_rest_sec: Optional[int] = None) ->
             )
 
     # Check for "EACH SIDE" without number - default to 10 reps (5 each side)
-    if re.search(r'EACH\s+SIDE', ex_name, re.IGNORECASE) and reps is None:
+    if name_parts.each_side and reps is None:
         return RepsStep(
             kind="reps",
             reps=10,  # Default: 5 each side
@@ -293,6 +285,7 @@ def block_to_intervals(block: dict, default_rest_sec: Optional[int] = None) -> L
     return intervals
 
 
+@span("export.workoutkit")
 def to_workoutkit(blocks_json: dict) -> WKPlanDTO:
     """Convert blocks JSON to WorkoutKit DTO format.
 
@@ -7,6 +7,7 @@ from typing import List, Optional, Tuple
 from xml.etree.ElementTree import Element, SubElement, tostring
 from backend.adapters.zwo_schemas import Workout, Step, Target
 from backend.adapters.blocks_to_hyrox_yaml import extract_rounds
+from backend.core.spans import span
 
 
 def extract_power_target(ex_name: str) -> Optional[Target]:
@@ -457,6 +458,7 @@ def block_to_steps(block: dict, sport: str) -> List[Step]:
     return steps
 
 
+@span("export.zwo")
 def to_zwo(blocks_json: dict, sport: Optional[str] = None) -> str:
     """Convert blocks JSON to Zwift ZWO XML format.
 
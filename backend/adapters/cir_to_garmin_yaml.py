@@ -1,12 +1,24 @@
 import yaml, pathlib
 
+from backend.core.dictionary_snapshot import load_dictionary
+from backend.core.spans import span
 from shared.schemas.cir import CIR
 
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 
-GARMIN = yaml.safe_load((ROOT / "shared/dictionaries/garmin_map.yaml").read_text())
+
+
+def __getattr__(name):
+
+    # GARMIN (garmin_map.yaml) is loaded lazily from the dictionary snapshot.
+
+    if name == "GARMIN":
+
+        return load_dictionary("garmin_map")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -14,7 +26,7 @@ def step_from_ex(ex):
 
     can = ex.canonical_name
 
-    m = GARMIN.get(can, None)
+    m = load_dictionary("garmin_map").get(can, None)
 
     if not m:
 
@@ -34,6 +46,7 @@ def step_from_ex(ex):
 
 
 
+@span("export.garmin_yaml")
 def to_garmin_yaml(cir: CIR) -> str:
 
     steps = []
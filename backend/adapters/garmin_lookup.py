@@ -1,7 +1,8 @@
 """
 Garmin Exercise Lookup Module
 
-Copy this file + garmin_exercises.json to your project.
+Copy this file + garmin_exercises.json + backend/core/exercise_name.py
+to your project.
 
 Usage:
     from garmin_lookup import GarminExerciseLookup
@@ -12,18 +13,36 @@ Usage:
 """
 
 import json
-import re
 from pathlib import Path
 from difflib import SequenceMatcher
 
+try:
+    from backend.core.dictionary_snapshot import SOURCES, DICTIONARIES_DIR, load_dictionary
+    SNAPSHOT_DATA_PATH = (DICTIONARIES_DIR / SOURCES["garmin_exercises"]).resolve()
+except ImportError:
+    # Standalone copy of this module: always parse the JSON file
+    load_dictionary = None
+    SNAPSHOT_DATA_PATH = None
+
+try:
+    from backend.core.exercise_name import lookup_key
+except ImportError:
+    from exercise_name import lookup_key
+
 
 class GarminExerciseLookup:
     def __init__(self, data_path=None):
-        if data_path is None:
-            data_path = Path(__file__).parent / "garmin_exercises.json"
-
-        with open(data_path) as f:
-            data = json.load(f)
+        # The shared dataset is served from the precompiled dictionary
+        # snapshot instead of re-parsing the JSON for every lookup instance
+        if load_dictionary is not None and (
+            data_path is None or Path(data_path).resolve() == SNAPSHOT_DATA_PATH
+        ):
+            data = load_dictionary("garmin_exercises")
+        else:
+            if data_path is None:
+                data_path = Path(__file__).parent / "garmin_exercises.json"
+            with open(data_path) as f:
+                data = json.load(f)
 
         self.categories = data["categories"]
         self.exercises = data["exercises"]
@@ -53,37 +72,13 @@ class GarminExerciseLookup:
         }
 
         # Build reverse lookup: category_name -> category_id
-        self.category_ids = {
+        self.category_ids = data.get("category_ids") or {
             v["name"]: v["id"] for v in self.categories.values()
         }
 
     def normalize(self, name):
-        """Normalize exercise name for matching."""
-        name = name.lower().strip()
-        # Remove trailing pipe characters that may come from canonical format parsing
-        name = name.rstrip('|').strip()
-
-        # Remove common prefixes like A1:, B2;, etc
-        name = re.sub(r'^[a-z]\d+[;:\s]+', '', name, flags=re.IGNORECASE)
-
-        # Remove equipment prefixes
-        for prefix in ['db ', 'kb ', 'bb ', 'sb ', 'mb ', 'trx ', 'cable ', 'band ']:
-            if name.startswith(prefix):
-                name = name[len(prefix):]
-
-        # Remove rep counts like x10, X8
-        name = re.sub(r'\s*x\s*\d+.*$', '', name, flags=re.IGNORECASE)
-
-        # Remove "each side", "per side", etc
-        name = re.sub(r'\s+(each|per)\s+(side|arm|leg).*$', '', name, flags=re.IGNORECASE)
-
-        # Remove distance at END like "200m", "1km", "1.5 km"
-        name = re.sub(r'\s*[\d.]+\s*(m|km)\s*$', '', name, flags=re.IGNORECASE)
-
-        # Remove distance at START like "1km Run", "500m Row"
-        name = re.sub(r'^[\d.]+\s*(m|km)\s+', '', name, flags=re.IGNORECASE)
-
-        return name.strip()
+        """Normalize exercise name for matching (see exercise_name.lookup_key)."""
+        return lookup_key(name)
 
     def find(self, exercise_name, lang="en"):
         """
@@ -2,6 +2,8 @@ import re
 from collections import OrderedDict
 from typing import List, Optional, Tuple
 
+from backend.core.exercise_name import split_exercise_name
+from backend.core.spans import span
 from shared.schemas.cir import CIR, Workout, Block, Exercise
 
 
@@ -19,33 +21,17 @@ STRUCTURE_TO_BLOCK_TYPE = {
 
 def _extract_reps_from_name(name: str) -> Optional[int]:
     """Extract reps from exercise name prefix (e.g., '100 wall balls' -> 100)."""
-    match = re.match(r'^(\d+)\s+(.+)$', name)
-    if match:
-        return int(match.group(1))
-    return None
+    return split_exercise_name(name).leading_count
 
 
 def _extract_distance_from_name(name: str) -> Optional[Tuple[float, str]]:
     """Extract distance from exercise name (e.g., '1000m Ski' -> (1000, 'm'))."""
-    match = re.match(r'^(\d+(?:\.\d+)?)\s*(m|km|miles?|yards?)\s+(.+)$', name, re.IGNORECASE)
-    if match:
-        value = float(match.group(1))
-        unit = match.group(2).lower()
-        # Normalize unit
-        if unit.startswith('m') and len(unit) == 1:
-            unit = 'm'  # meters
-        elif unit == 'mi':
-            unit = 'miles'
-        return (value, unit)
-    return None
+    return split_exercise_name(name).distance
 
 
 def _clean_name_of_numeric_prefix(name: str) -> str:
     """Remove numeric prefix from exercise name (e.g., '100 wall balls' -> 'wall balls')."""
-    match = re.match(r'^\d+\s+(.+)$', name)
-    if match:
-        return match.group(1)
-    return name
+    return split_exercise_name(name).count_stripped or name
 
 
 def _detect_timed_station_format(block_dict: dict) -> Optional[int]:
@@ -398,6 +384,7 @@ def _blocks_from_structured_input(ingest_json: dict) -> List[Block]:
     return blocks
 
 
+@span("export.ingest_to_cir")
 def to_cir(ingest_json: dict) -> CIR:
     """Convert ingest JSON to CIR format.
 
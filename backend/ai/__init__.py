@@ -1,5 +1,5 @@
 """AI client management for mapper API."""
-from .client_factory import AIClientFactory, AIRequestContext
+from .client_factory import AIClientFactory, AIRequestContext, span_tracking_headers
 from .retry import (
     ai_retry,
     create_retry_decorator,
@@ -16,4 +16,5 @@ __all__ = [
     "is_retryable_error",
     "retry_async_call",
     "retry_sync_call",
+    "span_tracking_headers",
 ]
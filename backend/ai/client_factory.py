@@ -1,12 +1,15 @@
 """AI client factory with Helicone integration support."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import httpx
+from backend.core.spans import current_span_path
 from backend.settings import get_settings
 
 
@@ -25,6 +28,11 @@ _VALID_HEADER_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\-]+$")
 # Headers that should not be logged (contain sensitive credentials)
 _SENSITIVE_HEADERS = {"helicone-auth", "authorization", "api-key"}
 
+# Shared AsyncAnthropic clients, one per event loop (their connection pools
+# are loop-bound). Per-request clients are cheap with_options() views on these.
+_async_anthropic_clients: Dict[int, Tuple[asyncio.AbstractEventLoop, Any]] = {}
+_async_clients_lock = threading.Lock()
+
 
 def _create_httpx_client_with_logging_filter(
     timeout: float = DEFAULT_TIMEOUT,
@@ -123,6 +131,11 @@ class AIRequestContext:
         # Add environment for filtering in Helicone dashboard
         headers["Helicone-Property-Environment"] = _sanitize_header_value(get_settings().environment)
 
+        # Add the request stage making the call (open spans, outermost first)
+        span_path = current_span_path()
+        if span_path:
+            headers["Helicone-Property-Span"] = _sanitize_header_value(span_path)
+
         # Add custom properties with sanitization
         for key, value in self.custom_properties.items():
             header_name = _sanitize_header_name(key)
@@ -133,6 +146,21 @@ class AIRequestContext:
         return headers
 
 
+def span_tracking_headers() -> Dict[str, str]:
+    """
+    Per-call header naming the spans open at the call site.
+
+    Clients created once and reused (e.g. the embedding client) carry
+    default headers from their creation time; pass this as extra_headers
+    on each call instead. Empty unless Helicone is enabled and a span is open.
+    """
+    settings = get_settings()
+    span_path = current_span_path()
+    if not span_path or not (settings.helicone_enabled and settings.helicone_api_key):
+        return {}
+    return {"Helicone-Property-Span": _sanitize_header_value(span_path)}
+
+
 class AIClientFactory:
     """Factory for creating AI clients with optional Helicone integration."""
 
@@ -269,3 +297,94 @@ class AIClientFactory:
         logger.debug("Creating Anthropic client (direct)")
 
         return Anthropic(**client_kwargs)
+
+    @staticmethod
+    def create_async_anthropic_client(
+        context: AIRequestContext | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Any:
+        """
+        Get an AsyncAnthropic client for the running event loop.
+
+        Unlike create_anthropic_client(), the underlying client (and its
+        connection pool) is created once per event loop and shared; each call
+        returns a with_options() view carrying this request's tracking headers
+        and timeout, so streaming chats reuse warm connections.
+
+        Args:
+            context: Request context for tracking and observability
+            timeout: Request timeout in seconds
+
+        Returns:
+            AsyncAnthropic client instance
+
+        Raises:
+            ImportError: If anthropic package is not installed
+            ValueError: If required API keys are not configured
+        """
+        base = _shared_async_anthropic_client()
+
+        # Tracking headers only mean something to the Helicone proxy
+        default_headers: Dict[str, str] = {}
+        settings = get_settings()
+        if context and settings.helicone_enabled and settings.helicone_api_key:
+            default_headers.update(context.to_tracking_headers())
+
+        return base.with_options(timeout=timeout, default_headers=default_headers)
+
+
+def _shared_async_anthropic_client() -> Any:
+    """The running loop's AsyncAnthropic client, created on first use."""
+    try:
+        from anthropic import AsyncAnthropic
+    except ImportError as e:
+        raise ImportError("Anthropic library not installed. Run: pip install anthropic") from e
+
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        entry = _async_anthropic_clients.get(id(loop))
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        settings = get_settings()
+        api_key = settings.ANTHROPIC_API_KEY
+        if not api_key:
+            raise ValueError("Anthropic API key not configured. Set ANTHROPIC_API_KEY environment variable.")
+
+        client_kwargs: Dict[str, Any] = {"api_key": api_key, "timeout": DEFAULT_TIMEOUT}
+
+        if settings.helicone_enabled:
+            if not settings.helicone_api_key:
+                logger.warning(
+                    "helicone_enabled=true but helicone_api_key not set. "
+                    "Falling back to direct Anthropic API calls."
+                )
+            else:
+                client_kwargs["base_url"] = _HELICONE_ANTHROPIC_BASE_URL
+                client_kwargs["default_headers"] = {
+                    "Helicone-Auth": f"Bearer {settings.helicone_api_key}",
+                }
+
+        # Clients of loops that have since closed cannot be reused
+        for key, (other_loop, _) in list(_async_anthropic_clients.items()):
+            if other_loop.is_closed():
+                del _async_anthropic_clients[key]
+
+        logger.debug("Creating shared AsyncAnthropic client")
+        client = AsyncAnthropic(**client_kwargs)
+        _async_anthropic_clients[id(loop)] = (loop, client)
+        return client
+
+
+async def close_async_ai_clients() -> None:
+    """Close the shared async AI clients (called on app shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        clients = list(_async_anthropic_clients.values())
+        _async_anthropic_clients.clear()
+    for other_loop, client in clients:
+        if other_loop is loop:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close AsyncAnthropic client: {e}")
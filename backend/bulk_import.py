@@ -18,10 +18,11 @@ Note: Pydantic models are now in api/schemas/bulk_import.py
 """
 
 import uuid
+import time
 import base64
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Literal
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Literal
 from datetime import datetime, timezone
 
 from backend.parsers import (
@@ -30,13 +31,21 @@ from backend.parsers import (
     ParseResult,
     ParsedWorkout,
     URLParser,
-    fetch_url_metadata_batch,
+    URLMetadata,
     ImageParser,
-    parse_images_batch,
+    ImageParseResult,
     is_supported_image,
 )
 from backend.services.content_classifier import classify_content, ContentCategory, ClassificationConfidence
-from backend.core.garmin_matcher import find_garmin_exercise, get_garmin_suggestions
+from backend.services.rate_limiter import FEATURE_CLASSIFICATION, get_rate_limiter
+from backend.services.bulk_import_executor import (
+    BulkImportExecutor,
+    ImportJob,
+    get_bulk_import_executor,
+    match_exercise_names,
+    parse_file_source,
+)
+from infrastructure.db.workout_repository import find_existing_workouts
 
 # Import Pydantic models from api/schemas (AMA-591)
 from api.schemas.bulk_import import (
@@ -72,6 +81,19 @@ MATCH_AUTO_THRESHOLD = 0.90      # 90%+ = auto-match
 MATCH_REVIEW_THRESHOLD = 0.70    # 70-90% = needs review
 MATCH_UNMAPPED_THRESHOLD = 0.50  # <50% = unmapped/new
 
+# Exercise names per process-pool task when matching
+MATCH_CHUNK_SIZE = 50
+
+# ============================================================================
+# Import Execution Constants
+# ============================================================================
+
+IMPORT_BATCH_SIZE = 25           # Workouts per multi-row insert
+IMPORT_PARALLEL_BATCHES = 2      # Insert batches in flight at once
+DETECTED_ITEMS_BATCH_SIZE = 500  # Detected items per multi-row insert
+PROGRESS_EVERY_ITEMS = 50        # Coalesce progress writes/cancel checks...
+PROGRESS_INTERVAL_MS = 1000      # ...to at most one per N items or T ms
+
 # ============================================================================
 # Re-export Pydantic models for backwards compatibility
 # ============================================================================
@@ -100,6 +122,134 @@ __all__ = [
 ]
 
 
+# ============================================================================
+# Import Progress
+# ============================================================================
+
+class _ImportProgress:
+    """
+    Coalesced progress writes and cancellation checks for a running import.
+
+    Talks to the database at most once per PROGRESS_EVERY_ITEMS items or
+    PROGRESS_INTERVAL_MS, instead of once per workout.
+    """
+
+    def __init__(self, service: "BulkImportService", job: ImportJob):
+        self._service = service
+        self._job = job
+        self._written_items = 0
+        self._written_at = time.monotonic()
+        self._pending: Optional[tuple] = None
+
+    async def update(self, processed: int, current_item: Optional[str]) -> bool:
+        """Record progress; returns True if the job has been cancelled."""
+        self._pending = (processed, current_item)
+        elapsed_ms = (time.monotonic() - self._written_at) * 1000
+        if (
+            processed - self._written_items < PROGRESS_EVERY_ITEMS
+            and elapsed_ms < PROGRESS_INTERVAL_MS
+        ):
+            return False
+
+        _, cancelled = await asyncio.gather(self.flush(), self.cancelled())
+        return cancelled
+
+    async def cancelled(self) -> bool:
+        """Read the job status; True if the job has been cancelled."""
+        job_row = await self._job.run_io(
+            self._service._get_job, self._job.job_id, self._job.profile_id
+        )
+        return bool(job_row and job_row.get("status") == "cancelled")
+
+    async def flush(self) -> None:
+        """Write any progress not yet persisted."""
+        if self._pending is None:
+            return
+        processed, current_item = self._pending
+        self._pending = None
+        self._written_items = processed
+        self._written_at = time.monotonic()
+        await self._job.run_io(
+            self._service._update_job_progress,
+            self._job.job_id, self._job.profile_id, processed, current_item,
+        )
+
+
+class _DetectionStream:
+    """
+    Streams detected items into the job as they finish.
+
+    Items are stored, and progress written, in coalesced batches: at most
+    once per PROGRESS_EVERY_ITEMS items or PROGRESS_INTERVAL_MS. Polling
+    clients see a long link dump fill in while it is still being detected.
+    """
+
+    def __init__(self, service: "BulkImportService", job: ImportJob):
+        self._service = service
+        self._job = job
+        self._buffer: List[Dict[str, Any]] = []
+        self._processed = 0
+        self._written_at = time.monotonic()
+        self.items: List[Dict[str, Any]] = []
+
+    async def add(self, item: Dict[str, Any]) -> None:
+        self.items.append(item)
+        self._buffer.append(item)
+        self._processed += 1
+        elapsed_ms = (time.monotonic() - self._written_at) * 1000
+        if len(self._buffer) >= PROGRESS_EVERY_ITEMS or elapsed_ms >= PROGRESS_INTERVAL_MS:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Store buffered items and write progress."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        self._written_at = time.monotonic()
+        await asyncio.gather(
+            self._job.run_io(
+                self._service._store_detected_items,
+                self._job.job_id, self._job.profile_id, batch,
+            ),
+            self._job.run_io(
+                self._service._update_job_progress,
+                self._job.job_id, self._job.profile_id,
+                self._processed, batch[-1].get("source_ref"),
+            ),
+        )
+
+    def sorted_items(self) -> List[Dict[str, Any]]:
+        return sorted(self.items, key=lambda item: item["source_index"])
+
+
+async def _detect_or_error(
+    idx: int,
+    source_type: str,
+    source_ref: str,
+    detection: Awaitable[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Await one source's detection; an exception becomes that source's error item."""
+    try:
+        return await detection
+    except Exception as e:
+        logger.error(f"Error detecting source {idx}: {e}")
+        return {
+            "id": str(uuid.uuid4()),
+            "source_index": idx,
+            "source_type": source_type,
+            "source_ref": source_ref,
+            "raw_data": {},
+            "confidence": 0,
+            "errors": [str(e)],
+        }
+
+
+async def _run_streaming(coros, stream: _DetectionStream) -> None:
+    """Run detection coroutines concurrently, streaming each item as it finishes."""
+    for next_item in asyncio.as_completed(list(coros)):
+        await stream.add(await next_item)
+
+
 # ============================================================================
 # Bulk Import Service
 # ============================================================================
@@ -120,6 +270,15 @@ class BulkImportService:
     def __init__(self):
         self.supabase = self._get_supabase_client()
 
+    @property
+    def executor(self) -> BulkImportExecutor:
+        """Shared worker pools for blocking DB calls and CPU-heavy steps"""
+        return get_bulk_import_executor()
+
+    def _job(self, profile_id: str, job_id: str) -> ImportJob:
+        """Get a pool handle that schedules this job's work fairly"""
+        return self.executor.job(profile_id, job_id)
+
     def _get_supabase_client(self):
         """Get Supabase client from database module"""
         try:
@@ -278,7 +437,10 @@ class BulkImportService:
                 for idx, item in enumerate(items)
             ]
 
-            self.supabase.table("bulk_import_detected_items").insert(records).execute()
+            for i in range(0, len(records), DETECTED_ITEMS_BATCH_SIZE):
+                self.supabase.table("bulk_import_detected_items")\
+                    .insert(records[i:i + DETECTED_ITEMS_BATCH_SIZE])\
+                    .execute()
             return True
         except Exception as e:
             logger.error(f"Failed to store detected items: {e}")
@@ -345,20 +507,23 @@ class BulkImportService:
         Detect and parse workout items from sources.
 
         For files: Parse Excel/CSV/JSON/Text content
-        For URLs: Fetch metadata and queue for processing (batched, max 5 concurrent)
+        For URLs: Fetch metadata and classify, streaming items into the job as they finish
         For images: Run OCR and extract workout data
-        """
-        job_id = self._create_job(profile_id, source_type, len(sources))
 
-        detected_items = []
-        success_count = 0
-        error_count = 0
+        Database calls and file parsing run on the bulk import worker pools
+        so large imports don't block the event loop.
+        """
+        job_id = await self.executor.run_io(
+            profile_id, self._create_job, profile_id, source_type, len(sources)
+        )
+        job = self._job(profile_id, job_id)
+        stream = _DetectionStream(self, job)
 
-        # Use optimized batch processing for URLs and images
+        # URLs and images run as pipelines (fetch -> classify / decode ->
+        # parse) per source, so stages overlap across sources; upstream
+        # concurrency is set by the shared adaptive limiters.
         if source_type == "urls":
-            detected_items, success_count, error_count = await self._detect_urls_batch(
-                sources, max_concurrent=5
-            )
+            await self._detect_urls_batch(sources, stream=stream, profile_id=profile_id)
         elif source_type == "images":
             # Images are passed as list of (base64_data, filename) or just base64_data
             # If just base64 strings, convert to tuples
@@ -370,45 +535,36 @@ class BulkImportService:
                     images.append((source.get("data", ""), source.get("filename", f"image_{idx}.jpg")))
                 else:
                     images.append((source, f"image_{idx}.jpg"))
-            detected_items, success_count, error_count = await self._detect_images_batch(
-                images, max_concurrent=3
-            )
+            await self._detect_images_batch(images, stream=stream)
         else:
-            # Process files sequentially
-            for idx, source in enumerate(sources):
-                try:
-                    item = await self._detect_single_source(
-                        source_type=source_type,
-                        source=source,
-                        index=idx
+            # Process files concurrently, bounded by the job's pool limit
+            await _run_streaming(
+                (
+                    _detect_or_error(
+                        idx, source_type, source[:100] if source else "",
+                        self._detect_single_source(
+                            source_type=source_type,
+                            source=source,
+                            index=idx,
+                            job=job,
+                        ),
                     )
-                    detected_items.append(item)
-
-                    if item.get("errors"):
-                        error_count += 1
-                    else:
-                        success_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error detecting source {idx}: {e}")
-                    detected_items.append({
-                        "id": str(uuid.uuid4()),
-                        "source_index": idx,
-                        "source_type": source_type,
-                        "source_ref": source[:100] if source else "",
-                        "raw_data": {},
-                        "confidence": 0,
-                        "errors": [str(e)],
-                    })
-                    error_count += 1
-
-        # Store in database
-        self._store_detected_items(job_id, profile_id, detected_items)
+                    for idx, source in enumerate(sources)
+                ),
+                stream,
+            )
+
+        # Store whatever is still buffered
+        await stream.flush()
+        detected_items = stream.sorted_items()
+        error_count = len([item for item in detected_items if item.get("errors")])
+        success_count = len(detected_items) - error_count
 
         # Update job with total items
-        self._update_job_status(
+        await job.run_io(
+            self._update_job_status,
             job_id, profile_id, "pending",
-            total_items=len(detected_items)
+            total_items=len(detected_items),
         )
 
         return BulkDetectResponse(
@@ -424,270 +580,236 @@ class BulkImportService:
     async def _detect_urls_batch(
         self,
         urls: List[str],
-        max_concurrent: int = 5
-    ) -> tuple:
+        stream: _DetectionStream,
+        profile_id: str,
+    ) -> None:
         """
-        Batch process URLs with concurrency limit.
+        Detect URLs as overlapping fetch -> classify pipelines.
 
-        Uses optimized batch fetching from URL parser.
+        Each URL is classified as soon as its own metadata arrives, rather than
+        after the whole batch has been fetched. Calls to oEmbed, the ingestor
+        and the classifier's LLM are paced by their shared adaptive limiters.
+        A URL whose pipeline raises becomes an error item; the rest carry on.
 
-        Returns:
-            Tuple of (detected_items, success_count, error_count)
+        Classifier LLM calls are charged to the job owner's classification
+        budget; once it is spent, URLs keep their keyword classification.
         """
-        detected_items = []
-        success_count = 0
-        error_count = 0
+        limiter = get_rate_limiter()
 
-        # Fetch metadata for all URLs in batch (with concurrency limit)
-        metadata_list = await fetch_url_metadata_batch(urls, max_concurrent)
+        def llm_allowed() -> bool:
+            return limiter.check(profile_id, FEATURE_CLASSIFICATION).allowed
 
-        for idx, metadata in enumerate(metadata_list):
-            item_id = str(uuid.uuid4())
+        async def detect_url(idx: int, url: str) -> Dict[str, Any]:
+            metadata = await URLParser.fetch_metadata(url)
+            return await self._build_url_item(idx, metadata, llm_allowed)
 
-            if metadata.error:
-                detected_items.append({
-                    "id": item_id,
-                    "source_index": idx,
-                    "source_type": "urls",
-                    "source_ref": metadata.url,
-                    "raw_data": {
-                        "url": metadata.url,
-                        "platform": metadata.platform,
-                        "video_id": metadata.video_id,
-                    },
-                    "parsed_title": f"{metadata.platform.title()} Video",
-                    "parsed_exercise_count": 0,
-                    "parsed_block_count": 0,
-                    "confidence": 30,
-                    "errors": [metadata.error],
-                })
-                error_count += 1
-            else:
-                # Build title
-                title = metadata.title
-                if not title:
-                    title = f"{metadata.platform.title()} Video"
-                    if metadata.video_id:
-                        title += f" ({metadata.video_id[:8]}...)"
-
-                # AMA-171: Classify content BEFORE expensive processing
-                classification_result = None
-                classification_error = None
-
-                if metadata.video_id and metadata.platform != 'unknown':
-                    try:
-                        classification_result = await classify_content(
-                            video_id=metadata.video_id,
-                            platform=metadata.platform,
-                            title=metadata.title,
-                            description=metadata.description
-                        )
-                    except (asyncio.TimeoutError, ValueError, ConnectionError) as e:
-                        logger.warning(f"Classification failed for {metadata.url}: {e}")
-                        classification_error = str(e)
-
-                # Check if non-workout content detected (high confidence)
-                is_non_workout = (
-                    classification_result and
-                    classification_result.category == ContentCategory.NON_WORKOUT and
-                    classification_result.confidence in [
-                        ClassificationConfidence.HIGH,
-                        ClassificationConfidence.MEDIUM
-                    ]
-                )
+        await _run_streaming(
+            (
+                _detect_or_error(idx, "urls", url, detect_url(idx, url))
+                for idx, url in enumerate(urls)
+            ),
+            stream,
+        )
 
-                if is_non_workout:
-                    # Reject non-workout content with clear message
-                    detected_items.append({
-                        "id": item_id,
-                        "source_index": idx,
-                        "source_type": "urls",
-                        "source_ref": metadata.url,
-                        "raw_data": {
-                            "url": metadata.url,
-                            "platform": metadata.platform,
-                            "video_id": metadata.video_id,
-                            "title": metadata.title,
-                            "author": metadata.author,
-                            "thumbnail_url": metadata.thumbnail_url,
-                            "duration_seconds": metadata.duration_seconds,
-                        },
-                        "parsed_title": title,
-                        "parsed_exercise_count": 0,
-                        "parsed_block_count": 0,
-                        "confidence": 20,
-                        "thumbnail_url": metadata.thumbnail_url,
-                        "author": metadata.author,
-                        "platform": metadata.platform,
-                        "errors": [
-                            f"Non-workout content detected: {classification_result.reason}. "
-                            f"This appears to be a {classification_result.category.value} video, not a workout. "
-                            "Please submit a workout video for processing."
-                        ],
-                        "content_classification": {
-                            "category": classification_result.category.value,
-                            "confidence": classification_result.confidence.value,
-                            "reason": classification_result.reason,
-                            "used_llm": classification_result.used_llm,
-                            "cached": classification_result.cached,
-                        },
-                    })
-                    error_count += 1
-                else:
-                    # Proceed with detection (workout or uncertain)
-                    item = {
-                        "id": item_id,
-                        "source_index": idx,
-                        "source_type": "urls",
-                        "source_ref": metadata.url,
-                        "raw_data": {
-                            "url": metadata.url,
-                            "platform": metadata.platform,
-                            "video_id": metadata.video_id,
-                            "title": metadata.title,
-                            "author": metadata.author,
-                            "thumbnail_url": metadata.thumbnail_url,
-                            "duration_seconds": metadata.duration_seconds,
-                        },
-                        "parsed_title": title,
-                        "parsed_exercise_count": 0,
-                        "parsed_block_count": 0,
-                        "confidence": 70,
-                        "thumbnail_url": metadata.thumbnail_url,
-                        "author": metadata.author,
-                        "platform": metadata.platform,
-                    }
+    async def _build_url_item(
+        self,
+        idx: int,
+        metadata: URLMetadata,
+        llm_allowed: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Classify fetched URL metadata and build its detected item."""
+        item_id = str(uuid.uuid4())
+
+        if metadata.error:
+            return {
+                "id": item_id,
+                "source_index": idx,
+                "source_type": "urls",
+                "source_ref": metadata.url,
+                "raw_data": {
+                    "url": metadata.url,
+                    "platform": metadata.platform,
+                    "video_id": metadata.video_id,
+                },
+                "parsed_title": f"{metadata.platform.title()} Video",
+                "parsed_exercise_count": 0,
+                "parsed_block_count": 0,
+                "confidence": 30,
+                "errors": [metadata.error],
+            }
+
+        # Build title
+        title = metadata.title
+        if not title:
+            title = f"{metadata.platform.title()} Video"
+            if metadata.video_id:
+                title += f" ({metadata.video_id[:8]}...)"
+
+        # AMA-171: Classify content BEFORE expensive processing
+        classification_result = None
+
+        if metadata.video_id and metadata.platform != 'unknown':
+            try:
+                classification_result = await classify_content(
+                    video_id=metadata.video_id,
+                    platform=metadata.platform,
+                    title=metadata.title,
+                    description=metadata.description,
+                    llm_allowed=llm_allowed,
+                )
+            except (asyncio.TimeoutError, ValueError, ConnectionError) as e:
+                logger.warning(f"Classification failed for {metadata.url}: {e}")
+
+        # Check if non-workout content detected (high confidence)
+        is_non_workout = (
+            classification_result and
+            classification_result.category == ContentCategory.NON_WORKOUT and
+            classification_result.confidence in [
+                ClassificationConfidence.HIGH,
+                ClassificationConfidence.MEDIUM
+            ]
+        )
 
-                    # Include classification info if available
-                    if classification_result:
-                        item["content_classification"] = {
-                            "category": classification_result.category.value,
-                            "confidence": classification_result.confidence.value,
-                            "reason": classification_result.reason,
-                            "used_llm": classification_result.used_llm,
-                            "cached": classification_result.cached,
-                        }
+        item = {
+            "id": item_id,
+            "source_index": idx,
+            "source_type": "urls",
+            "source_ref": metadata.url,
+            "raw_data": {
+                "url": metadata.url,
+                "platform": metadata.platform,
+                "video_id": metadata.video_id,
+                "title": metadata.title,
+                "author": metadata.author,
+                "thumbnail_url": metadata.thumbnail_url,
+                "duration_seconds": metadata.duration_seconds,
+            },
+            "parsed_title": title,
+            "parsed_exercise_count": 0,
+            "parsed_block_count": 0,
+            # Non-workout content is rejected with a clear message
+            "confidence": 20 if is_non_workout else 70,
+            "thumbnail_url": metadata.thumbnail_url,
+            "author": metadata.author,
+            "platform": metadata.platform,
+        }
+
+        if is_non_workout:
+            item["errors"] = [
+                f"Non-workout content detected: {classification_result.reason}. "
+                f"This appears to be a {classification_result.category.value} video, not a workout. "
+                "Please submit a workout video for processing."
+            ]
 
-                    detected_items.append(item)
-                    success_count += 1
+        # Include classification info if available
+        if classification_result:
+            item["content_classification"] = {
+                "category": classification_result.category.value,
+                "confidence": classification_result.confidence.value,
+                "reason": classification_result.reason,
+                "used_llm": classification_result.used_llm,
+                "cached": classification_result.cached,
+            }
 
-        return detected_items, success_count, error_count
+        return item
 
     async def _detect_images_batch(
         self,
         images: List[tuple],  # List of (base64_data, filename)
-        max_concurrent: int = 3
-    ) -> tuple:
+        stream: _DetectionStream,
+    ) -> None:
         """
-        Batch process images with concurrency limit.
+        Detect images as overlapping decode -> parse pipelines.
 
-        Uses Vision AI for workout extraction.
+        Uses Vision AI for workout extraction; calls to the ingestor are paced
+        by its shared adaptive limiter.
 
         Args:
             images: List of (base64_data, filename) tuples
-            max_concurrent: Max concurrent requests (lower than URLs due to cost)
-
-        Returns:
-            Tuple of (detected_items, success_count, error_count)
+            stream: Receives each detected item as it finishes
         """
-        detected_items = []
-        success_count = 0
-        error_count = 0
-
-        # Decode base64 images and prepare for batch processing
-        decoded_images = []
-        decode_errors = []
-
-        for idx, (b64_data, filename) in enumerate(images):
+        async def detect_image(idx: int, b64_data: str, filename: str) -> Dict[str, Any]:
             try:
                 image_data = base64.b64decode(b64_data)
-                decoded_images.append((image_data, filename or f"image_{idx}.jpg", idx))
             except Exception as e:
-                decode_errors.append((idx, filename, str(e)))
+                return {
+                    "id": str(uuid.uuid4()),
+                    "source_index": idx,
+                    "source_type": "images",
+                    "source_ref": filename or f"image_{idx}",
+                    "raw_data": {},
+                    "parsed_title": f"Image Workout {idx + 1}",
+                    "parsed_exercise_count": 0,
+                    "confidence": 0,
+                    "errors": [f"Invalid base64 image data: {e}"],
+                }
 
-        # Add decode error items
-        for idx, filename, error in decode_errors:
-            detected_items.append({
-                "id": str(uuid.uuid4()),
+            filename = filename or f"image_{idx}.jpg"
+            result = await ImageParser.parse_image(image_data, filename, mode="vision")
+            return self._build_image_item(idx, filename, result)
+
+        await _run_streaming(
+            (
+                _detect_or_error(
+                    idx, "images", filename or f"image_{idx}",
+                    detect_image(idx, b64_data, filename),
+                )
+                for idx, (b64_data, filename) in enumerate(images)
+            ),
+            stream,
+        )
+
+    @staticmethod
+    def _build_image_item(idx: int, filename: str, result: ImageParseResult) -> Dict[str, Any]:
+        """Build the detected item for one parsed image."""
+        item_id = str(uuid.uuid4())
+
+        if not result.success:
+            return {
+                "id": item_id,
                 "source_index": idx,
                 "source_type": "images",
-                "source_ref": filename or f"image_{idx}",
-                "raw_data": {},
+                "source_ref": filename,
+                "raw_data": {
+                    "extraction_method": result.extraction_method,
+                },
                 "parsed_title": f"Image Workout {idx + 1}",
                 "parsed_exercise_count": 0,
-                "confidence": 0,
-                "errors": [f"Invalid base64 image data: {error}"],
-            })
-            error_count += 1
-
-        # Process decoded images in batch
-        if decoded_images:
-            batch_input = [(data, fname) for data, fname, _ in decoded_images]
-            results = await parse_images_batch(
-                batch_input,
-                mode="vision",
-                max_concurrent=max_concurrent,
-            )
+                "confidence": result.confidence,
+                "errors": [result.error] if result.error else ["Failed to extract workout"],
+            }
 
-            for (_, filename, idx), result in zip(decoded_images, results):
-                item_id = str(uuid.uuid4())
-
-                if not result.success:
-                    detected_items.append({
-                        "id": item_id,
-                        "source_index": idx,
-                        "source_type": "images",
-                        "source_ref": filename,
-                        "raw_data": {
-                            "extraction_method": result.extraction_method,
-                        },
-                        "parsed_title": f"Image Workout {idx + 1}",
-                        "parsed_exercise_count": 0,
-                        "confidence": result.confidence,
-                        "errors": [result.error] if result.error else ["Failed to extract workout"],
-                    })
-                    error_count += 1
-                else:
-                    title = result.title or f"Image Workout {idx + 1}"
-                    exercise_count = len(result.exercises)
-                    block_count = len(result.blocks)
-
-                    detected_items.append({
-                        "id": item_id,
-                        "source_index": idx,
-                        "source_type": "images",
-                        "source_ref": filename,
-                        "raw_data": {
-                            "extraction_method": result.extraction_method,
-                            "model_used": result.model_used,
-                            "exercises": result.exercises,
-                            "blocks": result.blocks,
-                        },
-                        "parsed_title": title,
-                        "parsed_exercise_count": exercise_count,
-                        "parsed_block_count": block_count,
-                        "parsed_workout": result.raw_workout,
-                        "confidence": result.confidence,
-                        "flagged_items": result.flagged_items if result.flagged_items else None,
-                    })
-                    success_count += 1
-
-        # Sort by source_index to maintain order
-        detected_items.sort(key=lambda x: x["source_index"])
-
-        return detected_items, success_count, error_count
+        return {
+            "id": item_id,
+            "source_index": idx,
+            "source_type": "images",
+            "source_ref": filename,
+            "raw_data": {
+                "extraction_method": result.extraction_method,
+                "model_used": result.model_used,
+                "exercises": result.exercises,
+                "blocks": result.blocks,
+            },
+            "parsed_title": result.title or f"Image Workout {idx + 1}",
+            "parsed_exercise_count": len(result.exercises),
+            "parsed_block_count": len(result.blocks),
+            "parsed_workout": result.raw_workout,
+            "confidence": result.confidence,
+            "flagged_items": result.flagged_items if result.flagged_items else None,
+        }
 
     async def _detect_single_source(
         self,
         source_type: str,
         source: str,
-        index: int
+        index: int,
+        job: Optional[ImportJob] = None,
     ) -> Dict[str, Any]:
         """Detect workout from a single source"""
         item_id = str(uuid.uuid4())
 
         if source_type == "file":
-            return await self._detect_from_file(item_id, source, index)
+            return await self._detect_from_file(item_id, source, index, job=job)
         elif source_type == "urls":
             return await self._detect_from_url(item_id, source, index)
         elif source_type == "images":
@@ -708,16 +830,20 @@ class BulkImportService:
         item_id: str,
         source: str,
         index: int,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        job: Optional[ImportJob] = None,
     ) -> Dict[str, Any]:
         """
         Detect workout from file content (base64 encoded).
 
+        Parsing runs on the bulk import process pool.
+
         Args:
             item_id: Unique ID for this detected item
             source: Base64 encoded file content (optionally prefixed with "filename:")
             index: Source index in the batch
             filename: Optional filename (if not embedded in source)
+            job: Pool handle for the owning import job
         """
         try:
             # Parse source format: can be "filename:base64content" or just "base64content"
@@ -732,8 +858,10 @@ class BulkImportService:
             if not filename:
                 filename = f"file_{index}.txt"
 
-            # Use the parser factory
-            parse_result = await FileParserFactory.parse_base64(source, filename)
+            # Use the parser factory (off the event loop)
+            if job is None:
+                job = self._job("", item_id)
+            parse_result = await job.run_cpu(parse_file_source, source, filename)
 
             if not parse_result.success:
                 return {
@@ -1044,7 +1172,10 @@ class BulkImportService:
             profile_id: User profile ID
             user_mappings: Optional dict of {original_name: garmin_name} overrides
         """
-        detected = self._get_detected_items(job_id, profile_id, selected_only=True)
+        job = self._job(profile_id, job_id)
+        detected = await job.run_io(
+            self._get_detected_items, job_id, profile_id, selected_only=True
+        )
 
         # Collect all unique exercises with their sources
         exercise_names = set()
@@ -1072,6 +1203,15 @@ class BulkImportService:
                                 exercise_sources[name] = []
                             exercise_sources[name].append(item["id"])
 
+        # Fuzzy-match everything the user hasn't overridden on the process pool
+        match_results = await self._match_exercise_names(
+            job,
+            [
+                name for name in sorted(exercise_names)
+                if not (user_mappings and name in user_mappings)
+            ],
+        )
+
         # Match each unique exercise
         exercises = []
         for name in sorted(exercise_names):
@@ -1091,15 +1231,8 @@ class BulkImportService:
                 ))
                 continue
 
-            # Use Garmin matcher for fuzzy matching
-            matched_name, confidence = find_garmin_exercise(name, threshold=30)
-
-            # Get suggestions for alternatives
-            suggestions_list = get_garmin_suggestions(name, limit=5, score_cutoff=0.3)
-            suggestions = [
-                {"name": sugg_name, "confidence": round(sugg_conf, 2)}
-                for sugg_name, sugg_conf in suggestions_list
-            ]
+            # Garmin fuzzy match and suggestions for alternatives
+            matched_name, confidence, suggestions = match_results[name]
 
             # Determine status based on confidence thresholds
             if matched_name and confidence >= MATCH_AUTO_THRESHOLD:
@@ -1125,11 +1258,7 @@ class BulkImportService:
             ))
 
         # Store matches in job
-        if self.supabase:
-            self.supabase.table("bulk_import_jobs").update({
-                "exercise_matches": [e.dict() for e in exercises],
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-            }).eq("id", job_id).eq("profile_id", profile_id).execute()
+        await job.run_io(self._store_exercise_matches, job_id, profile_id, exercises)
 
         # Calculate statistics
         matched = len([e for e in exercises if e.status == "matched"])
@@ -1146,6 +1275,36 @@ class BulkImportService:
             unmapped=unmapped,
         )
 
+    async def _match_exercise_names(
+        self,
+        job: ImportJob,
+        names: List[str],
+    ) -> Dict[str, tuple]:
+        """Match names in chunks on the process pool, returning name -> (match, confidence, suggestions)"""
+        chunks = [
+            names[i:i + MATCH_CHUNK_SIZE]
+            for i in range(0, len(names), MATCH_CHUNK_SIZE)
+        ]
+        results: Dict[str, tuple] = {}
+        for chunk_result in await asyncio.gather(
+            *(job.run_cpu(match_exercise_names, chunk) for chunk in chunks)
+        ):
+            results.update(chunk_result)
+        return results
+
+    def _store_exercise_matches(
+        self,
+        job_id: str,
+        profile_id: str,
+        exercises: List[ExerciseMatch]
+    ) -> None:
+        """Store exercise matches on the job"""
+        if self.supabase:
+            self.supabase.table("bulk_import_jobs").update({
+                "exercise_matches": [e.dict() for e in exercises],
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }).eq("id", job_id).eq("profile_id", profile_id).execute()
+
     # ========================================================================
     # Step 4: Preview
     # ========================================================================
@@ -1157,13 +1316,23 @@ class BulkImportService:
         selected_ids: List[str]
     ) -> BulkPreviewResponse:
         """Generate preview of workouts to be imported."""
-        detected = self._get_detected_items(job_id, profile_id)
+        job = self._job(profile_id, job_id)
+        detected = await job.run_io(self._get_detected_items, job_id, profile_id)
+        return await job.run_io(self._build_preview, job_id, detected, selected_ids)
 
+    def _build_preview(
+        self,
+        job_id: str,
+        detected: List[Dict[str, Any]],
+        selected_ids: List[str]
+    ) -> BulkPreviewResponse:
+        """Build preview models for detected items (runs on the worker pool)"""
+        selected = set(selected_ids)
         previews = []
         stats = ImportStats()
 
         for item in detected:
-            is_selected = item["id"] in selected_ids
+            is_selected = item["id"] in selected
 
             if is_selected:
                 stats.total_selected += 1
@@ -1215,12 +1384,10 @@ class BulkImportService:
         In async mode, creates a background job and returns immediately.
         In sync mode, processes all workouts before returning.
         """
-        # Create import job entry
-        import_job_id = str(uuid.uuid4())
-
-        self._update_job_status(
+        await self.executor.run_io(
+            profile_id, self._update_job_status,
             job_id, profile_id, "running",
-            target_device=device
+            target_device=device,
         )
 
         if async_mode:
@@ -1263,16 +1430,18 @@ class BulkImportService:
                 job_id, profile_id, workout_ids, device
             )
 
-            self._update_job_status(
+            await self.executor.run_io(
+                profile_id, self._update_job_status,
                 job_id, profile_id, "complete",
-                results=[r.dict() for r in results]
+                results=[r.dict() for r in results],
             )
 
         except Exception as e:
             logger.error(f"Import job {job_id} failed: {e}")
-            self._update_job_status(
+            await self.executor.run_io(
+                profile_id, self._update_job_status,
                 job_id, profile_id, "failed",
-                error=str(e)
+                error=str(e),
             )
 
     async def _process_import_sync(
@@ -1282,28 +1451,71 @@ class BulkImportService:
         workout_ids: List[str],
         device: str
     ) -> List[ImportResult]:
-        """Synchronous import processing"""
-        detected = self._get_detected_items(job_id, profile_id)
-        results = []
-
-        total = len(workout_ids)
+        """
+        Import processing.
+
+        Workouts are persisted with multi-row upserts in batches of
+        IMPORT_BATCH_SIZE, with up to IMPORT_PARALLEL_BATCHES batches in
+        flight, deduplicated by title and device like save_many. The job is
+        checked for cancellation before the first batch; after that,
+        progress writes and cancellation checks are coalesced to at most one
+        per PROGRESS_EVERY_ITEMS items or PROGRESS_INTERVAL_MS.
+        """
+        job = self._job(profile_id, job_id)
+        detected = await job.run_io(self._get_detected_items, job_id, profile_id)
+        items_by_id = {item["id"]: item for item in detected}
+        progress = _ImportProgress(self, job)
+        if await progress.cancelled():
+            return []
 
-        for idx, workout_id in enumerate(workout_ids):
-            # Check for cancellation
-            job = self._get_job(job_id, profile_id)
-            if job and job.get("status") == "cancelled":
+        batches = [
+            workout_ids[i:i + IMPORT_BATCH_SIZE]
+            for i in range(0, len(workout_ids), IMPORT_BATCH_SIZE)
+        ]
+        results: List[ImportResult] = []
+        processed = 0
+        # (title, device) -> workout id, for rows saved earlier in this import
+        saved_ids: Dict[tuple, str] = {}
+
+        for wave_start in range(0, len(batches), IMPORT_PARALLEL_BATCHES):
+            wave = batches[wave_start:wave_start + IMPORT_PARALLEL_BATCHES]
+            for batch_results in await asyncio.gather(*(
+                self._import_batch(job, batch, items_by_id, device, saved_ids)
+                for batch in wave
+            )):
+                results.extend(batch_results)
+
+            processed += sum(len(batch) for batch in wave)
+            if await progress.update(processed, wave[-1][-1]):
                 break
 
-            # Update progress
-            self._update_job_progress(job_id, profile_id, idx + 1, workout_id)
+        await progress.flush()
+        return results
 
-            # Find the detected item
-            item = next(
-                (d for d in detected if d["id"] == workout_id),
-                None
+    async def _import_batch(
+        self,
+        job: ImportJob,
+        workout_ids: List[str],
+        items_by_id: Dict[str, Dict[str, Any]],
+        device: str,
+        saved_ids: Dict[tuple, str],
+    ) -> List[ImportResult]:
+        """Import one batch of workouts with a single multi-row upsert"""
+        records = []
+        for workout_id in workout_ids:
+            item = items_by_id.get(workout_id)
+            records.append(
+                self._build_workout_record(item, job.profile_id, device) if item else None
             )
 
-            if not item:
+        errors = await job.run_io(
+            self._save_workouts, job.profile_id, [r for r in records if r], saved_ids
+        )
+        errors_iter = iter(errors)
+
+        results = []
+        for workout_id, record in zip(workout_ids, records):
+            if record is None:
                 results.append(ImportResult(
                     workout_id=workout_id,
                     title="Unknown",
@@ -1312,41 +1524,100 @@ class BulkImportService:
                 ))
                 continue
 
-            try:
-                # TODO: Implement actual workout saving
-                # This will use database.save_workout()
-                result = await self._import_single_workout(
-                    item, profile_id, device
-                )
-                results.append(result)
-
-            except Exception as e:
-                logger.error(f"Failed to import workout {workout_id}: {e}")
-                results.append(ImportResult(
-                    workout_id=workout_id,
-                    title=item.get("parsed_title", "Unknown"),
-                    status="failed",
-                    error=str(e),
-                ))
-
+            error = next(errors_iter)
+            if error:
+                logger.error(f"Failed to import workout {workout_id}: {error}")
+            results.append(ImportResult(
+                workout_id=workout_id,
+                title=record["title"],
+                status="failed" if error else "success",
+                error=error,
+                saved_workout_id=None if error else record["id"],
+            ))
         return results
 
-    async def _import_single_workout(
+    def _build_workout_record(
         self,
         item: Dict[str, Any],
         profile_id: str,
         device: str
-    ) -> ImportResult:
-        """Import a single workout"""
-        # TODO: Implement using database.save_workout()
-        # This will be integrated with existing workout saving
-
-        return ImportResult(
-            workout_id=item["id"],
-            title=item.get("parsed_title", "Unknown"),
-            status="success",
-            saved_workout_id=str(uuid.uuid4()),  # Placeholder
-        )
+    ) -> Dict[str, Any]:
+        """Build a workouts table row for a detected item"""
+        return {
+            "id": str(uuid.uuid4()),
+            "profile_id": profile_id,
+            "workout_data": item.get("parsed_workout") or {},
+            "sources": [item["source_ref"]] if item.get("source_ref") else [],
+            "device": device,
+            "is_exported": False,
+            "title": item.get("parsed_title") or "Unknown",
+        }
+
+    def _save_workouts(
+        self,
+        profile_id: str,
+        records: List[Dict[str, Any]],
+        saved_ids: Dict[tuple, str],
+    ) -> List[Optional[str]]:
+        """
+        Save workout rows, deduplicated like WorkoutRepository.save_many.
+
+        A record whose title and device match an existing workout, or a
+        record saved earlier in the same import, takes over that workout's
+        id, so re-importing updates workouts instead of duplicating them.
+        Record ids are updated in place.
+
+        Returns:
+            Error message (or None on success) for each record, in order
+        """
+        if not self.supabase or not records:
+            return [None] * len(records)
+
+        titles = list({
+            r["title"] for r in records if (r["title"], r["device"]) not in saved_ids
+        })
+        try:
+            existing = find_existing_workouts(self.supabase, profile_id, titles) if titles else {}
+        except Exception as e:
+            logger.error(f"Failed to look up {len(titles)} workouts for dedup: {e}")
+            return [str(e)] * len(records)
+
+        now = datetime.now(timezone.utc).isoformat()
+        rows: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            key = (record["title"], record["device"])
+            record["id"] = saved_ids.setdefault(key, existing.get(key, record["id"]))
+            record["updated_at"] = now
+            # Later duplicates in the batch replace the row, as in save_many
+            rows[record["id"]] = record
+
+        errors = dict(zip(rows, self._upsert_workouts(list(rows.values()))))
+        return [errors[record["id"]] for record in records]
+
+    def _upsert_workouts(self, records: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Upsert workout rows on id in one request.
+
+        If the batch upsert fails, rows are retried one at a time so a single
+        bad row doesn't fail the whole batch.
+
+        Returns:
+            Error message (or None on success) for each record, in order
+        """
+        try:
+            self.supabase.table("workouts").upsert(records).execute()
+            return [None] * len(records)
+        except Exception as e:
+            logger.warning(f"Batch upsert of {len(records)} workouts failed, retrying individually: {e}")
+
+        errors: List[Optional[str]] = []
+        for record in records:
+            try:
+                self.supabase.table("workouts").upsert(record).execute()
+                errors.append(None)
+            except Exception as e:
+                errors.append(str(e))
+        return errors
 
     # ========================================================================
     # Status & Control
@@ -1,14 +1,26 @@
-import yaml, pathlib
+import pathlib
+
+from backend.core.dictionary_snapshot import load_dictionary
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 
-CAT = yaml.safe_load((ROOT / "shared/dictionaries/canonical_exercises.yaml").read_text())
+
+
+def __getattr__(name):
+
+    # CAT (canonical_exercises.yaml) is loaded lazily from the dictionary snapshot.
+
+    if name == "CAT":
+
+        return load_dictionary("canonical_exercises")["entries"]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
 def all_synonyms():
 
-    for item in CAT:
+    for item in load_dictionary("canonical_exercises")["entries"]:
 
         yield item["canonical"], item.get("synonyms", []) + [item["canonical"]]
 
@@ -16,4 +28,4 @@ def all_synonyms():
 
 def lookup(canonical):
 
-    return next((c for c in CAT if c["canonical"] == canonical), None)
+    return load_dictionary("canonical_exercises")["by_canonical"].get(canonical)
@@ -0,0 +1,246 @@
+"""
+Precompiled snapshot of the static exercise dictionaries.
+
+The YAML/JSON sources under ``shared/dictionaries`` are slow to parse (the
+Garmin raw dataset alone takes ~0.5s with ``yaml.safe_load``), and several
+modules used to parse them at import time. This module compiles them into a
+single versioned pickle holding pre-normalized keys and lookup indexes, and
+loads it lazily on first use.
+
+Every load validates the snapshot against the SHA-256 of each source file, so
+an edited dictionary is never served stale: out-of-date entries are recompiled
+from source and the snapshot is rewritten (best effort - a read-only image
+simply keeps compiling from source).
+
+Build the snapshot ahead of time with::
+
+    python scripts/build_dictionary_snapshot.py
+
+Set ``DICTIONARY_SNAPSHOT_DISABLED=1`` to always parse the sources.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+DICTIONARIES_DIR = ROOT / "shared" / "dictionaries"
+
+# Bump when the shape of any compiled payload changes.
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = DICTIONARIES_DIR / f".dictionaries.v{SNAPSHOT_VERSION}.pickle"
+
+# Snapshot entry name -> source file in shared/dictionaries.
+# Mutable runtime stores (user_mappings.yaml, global_mappings.yaml) are
+# deliberately excluded.
+SOURCES: Dict[str, str] = {
+    "garmin_exercises_raw": "garmin_exercises_raw.yaml",
+    "canonical_exercises": "canonical_exercises.yaml",
+    "normalization": "normalization.yaml",
+    "garmin_map": "garmin_map.yaml",
+    "garmin_exercises": "garmin_exercises.json",
+}
+
+
+# ---------------------------------------------------------------------------
+# Compilers: source text -> payload stored in the snapshot
+# ---------------------------------------------------------------------------
+
+
+def _normalize_category(category: Any) -> Optional[str]:
+    if not category:
+        return None
+    return str(category).strip().upper().replace(" ", "_") or None
+
+
+def _compile_garmin_exercises_raw(text: str) -> Dict[str, Any]:
+    data = yaml.safe_load(text) or {}
+    if not isinstance(data, dict):
+        raise ValueError(
+            f"garmin_exercises_raw.yaml has unexpected format (expected dict, got {type(data)})"
+        )
+    entries = {str(k).lower(): v for k, v in data.items()}
+    categories = {}
+    for key, entry in entries.items():
+        category = _normalize_category(entry.get("category")) if isinstance(entry, dict) else None
+        if category:
+            categories[key] = category
+    return {"entries": entries, "categories": categories}
+
+
+def _compile_canonical_exercises(text: str) -> Dict[str, Any]:
+    entries = yaml.safe_load(text) or []
+    by_canonical: Dict[str, dict] = {}
+    for entry in entries:
+        by_canonical.setdefault(entry["canonical"], entry)
+    return {"entries": entries, "by_canonical": by_canonical}
+
+
+def _compile_normalization(text: str) -> Dict[str, Any]:
+    data = yaml.safe_load(text) or {}
+    data.setdefault("expand", {})
+    data.setdefault("stopwords", [])
+    data.setdefault("plural_to_singular", {})
+    return data
+
+
+def _compile_garmin_map(text: str) -> Dict[str, Any]:
+    return yaml.safe_load(text) or {}
+
+
+def _compile_garmin_exercises(text: str) -> Dict[str, Any]:
+    data = json.loads(text)
+    data["category_ids"] = {v["name"]: v["id"] for v in data["categories"].values()}
+    return data
+
+
+_COMPILERS: Dict[str, Callable[[str], Any]] = {
+    "garmin_exercises_raw": _compile_garmin_exercises_raw,
+    "canonical_exercises": _compile_canonical_exercises,
+    "normalization": _compile_normalization,
+    "garmin_map": _compile_garmin_map,
+    "garmin_exercises": _compile_garmin_exercises,
+}
+
+
+# ---------------------------------------------------------------------------
+# Snapshot I/O
+# ---------------------------------------------------------------------------
+
+
+def _source_path(name: str) -> pathlib.Path:
+    return DICTIONARIES_DIR / SOURCES[name]
+
+
+def _read_source(name: str) -> tuple[str, str]:
+    """Return (text, sha256) for a source file."""
+    raw = _source_path(name).read_bytes()
+    return raw.decode("utf-8"), hashlib.sha256(raw).hexdigest()
+
+
+def _source_hash(name: str) -> Optional[str]:
+    try:
+        return hashlib.sha256(_source_path(name).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _snapshot_disabled() -> bool:
+    return os.environ.get("DICTIONARY_SNAPSHOT_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+def _read_snapshot(path: pathlib.Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable dictionary snapshot %s: %s", path, e)
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+
+def _write_snapshot(path: pathlib.Path, snapshot: Dict[str, Any]) -> bool:
+    """Atomically write the snapshot; returns False if the directory is read-only."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+    except OSError as e:
+        logger.info("Could not write dictionary snapshot %s: %s", path, e)
+        return False
+    return True
+
+
+def build_snapshot(path: Optional[pathlib.Path] = None) -> Dict[str, Any]:
+    """Compile every source and write the snapshot. Used by the build script."""
+    path = path or SNAPSHOT_FILE
+    snapshot: Dict[str, Any] = {"version": SNAPSHOT_VERSION, "sources": {}, "data": {}}
+    for name in SOURCES:
+        text, digest = _read_source(name)
+        snapshot["sources"][name] = digest
+        snapshot["data"][name] = _COMPILERS[name](text)
+    if not _write_snapshot(path, snapshot):
+        raise OSError(f"Failed to write dictionary snapshot to {path}")
+    return snapshot
+
+
+class DictionarySnapshot:
+    """Lazily loaded, hash-validated view over the compiled dictionaries.
+
+    The snapshot file is read once; each entry is checked against its source
+    hash the first time it is requested, so a stale or missing entry only
+    costs the parse of that one source.
+    """
+
+    def __init__(self, path: Optional[pathlib.Path] = None):
+        self._path = path or SNAPSHOT_FILE
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._validated: Dict[str, Any] = {}
+
+    def get(self, name: str) -> Any:
+        """Return the compiled payload for a source (see SOURCES)."""
+        try:
+            return self._validated[name]
+        except KeyError:
+            pass
+        if name not in SOURCES:
+            raise KeyError(f"Unknown dictionary: {name}")
+        with self._lock:
+            if name not in self._validated:
+                self._validated[name] = self._load_entry(name)
+            return self._validated[name]
+
+    def reset(self) -> None:
+        """Drop loaded entries so the next access revalidates against sources."""
+        with self._lock:
+            self._snapshot = None
+            self._validated = {}
+
+    def _load_entry(self, name: str) -> Any:
+        if _snapshot_disabled():
+            return _COMPILERS[name](_read_source(name)[0])
+
+        if self._snapshot is None:
+            self._snapshot = _read_snapshot(self._path) or {
+                "version": SNAPSHOT_VERSION, "sources": {}, "data": {},
+            }
+        snapshot = self._snapshot
+        if name in snapshot["data"] and snapshot["sources"].get(name) == _source_hash(name):
+            return snapshot["data"][name]
+
+        logger.info("Compiling dictionary %s from source", SOURCES[name])
+        text, digest = _read_source(name)
+        snapshot["sources"][name] = digest
+        snapshot["data"][name] = _COMPILERS[name](text)
+        _write_snapshot(self._path, snapshot)
+        return snapshot["data"][name]
+
+
+_snapshot = DictionarySnapshot()
+
+
+def load_dictionary(name: str) -> Any:
+    """Return the compiled payload for a shared dictionary source."""
+    return _snapshot.get(name)
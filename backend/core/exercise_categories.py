@@ -5,13 +5,13 @@
 from __future__ import annotations
 
 
-import json
 import logging
 import pathlib
 from typing import Optional, Dict
 
 
-import yaml
+from backend.core.dictionary_snapshot import load_dictionary
+from backend.core.export_trace import current_trace
 
 
 logger = logging.getLogger(__name__)
@@ -49,28 +49,36 @@ MANUAL_CATEGORY_OVERRIDES: Dict[str, str] = {
 
 
 
-def _load_raw() -> Dict[str, dict]:
-    """Load GarminExercisesCollector-derived YAML with official categories."""
-    try:
-        if not RAW_FILE.exists():
-            logger.error("garmin_exercises_raw.yaml missing at %s", RAW_FILE)
-            return {}
-        data = yaml.safe_load(RAW_FILE.read_text()) or {}
-        if not isinstance(data, dict):
-            logger.error(
-                "garmin_exercises_raw.yaml has unexpected format (expected dict, got %s)",
-                type(data),
-            )
-            return {}
-        return {str(k).lower(): v for k, v in data.items()}
-    except Exception as e:
-        logger.error("Failed to load raw Garmin dataset: %s", e)
-        return {}
+_EMPTY_DATASET: Dict[str, Dict[str, str]] = {"entries": {}, "categories": {}}
+_raw_dataset: Optional[Dict[str, Dict]] = None
 
 
+def _load_raw_dataset() -> Dict[str, Dict]:
+    """
+    Load GarminExercisesCollector-derived data with official categories.
+
+    Served from the precompiled dictionary snapshot on first use, so importing
+    this module no longer parses garmin_exercises_raw.yaml.
+    """
+    global _raw_dataset
+    if _raw_dataset is None:
+        try:
+            if not RAW_FILE.exists():
+                logger.error("garmin_exercises_raw.yaml missing at %s", RAW_FILE)
+                _raw_dataset = _EMPTY_DATASET
+            else:
+                _raw_dataset = load_dictionary("garmin_exercises_raw")
+        except Exception as e:
+            logger.error("Failed to load raw Garmin dataset: %s", e)
+            _raw_dataset = _EMPTY_DATASET
+    return _raw_dataset
 
 
-RAW: Dict[str, dict] = _load_raw()
+def __getattr__(name: str):
+    # RAW is resolved lazily: {lowercased name: {"name": ..., "category": ...}}
+    if name == "RAW":
+        return _load_raw_dataset()["entries"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 
@@ -88,20 +96,9 @@ def _official_category(name: str) -> Optional[str]:
         return None
 
 
-    key = name.strip().lower()
-    ex = RAW.get(key)
-    if not ex:
-        return None
-
-
-    cat = ex.get("category")
-    if not cat:
-        return None
-
-
-    # Most collector categories are already in enum form (e.g. BENCH_PRESS),
-    # but we normalize anyway.
-    return str(cat).strip().upper().replace(" ", "_") or None
+    # Categories are pre-normalized to enum form (e.g. BENCH_PRESS) when the
+    # dictionary snapshot is compiled.
+    return _load_raw_dataset()["categories"].get(name.strip().lower())
 
 
 
@@ -133,39 +130,18 @@ def add_category_to_exercise_name(garmin_name: str) -> str:
         category = _official_category(garmin_name)
 
 
-    # 3) No category at all → return name unchanged but log
+    trace = current_trace()
+    if trace is not None:
+        trace.event("category_assign", garmin_name=garmin_name, category=category)
+
+    # 3) No category at all → return name unchanged
     if not category:
-        print("=== GARMIN_CATEGORY_ASSIGN ===")
-        print(
-            json.dumps(
-                {
-                    "garmin_name_before": garmin_name,
-                    "assigned_category": None,
-                    "garmin_name_after": garmin_name,
-                },
-                indent=2,
-            )
-        )
         return garmin_name
 
 
     name_with_category = f"{garmin_name} [category: {category}]"
 
 
-    # Debug logging (keeps your existing log format)
-    print("=== GARMIN_CATEGORY_ASSIGN ===")
-    print(
-        json.dumps(
-            {
-                "garmin_name_before": garmin_name,
-                "assigned_category": category,
-                "garmin_name_after": name_with_category,
-            },
-            indent=2,
-        )
-    )
-
-
     return name_with_category
 
 
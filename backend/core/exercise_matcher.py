@@ -19,6 +19,7 @@ from enum import Enum
 from rapidfuzz import fuzz, process
 
 from backend.core.normalize import normalize
+from backend.core.spans import span
 
 if TYPE_CHECKING:
     from application.ports import ExercisesRepository
@@ -91,6 +92,7 @@ class ExerciseMatchingService:
         """Clear the exercises cache."""
         self._exercises_cache = None
 
+    @span("match.exercise")
     def match(self, planned_name: str) -> ExerciseMatch:
         """
         Match a planned exercise name to a canonical exercise.
@@ -189,6 +191,7 @@ class ExerciseMatchingService:
                     )
         return None
 
+    @span("match.fuzzy")
     def _try_fuzzy_match(self, planned_name: str) -> Optional[ExerciseMatch]:
         """Try fuzzy matching using rapidfuzz."""
         exercises = self._get_all_exercises()
@@ -267,6 +270,7 @@ class ExerciseMatchingService:
                 return True
         return False
 
+    @span("match.llm")
     def _try_llm_match(
         self,
         planned_name: str,
@@ -317,12 +321,13 @@ Respond with JSON:
 If the input doesn't clearly match any candidate, return null for exercise_id with low confidence."""
 
             # Call LLM (assuming OpenAI-compatible client)
-            response = self._llm_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                response_format={"type": "json_object"}
-            )
+            with span("llm.match"):
+                response = self._llm_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                )
 
             result = json.loads(response.choices[0].message.content)
 
@@ -362,6 +367,7 @@ If the input doesn't clearly match any candidate, return null for exercise_id wi
         """
         return [self.match(name) for name in planned_names]
 
+    @span("match.suggest")
     def suggest_matches(self, planned_name: str, limit: int = 5) -> List[ExerciseMatch]:
         """
         Get top N suggested matches for an exercise name.
@@ -0,0 +1,174 @@
+"""
+Shared exercise-name parser.
+
+Exercise names from OCR, AI parsing and the editor carry structure inside
+the string: a superset label ("A1:"), a rep scheme ("X10", "X8 EACH SIDE",
+"Xi2"), a distance ("200M SKI", "1.5 km Run") and a leading count
+("100 Wall Balls"). The export adapters each used to pick these apart
+with their own uncompiled patterns on every exercise of every export.
+
+split_exercise_name() extracts all of them in one call with precompiled
+patterns and memoizes the result by raw string, so an exercise that
+appears in many workouts (or in several adapters during one export) is
+parsed once per process:
+
+- label / name: superset label and the name without it
+- base_name: name without the trailing rep scheme, for display
+- reps / reps_style: trailing "X10" ("x"), "X10 EACH SIDE" ("each_side")
+  or "Xi2" ("xi") count, and name_without_reps (name before it)
+- each_side / each_side_reps: "EACH SIDE" / "X5 EACH SIDE" anywhere
+- leading_count / count_stripped: "100 Wall Balls" -> 100, "Wall Balls"
+- distance / has_distance_prefix: "1000m Ski" -> (1000.0, "m")
+- has_rep_count: any "x10" token after the label
+
+Only fields an adapter reads are extracted; add one here together with
+its first consumer.
+
+lookup_key() is the normalized form used for Garmin exercise lookups.
+
+Usage:
+    >>> parts = split_exercise_name("A1: KB SWING X10 EACH SIDE")
+    >>> parts.label, parts.name_without_reps, parts.reps, parts.reps_style
+    ('A1', 'KB SWING', 10, 'each_side')
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Number of distinct raw names kept; exercise vocabularies are small, so this
+# covers every name a process sees in practice.
+PARSE_CACHE_SIZE = 8192
+
+LABEL_PREFIX = re.compile(r"^([A-Z]\d+)[:\s;]+", re.IGNORECASE)
+TRAILING_EACH_SIDE = re.compile(r"\s+X\s*(\d+)\s+EACH\s+SIDE$", re.IGNORECASE)
+TRAILING_REPS = re.compile(r"\s+X\s*(\d+)$", re.IGNORECASE)
+TRAILING_XI = re.compile(r"\s+Xi(\d+)$", re.IGNORECASE)
+REP_SCHEME_SUFFIX = re.compile(r"\s+X\s*\d+.*$", re.IGNORECASE)
+WB_SUFFIX = re.compile(r"\s+wb$", re.IGNORECASE)
+EACH_SIDE = re.compile(r"EACH\s+SIDE", re.IGNORECASE)
+EACH_SIDE_REPS = re.compile(r"X\s*(\d+)\s+EACH\s+SIDE", re.IGNORECASE)
+REP_COUNT = re.compile(r"x\d+", re.IGNORECASE)
+LEADING_COUNT = re.compile(r"^(\d+)\s+(.+)$")
+LEADING_DISTANCE = re.compile(
+    r"^(\d+(?:\.\d+)?)\s*(m|km|miles?|yards?)\s+(.+)$", re.IGNORECASE
+)
+DISTANCE_PREFIX = re.compile(r"^[\d.]+\s*(m|km|mi)\s+", re.IGNORECASE)
+
+# lookup_key() patterns, applied to the lowercased name
+_LOOKUP_REPS = re.compile(r"\s*x\s*\d+.*$")
+_LOOKUP_SIDE = re.compile(r"\s+(each|per)\s+(side|arm|leg).*$")
+_LOOKUP_TRAILING_DISTANCE = re.compile(r"\s*[\d.]+\s*(m|km)\s*$")
+_LOOKUP_LEADING_DISTANCE = re.compile(r"^[\d.]+\s*(m|km)\s+")
+_LOOKUP_EQUIPMENT = ("db ", "kb ", "bb ", "sb ", "mb ", "trx ", "cable ", "band ")
+
+
+@dataclass(frozen=True, slots=True)
+class ExerciseNameParts:
+    """Structure extracted from a raw exercise name (see module docstring)."""
+
+    raw: str
+    name: str
+    base_name: str
+    name_without_reps: str
+    label: Optional[str] = None
+    reps: Optional[int] = None
+    reps_style: Optional[str] = None
+    each_side: bool = False
+    each_side_reps: Optional[int] = None
+    has_rep_count: bool = False
+    leading_count: Optional[int] = None
+    count_stripped: Optional[str] = None
+    distance: Optional[Tuple[float, str]] = None
+    has_distance_prefix: bool = False
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def split_exercise_name(raw: str) -> ExerciseNameParts:
+    """
+    Parse a raw exercise name into its parts.
+
+    Results are memoized by raw string; ExerciseNameParts is immutable,
+    so callers can share them freely.
+    """
+    raw = raw or ""
+    stripped = raw.strip()
+
+    label = None
+    name = stripped
+    label_match = LABEL_PREFIX.match(stripped)
+    if label_match:
+        label = label_match.group(1).upper()
+        name = stripped[label_match.end():].strip()
+
+    # Trailing rep scheme, most specific first
+    reps = None
+    reps_style = None
+    name_without_reps = name
+    for pattern, style in (
+        (TRAILING_EACH_SIDE, "each_side"),
+        (TRAILING_REPS, "x"),
+        (TRAILING_XI, "xi"),
+    ):
+        match = pattern.search(name)
+        if match:
+            reps = int(match.group(1))
+            reps_style = style
+            name_without_reps = name[: match.start()].strip()
+            break
+
+    base_name = REP_SCHEME_SUFFIX.sub("", name).strip()
+    base_name = WB_SUFFIX.sub("", base_name).strip()
+
+    each_side_match = EACH_SIDE_REPS.search(raw)
+
+    count_match = LEADING_COUNT.match(raw)
+    distance_match = LEADING_DISTANCE.match(raw)
+
+    return ExerciseNameParts(
+        raw=raw,
+        name=name,
+        base_name=base_name,
+        name_without_reps=name_without_reps,
+        label=label,
+        reps=reps,
+        reps_style=reps_style,
+        each_side=EACH_SIDE.search(raw) is not None,
+        each_side_reps=int(each_side_match.group(1)) if each_side_match else None,
+        has_rep_count=REP_COUNT.search(name) is not None,
+        leading_count=int(count_match.group(1)) if count_match else None,
+        count_stripped=count_match.group(2) if count_match else None,
+        distance=(
+            (float(distance_match.group(1)), distance_match.group(2).lower())
+            if distance_match
+            else None
+        ),
+        has_distance_prefix=DISTANCE_PREFIX.match(raw) is not None,
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def lookup_key(name: str) -> str:
+    """
+    Normalize an exercise name for Garmin exercise lookups.
+
+    Lowercases and drops the label, equipment prefixes, rep scheme,
+    "each side" suffix and distances: "A1: DB Bench Press X10" ->
+    "bench press".
+    """
+    name = name.lower().strip()
+    # Remove trailing pipe characters that may come from canonical format parsing
+    name = name.rstrip("|").strip()
+
+    name = LABEL_PREFIX.sub("", name)
+
+    for prefix in _LOOKUP_EQUIPMENT:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+
+    name = _LOOKUP_REPS.sub("", name)
+    name = _LOOKUP_SIDE.sub("", name)
+    name = _LOOKUP_TRAILING_DISTANCE.sub("", name)
+    name = _LOOKUP_LEADING_DISTANCE.sub("", name)
+    return name.strip()
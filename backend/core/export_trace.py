@@ -0,0 +1,250 @@
+"""
+Structured, sampled tracing for workout exports.
+
+Replaces ad-hoc ``print()`` debugging in the Garmin export path. When tracing
+is off (the default) every entry point returns immediately, so the hot path
+only pays for a context-variable lookup. When enabled, a sampled fraction of
+exports records a trace - mapping decisions as leveled events plus wall-clock
+timings per stage - into a fixed-size ring buffer that the admin endpoint
+``GET /debug/export-traces`` exposes.
+
+Usage:
+    with export_trace("hyrox_yaml", title=title):
+        with trace_stage("map_exercises"):
+            ...
+            trace = current_trace()
+            if trace is not None:
+                trace.event("category_assign", garmin_name=name, category=cat)
+
+Configuration comes from Settings (``EXPORT_TRACE_LEVEL``,
+``EXPORT_TRACE_SAMPLE_RATE``, ``EXPORT_TRACE_BUFFER_SIZE``);
+``GARMIN_EXPORT_DEBUG=true`` implies the ``debug`` level.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Trace levels, reusing the logging numbers. "off" disables tracing entirely.
+TRACE_LEVELS: Dict[str, int] = {
+    "off": logging.CRITICAL + 10,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+# Cap events per trace so a pathological workout cannot grow one trace unbounded
+MAX_EVENTS_PER_TRACE = 500
+
+_current: ContextVar[Optional["ExportTrace"]] = ContextVar("export_trace", default=None)
+_NULL_CONTEXT = nullcontext()
+
+
+class ExportTrace:
+    """Events and stage timings recorded for a single export."""
+
+    __slots__ = (
+        "trace_id", "kind", "attrs", "level", "started_at", "_t0",
+        "events", "stages", "dropped_events", "duration_ms", "error",
+    )
+
+    def __init__(self, trace_id: int, kind: str, level: int, attrs: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.kind = kind
+        self.attrs = attrs
+        self.level = level
+        self.started_at = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self.events: List[Dict[str, Any]] = []
+        self.stages: Dict[str, float] = {}
+        self.dropped_events = 0
+        self.duration_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def event(self, name: str, level: int = logging.DEBUG, **fields: Any) -> None:
+        """Record an event if it meets the trace level."""
+        if level < self.level:
+            return
+        if len(self.events) >= MAX_EVENTS_PER_TRACE:
+            self.dropped_events += 1
+            return
+        self.events.append({
+            "name": name,
+            "level": logging.getLevelName(level).lower(),
+            "t_ms": round((time.perf_counter() - self._t0) * 1000, 3),
+            **fields,
+        })
+
+    def add_stage_time(self, stage: str, elapsed_ms: float) -> None:
+        self.stages[stage] = round(self.stages.get(stage, 0.0) + elapsed_ms, 3)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.duration_ms = round((time.perf_counter() - self._t0) * 1000, 3)
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "kind": self.kind,
+            "attrs": self.attrs,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "stages_ms": dict(self.stages),
+            "events": list(self.events),
+            "dropped_events": self.dropped_events,
+            "error": self.error,
+        }
+
+
+class ExportTracer:
+    """Creates sampled export traces and keeps the most recent in a ring buffer."""
+
+    def __init__(self, level: str = "off", sample_rate: float = 1.0, buffer_size: int = 200):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._traces: Deque[ExportTrace] = deque(maxlen=max(1, buffer_size))
+        self.level_name = "off"
+        self.level = TRACE_LEVELS["off"]
+        self.sample_rate = 1.0
+        self.enabled = False
+        self.configure(level=level, sample_rate=sample_rate, buffer_size=buffer_size)
+
+    def configure(
+        self,
+        level: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """Change tracing settings at runtime."""
+        with self._lock:
+            if level is not None:
+                level = level.lower()
+                if level not in TRACE_LEVELS:
+                    raise ValueError(
+                        f"Unknown export trace level {level!r}; expected one of {sorted(TRACE_LEVELS)}"
+                    )
+                self.level_name = level
+                self.level = TRACE_LEVELS[level]
+            if sample_rate is not None:
+                self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+            if buffer_size is not None and buffer_size != self._traces.maxlen:
+                self._traces = deque(self._traces, maxlen=max(1, buffer_size))
+            self.enabled = self.level_name != "off" and self.sample_rate > 0
+
+    def export(self, kind: str, **attrs: Any):
+        """Context manager tracing one export; yields the trace or None if not sampled."""
+        if not self.enabled or _current.get() is not None:
+            # Disabled, or nested inside an export that is already traced
+            return _NULL_CONTEXT
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return _NULL_CONTEXT
+        return self._record(kind, attrs)
+
+    @contextmanager
+    def _record(self, kind: str, attrs: Dict[str, Any]) -> Iterator[ExportTrace]:
+        trace = ExportTrace(next(self._ids), kind, self.level, attrs)
+        token = _current.set(trace)
+        error: Optional[BaseException] = None
+        try:
+            yield trace
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current.reset(token)
+            trace.finish(error)
+            with self._lock:
+                self._traces.append(trace)
+
+    def recent(self, limit: Optional[int] = None, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent traces first."""
+        with self._lock:
+            traces = list(self._traces)
+        traces.reverse()
+        if kind:
+            traces = [t for t in traces if t.kind == kind]
+        if limit is not None:
+            traces = traces[:limit]
+        return [t.to_dict() for t in traces]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+    def config(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "level": self.level_name,
+            "sample_rate": self.sample_rate,
+            "buffer_size": self._traces.maxlen,
+            "buffered": len(self._traces),
+        }
+
+
+_tracer: Optional[ExportTracer] = None
+_tracer_lock = threading.Lock()
+
+
+def get_export_tracer() -> ExportTracer:
+    """Process-wide tracer configured from settings on first use."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                level = settings.export_trace_level
+                if level == "off" and settings.garmin_export_debug:
+                    level = "debug"
+                _tracer = ExportTracer(
+                    level=level,
+                    sample_rate=settings.export_trace_sample_rate,
+                    buffer_size=settings.export_trace_buffer_size,
+                )
+    return _tracer
+
+
+def current_trace() -> Optional[ExportTrace]:
+    """The trace for the export running in this context, if it is being traced."""
+    return _current.get()
+
+
+def export_trace(kind: str, **attrs: Any):
+    """Trace one export (see ExportTracer.export)."""
+    return get_export_tracer().export(kind, **attrs)
+
+
+@contextmanager
+def _timed_stage(trace: ExportTrace, stage: str) -> Iterator[ExportTrace]:
+    t0 = time.perf_counter()
+    try:
+        yield trace
+    finally:
+        trace.add_stage_time(stage, (time.perf_counter() - t0) * 1000)
+
+
+def trace_stage(stage: str):
+    """Accumulate wall-clock time for a stage of the current export."""
+    trace = _current.get()
+    if trace is None:
+        return _NULL_CONTEXT
+    return _timed_stage(trace, stage)
+
+
+def trace_event(name: str, level: int = logging.DEBUG, **fields: Any) -> None:
+    """Record an event on the current export's trace, if any."""
+    trace = _current.get()
+    if trace is not None:
+        trace.event(name, level, **fields)
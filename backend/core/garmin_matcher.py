@@ -5,6 +5,7 @@ import pathlib
 from rapidfuzz import fuzz, process
 from .normalize import normalize
 from backend.mapping.exercise_name_matcher import best_match, top_matches
+from backend.core.spans import span
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 
@@ -25,6 +26,7 @@ def load_garmin_exercises():
     return _GARMIN_EXERCISES
 
 
+@span("garmin.find")
 def find_garmin_exercise(raw_name: str, threshold: int = 80) -> tuple[str, float]:
     """
     Find best matching Garmin exercise name.
@@ -46,6 +48,7 @@ def find_garmin_exercise(raw_name: str, threshold: int = 80) -> tuple[str, float
     return None, 0.0
 
 
+@span("garmin.suggest")
 def get_garmin_suggestions(raw_name: str, limit: int = 5, score_cutoff: float = 0.3) -> list[tuple[str, float]]:
     """
     Get top matching Garmin exercise suggestions.
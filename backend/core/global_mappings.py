@@ -5,12 +5,17 @@ Popular mappings are prioritized in auto-mapping.
 """
 import yaml
 import pathlib
+import threading
 from typing import Optional, Dict, List, Tuple
 from collections import defaultdict
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 POPULARITY_FILE = ROOT / "shared/dictionaries/global_mappings.yaml"
 
+# Serializes read-modify-write of the popularity file (writes run on
+# background worker threads)
+_write_lock = threading.Lock()
+
 
 def load_global_mappings() -> Dict[str, Dict[str, int]]:
     """
@@ -49,16 +54,17 @@ def record_mapping_choice(exercise_name: str, garmin_name: str):
     from backend.core.normalize import normalize
 
     normalized = normalize(exercise_name)
-    mappings = load_global_mappings()
+    with _write_lock:
+        mappings = load_global_mappings()
 
-    if normalized not in mappings:
-        mappings[normalized] = {}
+        if normalized not in mappings:
+            mappings[normalized] = {}
 
-    if garmin_name not in mappings[normalized]:
-        mappings[normalized][garmin_name] = 0
+        if garmin_name not in mappings[normalized]:
+            mappings[normalized][garmin_name] = 0
 
-    mappings[normalized][garmin_name] += 1
-    save_global_mappings(mappings)
+        mappings[normalized][garmin_name] += 1
+        save_global_mappings(mappings)
 
 
 def get_popular_mappings(exercise_name: str, limit: int = 5) -> List[Tuple[str, int]]:
@@ -1,31 +1,67 @@
-import re, yaml, pathlib
+import re, pathlib
+
+from backend.core.dictionary_snapshot import load_dictionary
+from backend.core.spans import span
 
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 
-DICT = yaml.safe_load((ROOT / "shared/dictionaries/normalization.yaml").read_text())
+_RULES = None
+
+
+
+def __getattr__(name):
+
+    # DICT (normalization.yaml) is loaded lazily from the dictionary snapshot.
+
+    if name == "DICT":
+
+        return load_dictionary("normalization")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 
+def _rules():
 
+    """Compile the expansion patterns and word sets once per process."""
 
+    global _RULES
+
+    if _RULES is None:
+
+        d = load_dictionary("normalization")
+
+        expand = [(re.compile(rf"\b{k}\b"), v) for k, v in d["expand"].items()]
+
+        _RULES = (expand, frozenset(d["stopwords"]), d["plural_to_singular"])
+
+    return _RULES
+
+
+
+@span("normalize")
 def normalize(text: str) -> str:
 
+    expand, stopwords, plural_to_singular = _rules()
+
     t = text.lower()
 
-    for k,v in DICT["expand"].items():
+    for pattern, v in expand:
 
-        t = re.sub(rf"\b{k}\b", v, t)
+        t = pattern.sub(v, t)
 
     t = re.sub(r"[-_/]", " ", t)
 
     t = re.sub(r"[^\w\s]", "", t)
 
-    words = [w for w in t.split() if w not in set(DICT["stopwords"])]
+    words = [w for w in t.split() if w not in stopwords]
 
     for i,w in enumerate(words):
 
-        if w in DICT["plural_to_singular"]:
+        if w in plural_to_singular:
 
-            words[i] = DICT["plural_to_singular"][w]
+            words[i] = plural_to_singular[w]
 
     return " ".join(words).strip()
@@ -0,0 +1,289 @@
+"""
+Single-pass personal-records engine.
+
+Part of AMA-299: Exercise Progression Tracking
+Phase 3 - Progression Features
+
+ProgressionService used to compute personal records exercise by exercise,
+re-reading every session and estimating 1RM one set at a time. This module
+computes the records for every exercise in one pass over a user's flat set
+rows (see ProgressionRepository.get_all_sets):
+
+- 1RM estimates are vectorized over the weight/reps arrays for both formulas,
+  so the exercise's configured formula can be chosen afterwards.
+- Per-exercise maxima are found with one sort per metric instead of a Python
+  loop per set.
+
+The result is a per-user PR table (exercise_id -> ExerciseRecords) cached in
+PersonalRecordsCache and merged incrementally when a completion is saved,
+so reading records does not rescan history.
+
+Tie-breaking matches the original loop: rows arrive newest first and the
+first (newest) set reaching a maximum holds the record.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+import threading
+import time
+
+import numpy as np
+
+# Formulas an exercise can be configured with (exercise.one_rm_formula)
+RECORD_FORMULAS = ("brzycki", "epley")
+
+# Users whose PR tables are kept in memory
+DEFAULT_CACHE_SIZE = 1024
+
+# Cached tables are rebuilt after this long, picking up completions saved by
+# other workers
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+
+@dataclass
+class RecordCandidate:
+    """The set holding one record for one exercise."""
+    value: float
+    weight: float
+    reps: Any
+    workout_date: str
+    completion_id: str
+
+    def beats(self, other: Optional["RecordCandidate"]) -> bool:
+        """Higher value wins; on a tie the newer workout keeps the record."""
+        if other is None:
+            return True
+        if self.value != other.value:
+            return self.value > other.value
+        return self.workout_date > other.workout_date
+
+
+@dataclass
+class ExerciseRecords:
+    """All-time records for one exercise."""
+    exercise_id: str
+    exercise_name: str
+    completion_ids: Set[str] = field(default_factory=set)
+    best_1rm: Dict[str, RecordCandidate] = field(default_factory=dict)
+    max_weight: Optional[RecordCandidate] = None
+    max_reps: Optional[RecordCandidate] = None
+
+    @property
+    def session_count(self) -> int:
+        return len(self.completion_ids)
+
+    def merged(self, other: "ExerciseRecords") -> "ExerciseRecords":
+        """A copy with records computed from newer rows folded in."""
+        result = ExerciseRecords(
+            exercise_id=self.exercise_id,
+            exercise_name=self.exercise_name,
+            completion_ids=set(self.completion_ids),
+            best_1rm=dict(self.best_1rm),
+            max_weight=self.max_weight,
+            max_reps=self.max_reps,
+        )
+        result.merge(other)
+        return result
+
+    def merge(self, other: "ExerciseRecords") -> None:
+        """Fold in records computed from newer rows."""
+        self.completion_ids |= other.completion_ids
+        for formula, candidate in other.best_1rm.items():
+            if candidate.beats(self.best_1rm.get(formula)):
+                self.best_1rm[formula] = candidate
+        if other.max_weight is not None and other.max_weight.beats(self.max_weight):
+            self.max_weight = other.max_weight
+        if other.max_reps is not None and other.max_reps.beats(self.max_reps):
+            self.max_reps = other.max_reps
+
+
+def estimate_1rm_array(weights: Any, reps: Any, formula: str = "brzycki") -> np.ndarray:
+    """
+    Vectorized calculate_1rm over weight and rep arrays.
+
+    Applies the same rules as the scalar formulas (0 for reps <= 0, the weight
+    itself for a single, Brzycki capped at 2.5x from 37 reps) and rounds to
+    1 decimal place.
+    """
+    weights = np.asarray(weights, dtype=float)
+    reps = np.asarray(reps, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if formula == "epley":
+            estimates = weights * (1.0 + reps / 30.0)
+        else:
+            estimates = np.where(reps >= 37, weights * 2.5, weights * (36.0 / (37.0 - reps)))
+
+    estimates = np.where(reps == 1, weights, estimates)
+    estimates = np.where(reps <= 0, 0.0, estimates)
+    return np.round(estimates, 1)
+
+
+def _group_argmax(codes: np.ndarray, values: np.ndarray, mask: np.ndarray) -> Dict[int, int]:
+    """Row index of the largest value per group code; earliest row wins ties."""
+    rows = np.flatnonzero(mask)
+    if rows.size == 0:
+        return {}
+
+    # Sort by group, then value descending, then row order
+    order = rows[np.lexsort((rows, -values[rows], codes[rows]))]
+    grouped = codes[order]
+    first = np.ones(order.size, dtype=bool)
+    first[1:] = grouped[1:] != grouped[:-1]
+    winners = order[first]
+    return dict(zip(codes[winners].tolist(), winners.tolist()))
+
+
+def compute_records(rows: List[Dict[str, Any]]) -> Dict[str, ExerciseRecords]:
+    """
+    Build the PR table for every exercise from flat set rows.
+
+    Args:
+        rows: Set rows, newest first, each with exercise_id, exercise_name,
+            completion_id, workout_date, weight and reps_completed
+
+    Returns:
+        Map of exercise_id to ExerciseRecords
+    """
+    table: Dict[str, ExerciseRecords] = {}
+    if not rows:
+        return table
+
+    exercise_ids: List[str] = []
+    code_of: Dict[str, int] = {}
+    codes = np.empty(len(rows), dtype=np.int64)
+    weights = np.empty(len(rows), dtype=float)
+    reps = np.empty(len(rows), dtype=float)
+
+    for i, row in enumerate(rows):
+        exercise_id = row["exercise_id"]
+        code = code_of.get(exercise_id)
+        if code is None:
+            code = code_of[exercise_id] = len(exercise_ids)
+            exercise_ids.append(exercise_id)
+            table[exercise_id] = ExerciseRecords(
+                exercise_id=exercise_id,
+                exercise_name=row.get("exercise_name") or exercise_id,
+            )
+        table[exercise_id].completion_ids.add(row.get("completion_id", ""))
+
+        weight = row.get("weight")
+        rep_count = row.get("reps_completed")
+        codes[i] = code
+        weights[i] = np.nan if weight is None else weight
+        reps[i] = 0 if rep_count is None else rep_count
+
+    # Records only count sets with both a weight and reps
+    valid = ~np.isnan(weights) & (reps > 0)
+
+    def candidate(index: int, value: float) -> RecordCandidate:
+        row = rows[index]
+        return RecordCandidate(
+            value=value,
+            weight=row["weight"],
+            reps=row["reps_completed"],
+            workout_date=row.get("workout_date", ""),
+            completion_id=row.get("completion_id", ""),
+        )
+
+    for formula in RECORD_FORMULAS:
+        estimates = estimate_1rm_array(weights, reps, formula)
+        for code, index in _group_argmax(codes, estimates, valid).items():
+            table[exercise_ids[code]].best_1rm[formula] = candidate(index, float(estimates[index]))
+
+    for code, index in _group_argmax(codes, weights, valid).items():
+        table[exercise_ids[code]].max_weight = candidate(index, rows[index]["weight"])
+
+    for code, index in _group_argmax(codes, reps, valid).items():
+        table[exercise_ids[code]].max_reps = candidate(index, rows[index]["reps_completed"])
+
+    return table
+
+
+def merge_records(
+    table: Dict[str, ExerciseRecords],
+    rows: List[Dict[str, Any]],
+) -> Dict[str, ExerciseRecords]:
+    """
+    A new PR table with the set rows of newly saved completions folded in.
+
+    ``table`` and its ExerciseRecords are left untouched (copy-on-write), so
+    readers holding it never see a half-applied merge.
+    """
+    merged = dict(table)
+    for exercise_id, records in compute_records(rows).items():
+        existing = merged.get(exercise_id)
+        merged[exercise_id] = records if existing is None else existing.merged(records)
+    return merged
+
+
+class PersonalRecordsCache:
+    """
+    Bounded per-user cache of PR tables.
+
+    Least recently used users are evicted past ``max_users``; entries older
+    than ``ttl_seconds`` are treated as missing so the table is rebuilt.
+    """
+
+    def __init__(
+        self,
+        max_users: int = DEFAULT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        self._max_users = max(1, max_users)
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._tables: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, user_id: str) -> Optional[Dict[str, ExerciseRecords]]:
+        with self._lock:
+            entry = self._tables.get(user_id)
+            if entry is None:
+                return None
+            stored_at, table = entry
+            if time.monotonic() - stored_at > self._ttl_seconds:
+                del self._tables[user_id]
+                return None
+            self._tables.move_to_end(user_id)
+            return table
+
+    def put(self, user_id: str, table: Dict[str, ExerciseRecords]) -> None:
+        with self._lock:
+            self._tables[user_id] = (time.monotonic(), table)
+            self._tables.move_to_end(user_id)
+            while len(self._tables) > self._max_users:
+                self._tables.popitem(last=False)
+
+    def record_completion_sets(self, user_id: str, rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Merge a saved completion's set rows into the user's cached table.
+
+        Users without a cached table are left alone; their table is built
+        from the repository on the next read. The merged table replaces the
+        cached one, so tables handed out by get() are never modified.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock:
+            entry = self._tables.get(user_id)
+            if entry is not None:
+                stored_at, table = entry
+                self._tables[user_id] = (stored_at, merge_records(table, rows))
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's table (their completions were deleted)."""
+        with self._lock:
+            self._tables.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+
+_cache = PersonalRecordsCache()
+
+
+def get_personal_records_cache() -> PersonalRecordsCache:
+    """Process-wide PR table cache."""
+    return _cache
@@ -17,6 +17,12 @@ import logging
 
 from application.ports.progression_repository import ProgressionRepository
 from application.ports.exercises_repository import ExercisesRepository
+from backend.core.personal_records import (
+    RECORD_FORMULAS,
+    ExerciseRecords,
+    PersonalRecordsCache,
+    compute_records,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +178,18 @@ class VolumeAnalyticsResponse:
     granularity: str
 
 
+@dataclass
+class OneRepMaxTrendResponse:
+    """Response for the estimated 1RM trend endpoint."""
+    exercise_id: str
+    exercise_name: str
+    supports_1rm: bool
+    one_rm_formula: str
+    data: List[Dict[str, Any]]
+    period: Dict[str, Any]
+    granularity: str
+
+
 # =============================================================================
 # Progression Service
 # =============================================================================
@@ -191,6 +209,7 @@ class ProgressionService:
         self,
         progression_repo: ProgressionRepository,
         exercises_repo: ExercisesRepository,
+        records_cache: Optional[PersonalRecordsCache] = None,
     ):
         """
         Initialize the progression service.
@@ -198,9 +217,12 @@ class ProgressionService:
         Args:
             progression_repo: Repository for progression data access
             exercises_repo: Repository for exercise metadata
+            records_cache: Per-user personal-records tables; without one the
+                table is rebuilt on every request
         """
         self._progression_repo = progression_repo
         self._exercises_repo = exercises_repo
+        self._records_cache = records_cache
 
     def get_exercise_history(
         self,
@@ -327,6 +349,10 @@ class ProgressionService:
         - max_weight: Heaviest weight lifted
         - max_reps: Most reps at any weight
 
+        Records for every exercise come from one pass over the user's sets
+        (see backend.core.personal_records), served from the records cache
+        when one is configured.
+
         Args:
             user_id: User ID
             record_type: Filter to specific record type
@@ -337,117 +363,65 @@ class ProgressionService:
             PersonalRecordResponse with records list
         """
         records: List[Dict[str, Any]] = []
+        table = self._get_records_table(user_id)
 
-        # Get exercises to calculate records for
+        # Pick the exercises to report
         if exercise_id:
-            exercises = [self._exercises_repo.get_by_id(exercise_id)]
-            exercises = [e for e in exercises if e is not None]
+            selected = [table[exercise_id]] if exercise_id in table else []
         else:
-            # Get exercises that the user has history for
-            exercises_with_history = self._progression_repo.get_exercises_with_history(
-                user_id,
-                limit=limit,
-            )
-            exercise_ids = [e.get("exercise_id") for e in exercises_with_history]
-            exercises = [
-                self._exercises_repo.get_by_id(eid)
-                for eid in exercise_ids
-                if eid
-            ]
-            exercises = [e for e in exercises if e is not None]
-
-        for exercise in exercises:
+            # Exercises the user has trained most often
+            selected = sorted(
+                table.values(), key=lambda r: r.session_count, reverse=True
+            )[:limit]
+
+        for exercise_records in selected:
+            exercise = self._exercises_repo.get_by_id(exercise_records.exercise_id)
+            if exercise is None:
+                continue
+
             ex_id = exercise.get("id", "")
             ex_name = exercise.get("name", "")
             supports_1rm = exercise.get("supports_1rm", False)
             formula = exercise.get("one_rm_formula", "brzycki")
+            if formula not in RECORD_FORMULAS:
+                formula = "brzycki"
 
-            # Get all sessions for this exercise
-            sessions = self._progression_repo.get_all_exercise_sessions(
-                user_id,
-                ex_id,
-            )
-
-            # Calculate records
-            best_1rm = None
-            best_1rm_details = None
-            best_1rm_date = None
-            best_1rm_completion = None
-
-            max_weight = None
-            max_weight_date = None
-            max_weight_completion = None
-
-            max_reps = None
-            max_reps_weight = None
-            max_reps_date = None
-            max_reps_completion = None
-
-            for session in sessions:
-                session_date = session.get("workout_date", "")
-                completion_id = session.get("completion_id", "")
-
-                for set_data in session.get("sets", []):
-                    weight = set_data.get("weight")
-                    reps = set_data.get("reps_completed")
-
-                    if weight is not None and reps is not None and reps > 0:
-                        # Calculate 1RM
-                        if supports_1rm:
-                            est_1rm = calculate_1rm(weight, reps, formula)
-                            if best_1rm is None or est_1rm > best_1rm:
-                                best_1rm = est_1rm
-                                best_1rm_details = {"weight": weight, "reps": reps}
-                                best_1rm_date = session_date
-                                best_1rm_completion = completion_id
-
-                        # Track max weight
-                        if max_weight is None or weight > max_weight:
-                            max_weight = weight
-                            max_weight_date = session_date
-                            max_weight_completion = completion_id
-
-                        # Track max reps (at any weight)
-                        if max_reps is None or reps > max_reps:
-                            max_reps = reps
-                            max_reps_weight = weight
-                            max_reps_date = session_date
-                            max_reps_completion = completion_id
-
-            # Add records based on filter
+            best_1rm = exercise_records.best_1rm.get(formula) if supports_1rm else None
             if (record_type is None or record_type == "1rm") and best_1rm is not None:
                 records.append({
                     "exercise_id": ex_id,
                     "exercise_name": ex_name,
                     "record_type": "1rm",
-                    "value": best_1rm,
+                    "value": calculate_1rm(best_1rm.weight, best_1rm.reps, formula),
                     "unit": "lbs",  # TODO: get from set data
-                    "achieved_at": best_1rm_date,
-                    "completion_id": best_1rm_completion,
-                    "details": best_1rm_details,
+                    "achieved_at": best_1rm.workout_date,
+                    "completion_id": best_1rm.completion_id,
+                    "details": {"weight": best_1rm.weight, "reps": best_1rm.reps},
                 })
 
+            max_weight = exercise_records.max_weight
             if (record_type is None or record_type == "max_weight") and max_weight is not None:
                 records.append({
                     "exercise_id": ex_id,
                     "exercise_name": ex_name,
                     "record_type": "max_weight",
-                    "value": max_weight,
+                    "value": max_weight.value,
                     "unit": "lbs",
-                    "achieved_at": max_weight_date,
-                    "completion_id": max_weight_completion,
+                    "achieved_at": max_weight.workout_date,
+                    "completion_id": max_weight.completion_id,
                 })
 
+            max_reps = exercise_records.max_reps
             if (record_type is None or record_type == "max_reps") and max_reps is not None:
                 records.append({
                     "exercise_id": ex_id,
                     "exercise_name": ex_name,
                     "record_type": "max_reps",
-                    "value": max_reps,
+                    "value": max_reps.value,
                     "unit": "reps",
-                    "achieved_at": max_reps_date,
-                    "completion_id": max_reps_completion,
-                    "details": {"weight": max_reps_weight},
+                    "achieved_at": max_reps.workout_date,
+                    "completion_id": max_reps.completion_id,
+                    "details": {"weight": max_reps.weight},
                 })
 
         # Sort by value descending within each record type
@@ -458,6 +432,18 @@ class ProgressionService:
             exercise_id=exercise_id,
         )
 
+    def _get_records_table(self, user_id: str) -> Dict[str, ExerciseRecords]:
+        """The user's PR table, from the cache or built from all their sets."""
+        if self._records_cache is not None:
+            table = self._records_cache.get(user_id)
+            if table is not None:
+                return table
+
+        table = compute_records(self._progression_repo.get_all_sets(user_id))
+        if self._records_cache is not None:
+            self._records_cache.put(user_id, table)
+        return table
+
     def get_last_weight(
         self,
         user_id: str,
@@ -494,6 +480,49 @@ class ProgressionService:
             completion_id=result.get("completion_id", ""),
         )
 
+    def get_last_weights(
+        self,
+        user_id: str,
+        exercise_ids: List[str],
+    ) -> List[LastWeightResponse]:
+        """
+        Get the last weight used for every exercise in a workout.
+
+        Batch form of get_last_weight for companion apps starting a workout.
+        Unknown exercises and exercises without weight history are omitted.
+
+        Args:
+            user_id: User ID
+            exercise_ids: Canonical exercise IDs
+
+        Returns:
+            LastWeightResponse list, in the order requested
+        """
+        found = self._exercises_repo.get_by_ids(exercise_ids)
+        exercises = {
+            exercise_id: found[exercise_id]
+            for exercise_id in dict.fromkeys(exercise_ids)
+            if exercise_id in found
+        }
+        if not exercises:
+            return []
+
+        results = self._progression_repo.get_last_weights(user_id, list(exercises))
+
+        return [
+            LastWeightResponse(
+                exercise_id=exercise_id,
+                exercise_name=exercise.get("name", exercise_id),
+                weight=results[exercise_id].get("weight", 0),
+                weight_unit=results[exercise_id].get("weight_unit", "lbs"),
+                reps_completed=results[exercise_id].get("reps_completed", 0),
+                workout_date=results[exercise_id].get("workout_date", ""),
+                completion_id=results[exercise_id].get("completion_id", ""),
+            )
+            for exercise_id, exercise in exercises.items()
+            if exercise_id in results
+        ]
+
     def get_volume_analytics(
         self,
         user_id: str,
@@ -540,6 +569,69 @@ class ProgressionService:
             granularity=granularity,
         )
 
+    def get_1rm_trend(
+        self,
+        user_id: str,
+        exercise_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        granularity: str = "weekly",
+    ) -> Optional[OneRepMaxTrendResponse]:
+        """
+        Get the estimated 1RM trend for an exercise.
+
+        Uses the exercise's configured 1RM formula. Exercises that do not
+        support 1RM have an empty trend.
+
+        Args:
+            user_id: User ID
+            exercise_id: Canonical exercise ID
+            start_date: Start of date range (default: 90 days ago)
+            end_date: End of date range (default: today)
+            granularity: "daily", "weekly", or "monthly"
+
+        Returns:
+            OneRepMaxTrendResponse or None if exercise not found
+        """
+        exercise = self._exercises_repo.get_by_id(exercise_id)
+        if not exercise:
+            logger.warning(f"Exercise not found: {exercise_id}")
+            return None
+
+        supports_1rm = exercise.get("supports_1rm", False)
+        formula = exercise.get("one_rm_formula", "brzycki")
+
+        # Set default date range
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=90)
+
+        data: List[Dict[str, Any]] = []
+        if supports_1rm:
+            data = self._progression_repo.get_1rm_trend(
+                user_id,
+                exercise_id,
+                start_date=start_date,
+                end_date=end_date,
+                granularity=granularity,
+                formula=formula,
+            )
+
+        return OneRepMaxTrendResponse(
+            exercise_id=exercise_id,
+            exercise_name=exercise.get("name", exercise_id),
+            supports_1rm=supports_1rm,
+            one_rm_formula=formula,
+            data=data,
+            period={
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+            },
+            granularity=granularity,
+        )
+
     def get_exercises_with_history(
         self,
         user_id: str,
@@ -0,0 +1,341 @@
+"""
+Lightweight timing spans aggregated into in-process latency histograms.
+
+Wall-clock time per stage of a request (normalize, match, database, LLM,
+export encoding) is recorded under a span name into an HDR-style
+histogram: log-linear buckets with 16 sub-buckets per power of two, so
+any recorded latency from 1us to hours lands in a bucket within ~6% of
+its value and percentiles stay accurate without storing samples.
+GET /metrics renders every histogram in the Prometheus text format.
+
+Usage:
+    @span("match.exercise")
+    def match(self, planned_name): ...
+
+    with span("export.fit_encode"):
+        ...
+
+    @span_methods("db.workouts")       # every public method -> db.workouts.<name>
+    class SupabaseWorkoutRepository: ...
+
+Nested spans also form a path ("chat.stream/llm.chat") that is kept in a
+context variable; current_span_path() exposes it so AI requests can carry
+it as a tracking header.
+
+When spans are disabled (PERF_SPANS_ENABLED=false, or configure() at
+runtime) entering a span only checks a flag: no clock reads, no locks, no
+context-variable writes.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 2**SUB_BUCKET_BITS buckets per power of two: at most 1/16 relative error
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Buckets up to 2**40us (~12 days); longer spans land in the last bucket
+MAX_BUCKETS = (40 - SUB_BUCKET_BITS) * SUB_BUCKETS
+
+# Quantiles reported per span in the Prometheus summary
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Prometheus histogram bucket bounds in seconds, mapped onto the HDR buckets
+PROMETHEUS_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+METRIC_PREFIX = "mapper_span"
+
+_path: ContextVar[Tuple[str, ...]] = ContextVar("span_path", default=())
+
+
+def _bucket_index(value: int) -> int:
+    """Bucket of a non-negative integer value (microseconds)."""
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    if shift <= 0:
+        return value
+    return shift * SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    """[lower, upper) value range of a bucket."""
+    if index < 2 * SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index - shift * SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram over whole microseconds. Thread-safe."""
+
+    __slots__ = ("_lock", "_counts", "count", "errors", "total_us", "min_us", "max_us")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: List[int] = [0] * MAX_BUCKETS
+        self.count = 0
+        self.errors = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, value_us: int, error: bool = False) -> None:
+        # _bucket_index() inlined: this runs once per span
+        shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+        index = value_us if shift <= 0 else shift * SUB_BUCKETS + (value_us >> shift)
+        if index >= MAX_BUCKETS:
+            index = MAX_BUCKETS - 1
+        with self._lock:
+            self._counts[index] += 1
+            if value_us > self.max_us:
+                self.max_us = value_us
+            if value_us < self.min_us or not self.count:
+                self.min_us = value_us
+            self.count += 1
+            self.total_us += value_us
+            if error:
+                self.errors += 1
+
+    def percentile(self, quantile: float) -> int:
+        """Value (us) at or below which ``quantile`` of recordings fall."""
+        with self._lock:
+            return self._percentile(self._counts, self.count, quantile)
+
+    def _percentile(self, counts: List[int], total: int, quantile: float) -> int:
+        if not total:
+            return 0
+        rank = max(1, int(quantile * total + 0.999999))
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                # Highest value the bucket can hold, capped by what was seen
+                return min(_bucket_bounds(index)[1] - 1, self.max_us)
+        return self.max_us
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counts, sum, extremes, percentiles (ms) and cumulative Prometheus buckets."""
+        with self._lock:
+            counts = list(self._counts)
+            result: Dict[str, Any] = {
+                "count": self.count,
+                "errors": self.errors,
+                "sum_ms": self.total_us / 1000,
+                "min_ms": self.min_us / 1000,
+                "max_ms": self.max_us / 1000,
+            }
+            for quantile in QUANTILES:
+                result[f"p{quantile * 100:g}_ms"] = self._percentile(counts, self.count, quantile) / 1000
+
+        # A bucket counts towards "le" once all of its values are <= le
+        cumulative = []
+        seen = 0
+        index = 0
+        for bound in PROMETHEUS_BUCKETS:
+            bound_us = bound * 1_000_000
+            while index < len(counts) and _bucket_bounds(index)[1] - 1 <= bound_us:
+                seen += counts[index]
+                index += 1
+            cumulative.append(seen)
+        result["buckets"] = cumulative
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * MAX_BUCKETS
+            self.count = self.errors = self.total_us = self.min_us = self.max_us = 0
+
+
+class SpanRecorder:
+    """Histograms by span name, plus the process-wide on/off switch."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def configure(self, enabled: Optional[bool] = None) -> None:
+        """Turn recording on or off at runtime."""
+        if enabled is not None:
+            self.enabled = bool(enabled)
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def record(self, name: str, seconds: float, error: bool = False) -> None:
+        histogram = self._histograms.get(name) or self.histogram(name)
+        histogram.record(int(seconds * 1_000_000) if seconds > 0 else 0, error)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-span snapshots, by span name."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return {name: histogram.snapshot() for name, histogram in histograms}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def render_prometheus(self) -> str:
+        """All spans in the Prometheus text exposition format (version 0.0.4)."""
+        snapshots = self.snapshot()
+        duration = f"{METRIC_PREFIX}_duration_seconds"
+        latency = f"{METRIC_PREFIX}_latency_seconds"
+        errors = f"{METRIC_PREFIX}_errors_total"
+
+        lines = [
+            f"# HELP {duration} Wall-clock time per span.",
+            f"# TYPE {duration} histogram",
+        ]
+        for name, snap in snapshots.items():
+            label = f'span="{_escape_label(name)}"'
+            for bound, cumulative in zip(PROMETHEUS_BUCKETS, snap["buckets"]):
+                lines.append(f'{duration}_bucket{{{label},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{duration}_bucket{{{label},le="+Inf"}} {snap["count"]}')
+            lines.append(f"{duration}_sum{{{label}}} {snap['sum_ms'] / 1000:.6f}")
+            lines.append(f"{duration}_count{{{label}}} {snap['count']}")
+
+        lines += [
+            f"# HELP {latency} Span latency quantiles from the HDR histograms.",
+            f"# TYPE {latency} summary",
+        ]
+        for name, snap in snapshots.items():
+            label = f'span="{_escape_label(name)}"'
+            for quantile in QUANTILES:
+                value = snap[f"p{quantile * 100:g}_ms"] / 1000
+                lines.append(f'{latency}{{{label},quantile="{quantile:g}"}} {value:.6f}')
+            lines.append(f"{latency}_sum{{{label}}} {snap['sum_ms'] / 1000:.6f}")
+            lines.append(f"{latency}_count{{{label}}} {snap['count']}")
+
+        lines += [
+            f"# HELP {errors} Spans that ended with an exception.",
+            f"# TYPE {errors} counter",
+        ]
+        for name, snap in snapshots.items():
+            lines.append(f'{errors}{{span="{_escape_label(name)}"}} {snap["errors"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_recorder: Optional[SpanRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_span_recorder() -> SpanRecorder:
+    """Process-wide recorder configured from settings on first use."""
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                try:
+                    from backend.settings import get_settings
+                except ImportError:
+                    # Standalone adapter scripts run without the app settings
+                    _recorder = SpanRecorder()
+                else:
+                    _recorder = SpanRecorder(enabled=get_settings().perf_spans_enabled)
+    return _recorder
+
+
+class span:
+    """
+    Time a block or a function under ``name``.
+
+    As a context manager each ``with span(...)`` times one block; as a
+    decorator every call is timed (coroutine functions included). Spans
+    that raise are counted as errors.
+    """
+
+    __slots__ = ("name", "_t0", "_token")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._t0: Optional[float] = None
+        self._token = None
+
+    def __enter__(self) -> "span":
+        recorder = _recorder or get_span_recorder()
+        if recorder.enabled:
+            self._token = _path.set(_path.get() + (self.name,))
+            self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._t0 is not None:
+            elapsed = time.perf_counter() - self._t0
+            _path.reset(self._token)
+            self._t0 = self._token = None
+            (_recorder or get_span_recorder()).record(self.name, elapsed, exc_type is not None)
+        return False
+
+    def __call__(self, fn: F) -> F:
+        name = self.name
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not (_recorder or get_span_recorder()).enabled:
+                    return await fn(*args, **kwargs)
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not (_recorder or get_span_recorder()).enabled:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def span_methods(prefix: str, exclude: Iterable[str] = ()) -> Callable[[type], type]:
+    """
+    Class decorator timing every public method defined on the class as
+    ``<prefix>.<method name>``. Static and class methods are left alone.
+    """
+    excluded = set(exclude)
+
+    def decorate(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or attr in excluded or not callable(value):
+                continue
+            if isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            setattr(cls, attr, span(f"{prefix}.{attr}")(value))
+        return cls
+
+    return decorate
+
+
+def record_span(name: str, seconds: float, error: bool = False) -> None:
+    """Record a duration measured by the caller (e.g. across awaits or yields)."""
+    recorder = _recorder or get_span_recorder()
+    if recorder.enabled:
+        recorder.record(name, seconds, error)
+
+
+def current_span_path() -> Optional[str]:
+    """Names of the spans open in this context, outermost first ("a/b"), or None."""
+    names = _path.get()
+    return "/".join(names) if names else None
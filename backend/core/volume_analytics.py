@@ -0,0 +1,282 @@
+"""
+Columnar volume analytics engine.
+
+Part of AMA-299: Exercise Progression Tracking
+Phase 3 - Progression Features
+
+Volume analytics used to walk every completion's execution_log in Python,
+adding each set into nested per-muscle, per-period dicts - once for every
+muscle the exercise trains. A multi-year range meant tens of thousands of
+dict updates per request. This module flattens the logs once into NumPy
+columns (SetColumns: exercise code, day, weight, reps) and computes the
+aggregates with vectorized group-bys:
+
+- period_index() buckets days into daily/weekly/monthly periods with
+  datetime64 arithmetic (weeks start on Monday)
+- volume_by_muscle_group() expands sets to (set, muscle) pairs by index
+  arithmetic and sums volume, sets and reps with np.bincount
+- best_1rm_by_period() gives the estimated-1RM trend per exercise using
+  the same vectorized formulas as the personal-records engine (served by
+  GET /progression/exercises/{id}/1rm-trend)
+
+Output matches the previous loop: muscles in first-seen order, periods
+sorted, data volumes rounded to 1 decimal place.
+
+Per-workout helpers such as merge_set_logs_to_execution_log and
+calculate_intervals_duration stay in plain Python: they walk a single
+workout's handful of sets and build nested structures, not aggregates.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.personal_records import estimate_1rm_array
+
+GRANULARITIES = ("daily", "weekly", "monthly")
+
+# Muscle group for exercises without metadata
+UNKNOWN_MUSCLE = "other"
+
+
+@dataclass
+class SetColumns:
+    """Completed sets as parallel arrays, one row per set."""
+
+    exercise_ids: List[str]
+    exercise: np.ndarray
+    day: np.ndarray
+    weight: np.ndarray
+    reps: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.exercise.size)
+
+
+def _set_weight(weight_obj: Any) -> float:
+    """Weight of a logged set from its structured or plain weight, 0 if missing."""
+    if weight_obj and isinstance(weight_obj, dict):
+        components = weight_obj.get("components") or []
+        weight_obj = components[0].get("value") if components else 0
+    if isinstance(weight_obj, (int, float)):
+        return float(weight_obj)
+    return 0.0
+
+
+def flatten_execution_logs(completions: Iterable[Dict[str, Any]]) -> SetColumns:
+    """
+    Flatten completions into SetColumns in a single pass.
+
+    Only completed sets of intervals with a canonical_exercise_id are kept;
+    completions without a valid started_at date are skipped.
+
+    Args:
+        completions: Rows with started_at and execution_log
+
+    Returns:
+        SetColumns in completion, interval and set order
+    """
+    exercise_ids: List[str] = []
+    code_of: Dict[str, int] = {}
+    codes: List[int] = []
+    days: List[int] = []
+    weights: List[float] = []
+    reps: List[float] = []
+
+    for record in completions:
+        try:
+            day = date.fromisoformat((record.get("started_at") or "")[:10]).toordinal()
+        except ValueError:
+            continue
+        execution_log = record.get("execution_log") or {}
+
+        for interval in execution_log.get("intervals") or []:
+            canonical_id = interval.get("canonical_exercise_id")
+            if not canonical_id:
+                continue
+            code = code_of.get(canonical_id)
+            if code is None:
+                code = code_of[canonical_id] = len(exercise_ids)
+                exercise_ids.append(canonical_id)
+
+            for set_data in interval.get("sets") or []:
+                if set_data.get("status") != "completed":
+                    continue
+                codes.append(code)
+                days.append(day)
+                weights.append(_set_weight(set_data.get("weight")))
+                reps.append(set_data.get("reps_completed") or 0)
+
+    # Ordinals to datetime64 days (ordinal 719163 is 1970-01-01)
+    day_array = (np.asarray(days, dtype=np.int64) - date(1970, 1, 1).toordinal()).astype(
+        "datetime64[D]"
+    )
+    return SetColumns(
+        exercise_ids=exercise_ids,
+        exercise=np.asarray(codes, dtype=np.int64),
+        day=day_array,
+        weight=np.asarray(weights, dtype=float),
+        reps=np.asarray(reps, dtype=float),
+    )
+
+
+def period_index(days: np.ndarray, granularity: str = "daily") -> Tuple[np.ndarray, List[str]]:
+    """
+    Bucket days into periods.
+
+    Args:
+        days: datetime64[D] array
+        granularity: "daily", "weekly" (Monday start) or "monthly"
+
+    Returns:
+        (period code per day, sorted period labels: YYYY-MM-DD or YYYY-MM)
+    """
+    if granularity == "weekly":
+        # 1970-01-01 was a Thursday, three days after a Monday
+        periods = days - (days.astype(np.int64) + 3) % 7
+    elif granularity == "monthly":
+        periods = days.astype("datetime64[M]")
+    else:
+        periods = days
+    labels, codes = np.unique(periods, return_inverse=True)
+    return codes.reshape(-1), [str(label) for label in labels]
+
+
+def _as_number(total: float) -> Any:
+    """Keep integral rep totals as ints, like summing ints did."""
+    return int(total) if float(total).is_integer() else total
+
+
+def volume_by_muscle_group(
+    columns: SetColumns,
+    exercise_muscles: Dict[str, Optional[List[str]]],
+    *,
+    granularity: str = "daily",
+    muscle_groups: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate volume, sets and reps per muscle group and period.
+
+    Every set counts towards each primary muscle of its exercise. With
+    muscle_groups, only exercises training at least one of them count
+    (towards all of their muscles).
+
+    Args:
+        columns: Flattened sets
+        exercise_muscles: exercise_id -> primary muscles; unknown exercises
+            count as UNKNOWN_MUSCLE
+        granularity: "daily", "weekly" or "monthly"
+        muscle_groups: Optional muscle filter
+
+    Returns:
+        {"data": [{period, muscle_group, total_volume, total_sets, total_reps}],
+         "summary": {muscle: {total_volume, total_sets, total_reps}}}
+    """
+    muscles: List[str] = []
+    muscle_code: Dict[str, int] = {}
+    pair_muscles: List[int] = []
+    muscle_count = np.zeros(len(columns.exercise_ids), dtype=np.int64)
+    wanted = set(muscle_groups) if muscle_groups else None
+
+    # Muscles per exercise, laid out contiguously in exercise-code order
+    for code, exercise_id in enumerate(columns.exercise_ids):
+        trained = exercise_muscles.get(exercise_id, [UNKNOWN_MUSCLE]) or []
+        if wanted is not None and wanted.isdisjoint(trained):
+            continue
+        for muscle in trained:
+            if muscle not in muscle_code:
+                muscle_code[muscle] = len(muscles)
+                muscles.append(muscle)
+            pair_muscles.append(muscle_code[muscle])
+        muscle_count[code] = len(trained)
+
+    if not len(columns) or not pair_muscles:
+        return {"data": [], "summary": {}}
+
+    # Expand each set into one row per muscle of its exercise
+    per_set = muscle_count[columns.exercise]
+    rows = np.repeat(np.arange(len(columns)), per_set)
+    first_pair = np.concatenate(([0], np.cumsum(muscle_count)[:-1]))
+    offset_in_set = np.arange(rows.size) - np.repeat(np.cumsum(per_set) - per_set, per_set)
+    row_muscles = np.asarray(pair_muscles, dtype=np.int64)[
+        first_pair[columns.exercise[rows]] + offset_in_set
+    ]
+
+    set_periods, period_labels = period_index(columns.day, granularity)
+    period_codes = set_periods[rows]
+    volume = (columns.weight * columns.reps)[rows]
+    reps = columns.reps[rows]
+
+    n_periods = len(period_labels)
+    size = len(muscles) * n_periods
+    keys = row_muscles * n_periods + period_codes
+    volume_totals = np.bincount(keys, weights=volume, minlength=size).reshape(len(muscles), n_periods)
+    set_totals = np.bincount(keys, minlength=size).reshape(len(muscles), n_periods)
+    rep_totals = np.bincount(keys, weights=reps, minlength=size).reshape(len(muscles), n_periods)
+
+    # Muscles in the order their first set appears
+    _, first_row = np.unique(row_muscles, return_index=True)
+    muscle_order = np.unique(row_muscles)[np.argsort(first_row)]
+
+    # Convert once; indexing Python lists beats per-cell NumPy scalar access
+    volume_rows = volume_totals.tolist()
+    set_rows = set_totals.tolist()
+    rep_rows = rep_totals.tolist()
+
+    data: List[Dict[str, Any]] = []
+    summary: Dict[str, Dict[str, Any]] = {}
+    for m in muscle_order.tolist():
+        muscle = muscles[m]
+        volumes, sets, muscle_reps = volume_rows[m], set_rows[m], rep_rows[m]
+        for p in np.flatnonzero(set_totals[m]).tolist():
+            data.append({
+                "period": period_labels[p],
+                "muscle_group": muscle,
+                "total_volume": round(volumes[p], 1),
+                "total_sets": sets[p],
+                "total_reps": _as_number(muscle_reps[p]),
+            })
+        summary[muscle] = {
+            "total_volume": float(volume_totals[m].sum()),
+            "total_sets": int(set_totals[m].sum()),
+            "total_reps": _as_number(rep_totals[m].sum()),
+        }
+
+    return {"data": data, "summary": summary}
+
+
+def best_1rm_by_period(
+    columns: SetColumns,
+    *,
+    granularity: str = "weekly",
+    formula: str = "brzycki",
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Estimated 1RM trend: the best estimate per exercise and period.
+
+    Only sets with a weight and reps count.
+
+    Returns:
+        exercise_id -> [(period, best estimated 1RM)], periods in order
+    """
+    valid = (columns.weight > 0) & (columns.reps > 0)
+    if not valid.any():
+        return {}
+
+    exercise = columns.exercise[valid]
+    estimates = estimate_1rm_array(columns.weight[valid], columns.reps[valid], formula)
+    period_codes, period_labels = period_index(columns.day[valid], granularity)
+
+    n_periods = len(period_labels)
+    best = np.full(len(columns.exercise_ids) * n_periods, -np.inf)
+    np.maximum.at(best, exercise * n_periods + period_codes, estimates)
+    best = best.reshape(len(columns.exercise_ids), n_periods)
+
+    trend: Dict[str, List[Tuple[str, float]]] = {}
+    for code in np.unique(exercise).tolist():
+        periods = np.flatnonzero(np.isfinite(best[code]))
+        trend[columns.exercise_ids[code]] = [
+            (period_labels[p], float(best[code, p])) for p in periods.tolist()
+        ]
+    return trend
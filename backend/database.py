@@ -3,11 +3,18 @@ Database module for Supabase integration.
 Handles workout storage and retrieval.
 """
 import os
+import copy
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 from supabase import create_client, Client
 import logging
 from datetime import datetime, timezone
 
+from backend.core.personal_records import get_personal_records_cache
+from backend.services.sync_events import SYNC_CONFIRMED, SYNC_FAILED, SYNC_QUEUED, publish_sync_event
+
 logger = logging.getLogger(__name__)
 
 # Initialize Supabase client
@@ -496,10 +503,53 @@ def get_programs(profile_id: str, include_inactive: bool = False) -> List[Dict[s
         return []
 
 
+# Per-program cache for get_program(); invalidated by the program writes below
+PROGRAM_CACHE_TTL_SECONDS = 60.0
+PROGRAM_CACHE_MAX_ENTRIES = 1024
+
+_program_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_program_cache_lock = threading.Lock()
+
+
+def _get_cached_program(program_id: str, profile_id: str) -> Optional[Dict[str, Any]]:
+    with _program_cache_lock:
+        entry = _program_cache.get(program_id)
+        if entry is None:
+            return None
+        stored_at, program = entry
+        if time.monotonic() - stored_at > PROGRAM_CACHE_TTL_SECONDS:
+            del _program_cache[program_id]
+            return None
+        if program.get("profile_id") != profile_id:
+            return None
+        _program_cache.move_to_end(program_id)
+        return copy.deepcopy(program)
+
+
+def _cache_program(program: Dict[str, Any]) -> None:
+    with _program_cache_lock:
+        _program_cache[program["id"]] = (time.monotonic(), copy.deepcopy(program))
+        _program_cache.move_to_end(program["id"])
+        while len(_program_cache) > PROGRAM_CACHE_MAX_ENTRIES:
+            _program_cache.popitem(last=False)
+
+
+def invalidate_program_cache(program_id: Optional[str] = None) -> None:
+    """Drop one cached program, or every cached program when no ID is given."""
+    with _program_cache_lock:
+        if program_id is None:
+            _program_cache.clear()
+        else:
+            _program_cache.pop(program_id, None)
+
+
 def get_program(program_id: str, profile_id: str) -> Optional[Dict[str, Any]]:
     """
     Get a single program by ID with its members.
 
+    The program and its members are read with one embedded select and
+    cached per program until it is updated, deleted or its members change.
+
     Args:
         program_id: Program UUID
         profile_id: User profile ID (for security)
@@ -507,24 +557,24 @@ def get_program(program_id: str, profile_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Program data with members or None if not found
     """
+    cached = _get_cached_program(program_id, profile_id)
+    if cached is not None:
+        return cached
+
     supabase = get_supabase_client()
     if not supabase:
         return None
 
     try:
-        # Get program
-        program_result = supabase.table("workout_programs").select("*").eq("id", program_id).eq("profile_id", profile_id).single().execute()
+        result = supabase.table("workout_programs").select("*, members:program_members(*)").eq("id", program_id).eq("profile_id", profile_id).execute()
 
-        if not program_result.data:
+        if not result.data:
             return None
 
-        program = program_result.data
-
-        # Get program members
-        members_result = supabase.table("program_members").select("*").eq("program_id", program_id).order("day_order").execute()
-
-        program["members"] = members_result.data if members_result.data else []
+        program = result.data[0]
+        program["members"] = sorted(program.get("members") or [], key=lambda m: m.get("day_order") or 0)
 
+        _cache_program(program)
         return program
     except Exception as e:
         logger.error(f"Failed to get program {program_id}: {e}")
@@ -580,6 +630,7 @@ def update_program(
             return get_program(program_id, profile_id)
 
         result = supabase.table("workout_programs").update(update_data).eq("id", program_id).eq("profile_id", profile_id).execute()
+        invalidate_program_cache(program_id)
 
         if result.data and len(result.data) > 0:
             logger.info(f"Program {program_id} updated")
@@ -607,6 +658,7 @@ def delete_program(program_id: str, profile_id: str) -> bool:
 
     try:
         result = supabase.table("workout_programs").delete().eq("id", program_id).eq("profile_id", profile_id).execute()
+        invalidate_program_cache(program_id)
 
         deleted_count = len(result.data) if result.data else 0
         if deleted_count > 0:
@@ -671,6 +723,7 @@ def add_workout_to_program(
             data["follow_along_id"] = follow_along_id
 
         result = supabase.table("program_members").insert(data).execute()
+        invalidate_program_cache(program_id)
 
         if result.data and len(result.data) > 0:
             logger.info(f"Workout added to program {program_id} at position {day_order}")
@@ -709,6 +762,7 @@ def remove_workout_from_program(member_id: str, profile_id: str) -> bool:
             return False
 
         result = supabase.table("program_members").delete().eq("id", member_id).execute()
+        invalidate_program_cache(member.data["program_id"])
 
         deleted_count = len(result.data) if result.data else 0
         if deleted_count > 0:
@@ -848,7 +902,7 @@ def update_workout_ios_companion_sync(workout_id: str, profile_id: str) -> bool:
         return False
 
 
-def get_completed_workout_ids(profile_id: str) -> set:
+def get_completed_workout_ids(profile_id: str, workout_ids: Optional[List[str]] = None) -> set:
     """
     Get IDs of workouts that the user has completed.
 
@@ -856,20 +910,27 @@ def get_completed_workout_ids(profile_id: str) -> set:
 
     Args:
         profile_id: User profile ID
+        workout_ids: Only check these workouts (avoids reading every
+            completion the user has ever logged)
 
     Returns:
         Set of workout IDs that have completions
     """
+    if workout_ids is not None and not workout_ids:
+        return set()
+
     supabase = get_supabase_client()
     if not supabase:
         return set()
 
     try:
-        result = supabase.table("workout_completions") \
+        query = supabase.table("workout_completions") \
             .select("workout_id") \
             .eq("user_id", profile_id) \
-            .not_.is_("workout_id", "null") \
-            .execute()
+            .not_.is_("workout_id", "null")
+        if workout_ids is not None:
+            query = query.in_("workout_id", list(workout_ids))
+        result = query.execute()
 
         if result.data:
             return {r["workout_id"] for r in result.data if r.get("workout_id")}
@@ -879,6 +940,39 @@ def get_completed_workout_ids(profile_id: str) -> set:
         return set()
 
 
+def get_user_sync_version(profile_id: str) -> Optional[int]:
+    """
+    Get the user's sync version counter.
+
+    The counter in user_sync_versions is bumped by database triggers whenever
+    the user's workouts or completions change, so pollers can skip unchanged
+    feeds with one primary-key lookup.
+
+    Args:
+        profile_id: User profile ID
+
+    Returns:
+        Current version (0 if the user has no row yet), or None if unavailable
+    """
+    supabase = get_supabase_client()
+    if not supabase:
+        return None
+
+    try:
+        result = supabase.table("user_sync_versions") \
+            .select("version") \
+            .eq("user_id", profile_id) \
+            .limit(1) \
+            .execute()
+
+        if result.data:
+            return int(result.data[0]["version"])
+        return 0
+    except Exception as e:
+        logger.error(f"Failed to get sync version for {profile_id}: {e}")
+        return None
+
+
 def get_ios_companion_pending_workouts(
     profile_id: str,
     limit: int = 50,
@@ -904,7 +998,7 @@ def get_ios_companion_pending_workouts(
 
     try:
         result = supabase.table("workouts") \
-            .select("id, title, description, workout_data, device, ios_companion_synced_at, created_at") \
+            .select("id, title, description, workout_data, device, ios_companion_synced_at, created_at, updated_at") \
             .eq("profile_id", profile_id) \
             .not_.is_("ios_companion_synced_at", "null") \
             .order("ios_companion_synced_at", desc=True) \
@@ -915,7 +1009,7 @@ def get_ios_companion_pending_workouts(
 
         # Filter out completed workouts if requested
         if exclude_completed and workouts:
-            completed_ids = get_completed_workout_ids(profile_id)
+            completed_ids = get_completed_workout_ids(profile_id, workout_ids=[w["id"] for w in workouts])
             workouts = [w for w in workouts if w["id"] not in completed_ids]
 
         return workouts
@@ -1012,7 +1106,7 @@ def get_android_companion_pending_workouts(
 
     try:
         result = supabase.table("workouts") \
-            .select("id, title, description, workout_data, device, android_companion_synced_at, created_at") \
+            .select("id, title, description, workout_data, device, android_companion_synced_at, created_at, updated_at") \
             .eq("profile_id", profile_id) \
             .not_.is_("android_companion_synced_at", "null") \
             .order("android_companion_synced_at", desc=True) \
@@ -1023,7 +1117,7 @@ def get_android_companion_pending_workouts(
 
         # Filter out completed workouts if requested
         if exclude_completed and workouts:
-            completed_ids = get_completed_workout_ids(profile_id)
+            completed_ids = get_completed_workout_ids(profile_id, workout_ids=[w["id"] for w in workouts])
             workouts = [w for w in workouts if w["id"] not in completed_ids]
 
         return workouts
@@ -1221,11 +1315,13 @@ def delete_user_account(profile_id: str) -> Dict[str, Any]:
             deleted_counts["workout_completions"] = len(result.data) if result.data else 0
         except Exception:
             deleted_counts["workout_completions"] = 0
+        get_personal_records_cache().invalidate(profile_id)
 
         # Delete workout programs
         try:
             result = supabase.table("workout_programs").delete().eq("profile_id", profile_id).execute()
             deleted_counts["programs"] = len(result.data) if result.data else 0
+            invalidate_program_cache()
         except Exception:
             deleted_counts["programs"] = 0
 
@@ -1367,6 +1463,7 @@ def reset_user_data(profile_id: str) -> Dict[str, Any]:
         except Exception as e:
             logger.warning(f"Error deleting workout_completions during reset: {e}")
             deleted_counts["workout_completions"] = 0
+        get_personal_records_cache().invalidate(profile_id)
 
         # Delete workouts (after completions to avoid FK constraint violation)
         try:
@@ -1380,6 +1477,7 @@ def reset_user_data(profile_id: str) -> Dict[str, Any]:
         try:
             result = supabase.table("workout_programs").delete().eq("profile_id", profile_id).execute()
             deleted_counts["programs"] = len(result.data) if result.data else 0
+            invalidate_program_cache()
         except Exception:
             deleted_counts["programs"] = 0
 
@@ -1481,9 +1579,16 @@ def queue_workout_sync(
         }, on_conflict="workout_id,device_type,device_id").execute()
 
         if result.data and len(result.data) > 0:
+            queued_at = result.data[0].get("queued_at")
+            publish_sync_event(user_id, SYNC_QUEUED, {
+                "workout_id": workout_id,
+                "device_type": device_type,
+                "device_id": device_id or "",
+                "queued_at": queued_at,
+            })
             return {
                 "status": "pending",
-                "queued_at": result.data[0].get("queued_at")
+                "queued_at": queued_at
             }
 
         logger.warning(f"No data returned from sync queue upsert for workout {workout_id}")
@@ -1573,9 +1678,16 @@ def confirm_sync(
         ).execute()
 
         if result.data and len(result.data) > 0:
+            synced_at = result.data[0].get("synced_at")
+            publish_sync_event(user_id, SYNC_CONFIRMED, {
+                "workout_id": workout_id,
+                "device_type": device_type,
+                "device_id": device_id or "",
+                "synced_at": synced_at,
+            })
             return {
                 "status": "synced",
-                "synced_at": result.data[0].get("synced_at")
+                "synced_at": synced_at
             }
 
         logger.warning(f"No sync queue entry found for workout {workout_id}")
@@ -1623,9 +1735,17 @@ def report_sync_failed(
         ).execute()
 
         if result.data and len(result.data) > 0:
+            failed_at = result.data[0].get("failed_at")
+            publish_sync_event(user_id, SYNC_FAILED, {
+                "workout_id": workout_id,
+                "device_type": device_type,
+                "device_id": device_id or "",
+                "failed_at": failed_at,
+                "error_message": error_message,
+            })
             return {
                 "status": "failed",
-                "failed_at": result.data[0].get("failed_at"),
+                "failed_at": failed_at,
                 "error_message": error_message
             }
 
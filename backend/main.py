@@ -22,9 +22,11 @@ Usage:
     test_app = create_app(settings=test_settings)
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import sentry_sdk
 from fastapi import FastAPI
@@ -57,6 +59,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         title="AmakaFlow Mapper API",
         description="Workout mapping and transformation API",
         version="1.0.0",
+        lifespan=_lifespan,
     )
 
     # Configure CORS middleware
@@ -78,6 +81,34 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
     return app
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start-up and shutdown hooks for process-level resources."""
+    from backend.services.export_queue import shutdown_export_queue, start_export_queue
+    await start_export_queue()
+
+    yield
+
+    await shutdown_export_queue()
+    # Drain fire-and-forget work while the clients it uses are still open
+    from backend.services.background_tasks import shutdown_background_runner
+    await asyncio.to_thread(shutdown_background_runner)
+    from backend.services.http_clients import shutdown_http_clients
+    await shutdown_http_clients()
+    from backend.ai.client_factory import close_async_ai_clients
+    await close_async_ai_clients()
+    from backend.services.bulk_import_executor import shutdown_bulk_import_executor
+    from backend.services.chat_service import shutdown_chat_tool_pool
+    from backend.services.rate_limiter import shutdown_rate_limiter
+    from backend.services.sync_events import shutdown_sync_event_hub
+    from infrastructure.db.mapping_repository import flush_global_mapping_counters
+    shutdown_sync_event_hub()
+    shutdown_bulk_import_executor()
+    shutdown_chat_tool_pool()
+    shutdown_rate_limiter()
+    flush_global_mapping_counters()
+
+
 def _init_sentry(settings: Settings) -> None:
     """Initialize Sentry SDK if DSN is configured."""
     if settings.sentry_dsn:
@@ -232,6 +232,45 @@ def best_match(
     return best_choice, best_score / 100.0
 
 
+def best_matches(
+    queries: Iterable[str], choices: Iterable[str]
+) -> Dict[str, Tuple[Optional[str], float]]:
+    """
+    best_match() for many queries against the same choices.
+
+    Choices are normalized once for the whole batch instead of once per
+    query, and duplicate queries are scored once. Returns a dict of
+    query -> (best_choice, confidence).
+    """
+    choices = list(choices)
+    choice_set = set(choices)
+    norm_choices = [(c, n) for c, n in ((c, normalize_name(c)) for c in choices) if n]
+    norm_names = [n for _, n in norm_choices]
+
+    results: Dict[str, Tuple[Optional[str], float]] = {}
+    for query in queries:
+        if query in results:
+            continue
+        normalized_query = normalize_name(query) if query else ""
+        if not normalized_query:
+            results[query] = (None, 0.0)
+            continue
+
+        alias_target = ALIAS_MAP.get(normalized_query)
+        if alias_target and alias_target in choice_set:
+            results[query] = (alias_target, 1.0)
+            continue
+
+        best = process.extractOne(normalized_query, norm_names, scorer=fuzz.token_set_ratio)
+        if best is None:
+            results[query] = (None, 0.0)
+        else:
+            _, score, index = best
+            results[query] = (norm_choices[index][0], score / 100.0)
+
+    return results
+
+
 def top_matches(
     query: str,
     choices: Iterable[str],
@@ -26,6 +26,8 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from shared.ai_context import AIRequestContext
 
+from backend.services.http_clients import get_upstream_client
+
 logger = logging.getLogger(__name__)
 
 # Workout ingestor API URL
@@ -190,84 +192,84 @@ class ImageParser:
     ) -> ImageParseResult:
         """Parse image using Vision AI via workout-ingestor-api"""
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                # Create multipart form data
-                files = {
-                    "file": (filename, image_data, cls._get_content_type(filename))
-                }
-                data = {
-                    "vision_provider": vision_provider,
-                }
-                if vision_model:
-                    data["vision_model"] = vision_model
-
-                # Pass AI context metadata for observability (AMA-423)
-                if context:
-                    context_data = context.to_dict()
-                    if context_data:
-                        data["ai_context"] = context_data
-
-                response = await client.post(
-                    f"{INGESTOR_API_URL}/ingest/image_vision",
-                    files=files,
-                    data=data,
-                )
+        client = get_upstream_client("ingestor")
+        try:
+            # Create multipart form data
+            files = {
+                "file": (filename, image_data, cls._get_content_type(filename))
+            }
+            data = {
+                "vision_provider": vision_provider,
+            }
+            if vision_model:
+                data["vision_model"] = vision_model
+
+            # Pass AI context metadata for observability (AMA-423)
+            if context:
+                context_data = context.to_dict()
+                if context_data:
+                    data["ai_context"] = context_data
+
+            response = await client.post(
+                f"{INGESTOR_API_URL}/ingest/image_vision",
+                files=files,
+                data=data,
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                workout = result.get("workout", {})
+                metadata = result.get("metadata", {})
+
+                # Calculate confidence based on exercise count and completeness
+                confidence = cls._calculate_confidence(workout)
+
+                # Count exercises
+                exercise_count = 0
+                exercises = []
+                for block in workout.get("blocks", []):
+                    block_exercises = block.get("exercises", [])
+                    exercise_count += len(block_exercises)
+                    exercises.extend(block_exercises)
+                    for superset in block.get("supersets", []):
+                        superset_exercises = superset.get("exercises", [])
+                        exercise_count += len(superset_exercises)
+                        exercises.extend(superset_exercises)
+
+                # Flag low-confidence items
+                flagged = cls._flag_low_confidence_items(workout)
 
-                if response.status_code == 200:
-                    result = response.json()
-                    workout = result.get("workout", {})
-                    metadata = result.get("metadata", {})
-
-                    # Calculate confidence based on exercise count and completeness
-                    confidence = cls._calculate_confidence(workout)
-
-                    # Count exercises
-                    exercise_count = 0
-                    exercises = []
-                    for block in workout.get("blocks", []):
-                        block_exercises = block.get("exercises", [])
-                        exercise_count += len(block_exercises)
-                        exercises.extend(block_exercises)
-                        for superset in block.get("supersets", []):
-                            superset_exercises = superset.get("exercises", [])
-                            exercise_count += len(superset_exercises)
-                            exercises.extend(superset_exercises)
-
-                    # Flag low-confidence items
-                    flagged = cls._flag_low_confidence_items(workout)
-
-                    return ImageParseResult(
-                        image_id=image_id,
-                        success=True,
-                        confidence=confidence,
-                        title=workout.get("title"),
-                        exercises=exercises,
-                        blocks=workout.get("blocks", []),
-                        raw_workout=workout,
-                        extraction_method="vision",
-                        model_used=metadata.get("model", vision_model),
-                        flagged_items=flagged,
-                    )
-                else:
-                    error_text = response.text
-                    return ImageParseResult(
-                        image_id=image_id,
-                        success=False,
-                        confidence=0,
-                        extraction_method="vision",
-                        error=f"Vision API error ({response.status_code}): {error_text[:200]}"
-                    )
-
-            except httpx.ConnectError:
+                return ImageParseResult(
+                    image_id=image_id,
+                    success=True,
+                    confidence=confidence,
+                    title=workout.get("title"),
+                    exercises=exercises,
+                    blocks=workout.get("blocks", []),
+                    raw_workout=workout,
+                    extraction_method="vision",
+                    model_used=metadata.get("model", vision_model),
+                    flagged_items=flagged,
+                )
+            else:
+                error_text = response.text
                 return ImageParseResult(
                     image_id=image_id,
                     success=False,
                     confidence=0,
                     extraction_method="vision",
-                    error="Could not connect to workout-ingestor service"
+                    error=f"Vision API error ({response.status_code}): {error_text[:200]}"
                 )
 
+        except httpx.ConnectError:
+            return ImageParseResult(
+                image_id=image_id,
+                success=False,
+                confidence=0,
+                extraction_method="vision",
+                error="Could not connect to workout-ingestor service"
+            )
+
     @classmethod
     async def _parse_with_ocr(
         cls,
@@ -278,72 +280,73 @@ class ImageParser:
     ) -> ImageParseResult:
         """Parse image using OCR via workout-ingestor-api"""
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                files = {
-                    "file": (filename, image_data, cls._get_content_type(filename))
-                }
-
-                data = {}
-                # Pass AI context metadata for observability (AMA-423)
-                if context:
-                    context_data = context.to_dict()
-                    if context_data:
-                        data["ai_context"] = context_data
-
-                response = await client.post(
-                    f"{INGESTOR_API_URL}/ingest/image",
-                    files=files,
-                    data=data if data else None,
-                )
+        client = get_upstream_client("ingestor")
+        try:
+            files = {
+                "file": (filename, image_data, cls._get_content_type(filename))
+            }
+
+            data = {}
+            # Pass AI context metadata for observability (AMA-423)
+            if context:
+                context_data = context.to_dict()
+                if context_data:
+                    data["ai_context"] = context_data
+
+            response = await client.post(
+                f"{INGESTOR_API_URL}/ingest/image",
+                files=files,
+                data=data if data else None,
+                timeout=60.0,
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                workout = result.get("workout", {})
+
+                # OCR is generally less accurate
+                confidence = cls._calculate_confidence(workout)
+                # Reduce confidence for OCR (generally less reliable)
+                confidence = int(confidence * 0.8)
+
+                # Count exercises
+                exercises = []
+                for block in workout.get("blocks", []):
+                    exercises.extend(block.get("exercises", []))
+                    for superset in block.get("supersets", []):
+                        exercises.extend(superset.get("exercises", []))
+
+                flagged = cls._flag_low_confidence_items(workout)
 
-                if response.status_code == 200:
-                    result = response.json()
-                    workout = result.get("workout", {})
-
-                    # OCR is generally less accurate
-                    confidence = cls._calculate_confidence(workout)
-                    # Reduce confidence for OCR (generally less reliable)
-                    confidence = int(confidence * 0.8)
-
-                    # Count exercises
-                    exercises = []
-                    for block in workout.get("blocks", []):
-                        exercises.extend(block.get("exercises", []))
-                        for superset in block.get("supersets", []):
-                            exercises.extend(superset.get("exercises", []))
-
-                    flagged = cls._flag_low_confidence_items(workout)
-
-                    return ImageParseResult(
-                        image_id=image_id,
-                        success=True,
-                        confidence=confidence,
-                        title=workout.get("title"),
-                        exercises=exercises,
-                        blocks=workout.get("blocks", []),
-                        raw_workout=workout,
-                        extraction_method="ocr",
-                        flagged_items=flagged,
-                    )
-                else:
-                    return ImageParseResult(
-                        image_id=image_id,
-                        success=False,
-                        confidence=0,
-                        extraction_method="ocr",
-                        error=f"OCR API error ({response.status_code}): {response.text[:200]}"
-                    )
-
-            except httpx.ConnectError:
+                return ImageParseResult(
+                    image_id=image_id,
+                    success=True,
+                    confidence=confidence,
+                    title=workout.get("title"),
+                    exercises=exercises,
+                    blocks=workout.get("blocks", []),
+                    raw_workout=workout,
+                    extraction_method="ocr",
+                    flagged_items=flagged,
+                )
+            else:
                 return ImageParseResult(
                     image_id=image_id,
                     success=False,
                     confidence=0,
                     extraction_method="ocr",
-                    error="Could not connect to workout-ingestor service"
+                    error=f"OCR API error ({response.status_code}): {response.text[:200]}"
                 )
 
+        except httpx.ConnectError:
+            return ImageParseResult(
+                image_id=image_id,
+                success=False,
+                confidence=0,
+                extraction_method="ocr",
+                error="Could not connect to workout-ingestor service"
+            )
+
     @classmethod
     def _calculate_confidence(cls, workout: Dict[str, Any]) -> int:
         """
@@ -492,34 +495,40 @@ class ImageParser:
         mode: Literal["vision", "ocr", "auto"] = "vision",
         vision_provider: str = "openai",
         vision_model: Optional[str] = "gpt-4o-mini",
-        max_concurrent: int = 3,
+        max_concurrent: Optional[int] = None,
         context: Optional[AIRequestContext] = None,
     ) -> List[ImageParseResult]:
         """
-        Parse multiple images with concurrency limit.
+        Parse multiple images concurrently.
+
+        Calls to the ingestor are paced by its shared adaptive limiter (see
+        backend/services/http_clients.py) rather than a per-batch semaphore.
 
         Args:
             images: List of (image_data, filename) tuples
             mode: Extraction mode
             vision_provider: Vision provider
             vision_model: Model to use
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Optional hard cap on this batch's in-flight parses
             context: AI request context for observability (AMA-423)
 
         Returns:
             List of ImageParseResult in same order as input
         """
-        semaphore = asyncio.Semaphore(max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
 
         async def parse_with_limit(image_data: bytes, filename: str) -> ImageParseResult:
+            parse = cls.parse_image(
+                image_data, filename,
+                mode=mode,
+                vision_provider=vision_provider,
+                vision_model=vision_model,
+                context=context,
+            )
+            if semaphore is None:
+                return await parse
             async with semaphore:
-                return await cls.parse_image(
-                    image_data, filename,
-                    mode=mode,
-                    vision_provider=vision_provider,
-                    vision_model=vision_model,
-                    context=context,
-                )
+                return await parse
 
         tasks = [parse_with_limit(data, name) for data, name in images]
         return await asyncio.gather(*tasks)
@@ -538,7 +547,7 @@ async def parse_image(
 async def parse_images_batch(
     images: List[tuple],
     mode: Literal["vision", "ocr", "auto"] = "vision",
-    max_concurrent: int = 3,
+    max_concurrent: Optional[int] = None,
 ) -> List[ImageParseResult]:
     """Parse multiple workout images"""
     return await ImageParser.parse_images_batch(images, mode=mode, max_concurrent=max_concurrent)
@@ -17,6 +17,8 @@ from dataclasses import dataclass, field
 from urllib.parse import urlparse, parse_qs
 import httpx
 
+from backend.services.http_clients import get_upstream_client
+
 logger = logging.getLogger(__name__)
 
 # Workout ingestor API URL
@@ -160,34 +162,34 @@ class URLParser:
         # Use YouTube oEmbed API (no API key required)
         oembed_url = f"https://www.youtube.com/oembed?url={url}&format=json"
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                response = await client.get(oembed_url)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return URLMetadata(
-                        url=url,
-                        platform='youtube',
-                        video_id=video_id,
-                        title=data.get('title'),
-                        author=data.get('author_name'),
-                        thumbnail_url=data.get('thumbnail_url'),
-                    )
-                else:
-                    return URLMetadata(
-                        url=url,
-                        platform='youtube',
-                        video_id=video_id,
-                        error=f"Could not fetch metadata (status {response.status_code})"
-                    )
-            except httpx.ConnectError:
+        client = get_upstream_client("oembed")
+        try:
+            response = await client.get(oembed_url)
+
+            if response.status_code == 200:
+                data = response.json()
+                return URLMetadata(
+                    url=url,
+                    platform='youtube',
+                    video_id=video_id,
+                    title=data.get('title'),
+                    author=data.get('author_name'),
+                    thumbnail_url=data.get('thumbnail_url'),
+                )
+            else:
                 return URLMetadata(
                     url=url,
                     platform='youtube',
                     video_id=video_id,
-                    error="Could not connect to YouTube"
+                    error=f"Could not fetch metadata (status {response.status_code})"
                 )
+        except httpx.ConnectError:
+            return URLMetadata(
+                url=url,
+                platform='youtube',
+                video_id=video_id,
+                error="Could not connect to YouTube"
+            )
 
     @classmethod
     async def _fetch_instagram_metadata(cls, url: str, video_id: Optional[str]) -> URLMetadata:
@@ -212,51 +214,58 @@ class URLParser:
         # TikTok has a public oEmbed API
         oembed_url = f"https://www.tiktok.com/oembed?url={url}"
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            try:
-                response = await client.get(oembed_url)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return URLMetadata(
-                        url=url,
-                        platform='tiktok',
-                        video_id=video_id,
-                        title=data.get('title'),
-                        author=data.get('author_name'),
-                        thumbnail_url=data.get('thumbnail_url'),
-                    )
-                else:
-                    return URLMetadata(
-                        url=url,
-                        platform='tiktok',
-                        video_id=video_id,
-                        error=f"Could not fetch metadata (status {response.status_code})"
-                    )
-            except httpx.ConnectError:
+        client = get_upstream_client("oembed")
+        try:
+            response = await client.get(oembed_url)
+
+            if response.status_code == 200:
+                data = response.json()
+                return URLMetadata(
+                    url=url,
+                    platform='tiktok',
+                    video_id=video_id,
+                    title=data.get('title'),
+                    author=data.get('author_name'),
+                    thumbnail_url=data.get('thumbnail_url'),
+                )
+            else:
                 return URLMetadata(
                     url=url,
                     platform='tiktok',
                     video_id=video_id,
-                    error="Could not connect to TikTok"
+                    error=f"Could not fetch metadata (status {response.status_code})"
                 )
+        except httpx.ConnectError:
+            return URLMetadata(
+                url=url,
+                platform='tiktok',
+                video_id=video_id,
+                error="Could not connect to TikTok"
+            )
 
     @classmethod
     async def fetch_metadata_batch(
         cls,
         urls: List[str],
-        max_concurrent: int = 5
+        max_concurrent: Optional[int] = None
     ) -> List[URLMetadata]:
         """
-        Fetch metadata for multiple URLs with concurrency limit.
+        Fetch metadata for multiple URLs concurrently.
+
+        Concurrency against each upstream is governed by its shared adaptive
+        limiter (see backend/services/http_clients.py), so batches from
+        concurrent jobs split the upstream's capacity.
 
         Args:
             urls: List of URLs to process
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Optional hard cap on this batch's in-flight fetches
 
         Returns:
             List of URLMetadata in same order as input URLs
         """
+        if max_concurrent is None:
+            return await asyncio.gather(*(cls.fetch_metadata(url) for url in urls))
+
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def fetch_with_limit(url: str) -> URLMetadata:
@@ -280,52 +289,52 @@ class URLParser:
         Returns:
             Workout data from the ingestor API
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            try:
-                if platform == 'youtube':
-                    response = await client.post(
-                        f"{INGESTOR_API_URL}/ingest/youtube",
-                        json={"url": url}
-                    )
-                elif platform == 'tiktok':
-                    response = await client.post(
-                        f"{INGESTOR_API_URL}/ingest/tiktok",
-                        json={"url": url, "mode": "auto"}
-                    )
-                elif platform == 'instagram':
-                    response = await client.post(
-                        f"{INGESTOR_API_URL}/ingest/instagram_test",
-                        json={"url": url}
-                    )
-                else:
-                    # Generic URL ingestion
-                    response = await client.post(
-                        f"{INGESTOR_API_URL}/ingest/url",
-                        json=url
-                    )
-
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "workout": response.json()
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Ingestion failed: {response.text}"
-                    }
-
-            except httpx.ConnectError:
+        client = get_upstream_client("ingestor")
+        try:
+            if platform == 'youtube':
+                response = await client.post(
+                    f"{INGESTOR_API_URL}/ingest/youtube",
+                    json={"url": url}
+                )
+            elif platform == 'tiktok':
+                response = await client.post(
+                    f"{INGESTOR_API_URL}/ingest/tiktok",
+                    json={"url": url, "mode": "auto"}
+                )
+            elif platform == 'instagram':
+                response = await client.post(
+                    f"{INGESTOR_API_URL}/ingest/instagram_test",
+                    json={"url": url}
+                )
+            else:
+                # Generic URL ingestion
+                response = await client.post(
+                    f"{INGESTOR_API_URL}/ingest/url",
+                    json=url
+                )
+
+            if response.status_code == 200:
                 return {
-                    "success": False,
-                    "error": "Could not connect to workout-ingestor service"
+                    "success": True,
+                    "workout": response.json()
                 }
-            except Exception as e:
+            else:
                 return {
                     "success": False,
-                    "error": str(e)
+                    "error": f"Ingestion failed: {response.text}"
                 }
 
+        except httpx.ConnectError:
+            return {
+                "success": False,
+                "error": "Could not connect to workout-ingestor service"
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
 
 # Convenience functions
 def identify_platform(url: str) -> Tuple[str, Optional[str]]:
@@ -343,6 +352,6 @@ async def fetch_url_metadata(url: str) -> URLMetadata:
     return await URLParser.fetch_metadata(url)
 
 
-async def fetch_url_metadata_batch(urls: List[str], max_concurrent: int = 5) -> List[URLMetadata]:
+async def fetch_url_metadata_batch(urls: List[str], max_concurrent: Optional[int] = None) -> List[URLMetadata]:
     """Fetch metadata for multiple URLs"""
     return await URLParser.fetch_metadata_batch(urls, max_concurrent)
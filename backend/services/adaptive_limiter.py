@@ -0,0 +1,209 @@
+"""
+Adaptive (AIMD) concurrency limits for upstream calls.
+
+A fixed semaphore is either too small (a 500-link import crawls at 5 calls
+at a time) or too large (the ingestor or oEmbed endpoint starts answering
+429). AdaptiveLimiter finds the limit at runtime, the way TCP congestion
+control does:
+
+- Additive increase: every successful call at normal latency raises the
+  limit by 1/limit, i.e. by about one slot per round of calls
+- Multiplicative decrease: a 429, a gateway error (502-504), a timeout or
+  latency far above the observed baseline cuts the limit by ``backoff`` (at
+  most once per round, so one burst of errors counts as one congestion
+  signal). The latency signal can be disabled for upstreams whose call
+  times vary by design.
+
+One limiter per upstream is shared by every job on the worker (the pooled
+clients in backend/services/http_clients.py acquire a slot around each
+request), so concurrent imports split the upstream's capacity instead of
+each assuming it has all of it.
+
+Usage:
+    limiter = AdaptiveLimiter(initial_limit=4, max_limit=32)
+
+    async with limiter.slot() as slot:
+        response = await client.get(url)
+        slot.record(response.status_code)
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Responses that mean "slow down" rather than "this request was bad". A plain
+# 500 is usually about one request (e.g. a video the ingestor cannot parse),
+# matching the circuit breaker's BREAKER_STATUS_CODES in http_clients.
+OVERLOAD_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class LimiterSlot:
+    """One acquired slot; report the outcome with record() or failed()."""
+
+    __slots__ = ("_limiter", "_started", "_outcome")
+
+    def __init__(self, limiter: "AdaptiveLimiter", started: float):
+        self._limiter = limiter
+        self._started = started
+        self._outcome: Optional[bool] = None
+
+    def record(self, status_code: int) -> None:
+        """Record an HTTP response (429 and gateway errors count as overload)."""
+        self._outcome = status_code not in OVERLOAD_STATUS_CODES
+
+    def failed(self) -> None:
+        """Record a timeout or connection error."""
+        self._outcome = False
+
+    def _close(self, exc: Optional[BaseException]) -> None:
+        overloaded = self._outcome is False or (
+            self._outcome is None and exc is not None and _is_overload_error(exc)
+        )
+        self._limiter._release(self._limiter._clock() - self._started, overloaded)
+
+
+def _is_overload_error(exc: BaseException) -> bool:
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+    try:
+        import httpx
+    except ImportError:  # pragma: no cover - httpx is a hard dependency
+        return False
+    return isinstance(exc, httpx.TransportError)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limiter for one upstream.
+
+    Not thread-safe: use it from a single event loop (the API worker's).
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        backoff: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        self._min = min_limit
+        self._max = max_limit
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._clock = clock
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._baseline: Optional[float] = None
+        self._smoothed: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._decreases = 0
+        self._completed = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent calls allowed."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def slot(self) -> "_SlotAcquirer":
+        """``async with limiter.slot() as slot:`` - wait for and hold a slot."""
+        return _SlotAcquirer(self)
+
+    async def acquire(self) -> LimiterSlot:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return LimiterSlot(self, self._clock())
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation - give it back
+                self._in_flight -= 1
+                self._wake()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+        return LimiterSlot(self, self._clock())
+
+    def _release(self, latency: float, overloaded: bool) -> None:
+        self._in_flight -= 1
+        self._completed += 1
+        now = self._clock()
+
+        if not overloaded:
+            self._smoothed = latency if self._smoothed is None else 0.8 * self._smoothed + 0.2 * latency
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                # Let the baseline drift up slowly so one lucky call doesn't pin it
+                self._baseline += 0.01 * (latency - self._baseline)
+            if (
+                self._latency_tolerance is not None
+                and self._baseline > 0
+                and self._smoothed > self._latency_tolerance * self._baseline
+            ):
+                overloaded = True
+
+        if overloaded:
+            # One decrease per round of calls (~ one smoothed latency)
+            window = self._smoothed or 0.0
+            if now - self._last_decrease >= window:
+                self._limit = max(float(self._min), self._limit * self._backoff)
+                self._last_decrease = now
+                self._decreases += 1
+                logger.debug(f"Adaptive limit decreased to {self.limit}")
+        else:
+            self._limit = min(float(self._max), self._limit + 1.0 / self._limit)
+
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "completed": self._completed,
+            "decreases": self._decreases,
+            "baseline_latency_ms": round(self._baseline * 1000, 1) if self._baseline is not None else None,
+            "smoothed_latency_ms": round(self._smoothed * 1000, 1) if self._smoothed is not None else None,
+        }
+
+
+class _SlotAcquirer:
+    __slots__ = ("_limiter", "_slot")
+
+    def __init__(self, limiter: AdaptiveLimiter):
+        self._limiter = limiter
+        self._slot: Optional[LimiterSlot] = None
+
+    async def __aenter__(self) -> LimiterSlot:
+        self._slot = await self._limiter.acquire()
+        return self._slot
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._slot._close(exc)
@@ -0,0 +1,341 @@
+"""
+Bounded background task runner for fire-and-forget work.
+
+Side effects the user never waits for (patch audit logging, global mapping
+popularity) used to run inline on the request thread, adding their latency
+to every save and patch. This module runs them on a process-level pool of
+worker threads instead:
+
+- Bounded queue: submit() rejects work once max_queue_size tasks are
+  waiting, so a slow database cannot grow the backlog without limit
+- Priorities (TaskPriority), and round-robin between keys (users) at equal
+  priority so one user's burst cannot starve everyone else
+- Retries with exponential backoff and full jitter for failing tasks
+- Draining on shutdown: queued tasks and pending retries get up to
+  drain_seconds to finish before the rest are dropped
+- Metrics: queue depth, in-flight tasks, scheduling lag, retries, failures
+
+Usage:
+    from backend.services.background_tasks import TaskPriority, get_background_runner
+
+    get_background_runner().submit(
+        "patch_audit", repo.log_patch_audit, key=user_id, priority=TaskPriority.LOW,
+        workout_id=workout_id, user_id=user_id, operations=ops, changes_applied=n,
+    )
+
+Workers are started lazily on the first submit, so scripts and tests that
+never submit pay nothing. The app lifespan drains the pool on shutdown
+(shutdown_background_runner).
+"""
+
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from application.ports.task_runner import TaskPriority
+
+logger = logging.getLogger(__name__)
+
+# Fairness key for tasks submitted without one
+DEFAULT_TASK_KEY = "_"
+
+
+@dataclass
+class _Task:
+    name: str
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    key: str
+    priority: int
+    attempts: int = 0
+    # Monotonic time the task became runnable (submit or retry due time)
+    ready_at: float = field(default_factory=time.monotonic)
+
+
+class BackgroundTaskRunner:
+    """
+    Process-level pool of worker threads for fire-and-forget tasks.
+
+    submit() is synchronous, never blocks and is safe to call from any
+    thread (request handlers run in the threadpool). Tasks are plain
+    callables; they run on the worker threads, so blocking I/O is fine.
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        max_queue_size: int = 1000,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 30.0,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.max_queue_size = max(1, max_queue_size)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+        self._cond = threading.Condition()
+        # priority -> key -> runnable tasks, keys in rotation order
+        self._ready: Dict[int, "OrderedDict[str, Deque[_Task]]"] = {}
+        # Tasks waiting for a retry: (due time, sequence, task)
+        self._delayed: List[Tuple[float, int, _Task]] = []
+        self._sequence = itertools.count()
+        self._depth = 0
+        self._in_flight = 0
+        self._threads: List[threading.Thread] = []
+        self._closing = False
+
+        self._submitted = 0
+        self._completed = 0
+        self._retried = 0
+        self._failed = 0
+        self._dropped = 0
+        self._max_lag = 0.0
+        self._failures_by_task: Dict[str, int] = defaultdict(int)
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        priority: int = TaskPriority.NORMAL,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Queue fn(*args, **kwargs) to run on a worker.
+
+        Args:
+            name: Task name, used for logs and metrics
+            fn: Callable to run; exceptions are retried up to max_attempts
+            key: Fairness key (usually the user ID)
+            priority: Run order (see TaskPriority)
+
+        Returns:
+            False if the queue is full or the runner is shutting down
+        """
+        task = _Task(
+            name=name,
+            fn=fn,
+            args=args,
+            kwargs=kwargs,
+            key=key or DEFAULT_TASK_KEY,
+            priority=int(priority),
+        )
+        with self._cond:
+            if self._closing or self._depth >= self.max_queue_size:
+                self._dropped += 1
+                reason = "shutting down" if self._closing else "queue full"
+                logger.warning(f"Rejected background task {name} ({reason})")
+                return False
+            self._push(task)
+            self._depth += 1
+            self._submitted += 1
+            self._start_workers()
+            self._cond.notify()
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, lag and outcome counters."""
+        now = time.monotonic()
+        with self._cond:
+            oldest = min(
+                (tasks[0].ready_at for by_key in self._ready.values() for tasks in by_key.values()),
+                default=None,
+            )
+            return {
+                "workers": len(self._threads),
+                "queue_depth": self._depth,
+                "queue_capacity": self.max_queue_size,
+                "in_flight": self._in_flight,
+                "retry_pending": len(self._delayed),
+                "lag_seconds": round(now - oldest, 3) if oldest is not None else 0.0,
+                "max_lag_seconds": round(self._max_lag, 3),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "retried": self._retried,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "failures_by_task": dict(self._failures_by_task),
+            }
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until nothing is queued or running. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._depth or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def shutdown(self, timeout: float = 10.0) -> int:
+        """
+        Stop accepting tasks and drain the queue for up to ``timeout``.
+
+        Pending retries run immediately instead of waiting out their
+        backoff. Returns the number of tasks dropped because the drain
+        timed out.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            threads = list(self._threads)
+
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+        with self._cond:
+            abandoned = self._depth
+            self._ready.clear()
+            self._delayed.clear()
+            self._depth = 0
+            self._dropped += abandoned
+            self._threads = [thread for thread in threads if thread.is_alive()]
+            self._cond.notify_all()
+        if abandoned:
+            logger.warning(f"Dropped {abandoned} background tasks that did not finish before shutdown")
+        return abandoned
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _start_workers(self) -> None:
+        # Called with the lock held
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"background-task-{len(self._threads)}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    task, wait = self._next_task()
+                    if task is not None:
+                        break
+                    if self._closing and not self._depth:
+                        return
+                    self._cond.wait(wait)
+                self._depth -= 1
+                self._in_flight += 1
+                self._max_lag = max(self._max_lag, time.monotonic() - task.ready_at)
+
+            task.attempts += 1
+            try:
+                task.fn(*task.args, **task.kwargs)
+            except Exception as e:
+                self._task_failed(task, e)
+            else:
+                with self._cond:
+                    self._completed += 1
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._cond.notify_all()
+
+    def _task_failed(self, task: _Task, error: Exception) -> None:
+        with self._cond:
+            if task.attempts < self.max_attempts:
+                # Full jitter keeps retries of a shared outage from lining up
+                backoff = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (task.attempts - 1))
+                due = time.monotonic() + random.uniform(0, backoff)
+                heapq.heappush(self._delayed, (due, next(self._sequence), task))
+                self._depth += 1
+                self._retried += 1
+                logger.info(
+                    f"Background task {task.name} failed (attempt {task.attempts}), retrying: {error}"
+                )
+                return
+            self._failed += 1
+            self._failures_by_task[task.name] += 1
+        logger.warning(f"Background task {task.name} failed after {task.attempts} attempts: {error}")
+
+    def _push(self, task: _Task) -> None:
+        by_key = self._ready.setdefault(task.priority, OrderedDict())
+        by_key.setdefault(task.key, deque()).append(task)
+
+    def _next_task(self) -> Tuple[Optional[_Task], Optional[float]]:
+        """
+        Pop the next runnable task, called with the lock held.
+
+        Returns (task, None), or (None, seconds until the next retry is due).
+        """
+        now = time.monotonic()
+        while self._delayed and (self._closing or self._delayed[0][0] <= now):
+            due, _, task = heapq.heappop(self._delayed)
+            task.ready_at = min(due, now)
+            self._push(task)
+
+        for priority in sorted(self._ready, reverse=True):
+            by_key = self._ready[priority]
+            key, tasks = next(iter(by_key.items()))
+            task = tasks.popleft()
+            if tasks:
+                by_key.move_to_end(key)
+            else:
+                del by_key[key]
+            if not by_key:
+                del self._ready[priority]
+            return task, None
+
+        wait = self._delayed[0][0] - now if self._delayed else None
+        return None, wait
+
+
+# ============================================================================
+# Process-wide Runner
+# ============================================================================
+
+
+_runner: Optional[BackgroundTaskRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_background_runner() -> BackgroundTaskRunner:
+    """Process-wide background runner, created from settings on first use."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                _runner = BackgroundTaskRunner(
+                    workers=settings.background_task_workers,
+                    max_queue_size=settings.background_task_queue_size,
+                    max_attempts=settings.background_task_max_attempts,
+                    retry_base_seconds=settings.background_task_retry_base_seconds,
+                    retry_max_seconds=settings.background_task_retry_max_seconds,
+                )
+    return _runner
+
+
+def shutdown_background_runner(timeout: Optional[float] = None) -> None:
+    """Drain and stop the process-wide runner (called on app shutdown)."""
+    global _runner
+    with _runner_lock:
+        runner, _runner = _runner, None
+    if runner is not None:
+        if timeout is None:
+            from backend.settings import get_settings
+
+            timeout = get_settings().background_task_drain_seconds
+        runner.shutdown(timeout=timeout)
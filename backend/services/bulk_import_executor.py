@@ -0,0 +1,330 @@
+"""
+Bounded worker pools for the bulk import workflow.
+
+Bulk import steps (detect, match, preview) mix synchronous Supabase calls
+with CPU-heavy file parsing and fuzzy matching. Running them directly on the
+event loop stalls every other request on the worker, so this module moves
+that work onto dedicated pools:
+
+- A thread pool for blocking I/O (Supabase client calls)
+- A process pool for parsing and exercise matching (falls back to threads
+  when disabled or unavailable)
+
+Both pools are gated by a FairSlotScheduler, which hands out execution slots
+round-robin between users so one large import cannot starve everyone else.
+Each import job additionally gets its own concurrency limit via ImportJob.
+
+Usage:
+    from backend.services.bulk_import_executor import get_bulk_import_executor
+
+    job = get_bulk_import_executor().job(profile_id, job_id)
+    result = await job.run_cpu(parse_file_source, source, filename)
+    await job.run_io(service._update_job_progress, job_id, profile_id, 1)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Fair Scheduling
+# ============================================================================
+
+
+class FairSlotScheduler:
+    """
+    Grants a fixed number of execution slots, round-robin across users.
+
+    When all slots are busy, waiters are queued per user. A released slot is
+    handed to the next user in rotation rather than to the oldest waiter, so a
+    user with hundreds of queued tasks only gets every N-th slot while other
+    users are waiting.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._in_use = 0
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+
+    @property
+    def capacity(self) -> int:
+        """Total number of slots."""
+        return self._capacity
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held."""
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        """Number of queued acquire() calls across all users."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, user_key: str) -> None:
+        """Wait for a slot on behalf of user_key."""
+        if self._in_use < self._capacity and not self._waiters:
+            self._in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(user_key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed to us just before cancellation - pass it on
+                self.release()
+            else:
+                self._discard_waiter(user_key, future)
+            raise
+
+    def release(self) -> None:
+        """Release a slot, handing it to the next user in rotation."""
+        while self._waiters:
+            user_key, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(user_key)
+            else:
+                del self._waiters[user_key]
+            if not future.done():
+                # Slot ownership transfers directly; _in_use is unchanged
+                future.set_result(None)
+                return
+        self._in_use -= 1
+
+    def _discard_waiter(self, user_key: str, future: asyncio.Future) -> None:
+        queue = self._waiters.get(user_key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self._waiters[user_key]
+
+
+# ============================================================================
+# Executor
+# ============================================================================
+
+
+class ImportJob:
+    """
+    Handle for running one import job's work on the shared pools.
+
+    Limits the job to `concurrency` in-flight tasks and schedules every task
+    fairly against other users' jobs.
+    """
+
+    def __init__(
+        self,
+        executor: "BulkImportExecutor",
+        profile_id: str,
+        job_id: str,
+        concurrency: int,
+    ):
+        self.profile_id = profile_id
+        self.job_id = job_id
+        self._executor = executor
+        self._limit = asyncio.Semaphore(concurrency)
+
+    async def run_io(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking I/O call (e.g. Supabase) on the thread pool."""
+        async with self._limit:
+            return await self._executor.run_io(self.profile_id, fn, *args, **kwargs)
+
+    async def run_cpu(self, fn: Callable[..., Any], *args) -> Any:
+        """Run a CPU-bound, picklable top-level function on the process pool."""
+        async with self._limit:
+            return await self._executor.run_cpu(self.profile_id, fn, *args)
+
+
+class BulkImportExecutor:
+    """
+    Process-level pools for bulk import work.
+
+    Pools are created lazily so importing this module (and the app) stays
+    cheap. Set cpu_workers=0 to run CPU work on the thread pool instead of
+    spawning worker processes.
+    """
+
+    def __init__(
+        self,
+        io_workers: int = 8,
+        cpu_workers: int = 2,
+        job_concurrency: int = 4,
+    ):
+        self.io_workers = max(1, io_workers)
+        self.cpu_workers = max(0, cpu_workers)
+        self.job_concurrency = max(1, job_concurrency)
+
+        self._io_slots = FairSlotScheduler(self.io_workers)
+        self._cpu_slots = FairSlotScheduler(self.cpu_workers or self.io_workers)
+
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def job(self, profile_id: str, job_id: str) -> ImportJob:
+        """Create a handle for scheduling one job's work."""
+        return ImportJob(self, profile_id, job_id, self.job_concurrency)
+
+    async def run_io(self, user_key: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the thread pool, fairly scheduled by user."""
+        call = functools.partial(fn, *args, **kwargs)
+        await self._io_slots.acquire(user_key)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_io_pool(), call)
+        finally:
+            self._io_slots.release()
+
+    async def run_cpu(self, user_key: str, fn: Callable[..., Any], *args) -> Any:
+        """Run a CPU-bound call on the process pool, fairly scheduled by user."""
+        await self._cpu_slots.acquire(user_key)
+        try:
+            pool = self._get_cpu_pool()
+            if pool is None:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_io_pool(), functools.partial(fn, *args)
+                )
+            try:
+                return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+            except BrokenProcessPool:
+                logger.warning("Bulk import process pool broke; falling back to threads")
+                self._disable_cpu_pool()
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_io_pool(), functools.partial(fn, *args)
+                )
+        finally:
+            self._cpu_slots.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Current slot usage for both pools."""
+        return {
+            "io_in_use": self._io_slots.in_use,
+            "io_waiting": self._io_slots.waiting,
+            "cpu_in_use": self._cpu_slots.in_use,
+            "cpu_waiting": self._cpu_slots.waiting,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down both pools. They are recreated on next use."""
+        with self._pool_lock:
+            pools: List[Executor] = [p for p in (self._io_pool, self._cpu_pool) if p]
+            self._io_pool = None
+            self._cpu_pool = None
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._io_pool is None:
+                self._io_pool = ThreadPoolExecutor(
+                    max_workers=self.io_workers,
+                    thread_name_prefix="bulk_import_io_",
+                )
+            return self._io_pool
+
+    def _get_cpu_pool(self) -> Optional[ProcessPoolExecutor]:
+        if self.cpu_workers == 0:
+            return None
+        with self._pool_lock:
+            if self._cpu_pool is None:
+                try:
+                    # spawn avoids forking a process that already runs threads
+                    self._cpu_pool = ProcessPoolExecutor(
+                        max_workers=self.cpu_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Could not start bulk import process pool: {e}")
+                    self.cpu_workers = 0
+                    return None
+            return self._cpu_pool
+
+    def _disable_cpu_pool(self) -> None:
+        with self._pool_lock:
+            pool, self._cpu_pool = self._cpu_pool, None
+            self.cpu_workers = 0
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_executor: Optional[BulkImportExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_bulk_import_executor() -> BulkImportExecutor:
+    """Get the process-wide bulk import executor (created from settings)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                _executor = BulkImportExecutor(
+                    io_workers=settings.bulk_import_io_workers,
+                    cpu_workers=settings.bulk_import_cpu_workers,
+                    job_concurrency=settings.bulk_import_job_concurrency,
+                )
+    return _executor
+
+
+def shutdown_bulk_import_executor() -> None:
+    """Shut down the process-wide executor if it was started."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+# ============================================================================
+# Process-pool Tasks
+# ============================================================================
+# These run inside worker processes, so they must be top-level functions
+# with picklable arguments and results.
+
+
+def parse_file_source(source: str, filename: str):
+    """Parse a base64-encoded file and return its ParseResult."""
+    from backend.parsers import FileParserFactory
+
+    return asyncio.run(FileParserFactory.parse_base64(source, filename))
+
+
+def match_exercise_names(
+    names: List[str],
+) -> Dict[str, Tuple[Optional[str], float, List[Dict[str, Any]]]]:
+    """
+    Fuzzy-match exercise names against the Garmin exercise database.
+
+    Returns:
+        Dict of name -> (matched_name, confidence, suggestions)
+    """
+    from backend.core.garmin_matcher import find_garmin_exercise, get_garmin_suggestions
+
+    results = {}
+    for name in names:
+        matched_name, confidence = find_garmin_exercise(name, threshold=30)
+        suggestions = [
+            {"name": sugg_name, "confidence": round(sugg_conf, 2)}
+            for sugg_name, sugg_conf in get_garmin_suggestions(name, limit=5, score_cutoff=0.3)
+        ]
+        results[name] = (matched_name, confidence, suggestions)
+    return results
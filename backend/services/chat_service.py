@@ -7,20 +7,59 @@ Handles:
 - Claude Sonnet 4.5 AI interactions via Helicone
 - Session management (create/resume)
 - Message persistence
-- Rate limiting
 - Tool execution
+
+Streaming is fully async: tokens are read from a shared AsyncAnthropic
+client (one connection pool per worker) and tool calls, which embed the
+query and search the database synchronously, run on a small dedicated
+thread pool. A slow chat therefore never blocks the event loop that serves
+every other request on the worker.
 """
 
+import asyncio
+import contextvars
+import functools
 import json
 import logging
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, AsyncGenerator, Callable
+from backend.ai import AIClientFactory, AIRequestContext
+from backend.core.spans import record_span, span
 from backend.services.tool_executor import ToolExecutor
 from backend.services.tool_schemas import get_all_tool_schemas
 
 logger = logging.getLogger(__name__)
 
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    """Thread pool for blocking tool calls, created on first use."""
+    global _tool_pool
+    if _tool_pool is None:
+        with _tool_pool_lock:
+            if _tool_pool is None:
+                from backend.settings import get_settings
+                _tool_pool = ThreadPoolExecutor(
+                    max_workers=max(1, get_settings().chat_tool_workers),
+                    thread_name_prefix="chat-tool",
+                )
+    return _tool_pool
+
+
+def shutdown_chat_tool_pool() -> None:
+    """Stop the tool thread pool (called on app shutdown)."""
+    global _tool_pool
+    with _tool_pool_lock:
+        pool, _tool_pool = _tool_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 # System prompt for fitness coach persona
 FITNESS_COACH_SYSTEM_PROMPT = """You are FitCoach, a knowledgeable and encouraging fitness coach assistant. 
@@ -65,14 +104,17 @@ class ChatService:
         session_id: Optional[str] = None,
     ) -> Any:
         """
-        Create an Anthropic client for Claude interactions.
+        Get an async Anthropic client for Claude interactions.
+
+        The client shares the worker's pooled AsyncAnthropic connection and
+        only adds this conversation's tracking headers.
 
         Args:
             user_id: User ID for tracking
             session_id: Optional session ID for conversation continuity
 
         Returns:
-            Configured Anthropic client
+            Configured AsyncAnthropic client
         """
         context = AIRequestContext(
             user_id=user_id,
@@ -80,7 +122,7 @@ class ChatService:
             feature_name="chat_stream",
             custom_properties={"model": "claude-sonnet-4-5-20250514"},
         )
-        return AIClientFactory.create_anthropic_client(context=context)
+        return AIClientFactory.create_async_anthropic_client(context=context)
 
     async def stream_chat(
         self,
@@ -92,6 +134,10 @@ class ChatService:
         """
         Stream a chat response from Claude with SSE events.
 
+        Events are pulled from Claude only as fast as the consumer (the SSE
+        response) takes them, so a slow client applies backpressure all the
+        way upstream instead of buffering the reply in memory.
+
         Args:
             user_id: User ID
             session_id: Existing session ID or None for new session
@@ -123,6 +169,9 @@ class ChatService:
         # Build messages for Claude
         messages = self._build_messages(conversation_history, message, context)
 
+        # Stream the response
+        content_buffer = ""
+
         try:
             # Create Anthropic client
             client = self.create_anthropic_client(user_id, session_id)
@@ -130,17 +179,22 @@ class ChatService:
             # Tool schemas for function calling
             tool_schemas = get_all_tool_schemas()
 
-            # Stream the response
-            content_buffer = ""
-            
-            with client.messages.stream(
+            llm_started = time.perf_counter()
+            first_event = True
+            async with client.messages.stream(
                 model="claude-sonnet-4-5-20250514",
                 max_tokens=4096,
                 system=FITNESS_COACH_SYSTEM_PROMPT,
                 messages=messages,
                 tools=tool_schemas if tool_schemas else [],
             ) as stream:
-                for event in stream:
+                async for event in stream:
+                    if first_event:
+                        # Time to first streamed event; the rest of the stream
+                        # is paced by the client reading it
+                        record_span("llm.chat_first_event", time.perf_counter() - llm_started)
+                        first_event = False
+
                     if event.type == "content_block_delta":
                         if event.delta.type == "text_delta":
                             text = event.delta.text
@@ -149,11 +203,13 @@ class ChatService:
                                 "content": text,
                                 "message_id": message_id,
                             }
-                    
-                    elif event.type == "tool_use":
+                        continue
+
+                    tool_use = self._completed_tool_use(event)
+                    if tool_use is not None:
                         # Claude wants to use a tool
-                        tool_name = event.name
-                        tool_input = event.input
+                        tool_name = tool_use.name
+                        tool_input = tool_use.input
                         
                         yield "function_call", {
                             "function_name": tool_name,
@@ -161,19 +217,7 @@ class ChatService:
                             "message_id": message_id,
                         }
                         
-                        # Execute the tool
-                        if self.tool_executor:
-                            try:
-                                result = self.tool_executor.execute_tool(
-                                    tool_name=tool_name,
-                                    parameters=tool_input,
-                                    profile_id=user_id,
-                                )
-                            except Exception as e:
-                                logger.error(f"Tool execution failed: {e}")
-                                result = {"success": False, "error": "Tool execution failed"}
-                        else:
-                            result = {"success": False, "error": "Tool executor not configured"}
+                        result = await self._execute_tool(tool_name, tool_input, user_id)
                         
                         yield "function_result", {
                             "function_name": tool_name,
@@ -214,6 +258,42 @@ class ChatService:
         # Persist the conversation
         self._persist_message(session_id, user_id, message, content_buffer)
 
+    @staticmethod
+    def _completed_tool_use(event: Any) -> Optional[Any]:
+        """The finished tool_use block carried by a stream event, if any."""
+        if event.type == "tool_use":
+            return event
+        if event.type == "content_block_stop":
+            block = getattr(event, "content_block", None)
+            if block is not None and block.type == "tool_use":
+                return block
+        return None
+
+    @span("chat.tool")
+    async def _execute_tool(
+        self,
+        tool_name: str,
+        tool_input: Dict[str, Any],
+        user_id: str,
+    ) -> Dict[str, Any]:
+        """Run a tool on the tool thread pool so it can't block the event loop."""
+        if not self.tool_executor:
+            return {"success": False, "error": "Tool executor not configured"}
+
+        # Run in this context so spans opened by the tool nest under chat.tool
+        call = functools.partial(
+            contextvars.copy_context().run,
+            self.tool_executor.execute_tool,
+            tool_name=tool_name,
+            parameters=tool_input,
+            profile_id=user_id,
+        )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(_get_tool_pool(), call)
+        except Exception as e:
+            logger.error(f"Tool execution failed: {e}")
+            return {"success": False, "error": "Tool execution failed"}
+
     def _get_conversation_history(self, session_id: str) -> list:
         """Get conversation history for a session.
         
@@ -272,33 +352,6 @@ class ChatService:
         logger.info(f"Would persist message to session {session_id}: user='{user_message[:50]}...', assistant='{assistant_message[:50]}...'")
 
 
-class RateLimiter:
-    """Rate limiter for AI requests using ai_request_limits table."""
-    
-    def __init__(self):
-        """Initialize the rate limiter."""
-        pass
-
-    def check_rate_limit(self, user_id: str) -> tuple[bool, Optional[int]]:
-        """
-        Check if user has exceeded rate limit.
-
-        Args:
-            user_id: User ID to check
-
-        Returns:
-            Tuple of (is_allowed, retry_after_seconds)
-        """
-        # TODO: Implement actual rate limiting with ai_request_limits table
-        # For now, allow all requests
-        return True, None
-
-    def increment_rate_limit(self, user_id: str) -> None:
-        """Increment the rate limit counter for a user."""
-        # TODO: Implement actual rate limit increment
-        pass
-
-
 def create_chat_service(tool_executor: Optional[ToolExecutor] = None) -> ChatService:
     """Create a ChatService instance."""
     return ChatService(tool_executor=tool_executor)
@@ -0,0 +1,297 @@
+"""
+Conditional and delta polling for companion workout feeds.
+
+The mobile apps poll /workouts/incoming, /ios-companion/pending and
+/android-companion/pending. Most polls find nothing new, so this module lets
+those endpoints answer cheaply:
+
+- ETags derived from a per-user sync version (one primary-key lookup), so an
+  unchanged feed is answered with 304 Not Modified
+- An opaque ``since`` cursor: the response only carries workouts changed after
+  the cursor or not yet delivered to the client, plus the IDs still pending so
+  the client can drop the rest
+- Companion payloads (to_workoutkit output) cached per workout, keyed by a
+  hash of ``workout_data``, so unchanged workouts are never re-transformed
+
+Usage:
+    from backend.services.companion_feed import build_companion_feed, feed_etag
+
+    etag = feed_etag(user_id, version, "ios", limit)
+    if etag and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    feed = build_companion_feed(rows, "ios_companion_synced_at", since=since)
+"""
+
+import base64
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from backend.adapters.blocks_to_workoutkit import to_workoutkit
+from backend.utils.intervals import calculate_intervals_duration, convert_exercise_to_interval
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAYLOAD_CACHE_SIZE = 2048
+
+
+# ============================================================================
+# Companion Payload Cache
+# ============================================================================
+
+
+def workout_data_hash(workout_data: Dict[str, Any]) -> str:
+    """Stable content hash of a workout's ``workout_data``."""
+    encoded = json.dumps(workout_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _transform_intervals(workout_data: Dict[str, Any], workout_id: Optional[str]) -> Dict[str, Any]:
+    """Run to_workoutkit, falling back to a per-exercise conversion."""
+    try:
+        workoutkit_dto = to_workoutkit(workout_data)
+        intervals = [interval.model_dump() for interval in workoutkit_dto.intervals]
+        sport = workoutkit_dto.sportType
+    except Exception as e:
+        logger.warning(f"Failed to transform workout {workout_id}: {e}")
+        intervals = []
+        sport = "strengthTraining"
+        try:
+            for block in workout_data.get("blocks", []):
+                for exercise in block.get("exercises", []):
+                    intervals.append(convert_exercise_to_interval(exercise))
+        except (KeyError, AttributeError, TypeError) as fallback_err:
+            logger.warning(f"Fallback transformation also failed for {workout_id}: {fallback_err}")
+
+    return {
+        "sport": sport,
+        "duration": calculate_intervals_duration(intervals),
+        "intervals": intervals,
+    }
+
+
+class CompanionPayloadCache:
+    """
+    LRU cache of companion payloads keyed by ``workout_data`` hash.
+
+    The same workout content always produces the same intervals, so the key
+    changes exactly when a re-transform is needed. Callers get deep copies.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PAYLOAD_CACHE_SIZE):
+        self._max_entries = max(1, max_entries)
+        self._lock = threading.Lock()
+        self._payloads: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def get_payload(self, workout_data: Dict[str, Any], workout_id: Optional[str] = None) -> Dict[str, Any]:
+        key = workout_data_hash(workout_data)
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self._payloads.move_to_end(key)
+                return copy.deepcopy(payload)
+
+        payload = _transform_intervals(workout_data, workout_id)
+
+        with self._lock:
+            self._payloads[key] = payload
+            self._payloads.move_to_end(key)
+            while len(self._payloads) > self._max_entries:
+                self._payloads.popitem(last=False)
+        return copy.deepcopy(payload)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+
+_payload_cache = CompanionPayloadCache()
+
+
+def get_companion_payload_cache() -> CompanionPayloadCache:
+    """Process-wide companion payload cache."""
+    return _payload_cache
+
+
+def to_companion_workout(record: Dict[str, Any], pushed_at_field: str) -> Dict[str, Any]:
+    """Build the companion app representation of a workout row."""
+    workout_data = record.get("workout_data") or {}
+    title = record.get("title") or workout_data.get("title", "Workout")
+    payload = _payload_cache.get_payload(workout_data, record.get("id"))
+
+    return {
+        "id": record.get("id"),
+        "name": title,
+        "sport": payload["sport"],
+        "duration": payload["duration"],
+        "source": "amakaflow",
+        "sourceUrl": None,
+        "intervals": payload["intervals"],
+        "pushedAt": record.get(pushed_at_field),
+        "createdAt": record.get("created_at"),
+    }
+
+
+# ============================================================================
+# ETags
+# ============================================================================
+
+
+def feed_etag(user_id: str, version: Optional[int], *params: Any) -> Optional[str]:
+    """
+    Weak ETag for a feed response, or None when no sync version is available.
+
+    ``params`` are the query parameters that shape the response (feed name,
+    limit, ...) so different views of the same version never share a tag.
+    """
+    if version is None:
+        return None
+    raw = "|".join([user_id, str(version), *(str(p) for p in params)])
+    return f'W/"{hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag``."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == wanted:
+            return True
+    return False
+
+
+# ============================================================================
+# Delta Cursors
+# ============================================================================
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _changed_at(record: Dict[str, Any], pushed_at_field: str) -> Optional[datetime]:
+    stamps = [
+        _parse_timestamp(record.get("updated_at")),
+        _parse_timestamp(record.get(pushed_at_field)),
+    ]
+    stamps = [s for s in stamps if s is not None]
+    return max(stamps) if stamps else None
+
+
+# Bytes of the per-workout digest carried in cursors (collisions ~1e-11 per poll)
+CURSOR_ID_DIGEST_SIZE = 6
+
+
+def _id_digest(workout_id: Any) -> str:
+    return hashlib.blake2b(str(workout_id).encode("utf-8"), digest_size=CURSOR_ID_DIGEST_SIZE).hexdigest()
+
+
+def encode_cursor(high_water: Optional[datetime], ids: Optional[Iterable[Any]] = None) -> Optional[str]:
+    """
+    Opaque cursor for a change high-water mark and the workouts the client holds.
+
+    ``ids`` are the workouts delivered so far (stored as short digests), so a
+    later delta can send full records for workouts that enter the window
+    without having changed.
+    """
+    if high_water is None:
+        return None
+    raw = high_water.isoformat()
+    if ids is not None:
+        raw += "|" + ",".join(_id_digest(workout_id) for workout_id in ids)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _parse_cursor(cursor: Optional[str]) -> "tuple[Optional[datetime], Optional[set]]":
+    """(high-water mark, held ID digests); digests are None for cursors without them."""
+    if not cursor:
+        return None, None
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError):
+        return None, None
+    stamp, sep, digests = raw.partition("|")
+    high_water = _parse_timestamp(stamp)
+    if high_water is None or not sep:
+        return high_water, None
+    return high_water, set(filter(None, digests.split(",")))
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[datetime]:
+    """Decode a cursor's high-water mark; malformed cursors yield None (full response)."""
+    return _parse_cursor(cursor)[0]
+
+
+def build_companion_feed(
+    records: Iterable[Dict[str, Any]],
+    pushed_at_field: str,
+    since: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build a companion feed response body.
+
+    Without a valid ``since`` cursor every record is returned. With one,
+    records changed after it are returned, and so are records the client
+    never received: older workouts that moved into the ``limit`` window
+    because newer ones were completed or deleted, or because the client
+    changed ``limit``. ``ids`` lists every workout still pending so the
+    client can remove the others.
+    """
+    records = list(records)
+    since_at, held = _parse_cursor(since)
+
+    high_water = None
+    changed: List[Dict[str, Any]] = []
+    for record in records:
+        changed_at = _changed_at(record, pushed_at_field)
+        if changed_at is not None and (high_water is None or changed_at > high_water):
+            high_water = changed_at
+        if (
+            since_at is None
+            or changed_at is None
+            or changed_at > since_at
+            # Cursors from before ID tracking: the client's holdings are unknown
+            or held is None
+            or _id_digest(record.get("id")) not in held
+        ):
+            changed.append(record)
+
+    if since_at is not None and high_water is not None and high_water < since_at:
+        high_water = since_at
+    if high_water is None:
+        high_water = since_at
+
+    ids = [record.get("id") for record in records]
+    workouts = [to_companion_workout(record, pushed_at_field) for record in changed]
+    feed: Dict[str, Any] = {
+        "success": True,
+        "workouts": workouts,
+        "count": len(workouts),
+        "cursor": encode_cursor(high_water, ids) or since,
+    }
+    if since_at is not None:
+        feed["delta"] = True
+        feed["ids"] = ids
+    return feed
@@ -15,12 +15,13 @@ import hashlib
 import logging
 import time
 from functools import lru_cache
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Callable, Dict, Any, Optional, Tuple, List
 from dataclasses import dataclass, field
 from enum import Enum
 
 import httpx
 
+from backend.services.adaptive_limiter import AdaptiveLimiter
 from backend.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -53,6 +54,12 @@ class ClassificationResult:
 
 # Simple in-memory cache with size limit to prevent unbounded growth
 MAX_CACHE_SIZE = 1000  # Maximum number of cached entries
+
+# LLM calls in flight across every caller on this worker. The limit adapts
+# to the provider's rate limits and timeouts; call latency varies with load
+# on the provider's side, so it is not used as a congestion signal.
+LLM_INITIAL_CONCURRENCY = 4
+LLM_MAX_CONCURRENCY = 16
 _classification_cache: Dict[str, Tuple[ClassificationResult, float]] = {}
 
 
@@ -139,6 +146,7 @@ class ContentClassifier:
         """Initialize the classifier with optional settings override."""
         self._settings = settings or get_settings()
         self._llm_client: Optional[httpx.AsyncClient] = None
+        self._llm_limiter: Optional[Tuple[asyncio.AbstractEventLoop, AdaptiveLimiter]] = None
 
         # Compile keyword patterns for efficiency
         self._non_workout_pattern = self._compile_keywords(self.NON_WORKOUT_KEYWORDS)
@@ -245,6 +253,17 @@ class ContentClassifier:
             "No keywords matched - requires LLM classification"
         )
 
+    def _get_llm_limiter(self) -> AdaptiveLimiter:
+        """The LLM limiter for the running event loop (limiters are per loop)."""
+        loop = asyncio.get_running_loop()
+        if self._llm_limiter is None or self._llm_limiter[0] is not loop:
+            self._llm_limiter = (loop, AdaptiveLimiter(
+                initial_limit=LLM_INITIAL_CONCURRENCY,
+                max_limit=LLM_MAX_CONCURRENCY,
+                latency_tolerance=None,
+            ))
+        return self._llm_limiter[1]
+
     async def _llm_classify(
         self,
         title: Optional[str],
@@ -284,16 +303,21 @@ Respond with ONLY one word: "workout" or "non_workout"
 
             client = AsyncOpenAI(api_key=self._settings.openai_api_key)
 
-            response = await client.chat.completions.create(
-                model=self._settings.content_classifier_model,
-                messages=[
-                    {"role": "system", "content": "You are a content classifier. Respond with only 'workout' or 'non_workout'."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0,
-                timeout=30.0  # Add timeout to prevent hanging requests
-            )
+            async with self._get_llm_limiter().slot() as slot:
+                try:
+                    response = await client.chat.completions.create(
+                        model=self._settings.content_classifier_model,
+                        messages=[
+                            {"role": "system", "content": "You are a content classifier. Respond with only 'workout' or 'non_workout'."},
+                            {"role": "user", "content": prompt}
+                        ],
+                        max_tokens=10,
+                        temperature=0,
+                        timeout=30.0  # Add timeout to prevent hanging requests
+                    )
+                except (RateLimitError, APITimeoutError):
+                    slot.failed()
+                    raise
 
             # Validate response format before parsing
             if not response.choices or not response.choices[0].message.content:
@@ -346,7 +370,8 @@ Respond with ONLY one word: "workout" or "non_workout"
         video_id: str,
         platform: str,
         title: Optional[str] = None,
-        description: Optional[str] = None
+        description: Optional[str] = None,
+        llm_allowed: Optional[Callable[[], bool]] = None,
     ) -> ClassificationResult:
         """
         Classify video content using hybrid approach.
@@ -356,6 +381,8 @@ Respond with ONLY one word: "workout" or "non_workout"
             platform: Platform (youtube, instagram, tiktok)
             title: Video title
             description: Video description
+            llm_allowed: Called right before an LLM call (e.g. to charge the
+                caller's budget); False keeps the keyword result
 
         Returns:
             ClassificationResult with category, confidence, and reason
@@ -383,6 +410,17 @@ Respond with ONLY one word: "workout" or "non_workout"
 
         # Step 2: If uncertain or medium confidence, use LLM
         if category == ContentCategory.UNCERTAIN or confidence == ClassificationConfidence.MEDIUM:
+            if self._settings.openai_api_key and llm_allowed is not None and not llm_allowed():
+                # Budget spent: keyword result, not cached so a later call can use the LLM
+                logger.info(f"LLM budget spent, using keyword classification for {platform}:{video_id}")
+                return ClassificationResult(
+                    category=category,
+                    confidence=confidence,
+                    reason=reason,
+                    keywords_matched=keywords,
+                    used_llm=False
+                )
+
             llm_result = await self._llm_classify(title, description, platform)
 
             # Use LLM result if it's higher confidence
@@ -425,7 +463,8 @@ async def classify_content(
     video_id: str,
     platform: str,
     title: Optional[str] = None,
-    description: Optional[str] = None
+    description: Optional[str] = None,
+    llm_allowed: Optional[Callable[[], bool]] = None,
 ) -> ClassificationResult:
     """
     Convenience function to classify content.
@@ -435,12 +474,14 @@ async def classify_content(
         platform: Platform (youtube, instagram, tiktok)
         title: Video title
         description: Video description
+        llm_allowed: Called right before an LLM call; False keeps the
+            keyword result
 
     Returns:
         ClassificationResult with category, confidence, and reason
     """
     classifier = get_classifier()
-    return await classifier.classify(video_id, platform, title, description)
+    return await classifier.classify(video_id, platform, title, description, llm_allowed)
 
 
 def clear_classification_cache() -> None:
@@ -12,7 +12,8 @@ queries into 1536-dimension embedding vectors for cosine similarity search.
 import logging
 from typing import Optional
 
-from backend.ai import AIClientFactory, AIRequestContext
+from backend.ai import AIClientFactory, AIRequestContext, span_tracking_headers
+from backend.core.spans import span
 
 logger = logging.getLogger(__name__)
 
@@ -70,9 +71,11 @@ class EmbeddingService:
                 # Helicone uses 'properties' in extra body
                 extra_body["properties"] = helicone_headers
 
-        response = self._client.embeddings.create(
-            input=text,
-            model=self._model,
-            extra_body=extra_body if extra_body else None,
-        )
+        with span("llm.embedding"):
+            response = self._client.embeddings.create(
+                input=text,
+                model=self._model,
+                extra_body=extra_body if extra_body else None,
+                extra_headers=span_tracking_headers() or None,
+            )
         return response.data[0].embedding
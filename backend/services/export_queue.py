@@ -3,19 +3,52 @@ Export Queue Service for managing background export jobs.
 
 Part of AMA-611: Create ExportJob model and ExportQueue class
 
-This module provides a queue for managing export job execution:
+This module runs export work off the request path:
 - ExportJob dataclass for job status tracking
-- ExportQueue class for enqueuing and processing jobs
+- Job stores: in-memory (default), SQLite (local, survives restarts) and a
+  Supabase/Postgres ``export_jobs`` table (shared by every API worker)
+- ExportQueue: an asyncio worker pool with configurable concurrency that
+  claims jobs by priority, rotating between users at equal priority
+- Dedup by payload hash: enqueueing the same export twice returns the job
+  that is already queued, running or finished
+- Result TTL: finished jobs are evicted once their results expire
+- Handlers for heavy FIT and FIT ZIP exports
+
+Usage:
+    from backend.services.export_queue import ExportPriority, get_export_queue
+
+    queue = get_export_queue()
+    job_id = queue.enqueue(kind="fit", user_id=user_id, payload={"blocks_json": blocks})
+    status = queue.get_status(job_id)
+
+The worker pool is started and drained by the app lifespan
+(start_export_queue / shutdown_export_queue). Jobs enqueued before start, or
+by a process that never starts workers, stay pending in the store until a
+worker claims them.
 """
 
+import asyncio
+import base64
+import hashlib
+import io
+import json
 import logging
+import os
+import sqlite3
+import threading
+import time
 import uuid
+import zipfile
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional, Protocol
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_JOB_KIND = "workout_export"
+
 
 class ExportStatus(str, Enum):
     """Status states for export jobs."""
@@ -26,6 +59,17 @@ class ExportStatus(str, Enum):
     FAILED = "failed"
 
 
+class ExportPriority(IntEnum):
+    """Claim order for export jobs; higher runs first."""
+
+    LOW = 0
+    NORMAL = 5
+    HIGH = 10
+
+
+FINISHED_STATUSES = (ExportStatus.COMPLETED, ExportStatus.FAILED)
+
+
 @dataclass
 class ExportJob:
     """
@@ -36,45 +80,695 @@ class ExportJob:
         status: Current status of the job (pending, processing, completed, failed)
         result: Result data when job completes successfully
         error: Error message if job fails
+        kind: Handler that runs the job
+        user_id: Owner, used for fairness and access checks
+        payload: JSON-serializable handler input
+        priority: Claim priority (see ExportPriority)
+        payload_hash: Dedup key over kind, user and payload
+        attempts: Number of times a worker claimed the job
+        created_at / started_at / finished_at: Unix timestamps
     """
 
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     status: ExportStatus = ExportStatus.PENDING
     result: Optional[Any] = None
     error: Optional[str] = None
+    kind: str = DEFAULT_JOB_KIND
+    user_id: Optional[str] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    priority: int = ExportPriority.NORMAL
+    payload_hash: Optional[str] = None
+    attempts: int = 0
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
 
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
 
-class ExportQueue:
+
+def job_payload_hash(kind: str, user_id: Optional[str], payload: Dict[str, Any]) -> str:
+    """Stable dedup key for an export request."""
+    encoded = json.dumps(
+        [kind, user_id, payload], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# ============================================================================
+# Job Stores
+# ============================================================================
+
+
+class ExportJobStore(Protocol):
+    """Persistence for export jobs. Implementations must be thread-safe."""
+
+    def add(self, job: ExportJob) -> None:
+        """Insert a job, replacing any job with the same ID."""
+        ...
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        ...
+
+    def find_by_hash(self, payload_hash: str) -> Optional[ExportJob]:
+        """Newest job with this payload hash that has not failed."""
+        ...
+
+    def claim(self, worker_id: str) -> Optional[ExportJob]:
+        """Atomically move the next pending job to processing and return it."""
+        ...
+
+    def save(self, job: ExportJob) -> None:
+        """Persist status, result and timestamps of a claimed job."""
+        ...
+
+    def evict(self, finished_before: float) -> int:
+        """Delete jobs that finished before the given timestamp."""
+        ...
+
+    def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        """Refresh started_at of a job this worker is processing. False if it lost the job."""
+        ...
+
+    def requeue_stale(self, started_before: float, max_attempts: int) -> int:
+        """Return abandoned processing jobs to pending (or fail them)."""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class InMemoryExportJobStore:
     """
-    Queue for managing export job execution.
+    Process-local job store.
 
-    Provides methods to enqueue jobs, check status, and process them.
+    Pending jobs are kept per priority, then per user, so claim() only
+    compares users (least recently served first), never individual jobs.
     """
 
     def __init__(self):
+        self._lock = threading.Lock()
         self._jobs: Dict[str, ExportJob] = {}
-        self._pending: list[str] = []
+        self._by_hash: Dict[str, str] = {}
+        self._pending: Dict[int, "OrderedDict[str, Deque[str]]"] = {}
+        self._served: Dict[str, int] = {}
+        self._claims = 0
+
+    def add(self, job: ExportJob) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+            if job.payload_hash:
+                self._by_hash[job.payload_hash] = job.id
+            if job.status == ExportStatus.PENDING:
+                self._push_pending(job)
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def find_by_hash(self, payload_hash: str) -> Optional[ExportJob]:
+        with self._lock:
+            job = self._jobs.get(self._by_hash.get(payload_hash, ""))
+        if job is None or job.payload_hash != payload_hash or job.status == ExportStatus.FAILED:
+            return None
+        return job
+
+    def claim(self, worker_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            for priority in sorted(self._pending, reverse=True):
+                users = self._pending[priority]
+                while users:
+                    # Least recently served user first
+                    user_key = min(users, key=lambda u: self._served.get(u, -1))
+                    queue = users[user_key]
+                    job_id = queue.popleft()
+                    if not queue:
+                        del users[user_key]
+                    job = self._jobs.get(job_id)
+                    # Entries are removed lazily when a job was replaced or evicted
+                    if job is None or job.status != ExportStatus.PENDING or job.priority != priority:
+                        continue
+                    self._claims += 1
+                    self._served[user_key] = self._claims
+                    job.status = ExportStatus.PROCESSING
+                    job.attempts += 1
+                    job.started_at = time.time()
+                    return job
+                del self._pending[priority]
+        return None
+
+    def save(self, job: ExportJob) -> None:
+        with self._lock:
+            if job.id in self._jobs:
+                self._jobs[job.id] = job
+
+    def evict(self, finished_before: float) -> int:
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.is_finished and (job.finished_at or 0) < finished_before
+            ]
+            for job_id in expired:
+                job = self._jobs.pop(job_id)
+                if job.payload_hash and self._by_hash.get(job.payload_hash) == job_id:
+                    del self._by_hash[job.payload_hash]
+            # Users with nothing pending lose their turn history, so the
+            # map stays bounded by the users with queued work
+            waiting = {user for users in self._pending.values() for user in users}
+            self._served = {user: n for user, n in self._served.items() if user in waiting}
+        return len(expired)
+
+    def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status != ExportStatus.PROCESSING:
+                return False
+            job.started_at = time.time()
+            return True
+
+    def requeue_stale(self, started_before: float, max_attempts: int) -> int:
+        # Workers of this store live in this process and never abandon jobs
+        return 0
+
+    def close(self) -> None:
+        pass
+
+    def _push_pending(self, job: ExportJob) -> None:
+        users = self._pending.setdefault(int(job.priority), OrderedDict())
+        users.setdefault(job.user_id or "", deque()).append(job.id)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+
+_JOB_COLUMNS = (
+    "id", "kind", "user_id", "payload", "priority", "payload_hash", "status",
+    "result", "error", "attempts", "created_at", "started_at", "finished_at",
+)
+
+# Highest priority first; within a priority, the user served least recently
+# (never-served users first), then FIFO. This rotates between users, so one
+# user's bulk export cannot starve everyone else.
+_SQLITE_CLAIM_SQL = """
+SELECT id FROM export_jobs AS j
+WHERE status = 'pending'
+ORDER BY priority DESC,
+         (SELECT MAX(s.started_at) FROM export_jobs AS s
+          WHERE COALESCE(s.user_id, '') = COALESCE(j.user_id, '')) ASC,
+         created_at
+LIMIT 1
+"""
+
+
+class SQLiteExportJobStore:
+    """
+    Durable job store in a local SQLite file.
+
+    Jobs survive restarts, and several API processes on the same host can
+    share the file: claim() runs in an immediate transaction, so a job is
+    handed to exactly one worker.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS export_jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                user_id TEXT,
+                payload TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                payload_hash TEXT,
+                status TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                worker_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS export_jobs_pending_idx
+                ON export_jobs (status, priority, created_at);
+            CREATE INDEX IF NOT EXISTS export_jobs_user_idx
+                ON export_jobs (user_id, started_at);
+            CREATE INDEX IF NOT EXISTS export_jobs_hash_idx
+                ON export_jobs (payload_hash);
+            """
+        )
+
+    def add(self, job: ExportJob) -> None:
+        row = self._to_row(job)
+        placeholders = ", ".join("?" for _ in _JOB_COLUMNS)
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO export_jobs ({', '.join(_JOB_COLUMNS)}) VALUES ({placeholders})",
+                [row[column] for column in _JOB_COLUMNS],
+            )
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM export_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def find_by_hash(self, payload_hash: str) -> Optional[ExportJob]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM export_jobs WHERE payload_hash = ? AND status != 'failed' "
+                "ORDER BY created_at DESC LIMIT 1",
+                (payload_hash,),
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def claim(self, worker_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(_SQLITE_CLAIM_SQL).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                self._conn.execute(
+                    "UPDATE export_jobs SET status = 'processing', attempts = attempts + 1, "
+                    "started_at = ?, worker_id = ? WHERE id = ?",
+                    (time.time(), worker_id, row["id"]),
+                )
+                claimed = self._conn.execute(
+                    "SELECT * FROM export_jobs WHERE id = ?", (row["id"],)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._from_row(claimed)
+
+    def save(self, job: ExportJob) -> None:
+        row = self._to_row(job)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE export_jobs SET status = ?, result = ?, error = ?, attempts = ?, "
+                "started_at = ?, finished_at = ? WHERE id = ?",
+                (row["status"], row["result"], row["error"], row["attempts"],
+                 row["started_at"], row["finished_at"], job.id),
+            )
+
+    def evict(self, finished_before: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM export_jobs WHERE status IN ('completed', 'failed') AND finished_at < ?",
+                (finished_before,),
+            )
+        return cursor.rowcount
+
+    def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE export_jobs SET started_at = ? "
+                "WHERE id = ? AND status = 'processing' AND worker_id = ?",
+                (time.time(), job_id, worker_id),
+            )
+        return cursor.rowcount > 0
+
+    def requeue_stale(self, started_before: float, max_attempts: int) -> int:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE export_jobs SET status = 'failed', error = 'Export worker stopped responding', "
+                "finished_at = ? WHERE status = 'processing' AND started_at < ? AND attempts >= ?",
+                (now, started_before, max_attempts),
+            )
+            cursor = self._conn.execute(
+                "UPDATE export_jobs SET status = 'pending', worker_id = NULL "
+                "WHERE status = 'processing' AND started_at < ?",
+                (started_before,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_row(job: ExportJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "user_id": job.user_id,
+            "payload": json.dumps(job.payload, default=str),
+            "priority": int(job.priority),
+            "payload_hash": job.payload_hash,
+            "status": job.status.value,
+            "result": json.dumps(job.result, default=str) if job.result is not None else None,
+            "error": job.error,
+            "attempts": job.attempts,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+        }
+
+    @staticmethod
+    def _from_row(row: Any) -> ExportJob:
+        return ExportJob(
+            id=row["id"],
+            status=ExportStatus(row["status"]),
+            result=json.loads(row["result"]) if row["result"] is not None else None,
+            error=row["error"],
+            kind=row["kind"],
+            user_id=row["user_id"],
+            payload=json.loads(row["payload"]),
+            priority=row["priority"],
+            payload_hash=row["payload_hash"],
+            attempts=row["attempts"],
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+        )
+
+
+def _to_iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+def _from_iso(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+class SupabaseExportJobStore:
+    """
+    Job store backed by the ``export_jobs`` Postgres table.
+
+    Shared by every API instance. claim() calls the ``claim_export_job``
+    function (see DATABASE.md), which locks the next job with
+    FOR UPDATE SKIP LOCKED so concurrent workers never take the same job.
+    """
+
+    TABLE = "export_jobs"
+
+    def __init__(self, client: Any):
+        self._client = client
+
+    def add(self, job: ExportJob) -> None:
+        self._client.table(self.TABLE).upsert(self._to_row(job)).execute()
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        result = self._client.table(self.TABLE).select("*").eq("id", job_id).limit(1).execute()
+        return self._from_row(result.data[0]) if result.data else None
+
+    def find_by_hash(self, payload_hash: str) -> Optional[ExportJob]:
+        result = (
+            self._client.table(self.TABLE)
+            .select("*")
+            .eq("payload_hash", payload_hash)
+            .neq("status", ExportStatus.FAILED.value)
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return self._from_row(result.data[0]) if result.data else None
+
+    def claim(self, worker_id: str) -> Optional[ExportJob]:
+        result = self._client.rpc("claim_export_job", {"p_worker_id": worker_id}).execute()
+        return self._from_row(result.data[0]) if result.data else None
 
-    def enqueue(self, job_id: Optional[str] = None) -> str:
+    def save(self, job: ExportJob) -> None:
+        row = self._to_row(job)
+        update = {key: row[key] for key in ("status", "result", "error", "attempts", "started_at", "finished_at")}
+        self._client.table(self.TABLE).update(update).eq("id", job.id).execute()
+
+    def evict(self, finished_before: float) -> int:
+        result = (
+            self._client.table(self.TABLE)
+            .delete()
+            .in_("status", [s.value for s in FINISHED_STATUSES])
+            .lt("finished_at", _to_iso(finished_before))
+            .execute()
+        )
+        return len(result.data or [])
+
+    def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        result = (
+            self._client.table(self.TABLE)
+            .update({"started_at": _to_iso(time.time())})
+            .eq("id", job_id)
+            .eq("status", ExportStatus.PROCESSING.value)
+            .eq("worker_id", worker_id)
+            .execute()
+        )
+        return bool(result.data)
+
+    def requeue_stale(self, started_before: float, max_attempts: int) -> int:
+        cutoff = _to_iso(started_before)
+        (
+            self._client.table(self.TABLE)
+            .update({
+                "status": ExportStatus.FAILED.value,
+                "error": "Export worker stopped responding",
+                "finished_at": _to_iso(time.time()),
+            })
+            .eq("status", ExportStatus.PROCESSING.value)
+            .lt("started_at", cutoff)
+            .gte("attempts", max_attempts)
+            .execute()
+        )
+        result = (
+            self._client.table(self.TABLE)
+            .update({"status": ExportStatus.PENDING.value, "worker_id": None})
+            .eq("status", ExportStatus.PROCESSING.value)
+            .lt("started_at", cutoff)
+            .execute()
+        )
+        return len(result.data or [])
+
+    def close(self) -> None:
+        pass
+
+    @staticmethod
+    def _to_row(job: ExportJob) -> Dict[str, Any]:
+        return {
+            "id": job.id,
+            "kind": job.kind,
+            "user_id": job.user_id,
+            "payload": job.payload,
+            "priority": int(job.priority),
+            "payload_hash": job.payload_hash,
+            "status": job.status.value,
+            "result": job.result,
+            "error": job.error,
+            "attempts": job.attempts,
+            "created_at": _to_iso(job.created_at),
+            "started_at": _to_iso(job.started_at),
+            "finished_at": _to_iso(job.finished_at),
+        }
+
+    @staticmethod
+    def _from_row(row: Dict[str, Any]) -> ExportJob:
+        return ExportJob(
+            id=row["id"],
+            status=ExportStatus(row["status"]),
+            result=row.get("result"),
+            error=row.get("error"),
+            kind=row["kind"],
+            user_id=row.get("user_id"),
+            payload=row.get("payload") or {},
+            priority=row.get("priority", ExportPriority.NORMAL),
+            payload_hash=row.get("payload_hash"),
+            attempts=row.get("attempts", 0),
+            created_at=_from_iso(row.get("created_at")) or time.time(),
+            started_at=_from_iso(row.get("started_at")),
+            finished_at=_from_iso(row.get("finished_at")),
+        )
+
+
+# ============================================================================
+# Export Handlers
+# ============================================================================
+
+
+ExportHandler = Callable[[Dict[str, Any]], Any]
+
+
+def _file_result(content: bytes, filename: str, media_type: str) -> Dict[str, Any]:
+    return {
+        "filename": filename,
+        "media_type": media_type,
+        "size": len(content),
+        "content_base64": base64.b64encode(content).decode("ascii"),
+    }
+
+
+def _fit_filename(blocks_json: Dict[str, Any], index: Optional[int] = None) -> str:
+    title = str(blocks_json.get("title") or "workout").replace(" ", "_").replace("/", "_")
+    return f"{index:02d}_{title}.fit" if index is not None else f"{title}.fit"
+
+
+def run_workout_export(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Record the hand-off of a saved workout to a device export."""
+    return {"status": "exported", **{k: payload[k] for k in ("workout_id", "device") if k in payload}}
+
+
+def run_fit_export(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a Garmin FIT file from ``payload["blocks_json"]``."""
+    from backend.adapters.blocks_to_fit import to_fit
+
+    blocks_json = payload["blocks_json"]
+    content = to_fit(
+        blocks_json,
+        force_sport_type=payload.get("sport_type"),
+        use_lap_button=payload.get("use_lap_button", False),
+    )
+    return _file_result(content, _fit_filename(blocks_json), "application/octet-stream")
+
+
+def run_fit_zip_export(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one ZIP archive with a FIT file per workout in ``payload["workouts"]``."""
+    from backend.adapters.blocks_to_fit import to_fit
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, blocks_json in enumerate(payload["workouts"], start=1):
+            content = to_fit(
+                blocks_json,
+                force_sport_type=payload.get("sport_type"),
+                use_lap_button=payload.get("use_lap_button", False),
+            )
+            archive.writestr(_fit_filename(blocks_json, index), content)
+    filename = payload.get("filename") or "workouts.zip"
+    return _file_result(buffer.getvalue(), filename, "application/zip")
+
+
+DEFAULT_HANDLERS: Dict[str, ExportHandler] = {
+    DEFAULT_JOB_KIND: run_workout_export,
+    "fit": run_fit_export,
+    "fit_zip": run_fit_zip_export,
+}
+
+
+# ============================================================================
+# Export Queue
+# ============================================================================
+
+
+class ExportQueue:
+    """
+    Queue for managing export job execution.
+
+    enqueue() and get_status() are synchronous and safe to call from any
+    thread. start() launches ``concurrency`` asyncio workers on the running
+    loop; handlers run in the default thread pool so FIT/ZIP generation never
+    blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ExportJobStore] = None,
+        concurrency: int = 2,
+        result_ttl_seconds: float = 3600.0,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval_seconds: float = 1.0,
+        handlers: Optional[Dict[str, ExportHandler]] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._store = store if store is not None else InMemoryExportJobStore()
+        self._concurrency = concurrency
+        self._result_ttl = result_ttl_seconds
+        self._lease = lease_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._poll_interval = poll_interval_seconds
+        self._handlers: Dict[str, ExportHandler] = dict(DEFAULT_HANDLERS if handlers is None else handlers)
+        self._worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+
+    @property
+    def store(self) -> ExportJobStore:
+        return self._store
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def register_handler(self, kind: str, handler: ExportHandler) -> None:
+        """Register (or replace) the handler for a job kind."""
+        self._handlers[kind] = handler
+
+    def enqueue(
+        self,
+        job_id: Optional[str] = None,
+        *,
+        kind: str = DEFAULT_JOB_KIND,
+        user_id: Optional[str] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        priority: int = ExportPriority.NORMAL,
+    ) -> str:
         """
         Add a new job to the queue.
 
+        If a job with the same kind, user and payload is already queued,
+        running or finished (and not expired), its ID is returned instead.
+
         Args:
             job_id: Optional pre-determined job ID. If not provided, one will be generated.
+            kind: Handler to run (workout_export, fit, fit_zip, ...)
+            user_id: Owner of the job
+            payload: JSON-serializable handler input
+            priority: Claim priority (see ExportPriority)
 
         Returns:
             The job ID
         """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown export job kind: {kind}")
+        payload = payload or {}
+        payload_hash = job_payload_hash(kind, user_id, payload)
+
+        existing = self._store.find_by_hash(payload_hash)
+        if existing is not None and not self._is_expired(existing):
+            logger.info(f"Deduplicated export job {existing.id} ({kind})")
+            return existing.id
+
         if job_id is None:
             job_id = str(uuid.uuid4())
+        else:
+            current = self._store.get(job_id)
+            if current is not None and not current.is_finished:
+                return job_id
 
-        job = ExportJob(id=job_id)
-        self._jobs[job_id] = job
-        self._pending.append(job_id)
+        job = ExportJob(
+            id=job_id,
+            kind=kind,
+            user_id=user_id,
+            payload=payload,
+            priority=int(priority),
+            payload_hash=payload_hash,
+        )
+        self._store.add(job)
+        self._notify()
 
-        logger.info(f"Enqueued job {job_id}")
+        logger.info(f"Enqueued job {job_id} ({kind})")
         return job_id
 
+    def get_job(self, job_id: str) -> Optional[ExportJob]:
+        """The job, or None if unknown or its result has expired."""
+        job = self._store.get(job_id)
+        if job is None or self._is_expired(job):
+            return None
+        return job
+
     def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """
         Get the current status of a job.
@@ -85,7 +779,7 @@ class ExportQueue:
         Returns:
             Dictionary with job status info, or None if job not found
         """
-        job = self._jobs.get(job_id)
+        job = self.get_job(job_id)
         if job is None:
             return None
 
@@ -94,30 +788,213 @@ class ExportQueue:
             "status": job.status.value,
             "result": job.result,
             "error": job.error,
+            "kind": job.kind,
+            "user_id": job.user_id,
+            "priority": int(job.priority),
+            "attempts": job.attempts,
+            "created_at": _to_iso(job.created_at),
+            "finished_at": _to_iso(job.finished_at),
         }
 
-    def _process(self, job_id: str) -> None:
-        """
-        Process a single job.
+    def evict_expired(self) -> int:
+        """Delete finished jobs whose results outlived the TTL."""
+        evicted = self._store.evict(time.time() - self._result_ttl)
+        if evicted:
+            logger.info(f"Evicted {evicted} expired export jobs")
+        return evicted
 
-        Args:
-            job_id: The job identifier to process
-        """
-        job = self._jobs.get(job_id)
-        if job is None:
-            logger.warning(f"Job {job_id} not found for processing")
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the worker pool and the expiry sweeper on the running loop."""
+        if self._tasks:
             return
+        self._closing = False
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopped = asyncio.Event()
+        # Jobs left processing by a previous (crashed) process go back to pending;
+        # the sweeper retries this, so a store error must not block startup
+        try:
+            await asyncio.to_thread(self._store.requeue_stale, time.time() - self._lease, self._max_attempts)
+        except Exception:
+            logger.exception("Export queue startup requeue failed")
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"export-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._sweeper(), name="export-sweeper"))
+        logger.info(f"Export queue started with {self._concurrency} workers")
 
-        job.status = ExportStatus.PROCESSING
-        logger.info(f"Processing job {job_id}")
+    async def shutdown(self, timeout: float = 10.0) -> None:
+        """Let running jobs finish (up to ``timeout``), then stop the workers."""
+        self._closing = True
+        tasks, self._tasks = self._tasks, []
+        if self._wakeup is not None:
+            self._wakeup.set()
+            self._stopped.set()
+        if tasks:
+            _, still_running = await asyncio.wait(tasks, timeout=timeout)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+        self._loop = None
+        self._wakeup = None
+        self._stopped = None
 
+    async def run_once(self) -> bool:
+        """Claim and run one job. Returns False when nothing was pending."""
+        job = await asyncio.to_thread(self._store.claim, self._worker_id)
+        if job is None:
+            return False
+
+        handler = self._handlers.get(job.kind)
+        # Keep the lease fresh so the sweeper never requeues a job that is
+        # still running (long FIT ZIP exports outlive lease_seconds)
+        heartbeat = asyncio.create_task(self._renew_lease(job.id))
         try:
-            # Placeholder for actual export processing logic
-            # This would be implemented based on the export type
-            job.result = {"status": "exported"}
+            if handler is None:
+                raise ValueError(f"No handler for export job kind: {job.kind}")
+            if asyncio.iscoroutinefunction(handler):
+                job.result = await handler(job.payload)
+            else:
+                job.result = await asyncio.to_thread(handler, job.payload)
             job.status = ExportStatus.COMPLETED
-            logger.info(f"Job {job_id} completed successfully")
+            job.error = None
+            logger.info(f"Job {job.id} completed successfully")
         except Exception as e:
             job.error = str(e)
             job.status = ExportStatus.FAILED
-            logger.error(f"Job {job_id} failed: {e}")
+            logger.error(f"Job {job.id} failed: {e}")
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+        job.finished_at = time.time()
+        await asyncio.to_thread(self._store.save, job)
+        return True
+
+    async def drain(self) -> int:
+        """Run pending jobs until none are left (used by scripts and tests)."""
+        processed = 0
+        while await self.run_once():
+            processed += 1
+        return processed
+
+    async def _worker(self) -> None:
+        while not self._closing:
+            self._wakeup.clear()
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Export worker error: {e}")
+                processed = False
+            if not processed and not self._closing:
+                # Other processes may enqueue into a shared store, so poll as well
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _renew_lease(self, job_id: str) -> None:
+        interval = max(0.01, self._lease / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await asyncio.to_thread(self._store.renew_lease, job_id, self._worker_id)
+            except Exception as e:
+                logger.warning(f"Failed to renew lease on export job {job_id}: {e}")
+                continue
+            if not renewed:
+                logger.warning(f"Export job {job_id} was requeued while still running")
+                return
+
+    async def _sweeper(self) -> None:
+        interval = max(1.0, min(self._result_ttl, self._lease) / 2)
+        while not self._closing:
+            try:
+                await asyncio.to_thread(self.evict_expired)
+                await asyncio.to_thread(
+                    self._store.requeue_stale, time.time() - self._lease, self._max_attempts
+                )
+            except Exception as e:
+                logger.warning(f"Export queue sweep failed: {e}")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _notify(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass
+
+    def _is_expired(self, job: ExportJob) -> bool:
+        return (
+            job.is_finished
+            and job.finished_at is not None
+            and job.finished_at < time.time() - self._result_ttl
+        )
+
+
+# ============================================================================
+# Process-wide Queue
+# ============================================================================
+
+
+_queue: Optional[ExportQueue] = None
+_queue_lock = threading.Lock()
+
+
+def _build_store(backend: str, sqlite_path: str) -> ExportJobStore:
+    if backend == "sqlite":
+        return SQLiteExportJobStore(sqlite_path)
+    if backend == "supabase":
+        from backend.database import get_supabase_client
+
+        client = get_supabase_client()
+        if client is not None:
+            return SupabaseExportJobStore(client)
+        logger.warning("Supabase not configured; export jobs will be kept in memory")
+    elif backend != "memory":
+        logger.warning(f"Unknown export queue backend '{backend}'; using memory")
+    return InMemoryExportJobStore()
+
+
+def get_export_queue() -> ExportQueue:
+    """Process-wide export queue, created from settings on first use."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                _queue = ExportQueue(
+                    store=_build_store(settings.export_queue_backend, settings.export_queue_sqlite_path),
+                    concurrency=settings.export_queue_concurrency,
+                    result_ttl_seconds=settings.export_queue_result_ttl_seconds,
+                    lease_seconds=settings.export_queue_lease_seconds,
+                    max_attempts=settings.export_queue_max_attempts,
+                )
+    return _queue
+
+
+async def start_export_queue() -> None:
+    """Start the process-wide worker pool (called on app startup)."""
+    await get_export_queue().start()
+
+
+async def shutdown_export_queue() -> None:
+    """Drain and stop the worker pool and close the store (called on app shutdown)."""
+    global _queue
+    with _queue_lock:
+        queue, _queue = _queue, None
+    if queue is not None:
+        await queue.shutdown()
+        queue.store.close()
@@ -0,0 +1,423 @@
+"""
+Pooled outbound HTTP clients, one per upstream service.
+
+URL and image detection, Garmin sync and metadata lookups call a handful of
+upstreams (workout-ingestor-api, garmin-sync-api, the YouTube/TikTok oEmbed
+endpoints). Creating an httpx.AsyncClient per call paid TCP and TLS setup on
+every request; bulk detection fans out dozens of calls per job. This module
+keeps one pooled client per upstream for the life of the app:
+
+- Keep-alive pools with per-upstream limits and timeouts
+- HTTP/2 when the ``h2`` package is installed
+- A circuit breaker per upstream: after repeated connection failures or
+  gateway errors, calls fail fast with UpstreamUnavailableError (an
+  httpx.ConnectError, so existing "could not connect" handling applies)
+  until a trial request succeeds
+- An AdaptiveLimiter per upstream (AIMD on latency, 429 and gateway errors) bounding
+  concurrent requests from every job on the worker
+- Counters for requests, failures, short-circuits and new connections, so
+  connection reuse is visible at /debug/http-clients
+
+Usage:
+    from backend.services.http_clients import get_upstream_client
+
+    client = get_upstream_client("ingestor")
+    response = await client.post(f"{INGESTOR_API_URL}/ingest/youtube", json=body)
+
+Clients are bound to the event loop that created them; a call from another
+loop (e.g. a worker thread running asyncio.run) gets its own pool. The app
+lifespan closes every pool via shutdown_http_clients().
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from backend.services.adaptive_limiter import AdaptiveLimiter
+
+logger = logging.getLogger(__name__)
+
+try:  # HTTP/2 needs the optional h2 package
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    HTTP2_AVAILABLE = False
+
+# Gateway errors say the upstream itself is unhealthy; other 5xx are usually
+# specific to one request (e.g. a video the ingestor cannot parse).
+BREAKER_STATUS_CODES = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Pool, timeout and breaker settings for one upstream."""
+
+    name: str
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 50
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    adaptive_concurrency: bool = True
+    initial_concurrency: int = 4
+    max_concurrency: int = 32
+    # None: ignore latency, adapt on 429/gateway errors/timeouts only
+    latency_tolerance: Optional[float] = 2.0
+
+
+# Timeouts match the values the call sites used before pooling. Ingestor
+# calls (vision/OCR, full ingestion) take 2-60s depending on the input, so
+# latency is not a congestion signal there.
+DEFAULT_UPSTREAMS: Dict[str, UpstreamConfig] = {
+    "ingestor": UpstreamConfig(
+        name="ingestor", timeout=120.0, initial_concurrency=3, max_concurrency=16,
+        latency_tolerance=None,
+    ),
+    "oembed": UpstreamConfig(name="oembed", timeout=15.0, initial_concurrency=5, max_concurrency=32),
+    "garmin": UpstreamConfig(
+        name="garmin", timeout=30.0, initial_concurrency=2, max_concurrency=4,
+        latency_tolerance=None,
+    ),
+}
+
+
+class UpstreamUnavailableError(httpx.ConnectError):
+    """Raised without calling the upstream while its circuit is open."""
+
+
+# ============================================================================
+# Circuit Breaker
+# ============================================================================
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after ``failure_threshold`` failures in a row; open ->
+    half-open once ``reset_timeout`` has passed, letting one trial request
+    through; the trial's outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self._threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+    def record_abandoned(self) -> None:
+        """A request ended without an outcome (cancelled); a trial re-opens the circuit."""
+        with self._lock:
+            if self._trial_in_flight:
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+
+# ============================================================================
+# Upstream Client
+# ============================================================================
+
+
+class UpstreamClient:
+    """
+    Pooled client for one upstream with breaker and connection metrics.
+
+    Exposes get/post/put/delete/request with httpx's signatures. The
+    underlying httpx.AsyncClient is created lazily per event loop.
+    """
+
+    def __init__(self, config: UpstreamConfig, breaker: Optional[CircuitBreaker] = None):
+        self.config = config
+        self.breaker = breaker or CircuitBreaker(config.failure_threshold, config.reset_timeout)
+        self._clients: Dict[int, "tuple[asyncio.AbstractEventLoop, httpx.AsyncClient, Optional[AdaptiveLimiter]]"] = {}
+        self._last_limiter: Optional[AdaptiveLimiter] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "connections_opened": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if not self.breaker.allow_request():
+            self._count("short_circuited")
+            raise UpstreamUnavailableError(f"Circuit open for upstream '{self.config.name}'")
+
+        # Every exit reports to the breaker, so a half-open trial is always
+        # released: success only on a healthy response, failure on any error
+        # and re-open if the caller gives up (cancellation, wait_for timeout)
+        healthy: Optional[bool] = None
+        try:
+            client, limiter = self._pool()
+            if limiter is None:
+                response = await self._send(client, method, url, kwargs)
+            else:
+                async with limiter.slot() as slot:
+                    response = await self._send(client, method, url, kwargs)
+                    slot.record(response.status_code)
+            healthy = response.status_code not in BREAKER_STATUS_CODES
+            return response
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            if healthy:
+                self.breaker.record_success()
+            elif healthy is None:
+                self.breaker.record_abandoned()
+            else:
+                self.breaker.record_failure()
+
+    async def _send(
+        self, client: httpx.AsyncClient, method: str, url: str, kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions.setdefault("trace", self._trace)
+        self._count("requests")
+        try:
+            response = await client.request(method, url, extensions=extensions, **kwargs)
+        except Exception:
+            self._count("failures")
+            raise
+
+        if response.status_code in BREAKER_STATUS_CODES:
+            self._count("failures")
+        return response
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Pool management
+    # ------------------------------------------------------------------
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._pool()[0]
+
+    def _pool(self) -> "tuple[httpx.AsyncClient, Optional[AdaptiveLimiter]]":
+        """httpx client and limiter for the running loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(id(loop))
+            if entry is not None and entry[0] is loop:
+                return entry[1], entry[2]
+            # Pools of loops that have since closed cannot be reused
+            for key, (other_loop, _, _) in list(self._clients.items()):
+                if other_loop.is_closed():
+                    del self._clients[key]
+            client = self._build_client()
+            limiter = self._build_limiter()
+            self._clients[id(loop)] = (loop, client, limiter)
+            self._last_limiter = limiter
+            return client, limiter
+
+    def _build_limiter(self) -> Optional[AdaptiveLimiter]:
+        config = self.config
+        if not config.adaptive_concurrency:
+            return None
+        return AdaptiveLimiter(
+            initial_limit=config.initial_concurrency,
+            max_limit=config.max_concurrency,
+            latency_tolerance=config.latency_tolerance,
+        )
+
+    def _build_client(self) -> httpx.AsyncClient:
+        config = self.config
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            http2=config.http2 and HTTP2_AVAILABLE,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pool owned by the running loop and drop the others."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for other_loop, client, _ in clients.values():
+            if other_loop is loop:
+                await client.aclose()
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._count("connections_opened")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            pools = len(self._clients)
+            limiter = self._last_limiter
+        sent = stats["requests"] - stats["failures"]
+        stats["connections_reused"] = max(0, sent - stats["connections_opened"])
+        stats["reuse_ratio"] = round(stats["connections_reused"] / sent, 3) if sent > 0 else None
+        stats["circuit"] = self.breaker.state
+        stats["pools"] = pools
+        stats["http2"] = self.config.http2 and HTTP2_AVAILABLE
+        stats["concurrency"] = limiter.metrics() if limiter is not None else None
+        return stats
+
+
+# ============================================================================
+# Registry
+# ============================================================================
+
+
+class HTTPClientRegistry:
+    """Named UpstreamClients, created on first use."""
+
+    def __init__(self, configs: Optional[Dict[str, UpstreamConfig]] = None):
+        self._configs = dict(DEFAULT_UPSTREAMS if configs is None else configs)
+        self._clients: Dict[str, UpstreamClient] = {}
+        self._lock = threading.Lock()
+
+    def client(self, name: str) -> UpstreamClient:
+        with self._lock:
+            client = self._clients.get(name)
+            if client is None:
+                config = self._configs.get(name) or UpstreamConfig(name=name)
+                client = UpstreamClient(config)
+                self._clients[name] = client
+            return client
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            clients = dict(self._clients)
+        return {name: client.metrics() for name, client in clients.items()}
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP client {client.config.name}: {e}")
+
+
+_registry: Optional[HTTPClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def _configs_from_settings() -> Dict[str, UpstreamConfig]:
+    from backend.settings import get_settings
+
+    settings = get_settings()
+    return {
+        name: UpstreamConfig(
+            name=name,
+            timeout=config.timeout,
+            connect_timeout=config.connect_timeout,
+            max_connections=settings.http_client_max_connections,
+            max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+            http2=settings.http_client_http2,
+            failure_threshold=settings.http_circuit_failure_threshold,
+            reset_timeout=settings.http_circuit_reset_seconds,
+            adaptive_concurrency=settings.http_adaptive_concurrency,
+            initial_concurrency=config.initial_concurrency,
+            max_concurrency=min(config.max_concurrency, settings.http_adaptive_max_concurrency),
+            latency_tolerance=config.latency_tolerance,
+        )
+        for name, config in DEFAULT_UPSTREAMS.items()
+    }
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Process-wide registry, configured from settings on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = HTTPClientRegistry(_configs_from_settings())
+    return _registry
+
+
+def get_upstream_client(name: str) -> UpstreamClient:
+    """Pooled client for a named upstream (ingestor, oembed, garmin, ...)."""
+    return get_http_client_registry().client(name)
+
+
+async def shutdown_http_clients() -> None:
+    """Close every pool (called on app shutdown)."""
+    global _registry
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
@@ -0,0 +1,287 @@
+"""
+Per-user rate limits for AI-backed features.
+
+Chat, content classification and embedding generation each call a paid LLM
+upstream and hold a worker for seconds. Without a limit one heavy user can
+burn the budget and push every other user's latency up.
+This module enforces a per-user, per-feature budget with GCRA (the generic
+cell rate algorithm, an exact token bucket that stores one timestamp per key):
+
+- RateBudget: sustained requests per minute plus a burst allowance
+- RateLimiter.check(): O(1) allow/deny with the seconds until the next
+  request would be allowed, for ``Retry-After``
+- RateLimitBackend: where the per-key state lives. The default is
+  process-local; multi-node deployments configure a shared backend factory
+  via ``RATE_LIMIT_BACKEND`` ("package.module:factory"), e.g. a Redis script
+  implementing the same acquire() step atomically.
+
+If the backend fails the request is allowed (and logged): a limiter outage
+must not take the AI features down with it.
+
+Usage:
+    from backend.services.rate_limiter import FEATURE_CHAT, get_rate_limiter
+
+    decision = get_rate_limiter().check(user_id, FEATURE_CHAT)
+    if not decision.allowed:
+        raise HTTPException(429, headers={"Retry-After": decision.retry_after_header})
+"""
+
+import importlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+FEATURE_CHAT = "chat"
+FEATURE_CLASSIFICATION = "classification"
+FEATURE_EMBEDDINGS = "embeddings"
+
+DEFAULT_MAX_KEYS = 100000
+
+
+@dataclass(frozen=True)
+class RateBudget:
+    """Sustained rate plus burst for one feature."""
+
+    requests_per_minute: float
+    burst: int = 1
+
+    @property
+    def emission_interval(self) -> float:
+        """Seconds one request 'costs' at the sustained rate."""
+        return 60.0 / self.requests_per_minute
+
+    @property
+    def burst_offset(self) -> float:
+        """How far ahead of now the schedule may run (burst requests' worth)."""
+        return self.emission_interval * max(1, self.burst)
+
+
+DEFAULT_BUDGETS: Dict[str, RateBudget] = {
+    FEATURE_CHAT: RateBudget(requests_per_minute=6, burst=3),
+    FEATURE_CLASSIFICATION: RateBudget(requests_per_minute=30, burst=10),
+    FEATURE_EMBEDDINGS: RateBudget(requests_per_minute=60, burst=20),
+}
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one check."""
+
+    allowed: bool
+    retry_after: float = 0.0
+    remaining: int = 0
+
+    @property
+    def retry_after_header(self) -> str:
+        """Whole seconds for the Retry-After header (never 0 when denied)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class RateLimitBackend(Protocol):
+    """
+    Storage for GCRA state (one theoretical arrival time per key).
+
+    ``acquire`` must run the whole step atomically: with
+    ``tat = max(stored_tat, now)`` and ``new_tat = tat + emission_interval * cost``,
+    store new_tat and return (True, new_tat) if ``new_tat - burst_offset <= now``,
+    otherwise leave the state alone and return (False, tat).
+    """
+
+    def acquire(
+        self,
+        key: str,
+        now: float,
+        emission_interval: float,
+        burst_offset: float,
+        cost: int,
+    ) -> Tuple[bool, float]:
+        ...
+
+    def reset(self, key: Optional[str] = None) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class InMemoryRateLimitBackend:
+    """
+    Process-local backend (also the stand-in for shared backends in tests).
+
+    Keys are kept in LRU order and the oldest are dropped past max_keys; a
+    dropped key simply starts again with a full burst.
+    """
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS):
+        self._max_keys = max_keys
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: str,
+        now: float,
+        emission_interval: float,
+        burst_offset: float,
+        cost: int,
+    ) -> Tuple[bool, float]:
+        with self._lock:
+            tat = max(self._tats.get(key, now), now)
+            new_tat = tat + emission_interval * cost
+            if new_tat - burst_offset > now:
+                return False, tat
+            self._tats[key] = new_tat
+            self._tats.move_to_end(key)
+            while len(self._tats) > self._max_keys:
+                self._tats.popitem(last=False)
+            return True, new_tat
+
+    def reset(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            if key is None:
+                self._tats.clear()
+            else:
+                self._tats.pop(key, None)
+
+    def close(self) -> None:
+        self.reset()
+
+
+class RateLimiter:
+    """Per-user, per-feature GCRA limiter."""
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, RateBudget]] = None,
+        backend: Optional[RateLimitBackend] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._budgets = dict(DEFAULT_BUDGETS if budgets is None else budgets)
+        self._backend = backend or InMemoryRateLimitBackend()
+        self._enabled = enabled
+        self._clock = clock
+
+    def budget(self, feature: str) -> Optional[RateBudget]:
+        return self._budgets.get(feature)
+
+    def check(self, user_id: str, feature: str, cost: int = 1) -> RateLimitDecision:
+        """
+        Take ``cost`` requests from the user's budget for a feature.
+
+        Features without a budget are not limited.
+        """
+        budget = self._budgets.get(feature)
+        if not self._enabled or budget is None:
+            return RateLimitDecision(allowed=True)
+
+        now = self._clock()
+        interval = budget.emission_interval
+        try:
+            allowed, tat = self._backend.acquire(
+                f"{feature}:{user_id}", now, interval, budget.burst_offset, cost
+            )
+        except Exception as e:
+            logger.warning(f"Rate limit backend failed for {feature}; allowing request: {e}")
+            return RateLimitDecision(allowed=True)
+
+        if allowed:
+            remaining = int((budget.burst_offset - (tat - now)) / interval)
+            return RateLimitDecision(allowed=True, remaining=max(0, remaining))
+
+        retry_after = tat + interval * cost - budget.burst_offset - now
+        logger.info(f"Rate limited {feature} for user {user_id} (retry in {retry_after:.1f}s)")
+        return RateLimitDecision(allowed=False, retry_after=retry_after)
+
+    def check_rate_limit(
+        self, user_id: str, feature: str = FEATURE_CHAT
+    ) -> Tuple[bool, Optional[int]]:
+        """check() as (is_allowed, retry_after_seconds)."""
+        decision = self.check(user_id, feature)
+        if decision.allowed:
+            return True, None
+        return False, int(decision.retry_after_header)
+
+    def reset(self, user_id: Optional[str] = None, feature: Optional[str] = None) -> None:
+        """Forget usage for one user's feature, or for everyone."""
+        if user_id is None or feature is None:
+            self._backend.reset()
+        else:
+            self._backend.reset(f"{feature}:{user_id}")
+
+    def close(self) -> None:
+        self._backend.close()
+
+
+# ============================================================================
+# Process-wide limiter
+# ============================================================================
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def _load_backend(spec: str) -> RateLimitBackend:
+    module_name, _, factory_name = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    return factory()
+
+
+def _budgets_from_settings(settings) -> Dict[str, RateBudget]:
+    return {
+        FEATURE_CHAT: RateBudget(
+            settings.rate_limit_chat_per_minute, settings.rate_limit_chat_burst
+        ),
+        FEATURE_CLASSIFICATION: RateBudget(
+            settings.rate_limit_classification_per_minute,
+            settings.rate_limit_classification_burst,
+        ),
+        FEATURE_EMBEDDINGS: RateBudget(
+            settings.rate_limit_embeddings_per_minute, settings.rate_limit_embeddings_burst
+        ),
+    }
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter, configured from settings on first use."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                backend: Optional[RateLimitBackend] = None
+                if settings.rate_limit_backend:
+                    try:
+                        backend = _load_backend(settings.rate_limit_backend)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to load rate limit backend {settings.rate_limit_backend}; "
+                            f"using process-local limits: {e}"
+                        )
+                _limiter = RateLimiter(
+                    budgets=_budgets_from_settings(settings),
+                    backend=backend,
+                    enabled=settings.rate_limit_enabled,
+                )
+    return _limiter
+
+
+def shutdown_rate_limiter() -> None:
+    """Close the limiter's backend (called on app shutdown)."""
+    global _limiter
+    with _limiter_lock:
+        limiter, _limiter = _limiter, None
+    if limiter is not None:
+        try:
+            limiter.close()
+        except Exception as e:
+            logger.warning(f"Rate limit backend close failed: {e}")
@@ -0,0 +1,382 @@
+"""
+Server-push channel for workout sync-queue events (AMA-307).
+
+Devices used to discover queued workouts by polling /sync/pending. This
+module lets them hold one SSE connection instead:
+
+- SyncEventHub: in-process pub/sub. queue_sync, confirm_sync and
+  report_sync_failed publish to it (from worker threads); each connected
+  stream subscribes for one user.
+- A bounded per-user replay buffer so a reconnecting client can resume from
+  its Last-Event-ID. If the client fell further behind than the buffer, it is
+  told to resync (re-fetch /sync/pending once).
+- SyncEventBroker: optional fan-out between nodes. The default hub is
+  process-local; multi-node deployments configure a broker factory via
+  ``SYNC_EVENTS_BROKER`` ("package.module:factory").
+
+Usage:
+    from backend.services.sync_events import publish_sync_event
+
+    publish_sync_event(user_id, "sync_queued", {"workout_id": workout_id, ...})
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Protocol, Set
+
+logger = logging.getLogger(__name__)
+
+SYNC_QUEUED = "sync_queued"
+SYNC_CONFIRMED = "sync_confirmed"
+SYNC_FAILED = "sync_failed"
+
+DEFAULT_REPLAY_SIZE = 256
+DEFAULT_MAX_USERS = 10000
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 100
+DEFAULT_HEARTBEAT_SECONDS = 15.0
+
+# Sent to the client when events were lost (replay window exceeded or the
+# subscriber fell behind); the client should re-fetch /sync/pending once.
+RESYNC_EVENT = "resync"
+
+
+@dataclass(frozen=True)
+class SyncEvent:
+    """A single sync-queue state change for one user."""
+
+    id: int
+    user_id: str
+    type: str
+    data: Dict[str, Any]
+    origin: str = ""
+
+    def to_sse(self) -> str:
+        payload = json.dumps({**self.data, "type": self.type})
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "type": self.type,
+            "data": self.data,
+            "origin": self.origin,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "SyncEvent":
+        return cls(
+            id=int(raw["id"]),
+            user_id=raw["user_id"],
+            type=raw["type"],
+            data=raw.get("data") or {},
+            origin=raw.get("origin", ""),
+        )
+
+
+class SyncEventBroker(Protocol):
+    """
+    Cross-node transport for sync events.
+
+    ``publish`` forwards a locally published event to the other nodes;
+    ``start`` registers the callback that receives events from them. Events
+    a node published itself may be echoed back; the hub drops them by origin.
+    """
+
+    def publish(self, event: SyncEvent) -> None:
+        ...
+
+    def start(self, deliver: Callable[[SyncEvent], None]) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+# ============================================================================
+# Subscriptions
+# ============================================================================
+
+
+@dataclass(eq=False)
+class SyncSubscription:
+    """One connected stream's view of a user's events."""
+
+    user_id: str
+    device_type: Optional[str]
+    replay: List[SyncEvent]
+    needs_resync: bool
+    _loop: asyncio.AbstractEventLoop
+    _queue: "asyncio.Queue[Optional[SyncEvent]]"
+    _overflowed: bool = field(default=False)
+
+    def wants(self, event: SyncEvent) -> bool:
+        if self.device_type is None:
+            return True
+        return event.data.get("device_type") in (None, self.device_type)
+
+    def push(self, event: Optional[SyncEvent]) -> None:
+        """Thread-safe delivery; ``None`` closes the stream."""
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # Event loop already closed; the stream is gone.
+            pass
+
+    def _put(self, event: Optional[SyncEvent]) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the backlog and ask the client to resync
+            # rather than buffer without bound.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._overflowed = True
+            self._queue.put_nowait(event)
+
+    async def next_event(self, timeout: float) -> Optional[SyncEvent]:
+        """Wait for the next event; raises asyncio.TimeoutError when idle."""
+        return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+
+    def take_overflow(self) -> bool:
+        overflowed, self._overflowed = self._overflowed, False
+        return overflowed
+
+
+# ============================================================================
+# Hub
+# ============================================================================
+
+
+class SyncEventHub:
+    """
+    In-process pub/sub for sync-queue events with per-user replay buffers.
+
+    ``publish`` may be called from any thread (the database helpers run in
+    the threadpool). Event IDs are microsecond timestamps made strictly
+    increasing per hub, so IDs from different nodes still sort roughly in
+    publish order.
+
+    Replay buffers are kept for the ``max_users`` most recently active users.
+    A client resuming from an ID older than what the hub can vouch for (before
+    it started, or before an evicted buffer) is sent a resync instead.
+    """
+
+    def __init__(
+        self,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        broker: Optional[SyncEventBroker] = None,
+        max_users: int = DEFAULT_MAX_USERS,
+    ):
+        self._replay_size = max(1, replay_size)
+        self._queue_size = max(1, subscriber_queue_size)
+        self._max_users = max(1, max_users)
+        self._lock = threading.Lock()
+        self._buffers: "OrderedDict[str, Deque[SyncEvent]]" = OrderedDict()
+        self._evicted_up_to: Dict[str, int] = {}
+        self._subscribers: Dict[str, Set[SyncSubscription]] = {}
+        self._last_id = 0
+        # IDs at or below this may belong to events this hub never buffered
+        self._replay_floor = time.time_ns() // 1000
+        self._node_id = uuid.uuid4().hex
+        self._broker: Optional[SyncEventBroker] = None
+        if broker is not None:
+            self.set_broker(broker)
+
+    def set_broker(self, broker: SyncEventBroker) -> None:
+        self._broker = broker
+        broker.start(self._deliver_remote)
+
+    def publish(self, user_id: str, event_type: str, data: Dict[str, Any]) -> SyncEvent:
+        with self._lock:
+            self._last_id = max(self._last_id + 1, time.time_ns() // 1000)
+            event = SyncEvent(self._last_id, user_id, event_type, dict(data), self._node_id)
+        self._deliver(event)
+
+        if self._broker is not None:
+            try:
+                self._broker.publish(event)
+            except Exception as e:
+                logger.warning(f"Sync event broker publish failed: {e}")
+        return event
+
+    def subscribe(
+        self,
+        user_id: str,
+        last_event_id: Optional[int] = None,
+        device_type: Optional[str] = None,
+    ) -> SyncSubscription:
+        """
+        Register a stream for ``user_id``. Must be called on the event loop.
+
+        Events after ``last_event_id`` still in the replay buffer are returned
+        in ``replay``; registration and the replay snapshot happen under one
+        lock so nothing is missed or duplicated in between.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            buffered = list(self._buffers.get(user_id, ()))
+            needs_resync = False
+            replay: List[SyncEvent] = []
+            if last_event_id is not None:
+                floor = max(self._replay_floor, self._evicted_up_to.get(user_id, 0))
+                needs_resync = last_event_id < floor
+                replay = [e for e in buffered if e.id > last_event_id]
+
+            subscription = SyncSubscription(
+                user_id=user_id,
+                device_type=device_type,
+                replay=[],
+                needs_resync=needs_resync,
+                _loop=loop,
+                _queue=asyncio.Queue(maxsize=self._queue_size),
+            )
+            subscription.replay = [e for e in replay if subscription.wants(e)]
+            self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: SyncSubscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.user_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.user_id]
+
+    def subscriber_count(self, user_id: Optional[str] = None) -> int:
+        with self._lock:
+            if user_id is not None:
+                return len(self._subscribers.get(user_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+    def close(self) -> None:
+        """Close every open stream and the broker."""
+        with self._lock:
+            subscribers = [s for subs in self._subscribers.values() for s in subs]
+            self._subscribers.clear()
+        for subscription in subscribers:
+            subscription.push(None)
+        if self._broker is not None:
+            try:
+                self._broker.close()
+            except Exception as e:
+                logger.warning(f"Sync event broker close failed: {e}")
+
+    def _deliver_remote(self, event: SyncEvent) -> None:
+        if event.origin == self._node_id:
+            return
+        with self._lock:
+            self._last_id = max(self._last_id, event.id)
+        self._deliver(event)
+
+    def _deliver(self, event: SyncEvent) -> None:
+        with self._lock:
+            buffer = self._buffers.get(event.user_id)
+            if buffer is None:
+                buffer = self._buffers[event.user_id] = deque(maxlen=self._replay_size)
+                while len(self._buffers) > self._max_users:
+                    evicted_user, evicted = self._buffers.popitem(last=False)
+                    self._evicted_up_to.pop(evicted_user, None)
+                    if evicted:
+                        self._replay_floor = max(self._replay_floor, evicted[-1].id)
+            self._buffers.move_to_end(event.user_id)
+            if len(buffer) == buffer.maxlen:
+                self._evicted_up_to[event.user_id] = buffer[0].id
+            buffer.append(event)
+            subscribers = list(self._subscribers.get(event.user_id, ()))
+
+        for subscription in subscribers:
+            if subscription.wants(event):
+                subscription.push(event)
+
+
+async def stream_sync_events(
+    subscription: SyncSubscription,
+    heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS,
+    is_disconnected: Optional[Callable[[], Any]] = None,
+) -> AsyncIterator[str]:
+    """
+    Render a subscription as SSE text: replay first, then live events.
+
+    A comment line is sent every ``heartbeat_seconds`` of silence so proxies
+    keep the connection open and dead clients are noticed.
+    """
+    yield f"retry: {int(heartbeat_seconds * 1000)}\n\n"
+
+    if subscription.needs_resync:
+        yield f"event: {RESYNC_EVENT}\ndata: {{}}\n\n"
+    for event in subscription.replay:
+        yield event.to_sse()
+
+    while True:
+        if is_disconnected is not None and await is_disconnected():
+            return
+        try:
+            event = await subscription.next_event(heartbeat_seconds)
+        except asyncio.TimeoutError:
+            yield ": heartbeat\n\n"
+            continue
+        if subscription.take_overflow():
+            yield f"event: {RESYNC_EVENT}\ndata: {{}}\n\n"
+        if event is None:
+            return
+        yield event.to_sse()
+
+
+# ============================================================================
+# Process-wide hub
+# ============================================================================
+
+
+_hub: Optional[SyncEventHub] = None
+_hub_lock = threading.Lock()
+
+
+def _load_broker(spec: str) -> SyncEventBroker:
+    module_name, _, factory_name = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    return factory()
+
+
+def get_sync_event_hub() -> SyncEventHub:
+    """Process-wide hub, created (with the configured broker) on first use."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                from backend.settings import get_settings
+
+                settings = get_settings()
+                hub = SyncEventHub(replay_size=settings.sync_events_replay_size)
+                if settings.sync_events_broker:
+                    try:
+                        hub.set_broker(_load_broker(settings.sync_events_broker))
+                    except Exception as e:
+                        logger.error(f"Failed to start sync event broker {settings.sync_events_broker}: {e}")
+                _hub = hub
+    return _hub
+
+
+def publish_sync_event(user_id: str, event_type: str, data: Dict[str, Any]) -> None:
+    """Publish a sync-queue event; never raises into the caller's write path."""
+    try:
+        get_sync_event_hub().publish(user_id, event_type, data)
+    except Exception as e:
+        logger.warning(f"Failed to publish {event_type} event for {user_id}: {e}")
+
+
+def shutdown_sync_event_hub() -> None:
+    """Close open streams and the broker (called on app shutdown)."""
+    global _hub
+    with _hub_lock:
+        hub, _hub = _hub, None
+    if hub is not None:
+        hub.close()
@@ -130,6 +130,35 @@ class Settings(BaseSettings):
         description="Enable debug logging for Garmin exports",
     )
 
+    # -------------------------------------------------------------------------
+    # Export Tracing
+    # -------------------------------------------------------------------------
+    export_trace_level: str = Field(
+        default="off",
+        description="Export trace level: off, warning, info or debug "
+        "(GARMIN_EXPORT_DEBUG implies debug)",
+    )
+    export_trace_sample_rate: float = Field(
+        default=1.0,
+        description="Fraction of exports traced when tracing is enabled",
+    )
+    export_trace_buffer_size: int = Field(
+        default=200,
+        description="Number of recent export traces kept in memory",
+    )
+    export_trace_admin_secret: str = Field(
+        default="",
+        description="Secret for the export trace admin endpoint outside development",
+    )
+
+    # -------------------------------------------------------------------------
+    # Performance Spans
+    # -------------------------------------------------------------------------
+    perf_spans_enabled: bool = Field(
+        default=True,
+        description="Record per-stage span timings for /metrics (near-zero cost when off)",
+    )
+
     # -------------------------------------------------------------------------
     # External Services - Ingestor
     # -------------------------------------------------------------------------
@@ -199,6 +228,174 @@ class Settings(BaseSettings):
         description="Cache TTL for classification results in seconds (default 24h)",
     )
 
+    # -------------------------------------------------------------------------
+    # Bulk Import Workers
+    # -------------------------------------------------------------------------
+    bulk_import_io_workers: int = Field(
+        default=8,
+        description="Thread pool size for bulk import database calls",
+    )
+    bulk_import_cpu_workers: int = Field(
+        default=2,
+        description="Process pool size for bulk import parsing/matching (0 = use threads)",
+    )
+    bulk_import_job_concurrency: int = Field(
+        default=4,
+        description="Max in-flight pool tasks per bulk import job",
+    )
+
+    # -------------------------------------------------------------------------
+    # Background Tasks
+    # -------------------------------------------------------------------------
+    background_task_workers: int = Field(
+        default=4,
+        description="Worker threads for fire-and-forget work (audit logs, popularity counters)",
+    )
+    background_task_queue_size: int = Field(
+        default=1000,
+        description="Queued background tasks before new ones are rejected",
+    )
+    background_task_max_attempts: int = Field(
+        default=3,
+        description="Attempts per background task before it is logged as failed",
+    )
+    background_task_retry_base_seconds: float = Field(
+        default=0.5,
+        description="Backoff before the first retry; doubles per attempt, with full jitter",
+    )
+    background_task_retry_max_seconds: float = Field(
+        default=30.0,
+        description="Upper bound for the retry backoff",
+    )
+    background_task_drain_seconds: float = Field(
+        default=10.0,
+        description="Seconds queued background tasks get to finish on shutdown",
+    )
+
+    # -------------------------------------------------------------------------
+    # Sync Event Stream (AMA-307)
+    # -------------------------------------------------------------------------
+    sync_events_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Seconds of silence before a heartbeat is sent on /sync/events",
+    )
+    sync_events_replay_size: int = Field(
+        default=256,
+        description="Events kept per user for Last-Event-ID resume",
+    )
+    sync_events_broker: Optional[str] = Field(
+        default=None,
+        description="Cross-node broker factory as 'package.module:factory' (unset = single node)",
+    )
+
+    # -------------------------------------------------------------------------
+    # Export Queue (AMA-611)
+    # -------------------------------------------------------------------------
+    export_queue_backend: str = Field(
+        default="memory",
+        description="Export job store: memory, sqlite (local file) or supabase (export_jobs table)",
+    )
+    export_queue_sqlite_path: str = Field(
+        default="export_jobs.sqlite3",
+        description="SQLite file used when export_queue_backend is sqlite",
+    )
+    export_queue_concurrency: int = Field(
+        default=2,
+        description="Export worker tasks per API process",
+    )
+    export_queue_result_ttl_seconds: float = Field(
+        default=3600.0,
+        description="Seconds finished export jobs (and their files) are kept",
+    )
+    export_queue_lease_seconds: float = Field(
+        default=300.0,
+        description="Seconds after which a processing job is considered abandoned and requeued",
+    )
+    export_queue_max_attempts: int = Field(
+        default=3,
+        description="Claims before an abandoned export job is marked failed",
+    )
+
+    # -------------------------------------------------------------------------
+    # Outbound HTTP Clients
+    # -------------------------------------------------------------------------
+    http_client_max_connections: int = Field(
+        default=50,
+        description="Max open connections per upstream pool (ingestor, oembed, garmin)",
+    )
+    http_client_max_keepalive_connections: int = Field(
+        default=20,
+        description="Idle keep-alive connections kept per upstream pool",
+    )
+    http_client_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle pooled connection is kept open",
+    )
+    http_client_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for upstream calls when the h2 package is installed",
+    )
+    http_circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive upstream failures before its circuit opens",
+    )
+    http_circuit_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds an open circuit waits before letting a trial request through",
+    )
+    http_adaptive_concurrency: bool = Field(
+        default=True,
+        description="Adapt per-upstream concurrency (AIMD on latency and 429/5xx) across all jobs",
+    )
+    http_adaptive_max_concurrency: int = Field(
+        default=32,
+        description="Upper bound for any upstream's adaptive concurrency limit",
+    )
+
+    # -------------------------------------------------------------------------
+    # Chat Streaming (AMA-439)
+    # -------------------------------------------------------------------------
+    chat_tool_workers: int = Field(
+        default=4,
+        description="Threads for chat tool calls (embedding + search), kept off the event loop",
+    )
+
+    # -------------------------------------------------------------------------
+    # AI Rate Limits (per user, per feature)
+    # -------------------------------------------------------------------------
+    rate_limit_enabled: bool = Field(
+        default=True,
+        description="Enforce per-user budgets on AI-backed features",
+    )
+    rate_limit_backend: Optional[str] = Field(
+        default=None,
+        description="Shared limiter state as 'package.module:factory' (unset = per-process)",
+    )
+    rate_limit_chat_per_minute: float = Field(
+        default=6.0,
+        description="Sustained chat messages per user per minute",
+    )
+    rate_limit_chat_burst: int = Field(
+        default=3,
+        description="Chat messages a user may send back-to-back",
+    )
+    rate_limit_classification_per_minute: float = Field(
+        default=30.0,
+        description="Sustained content classifications per user per minute",
+    )
+    rate_limit_classification_burst: int = Field(
+        default=10,
+        description="Content classifications a user may run back-to-back",
+    )
+    rate_limit_embeddings_per_minute: float = Field(
+        default=60.0,
+        description="Sustained query embeddings per user per minute",
+    )
+    rate_limit_embeddings_burst: int = Field(
+        default=20,
+        description="Query embeddings a user may request back-to-back",
+    )
+
     # -------------------------------------------------------------------------
     # Observability - Sentry
     # -------------------------------------------------------------------------
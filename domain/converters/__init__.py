@@ -9,6 +9,8 @@ workout data formats into the canonical Workout domain model:
 - ingest_to_workout: ParsedWorkout (from AI parsing) -> Workout
 - blocks_to_workout: Blocks JSON (from web editor) -> Workout
 - db_row_to_workout: Database row (from Supabase) -> Workout
+- blocks_to_record / db_row_to_record: same conversions to the unvalidated
+  WorkoutRecord tree, for paths that only serialize the result again
 - workout_to_db_row: Workout -> Database row (for persistence)
 
 All converters are pure functions with no side effects.
@@ -30,13 +32,15 @@ Examples:
     >>> workout = db_row_to_workout(row)
 """
 
-from domain.converters.blocks_to_workout import blocks_to_workout
-from domain.converters.db_converters import db_row_to_workout, workout_to_db_row
+from domain.converters.blocks_to_workout import blocks_to_record, blocks_to_workout
+from domain.converters.db_converters import db_row_to_record, db_row_to_workout, workout_to_db_row
 from domain.converters.ingest_to_workout import ingest_to_workout
 
 __all__ = [
     "ingest_to_workout",
     "blocks_to_workout",
+    "blocks_to_record",
     "db_row_to_workout",
+    "db_row_to_record",
     "workout_to_db_row",
 ]
@@ -4,14 +4,20 @@ Converter: Blocks format (web editor JSON) to domain Workout.
 Part of AMA-390: Add converters for ingest and block formats
 
 Converts the blocks-based JSON format used by the web editor to the
-canonical Workout domain model.
+canonical Workout domain model, or to the lightweight WorkoutRecord tree
+(blocks_to_record) for hot paths that serialize the result straight back.
 """
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel, TypeAdapter
 
 from domain.models import Block, BlockType, Exercise, Load, Workout, WorkoutMetadata, WorkoutSource
+from domain.models.workout import normalize_tags
+from domain.models.workout_record import BlockRecord, ExerciseRecord, WorkoutRecord
 
 logger = logging.getLogger(__name__)
 
@@ -108,9 +114,9 @@ def _parse_load(
         return None
 
 
-def _convert_exercise(ex_data: Dict[str, Any]) -> Exercise:
+def _exercise_fields(ex_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Convert exercise dict from blocks format to domain Exercise.
+    Parse exercise dict from blocks format into Exercise field values.
     """
     name = ex_data.get("name", "Exercise")
     int_reps, str_reps, duration_secs = _parse_reps(ex_data.get("reps"))
@@ -125,17 +131,24 @@ def _convert_exercise(ex_data: Dict[str, Any]) -> Exercise:
     # Map rest_sec to rest_seconds
     rest_seconds = ex_data.get("rest_sec") or ex_data.get("rest_seconds")
 
-    return Exercise(
-        name=name,
-        canonical_name=ex_data.get("canonical_name"),
-        tempo=ex_data.get("tempo"),
-        sets=ex_data.get("sets"),
-        reps=int_reps if int_reps is not None else str_reps,
-        duration_seconds=duration_secs,
-        load=load,
-        rest_seconds=rest_seconds,
-        notes=ex_data.get("notes"),
-    )
+    return {
+        "name": name,
+        "canonical_name": ex_data.get("canonical_name"),
+        "tempo": ex_data.get("tempo"),
+        "sets": ex_data.get("sets"),
+        "reps": int_reps if int_reps is not None else str_reps,
+        "duration_seconds": duration_secs,
+        "load": load,
+        "rest_seconds": rest_seconds,
+        "notes": ex_data.get("notes"),
+    }
+
+
+def _convert_exercise(ex_data: Dict[str, Any]) -> Exercise:
+    """
+    Convert exercise dict from blocks format to domain Exercise.
+    """
+    return Exercise(**_exercise_fields(ex_data))
 
 
 def _resolve_block_type(block_data: Dict[str, Any]) -> BlockType:
@@ -173,14 +186,20 @@ def _resolve_rounds(block_data: Dict[str, Any]) -> int:
     return _parse_structure(block_data.get("structure"))
 
 
-def _convert_block(block_data: Dict[str, Any]) -> List[Block]:
+def _convert_block(
+    block_data: Dict[str, Any],
+    make_block: Callable[..., Any] = Block,
+    make_exercise: Callable[[Dict[str, Any]], Any] = _convert_exercise,
+) -> List[Any]:
     """
     Convert block dict from blocks format to domain Block(s).
 
     A single block in the input format can produce multiple domain blocks
     if it contains both supersets and standalone exercises (legacy format).
+    make_block and make_exercise build the output nodes (Block and Exercise
+    by default, records for blocks_to_record).
     """
-    blocks: List[Block] = []
+    blocks: List[Any] = []
 
     # Resolve block-level settings
     label = block_data.get("label") or block_data.get("name")
@@ -193,7 +212,7 @@ def _convert_block(block_data: Dict[str, Any]) -> List[Block]:
     for i, superset in enumerate(supersets):
         superset_exercises = superset.get("exercises", [])
         if superset_exercises:
-            exercises = [_convert_exercise(ex) for ex in superset_exercises]
+            exercises = [make_exercise(ex) for ex in superset_exercises]
 
             # Determine block type based on exercise count
             if len(exercises) > 1:
@@ -204,7 +223,7 @@ def _convert_block(block_data: Dict[str, Any]) -> List[Block]:
                 superset_label = label
 
             blocks.append(
-                Block(
+                make_block(
                     label=superset_label,
                     type=superset_type,
                     rounds=rounds,
@@ -216,9 +235,9 @@ def _convert_block(block_data: Dict[str, Any]) -> List[Block]:
     # Standard format: exercises[] with structure-driven block type
     standalone = block_data.get("exercises", [])
     if standalone:
-        exercises = [_convert_exercise(ex) for ex in standalone]
+        exercises = [make_exercise(ex) for ex in standalone]
         blocks.append(
-            Block(
+            make_block(
                 label=label,
                 type=block_type,
                 rounds=rounds,
@@ -230,6 +249,27 @@ def _convert_block(block_data: Dict[str, Any]) -> List[Block]:
     return blocks
 
 
+def _parse_metadata(blocks_json: Dict[str, Any]) -> WorkoutMetadata:
+    """Build WorkoutMetadata from the blocks format metadata and workout_type."""
+    sources: List[WorkoutSource] = []
+    metadata_dict = blocks_json.get("metadata", {})
+
+    # Parse sources from metadata
+    source_list = metadata_dict.get("sources", [])
+    for src in source_list:
+        try:
+            sources.append(WorkoutSource(src))
+        except ValueError:
+            pass
+
+    return WorkoutMetadata(
+        sources=sources,
+        source_url=metadata_dict.get("source_url"),
+        platform=metadata_dict.get("platform"),
+        workout_type=blocks_json.get("workout_type"),
+    )
+
+
 def blocks_to_workout(blocks_json: Dict[str, Any]) -> Workout:
     """
     Convert blocks format JSON to domain Workout.
@@ -292,24 +332,7 @@ def blocks_to_workout(blocks_json: Dict[str, Any]) -> Workout:
         # Create a placeholder block if no exercises found
         raise ValueError("Workout must contain at least one block with exercises")
 
-    # Build metadata
-    sources: List[WorkoutSource] = []
-    metadata_dict = blocks_json.get("metadata", {})
-
-    # Parse sources from metadata
-    source_list = metadata_dict.get("sources", [])
-    for src in source_list:
-        try:
-            sources.append(WorkoutSource(src))
-        except ValueError:
-            pass
-
-    metadata = WorkoutMetadata(
-        sources=sources,
-        source_url=metadata_dict.get("source_url"),
-        platform=metadata_dict.get("platform"),
-        workout_type=blocks_json.get("workout_type"),
-    )
+    metadata = _parse_metadata(blocks_json)
 
     return Workout(
         id=blocks_json.get("id"),
@@ -322,3 +345,87 @@ def blocks_to_workout(blocks_json: Dict[str, Any]) -> Workout:
         is_favorite=blocks_json.get("is_favorite", False),
         times_completed=blocks_json.get("times_completed", 0),
     )
+
+
+# ---------------------------------------------------------------------------
+# Record conversion
+# ---------------------------------------------------------------------------
+#
+# The record builders run every field through the pydantic model's own
+# field validators (_model_field), so blocks_to_record() accepts, coerces
+# and rejects the same input as blocks_to_workout() without building
+# validated models.
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model: type, name: str) -> TypeAdapter:
+    info = model.model_fields[name]
+    if info.metadata:
+        return TypeAdapter(Annotated[(info.annotation, *info.metadata)])
+    return TypeAdapter(info.annotation)
+
+
+def _model_field(model: type[BaseModel], name: str, value: Any) -> Any:
+    """Validate and coerce one field value exactly like ``model`` would."""
+    return _field_adapter(model, name).validate_python(value)
+
+
+def _model_fields(model: type[BaseModel], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate and coerce several field values exactly like ``model`` would."""
+    return {name: _model_field(model, name, value) for name, value in values.items()}
+
+
+def _exercise_record(ex_data: Dict[str, Any]) -> ExerciseRecord:
+    return ExerciseRecord(**_model_fields(Exercise, _exercise_fields(ex_data)))
+
+
+def _block_record(*, exercises: List[ExerciseRecord], **fields: Any) -> BlockRecord:
+    return BlockRecord(exercises=exercises, **_model_fields(Block, fields))
+
+
+def blocks_to_record(
+    blocks_json: Dict[str, Any],
+    *,
+    metadata: Optional[WorkoutMetadata] = None,
+) -> WorkoutRecord:
+    """
+    Convert blocks format JSON to a WorkoutRecord.
+
+    Same parsing and constraints as blocks_to_workout(), but builds the
+    unvalidated record tree, which is several times cheaper when the
+    result is only serialized again (exports, mapping).
+
+    Args:
+        blocks_json: Dictionary with blocks format data.
+        metadata: Metadata to use instead of parsing blocks_json's own.
+
+    Returns:
+        WorkoutRecord for the workout.
+
+    Raises:
+        ValueError: If the data violates a Workout model constraint.
+    """
+    tags = blocks_json.get("tags", [])
+    fields = _model_fields(Workout, {
+        "id": blocks_json.get("id"),
+        "title": blocks_json.get("title") or blocks_json.get("name") or "Workout",
+        "description": blocks_json.get("description"),
+        "notes": blocks_json.get("notes"),
+        "tags": tags if isinstance(tags, list) else [],
+        "is_favorite": blocks_json.get("is_favorite", False),
+        "times_completed": blocks_json.get("times_completed", 0),
+    })
+    fields["tags"] = normalize_tags(fields["tags"])
+
+    all_blocks: List[BlockRecord] = []
+    for block_data in blocks_json.get("blocks", []):
+        all_blocks.extend(_convert_block(block_data, _block_record, _exercise_record))
+
+    if not all_blocks:
+        raise ValueError("Workout must contain at least one block with exercises")
+
+    return WorkoutRecord(
+        blocks=all_blocks,
+        metadata=metadata if metadata is not None else _parse_metadata(blocks_json),
+        **fields,
+    )
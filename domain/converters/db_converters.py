@@ -23,10 +23,12 @@ Database schema (workouts table):
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from domain.converters.blocks_to_workout import blocks_to_workout
+from domain.converters.blocks_to_workout import blocks_to_record, blocks_to_workout
 from domain.models import BlockType, Workout, WorkoutMetadata, WorkoutSource
+from domain.models.workout import normalize_tags
+from domain.models.workout_record import WorkoutRecord
 
 
 def _parse_datetime(value: Any) -> Optional[datetime]:
@@ -62,6 +64,35 @@ def _parse_sources(sources: Any) -> List[WorkoutSource]:
     return result
 
 
+def _row_metadata(row: Dict[str, Any]) -> WorkoutMetadata:
+    """Build WorkoutMetadata from the database tracking columns."""
+    return WorkoutMetadata(
+        sources=_parse_sources(row.get("sources", [])),
+        source_url=row.get("source_url"),
+        platform=row.get("device"),
+        created_at=_parse_datetime(row.get("created_at")),
+        updated_at=_parse_datetime(row.get("updated_at")),
+        is_exported=row.get("is_exported", False),
+        exported_at=_parse_datetime(row.get("exported_at")),
+        exported_to_device=row.get("exported_to_device"),
+        ios_companion_synced_at=_parse_datetime(row.get("ios_companion_synced_at")),
+    )
+
+
+def _row_workout_data(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Get workout_data with the row's title and description overlaid."""
+    workout_data = row.get("workout_data")
+    if not workout_data:
+        raise ValueError("Database row missing workout_data")
+
+    # Use title from row if present, otherwise fall back to workout_data
+    if row.get("title"):
+        workout_data = {**workout_data, "title": row["title"]}
+    if row.get("description"):
+        workout_data = {**workout_data, "description": row["description"]}
+    return workout_data
+
+
 def db_row_to_workout(row: Dict[str, Any]) -> Workout:
     """
     Convert a database row to domain Workout.
@@ -96,32 +127,13 @@ def db_row_to_workout(row: Dict[str, Any]) -> Workout:
         >>> workout.id
         '123e4567-e89b-12d3-a456-426614174000'
     """
-    workout_data = row.get("workout_data")
-    if not workout_data:
-        raise ValueError("Database row missing workout_data")
-
-    # Use title from row if present, otherwise fall back to workout_data
-    if row.get("title"):
-        workout_data = {**workout_data, "title": row["title"]}
-    if row.get("description"):
-        workout_data = {**workout_data, "description": row["description"]}
+    workout_data = _row_workout_data(row)
 
     # Convert blocks format to Workout
     workout = blocks_to_workout(workout_data)
 
     # Build enhanced metadata from database fields
-    sources = _parse_sources(row.get("sources", []))
-    metadata = WorkoutMetadata(
-        sources=sources,
-        source_url=row.get("source_url"),
-        platform=row.get("device"),
-        created_at=_parse_datetime(row.get("created_at")),
-        updated_at=_parse_datetime(row.get("updated_at")),
-        is_exported=row.get("is_exported", False),
-        exported_at=_parse_datetime(row.get("exported_at")),
-        exported_to_device=row.get("exported_to_device"),
-        ios_companion_synced_at=_parse_datetime(row.get("ios_companion_synced_at")),
-    )
+    metadata = _row_metadata(row)
 
     # Overlay database fields onto workout
     return Workout(
@@ -138,6 +150,31 @@ def db_row_to_workout(row: Dict[str, Any]) -> Workout:
     )
 
 
+def db_row_to_record(row: Dict[str, Any]) -> WorkoutRecord:
+    """
+    Convert a database row to a WorkoutRecord.
+
+    Equivalent to WorkoutRecord.from_workout(db_row_to_workout(row)) -
+    same overlay of database fields, same constraints - without building
+    the validated models. Use it where the workout is only read and
+    serialized again, e.g. exports.
+
+    Raises:
+        ValueError: If workout_data is missing or invalid.
+    """
+    record = blocks_to_record(_row_workout_data(row), metadata=_row_metadata(row))
+
+    # Overlay database fields onto the record
+    row_tags = row.get("tags", [])
+    record.id = row.get("id")
+    record.description = record.description or row.get("description")
+    record.tags = normalize_tags(row_tags) if row_tags else record.tags
+    record.is_favorite = row.get("is_favorite", False)
+    record.times_completed = row.get("times_completed", 0)
+    record.last_used_at = _parse_datetime(row.get("last_used_at"))
+    return record
+
+
 def workout_to_db_row(
     workout: Workout,
     profile_id: str,
@@ -216,13 +253,14 @@ def workout_to_db_row(
     return row
 
 
-def _workout_to_blocks_format(workout: Workout) -> Dict[str, Any]:
+def _workout_to_blocks_format(workout: Union[Workout, WorkoutRecord]) -> Dict[str, Any]:
     """
     Serialize domain Workout to blocks format JSON.
 
     This is the inverse of blocks_to_workout - converts the domain
     model back to the JSON structure expected by the web editor
-    and stored in the database.
+    and stored in the database. Accepts a WorkoutRecord as well,
+    which has the same attributes.
     """
     blocks_data: List[Dict[str, Any]] = []
 
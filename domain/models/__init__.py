@@ -10,6 +10,8 @@ These models represent the core business concepts:
 - Exercise: A single exercise with sets, reps, load, etc.
 - Load: Weight/resistance value object
 - WorkoutMetadata: Provenance and tracking information
+- WorkoutRecord / BlockRecord / ExerciseRecord: unvalidated slotted mirrors
+  of the above for conversion hot paths (exports, mapping)
 
 Part of AMA-389: Define canonical Workout domain model
 Part of AMA-373: Mapper-API Architecture Refactoring (Phase 3)
@@ -46,6 +48,7 @@ from domain.models.exercise import Exercise
 from domain.models.load import Load
 from domain.models.metadata import WorkoutMetadata, WorkoutSource
 from domain.models.workout import Workout, WorkoutSettings
+from domain.models.workout_record import BlockRecord, ExerciseRecord, WorkoutRecord
 
 __all__ = [
     # Main entities
@@ -55,6 +58,10 @@ __all__ = [
     "Exercise",
     "Load",
     "WorkoutMetadata",
+    # Lightweight records
+    "WorkoutRecord",
+    "BlockRecord",
+    "ExerciseRecord",
     # Enums
     "BlockType",
     "WorkoutSource",
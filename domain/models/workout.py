@@ -13,6 +13,20 @@ from domain.models.block import Block
 from domain.models.metadata import WorkoutMetadata
 
 
+def normalize_tags(tags: List[str]) -> List[str]:
+    """Lowercase, strip and deduplicate tags, preserving order."""
+    # Lowercase and strip whitespace
+    normalized = [tag.lower().strip() for tag in tags if tag.strip()]
+    # Remove duplicates while preserving order
+    seen = set()
+    unique = []
+    for tag in normalized:
+        if tag not in seen:
+            seen.add(tag)
+            unique.append(tag)
+    return unique
+
+
 class WorkoutSettings(BaseModel):
     """
     Settings/options for a workout.
@@ -145,16 +159,7 @@ class Workout(BaseModel):
     @classmethod
     def validate_tags(cls, v: List[str]) -> List[str]:
         """Normalize and deduplicate tags."""
-        # Lowercase and strip whitespace
-        normalized = [tag.lower().strip() for tag in v if tag.strip()]
-        # Remove duplicates while preserving order
-        seen = set()
-        unique = []
-        for tag in normalized:
-            if tag not in seen:
-                seen.add(tag)
-                unique.append(tag)
-        return unique
+        return normalize_tags(v)
 
     # -------------------------------------------------------------------------
     # Computed Properties
@@ -0,0 +1,185 @@
+"""
+Lightweight workout tree for conversion hot paths.
+
+The pydantic models in this package validate every field on construction,
+which is what the API boundary needs but is pure overhead when a use case
+or adapter converts a stored workout it is about to serialize again (an
+export rebuilds Exercise, Block and Workout twice per request). These
+slotted dataclasses mirror the same fields without validation:
+
+- WorkoutRecord / BlockRecord / ExerciseRecord: same field names as
+  Workout / Block / Exercise, so code that only reads attributes (e.g. the
+  blocks-format serializer) accepts either
+- WorkoutRecord.from_workout(): zero-copy view of a validated Workout
+  (lists, Load and metadata objects are shared, not copied)
+- WorkoutRecord.to_workout(): back to the domain model, validated by
+  default or via model_construct for trees built from trusted data
+
+Records are built from blocks-format JSON by
+domain.converters.blocks_to_workout.blocks_to_record(), which applies the
+same parsing and constraints as blocks_to_workout().
+
+Usage:
+    >>> record = WorkoutRecord.from_workout(workout)
+    >>> record.blocks[0].exercises[0].canonical_name = "Back Squat"
+    >>> workout = record.to_workout(validate=False)
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Union
+
+from domain.models.block import Block, BlockType
+from domain.models.exercise import Exercise
+from domain.models.load import Load
+from domain.models.metadata import WorkoutMetadata
+from domain.models.workout import Workout, WorkoutSettings
+
+
+@dataclass(slots=True)
+class ExerciseRecord:
+    """Unvalidated counterpart of Exercise."""
+
+    name: str
+    canonical_name: Optional[str] = None
+    equipment: List[str] = field(default_factory=list)
+    modifiers: List[str] = field(default_factory=list)
+    tempo: Optional[str] = None
+    side: Optional[str] = None
+    sets: Optional[int] = None
+    reps: Optional[Union[int, str]] = None
+    duration_seconds: Optional[int] = None
+    load: Optional[Load] = None
+    rest_seconds: Optional[int] = None
+    distance: Optional[float] = None
+    distance_unit: Optional[str] = None
+    notes: Optional[str] = None
+
+    @classmethod
+    def from_exercise(cls, exercise: Exercise) -> "ExerciseRecord":
+        return cls(
+            name=exercise.name,
+            canonical_name=exercise.canonical_name,
+            equipment=exercise.equipment,
+            modifiers=exercise.modifiers,
+            tempo=exercise.tempo,
+            side=exercise.side,
+            sets=exercise.sets,
+            reps=exercise.reps,
+            duration_seconds=exercise.duration_seconds,
+            load=exercise.load,
+            rest_seconds=exercise.rest_seconds,
+            distance=exercise.distance,
+            distance_unit=exercise.distance_unit,
+            notes=exercise.notes,
+        )
+
+    def to_exercise(self, validate: bool = True) -> Exercise:
+        fields = {
+            "name": self.name,
+            "canonical_name": self.canonical_name,
+            "equipment": self.equipment,
+            "modifiers": self.modifiers,
+            "tempo": self.tempo,
+            "side": self.side,
+            "sets": self.sets,
+            "reps": self.reps,
+            "duration_seconds": self.duration_seconds,
+            "load": self.load,
+            "rest_seconds": self.rest_seconds,
+            "distance": self.distance,
+            "distance_unit": self.distance_unit,
+            "notes": self.notes,
+        }
+        return Exercise(**fields) if validate else Exercise.model_construct(**fields)
+
+
+@dataclass(slots=True)
+class BlockRecord:
+    """Unvalidated counterpart of Block."""
+
+    exercises: List[ExerciseRecord]
+    label: Optional[str] = None
+    type: BlockType = BlockType.STRAIGHT
+    rounds: int = 1
+    rest_between_seconds: Optional[int] = None
+
+    @classmethod
+    def from_block(cls, block: Block) -> "BlockRecord":
+        return cls(
+            exercises=[ExerciseRecord.from_exercise(ex) for ex in block.exercises],
+            label=block.label,
+            type=block.type,
+            rounds=block.rounds,
+            rest_between_seconds=block.rest_between_seconds,
+        )
+
+    def to_block(self, validate: bool = True) -> Block:
+        fields = {
+            "label": self.label,
+            "type": self.type,
+            "rounds": self.rounds,
+            "exercises": [ex.to_exercise(validate) for ex in self.exercises],
+            "rest_between_seconds": self.rest_between_seconds,
+        }
+        return Block(**fields) if validate else Block.model_construct(**fields)
+
+
+@dataclass(slots=True)
+class WorkoutRecord:
+    """Unvalidated counterpart of Workout."""
+
+    title: str
+    blocks: List[BlockRecord]
+    id: Optional[str] = None
+    description: Optional[str] = None
+    notes: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+    metadata: WorkoutMetadata = field(default_factory=WorkoutMetadata)
+    settings: WorkoutSettings = field(default_factory=WorkoutSettings)
+    is_favorite: bool = False
+    times_completed: int = 0
+    last_used_at: Optional[datetime] = None
+
+    @classmethod
+    def from_workout(cls, workout: Workout) -> "WorkoutRecord":
+        """View a validated Workout as a record (values are shared, not copied)."""
+        return cls(
+            id=workout.id,
+            title=workout.title,
+            description=workout.description,
+            notes=workout.notes,
+            tags=workout.tags,
+            blocks=[BlockRecord.from_block(block) for block in workout.blocks],
+            metadata=workout.metadata,
+            settings=workout.settings,
+            is_favorite=workout.is_favorite,
+            times_completed=workout.times_completed,
+            last_used_at=workout.last_used_at,
+        )
+
+    def to_workout(self, validate: bool = True) -> Workout:
+        """
+        Convert to the domain model.
+
+        Pass validate=False only for records built from validated or
+        already-checked data (from_workout, blocks_to_record).
+        """
+        fields = {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "notes": self.notes,
+            "tags": self.tags,
+            "blocks": [block.to_block(validate) for block in self.blocks],
+            "metadata": self.metadata,
+            "settings": self.settings,
+            "is_favorite": self.is_favorite,
+            "times_completed": self.times_completed,
+            "last_used_at": self.last_used_at,
+        }
+        return Workout(**fields) if validate else Workout.model_construct(**fields)
+
+    @property
+    def total_exercises(self) -> int:
+        return sum(len(block.exercises) for block in self.blocks)
@@ -17,6 +17,10 @@ from application.ports.completion_repository import (
     HealthMetricsDTO,
     CompletionSummary,
 )
+from infrastructure.db.exercise_set_index import index_completion_sets
+from infrastructure.db.last_weight_store import update_last_weights
+from backend.core.personal_records import get_personal_records_cache
+from backend.core.spans import span_methods
 
 logger = logging.getLogger(__name__)
 
@@ -367,6 +371,7 @@ def _get_or_build_execution_log(
 # Repository Implementation
 # ============================================================================
 
+@span_methods("db.completions")
 class SupabaseCompletionRepository:
     """
     Supabase implementation of CompletionRepository.
@@ -479,6 +484,19 @@ class SupabaseCompletionRepository:
                 saved = result.data[0]
                 logger.info(f"Workout completion saved for user {user_id}: {saved['id']}")
 
+                # Per-set rows for DB-side exercise history queries
+                set_rows = index_completion_sets(
+                    self._client,
+                    user_id,
+                    saved["id"],
+                    started_at,
+                    record.get("execution_log"),
+                )
+                # Write-through "Use Last Weight" store for companion apps
+                update_last_weights(self._client, user_id, set_rows)
+                # Keep a cached personal-records table current without a rebuild
+                get_personal_records_cache().record_completion_sets(user_id, set_rows)
+
                 summary = CompletionSummary(
                     duration_formatted=format_duration(duration_seconds),
                     avg_heart_rate=health_metrics.avg_heart_rate,
@@ -20,6 +20,8 @@ from application.ports.device_repository import (
     DeviceRepository,
     UserProfileRepository,
 )
+from backend.core.personal_records import get_personal_records_cache
+from backend.core.spans import span_methods
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +131,7 @@ def fetch_clerk_profile(clerk_user_id: str) -> Optional[Dict[str, Any]]:
 # Repository Implementations
 # ============================================================================
 
+@span_methods("db.devices")
 class SupabaseDeviceRepository:
     """
     Supabase implementation of DeviceRepository.
@@ -651,6 +654,7 @@ class SupabaseDeviceRepository:
             }
 
 
+@span_methods("db.profiles")
 class SupabaseUserProfileRepository:
     """
     Supabase implementation of UserProfileRepository.
@@ -768,6 +772,7 @@ class SupabaseUserProfileRepository:
                 .eq("user_id", user_id) \
                 .execute()
             deleted_counts["completions"] = len(completions_result.data) if completions_result.data else 0
+            get_personal_records_cache().invalidate(user_id)
 
             # 2. Workouts
             workouts_result = self._client.table("workouts") \
@@ -829,6 +834,7 @@ class SupabaseUserProfileRepository:
                 .eq("user_id", user_id) \
                 .execute()
             deleted_counts["completions"] = len(completions_result.data) if completions_result.data else 0
+            get_personal_records_cache().invalidate(user_id)
 
             # 2. Workouts
             workouts_result = self._client.table("workouts") \
@@ -0,0 +1,136 @@
+"""
+Per-set exercise index for workout completions.
+
+workout_completions stores every logged set inside the execution_log JSONB
+column, which cannot be filtered or paginated by exercise server-side. The
+exercise_set_index table holds one row per logged set (user, exercise, date,
+weight, reps, completion) so progression queries can filter and paginate in
+the database. Rows are written when a completion is saved and backfilled for
+older completions by scripts/backfill_exercise_set_index.py.
+
+Schema (migration lives in the web app repo, see DATABASE.md):
+
+    exercise_set_index (
+        user_id, completion_id, exercise_id, exercise_name,
+        started_at, workout_date, interval_index, set_index, set_number,
+        weight, weight_unit, reps_completed, reps_planned, status,
+        is_session_start
+    )
+    unique (completion_id, interval_index, set_index)
+
+``is_session_start`` marks the first set of each (completion, exercise) pair,
+so a page of sessions is a plain filtered, ordered range query.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+EXERCISE_SET_INDEX_TABLE = "exercise_set_index"
+EXERCISE_SET_INDEX_CONFLICT = "completion_id,interval_index,set_index"
+
+# Rows per upsert request
+WRITE_BATCH_SIZE = 500
+
+
+def parse_set_weight(set_data: Dict[str, Any]) -> Tuple[Optional[float], str]:
+    """Return (weight, unit) from a logged set's structured or plain weight."""
+    weight = None
+    weight_unit = "lbs"
+
+    weight_obj = set_data.get("weight")
+    if weight_obj and isinstance(weight_obj, dict):
+        components = weight_obj.get("components", [])
+        if components:
+            weight = components[0].get("value")
+            weight_unit = components[0].get("unit", "lbs")
+    elif isinstance(weight_obj, (int, float)):
+        weight = weight_obj
+
+    return weight, weight_unit
+
+
+def build_exercise_set_rows(
+    user_id: str,
+    completion_id: str,
+    started_at: Optional[str],
+    execution_log: Optional[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Flatten a completion's execution_log into exercise_set_index rows.
+
+    Only intervals with a canonical_exercise_id are indexed, matching what
+    the progression endpoints can look up.
+    """
+    if not execution_log or not isinstance(execution_log, dict):
+        return []
+
+    workout_date = started_at[:10] if started_at else ""
+    rows: List[Dict[str, Any]] = []
+    seen_exercises = set()
+
+    for interval_index, interval in enumerate(execution_log.get("intervals") or []):
+        exercise_id = interval.get("canonical_exercise_id")
+        if not exercise_id:
+            continue
+
+        for set_index, set_data in enumerate(interval.get("sets") or []):
+            weight, weight_unit = parse_set_weight(set_data)
+            rows.append({
+                "user_id": user_id,
+                "completion_id": completion_id,
+                "exercise_id": exercise_id,
+                "exercise_name": interval.get("planned_name") or exercise_id,
+                "started_at": started_at,
+                "workout_date": workout_date,
+                "interval_index": interval_index,
+                "set_index": set_index,
+                "set_number": set_data.get("set_number", 1),
+                "weight": weight,
+                "weight_unit": weight_unit,
+                "reps_completed": set_data.get("reps_completed"),
+                "reps_planned": set_data.get("reps_planned"),
+                "status": set_data.get("status", "completed"),
+                "is_session_start": exercise_id not in seen_exercises,
+            })
+            seen_exercises.add(exercise_id)
+
+    return rows
+
+
+def write_exercise_set_rows(client: Client, rows: List[Dict[str, Any]]) -> int:
+    """Upsert index rows in batches; idempotent per (completion, interval, set)."""
+    for start in range(0, len(rows), WRITE_BATCH_SIZE):
+        client.table(EXERCISE_SET_INDEX_TABLE) \
+            .upsert(rows[start:start + WRITE_BATCH_SIZE], on_conflict=EXERCISE_SET_INDEX_CONFLICT) \
+            .execute()
+    return len(rows)
+
+
+def index_completion_sets(
+    client: Client,
+    user_id: str,
+    completion_id: str,
+    started_at: Optional[str],
+    execution_log: Optional[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Write the index rows for one saved completion.
+
+    Failures are logged rather than raised: the completion itself is already
+    stored and the backfill script can repair the index later.
+
+    Returns:
+        The completion's set rows, whether or not the write succeeded, so
+        callers can update derived state without rebuilding them
+    """
+    rows = build_exercise_set_rows(user_id, completion_id, started_at, execution_log)
+    if not rows:
+        return rows
+    try:
+        write_exercise_set_rows(client, rows)
+    except Exception as e:
+        logger.warning(f"Failed to index sets for completion {completion_id}: {e}")
+    return rows
@@ -13,12 +13,15 @@ from functools import lru_cache
 
 from supabase import Client
 
+from backend.core.spans import span_methods
+
 logger = logging.getLogger(__name__)
 
 # Cache TTL in seconds (5 minutes)
 CACHE_TTL_SECONDS = 300
 
 
+@span_methods("db.exercises")
 class SupabaseExercisesRepository:
     """
     Supabase implementation of ExercisesRepository protocol.
@@ -118,6 +121,36 @@ class SupabaseExercisesRepository:
             logger.exception(f"Error fetching exercise by id {exercise_id}")
             return None
 
+    def get_by_ids(self, exercise_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several exercises by canonical ID in one lookup.
+
+        Args:
+            exercise_ids: Exercise slugs
+
+        Returns:
+            Exercise dictionaries keyed by ID; unknown IDs are omitted
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for exercise_id in dict.fromkeys(exercise_ids):
+            cached = self._get_cached(exercise_id)
+            if cached is not None:
+                found[exercise_id] = cached
+            else:
+                missing.append(exercise_id)
+        if not missing:
+            return found
+
+        try:
+            result = self._client.table("exercises").select("*").in_("id", missing).execute()
+            for exercise in result.data or []:
+                self._cache_result(exercise)
+                found[exercise["id"]] = exercise
+        except Exception as e:
+            logger.exception(f"Error fetching exercises by id {missing}")
+        return found
+
     def find_by_exact_name(self, name: str) -> Optional[Dict[str, Any]]:
         """
         Find an exercise by exact name match (case-insensitive).
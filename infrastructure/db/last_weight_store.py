@@ -0,0 +1,131 @@
+"""
+Last-weight store for companion apps.
+
+The "Use Last Weight" feature needs, per exercise, the first completed set
+with a weight from the user's most recent session. Reading that from history
+costs a query per exercise at workout start. The exercise_last_weights table
+keeps one row per (user, exercise) instead, written through whenever a
+completion is saved, so a whole workout's last weights are a single lookup.
+
+Schema (migration lives in the web app repo, see DATABASE.md):
+
+    exercise_last_weights (
+        user_id, exercise_id, exercise_name, weight, weight_unit,
+        reps_completed, workout_date, started_at, completion_id, updated_at
+    )
+    primary key (user_id, exercise_id)
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+LAST_WEIGHT_TABLE = "exercise_last_weights"
+LAST_WEIGHT_CONFLICT = "user_id,exercise_id"
+
+LAST_WEIGHT_COLUMNS = (
+    "exercise_id, exercise_name, weight, weight_unit, reps_completed, "
+    "workout_date, started_at, completion_id"
+)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def build_last_weight_rows(set_rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Last-weight rows for one completion from its exercise_set_index rows.
+
+    Takes the first completed set with a weight for each exercise, matching
+    what get_last_weight_used returns from history.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for set_row in set_rows:
+        exercise_id = set_row.get("exercise_id")
+        if not exercise_id or exercise_id in rows:
+            continue
+        if set_row.get("weight") is None or set_row.get("status") != "completed":
+            continue
+        rows[exercise_id] = {
+            "user_id": set_row["user_id"],
+            "exercise_id": exercise_id,
+            "exercise_name": set_row.get("exercise_name") or exercise_id,
+            "weight": set_row["weight"],
+            "weight_unit": set_row.get("weight_unit") or "lbs",
+            "reps_completed": set_row.get("reps_completed") or 0,
+            "workout_date": set_row.get("workout_date") or "",
+            "started_at": set_row.get("started_at"),
+            "completion_id": set_row.get("completion_id", ""),
+        }
+    return list(rows.values())
+
+
+def update_last_weights(
+    client: Client,
+    user_id: str,
+    set_rows: Iterable[Dict[str, Any]],
+) -> int:
+    """
+    Write through the last weights from a saved completion.
+
+    Completions synced late (an older started_at than the stored row) do not
+    overwrite newer weights. Failures are logged rather than raised: the
+    completion itself is already stored and reads fall back to the set index.
+    """
+    rows = build_last_weight_rows(set_rows)
+    if not rows:
+        return 0
+
+    try:
+        existing = client.table(LAST_WEIGHT_TABLE) \
+            .select("exercise_id, started_at") \
+            .eq("user_id", user_id) \
+            .in_("exercise_id", [row["exercise_id"] for row in rows]) \
+            .execute()
+        stored_at = {
+            row["exercise_id"]: _parse_timestamp(row.get("started_at"))
+            for row in existing.data or []
+        }
+
+        updated_at = datetime.now(timezone.utc).isoformat()
+        newer = []
+        for row in rows:
+            previous = stored_at.get(row["exercise_id"])
+            started_at = _parse_timestamp(row["started_at"])
+            if previous and started_at and started_at < previous:
+                continue
+            newer.append({**row, "updated_at": updated_at})
+
+        if newer:
+            client.table(LAST_WEIGHT_TABLE) \
+                .upsert(newer, on_conflict=LAST_WEIGHT_CONFLICT) \
+                .execute()
+        return len(newer)
+
+    except Exception as e:
+        logger.warning(f"Failed to update last weights for user {user_id}: {e}")
+        return 0
+
+
+def get_stored_last_weights(
+    client: Client,
+    user_id: str,
+    exercise_ids: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Stored last weights for the given exercises, keyed by exercise_id."""
+    if not exercise_ids:
+        return {}
+    result = client.table(LAST_WEIGHT_TABLE) \
+        .select(LAST_WEIGHT_COLUMNS) \
+        .eq("user_id", user_id) \
+        .in_("exercise_id", exercise_ids) \
+        .execute()
+    return {row["exercise_id"]: row for row in result.data or []}
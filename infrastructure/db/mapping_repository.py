@@ -7,8 +7,12 @@ Phase 2 - Dependency Injection
 This module implements the mapping repository protocols using Supabase as the backend.
 Extracted from backend/core/user_mappings.py, global_mappings.py, and exercise_suggestions.py.
 """
+import atexit
 import pathlib
-from typing import Optional, Dict, Any, List, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, Any, Iterable, List, Tuple
 from supabase import Client
 import logging
 
@@ -17,6 +21,7 @@ from application.ports.mapping_repository import (
     GlobalMappingRepository,
     ExerciseMatchRepository,
 )
+from backend.core.spans import span_methods
 
 logger = logging.getLogger(__name__)
 
@@ -54,24 +59,142 @@ def _load_garmin_exercises() -> List[str]:
 # Repository Implementations
 # ============================================================================
 
+class UserMappingSnapshotCache:
+    """
+    Process-wide cache of each user's full mapping dict.
+
+    Entries carry a per-user version that add/remove/clear_all bump, so a
+    snapshot loaded while a write was in flight is never stored. Writes made
+    by other processes are picked up once the entry's ttl_seconds expire.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 60.0,
+        max_users: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._max_users = max_users
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[Dict[str, str]]:
+        """Get a user's cached mappings, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            loaded_at, mappings = entry
+            if self._clock() - loaded_at > self._ttl:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return mappings
+
+    def version(self, user_id: str) -> int:
+        """Current version; pass it to put() after loading."""
+        with self._lock:
+            return self._versions.get(user_id, 0)
+
+    def put(self, user_id: str, mappings: Dict[str, str], version: int) -> bool:
+        """Store a snapshot unless the user's mappings changed since version."""
+        with self._lock:
+            if self._versions.get(user_id, 0) != version:
+                return False
+            self._entries[user_id] = (self._clock(), mappings)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._max_users:
+                self._entries.popitem(last=False)
+            return True
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's snapshot after their mappings changed."""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._entries.pop(user_id, None)
+
+
+_snapshot_cache: Optional[UserMappingSnapshotCache] = None
+_snapshot_cache_lock = threading.Lock()
+
+
+def get_user_mapping_snapshot_cache() -> UserMappingSnapshotCache:
+    """Get the process-wide user mapping snapshot cache."""
+    global _snapshot_cache
+    if _snapshot_cache is None:
+        with _snapshot_cache_lock:
+            if _snapshot_cache is None:
+                _snapshot_cache = UserMappingSnapshotCache()
+    return _snapshot_cache
+
+
+@span_methods("db.user_mappings")
 class SupabaseUserMappingRepository:
     """
     Supabase implementation of UserMappingRepository.
 
     Handles per-user exercise name mappings stored in the database.
     Replaces the file-based user_mappings.yaml approach.
+
+    Reads are served from a snapshot of the user's full mapping dict,
+    loaded at most once per repository instance (i.e. per request) and
+    shared through the process-wide UserMappingSnapshotCache. Writes
+    invalidate both.
     """
 
-    def __init__(self, client: Client, user_id: str):
+    def __init__(
+        self,
+        client: Client,
+        user_id: str,
+        snapshot_cache: Optional[UserMappingSnapshotCache] = None,
+    ):
         """
         Initialize with Supabase client and user ID.
 
         Args:
             client: Supabase client instance (injected)
             user_id: User ID for scoping mappings
+            snapshot_cache: Optional snapshot cache (defaults to the
+                process-wide cache)
         """
         self._client = client
         self._user_id = user_id
+        self._snapshot_cache = snapshot_cache or get_user_mapping_snapshot_cache()
+        self._snapshot: Optional[Dict[str, str]] = None
+
+    def _mappings(self) -> Dict[str, str]:
+        """The user's mappings (normalized name -> garmin name)."""
+        if self._snapshot is not None:
+            return self._snapshot
+
+        cached = self._snapshot_cache.get(self._user_id)
+        if cached is not None:
+            self._snapshot = cached
+            return cached
+
+        version = self._snapshot_cache.version(self._user_id)
+        try:
+            result = self._client.table("user_mappings") \
+                .select("exercise_name, garmin_name") \
+                .eq("user_id", self._user_id) \
+                .execute()
+            mappings = {r["exercise_name"]: r["garmin_name"] for r in (result.data or [])}
+        except Exception as e:
+            logger.error(f"Error loading user mappings: {e}")
+            # Don't retry on every lookup in this request, but don't cache it
+            self._snapshot = {}
+            return self._snapshot
+
+        self._snapshot = mappings
+        self._snapshot_cache.put(self._user_id, self._snapshot, version)
+        return self._snapshot
+
+    def _invalidate(self) -> None:
+        self._snapshot = None
+        self._snapshot_cache.invalidate(self._user_id)
 
     def add(
         self,
@@ -102,6 +225,9 @@ class SupabaseUserMappingRepository:
             logger.error(f"Error adding user mapping: {e}")
             return {"error": str(e)}
 
+        finally:
+            self._invalidate()
+
     def remove(
         self,
         exercise_name: str,
@@ -122,46 +248,27 @@ class SupabaseUserMappingRepository:
             logger.error(f"Error removing user mapping: {e}")
             return False
 
+        finally:
+            self._invalidate()
+
     def get(
         self,
         exercise_name: str,
     ) -> Optional[str]:
         """Get the mapped Garmin name for an exercise."""
-        try:
-            normalized = _normalize(exercise_name)
+        return self._mappings().get(_normalize(exercise_name))
 
-            result = self._client.table("user_mappings") \
-                .select("garmin_name") \
-                .eq("user_id", self._user_id) \
-                .eq("exercise_name", normalized) \
-                .single() \
-                .execute()
-
-            if result.data:
-                return result.data.get("garmin_name")
-
-            return None
-
-        except Exception as e:
-            logger.error(f"Error getting user mapping: {e}")
-            return None
+    def get_many(
+        self,
+        exercise_names: Iterable[str],
+    ) -> Dict[str, Optional[str]]:
+        """Get the mapped Garmin names for several exercises from one snapshot."""
+        mappings = self._mappings()
+        return {name: mappings.get(_normalize(name)) for name in exercise_names}
 
     def get_all(self) -> Dict[str, str]:
         """Get all user-defined mappings."""
-        try:
-            result = self._client.table("user_mappings") \
-                .select("exercise_name, garmin_name") \
-                .eq("user_id", self._user_id) \
-                .execute()
-
-            if result.data:
-                return {r["exercise_name"]: r["garmin_name"] for r in result.data}
-
-            return {}
-
-        except Exception as e:
-            logger.error(f"Error getting all user mappings: {e}")
-            return {}
+        return dict(self._mappings())
 
     def clear_all(self) -> None:
         """Clear all user-defined mappings."""
@@ -174,22 +281,182 @@ class SupabaseUserMappingRepository:
         except Exception as e:
             logger.error(f"Error clearing user mappings: {e}")
 
+        finally:
+            self._invalidate()
+
+
+class GlobalMappingCounterBuffer:
+    """
+    In-process aggregator for global mapping popularity increments.
+
+    record_choice() runs on every user confirmation, so increments are
+    buffered per (exercise_name, garmin_name) and flushed in one
+    increment_global_mapping_counts RPC call, either every flush_interval
+    seconds or as soon as max_pending distinct keys are waiting. The RPC
+    upserts and increments server-side, so concurrent writers never lose
+    counts.
+
+    At most max_buffered distinct keys are held. During a database outage
+    failed flushes are re-queued up to that cap; increments for new keys
+    beyond it are dropped (popularity is a best-effort signal) rather than
+    growing the buffer without limit.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        flush_interval: float = 5.0,
+        max_pending: int = 500,
+        max_buffered: int = 10_000,
+    ):
+        self._client = client
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._max_buffered = max(max_pending, max_buffered)
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add(self, exercise_name: str, garmin_name: str, count: int = 1) -> None:
+        """Buffer an increment for a normalized exercise name."""
+        with self._lock:
+            self._merge({(exercise_name, garmin_name): count})
+            pending = len(self._pending)
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(
+                    target=self._run, name="global_mapping_flush", daemon=True
+                )
+                self._thread.start()
+
+        if pending >= self._max_pending:
+            self._wakeup.set()
+
+    def pending_for(self, exercise_name: str) -> Dict[str, int]:
+        """Get unflushed counts for a normalized exercise name."""
+        with self._lock:
+            return {
+                garmin: count
+                for (name, garmin), count in self._pending.items()
+                if name == exercise_name
+            }
+
+    def flush(self) -> int:
+        """
+        Send buffered increments to the database.
 
+        Returns:
+            Number of (exercise, garmin) rows flushed. On failure the
+            increments are put back and 0 is returned.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+
+        if not batch:
+            return 0
+
+        rows = [
+            {"exercise_name": name, "garmin_name": garmin, "delta": count}
+            for (name, garmin), count in batch.items()
+        ]
+        try:
+            self._client.rpc(
+                "increment_global_mapping_counts",
+                {"p_increments": rows},
+            ).execute()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Error flushing {len(rows)} global mapping increments: {e}")
+            with self._lock:
+                dropped = self._merge(batch)
+            if dropped:
+                logger.warning(f"Global mapping buffer full, dropped {dropped} increments")
+            return 0
+
+    def _merge(self, increments: Dict[Tuple[str, str], int]) -> int:
+        """Add increments to the pending map (lock held). Returns keys dropped by the cap."""
+        dropped = 0
+        for key, count in increments.items():
+            if key in self._pending:
+                self._pending[key] += count
+            elif len(self._pending) < self._max_buffered:
+                self._pending[key] = count
+            else:
+                dropped += 1
+        self.dropped += dropped
+        return dropped
+
+    def close(self) -> None:
+        """Stop the flush thread and flush what's left."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout=self._flush_interval)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait(self._flush_interval)
+            self._wakeup.clear()
+            if not self._closed:
+                self.flush()
+
+
+_counter_buffers: Dict[int, GlobalMappingCounterBuffer] = {}
+_counter_buffers_lock = threading.Lock()
+
+
+def get_global_mapping_counter_buffer(client: Client) -> GlobalMappingCounterBuffer:
+    """Get the process-wide counter buffer for a Supabase client."""
+    with _counter_buffers_lock:
+        buffer = _counter_buffers.get(id(client))
+        if buffer is None:
+            if not _counter_buffers:
+                atexit.register(flush_global_mapping_counters)
+            buffer = GlobalMappingCounterBuffer(client)
+            _counter_buffers[id(client)] = buffer
+        return buffer
+
+
+def flush_global_mapping_counters() -> None:
+    """Flush and stop all counter buffers (called on app shutdown)."""
+    with _counter_buffers_lock:
+        buffers = list(_counter_buffers.values())
+        _counter_buffers.clear()
+    for buffer in buffers:
+        buffer.close()
+
+
+@span_methods("db.global_mappings")
 class SupabaseGlobalMappingRepository:
     """
     Supabase implementation of GlobalMappingRepository.
 
     Tracks crowd-sourced mapping popularity across all users.
+    Choices are aggregated in-process and flushed as batched server-side
+    increments; stats are read from the maintained
+    global_exercise_mapping_stats summary row.
     """
 
-    def __init__(self, client: Client):
+    def __init__(
+        self,
+        client: Client,
+        counter_buffer: Optional[GlobalMappingCounterBuffer] = None,
+    ):
         """
         Initialize with Supabase client.
 
         Args:
             client: Supabase client instance (injected)
+            counter_buffer: Optional increment buffer (defaults to the
+                process-wide buffer for this client)
         """
         self._client = client
+        self._counter_buffer = counter_buffer or get_global_mapping_counter_buffer(client)
 
     def record_choice(
         self,
@@ -197,33 +464,7 @@ class SupabaseGlobalMappingRepository:
         garmin_name: str,
     ) -> None:
         """Record a user's mapping choice for global popularity tracking."""
-        try:
-            normalized = _normalize(exercise_name)
-
-            # Try to increment existing count
-            result = self._client.table("global_exercise_mappings") \
-                .select("id, count") \
-                .eq("exercise_name", normalized) \
-                .eq("garmin_name", garmin_name) \
-                .execute()
-
-            if result.data and len(result.data) > 0:
-                # Update existing record
-                current_count = result.data[0].get("count", 0)
-                self._client.table("global_exercise_mappings") \
-                    .update({"count": current_count + 1}) \
-                    .eq("id", result.data[0]["id"]) \
-                    .execute()
-            else:
-                # Insert new record
-                self._client.table("global_exercise_mappings").insert({
-                    "exercise_name": normalized,
-                    "garmin_name": garmin_name,
-                    "count": 1,
-                }).execute()
-
-        except Exception as e:
-            logger.error(f"Error recording mapping choice: {e}")
+        self._counter_buffer.add(_normalize(exercise_name), garmin_name)
 
     def get_popular(
         self,
@@ -242,10 +483,13 @@ class SupabaseGlobalMappingRepository:
                 .limit(limit) \
                 .execute()
 
-            if result.data:
-                return [(r["garmin_name"], r["count"]) for r in result.data]
+            counts = {r["garmin_name"]: r["count"] for r in (result.data or [])}
 
-            return []
+            # Include choices that haven't been flushed yet
+            for garmin_name, count in self._counter_buffer.pending_for(normalized).items():
+                counts[garmin_name] = counts.get(garmin_name, 0) + count
+
+            return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:limit]
 
         except Exception as e:
             logger.error(f"Error getting popular mappings: {e}")
@@ -254,12 +498,12 @@ class SupabaseGlobalMappingRepository:
     def get_stats(self) -> Dict[str, Any]:
         """Get global popularity statistics."""
         try:
-            # Get total counts
-            result = self._client.table("global_exercise_mappings") \
-                .select("exercise_name, garmin_name, count") \
+            summary = self._client.table("global_exercise_mapping_stats") \
+                .select("total_choices, unique_exercises, unique_mappings") \
+                .eq("id", 1) \
                 .execute()
 
-            if not result.data:
+            if not summary.data:
                 return {
                     "total_choices": 0,
                     "unique_exercises": 0,
@@ -267,21 +511,20 @@ class SupabaseGlobalMappingRepository:
                     "most_popular": []
                 }
 
-            data = result.data
-            total_choices = sum(r["count"] for r in data)
-            unique_exercises = len(set(r["exercise_name"] for r in data))
-            unique_mappings = len(data)
-
-            # Sort by count and get top 10
-            sorted_data = sorted(data, key=lambda x: x["count"], reverse=True)[:10]
+            top = self._client.table("global_exercise_mappings") \
+                .select("exercise_name, garmin_name, count") \
+                .order("count", desc=True) \
+                .limit(10) \
+                .execute()
 
+            stats = summary.data[0]
             return {
-                "total_choices": total_choices,
-                "unique_exercises": unique_exercises,
-                "unique_mappings": unique_mappings,
+                "total_choices": stats["total_choices"],
+                "unique_exercises": stats["unique_exercises"],
+                "unique_mappings": stats["unique_mappings"],
                 "most_popular": [
                     {"exercise": r["exercise_name"], "garmin_name": r["garmin_name"], "count": r["count"]}
-                    for r in sorted_data
+                    for r in (top.data or [])
                 ]
             }
 
@@ -352,6 +595,32 @@ class InMemoryExerciseMatchRepository:
 
             return None, 0.0
 
+    def find_matches(
+        self,
+        exercise_names: Iterable[str],
+        *,
+        threshold: float = 0.3,
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """Find the best matching Garmin exercise for several names at once."""
+        exercise_names = list(exercise_names)
+        if not self._exercises:
+            return {name: (None, 0.0) for name in exercise_names}
+
+        try:
+            from backend.mapping.exercise_name_matcher import best_matches
+        except ImportError:
+            return {
+                name: self.find_match(name, threshold=threshold)
+                for name in exercise_names
+            }
+
+        return {
+            name: (mapped_name, confidence)
+            if mapped_name and confidence >= threshold else (None, 0.0)
+            for name, (mapped_name, confidence)
+            in best_matches(exercise_names, self._exercises).items()
+        }
+
     def get_suggestions(
         self,
         exercise_name: str,
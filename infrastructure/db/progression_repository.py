@@ -5,8 +5,9 @@ Part of AMA-299: Exercise Progression Tracking
 Phase 3 - Progression Features
 
 This module implements the ProgressionRepository protocol using Supabase.
-Queries the workout_completions table's execution_log JSONB column
-to extract exercise history, weights, and calculate progression metrics.
+Exercise history is read from the per-set exercise_set_index table and last
+weights from the exercise_last_weights store; other queries still aggregate
+the workout_completions execution_log JSONB column.
 """
 from typing import Optional, List, Dict, Any
 from datetime import date, timedelta
@@ -15,9 +16,26 @@ import logging
 
 from supabase import Client
 
+from backend.core.spans import span_methods
+from backend.core.volume_analytics import (
+    best_1rm_by_period,
+    flatten_execution_logs,
+    volume_by_muscle_group,
+)
+from infrastructure.db.exercise_set_index import (
+    EXERCISE_SET_INDEX_TABLE,
+    build_exercise_set_rows,
+    parse_set_weight,
+)
+from infrastructure.db.last_weight_store import get_stored_last_weights
+
 logger = logging.getLogger(__name__)
 
+# Rows per request when reading a user's whole set index
+ALL_SETS_PAGE_SIZE = 1000
+
 
+@span_methods("db.progression")
 class SupabaseProgressionRepository:
     """
     Supabase implementation of ProgressionRepository.
@@ -46,8 +64,99 @@ class SupabaseProgressionRepository:
         """
         Get the history of a specific exercise for a user.
 
-        Queries workout_completions and extracts intervals from execution_log
-        where the canonical_exercise_id matches.
+        Filters and paginates sessions in the database via exercise_set_index,
+        then loads the sets and workout names for just that page. Falls back
+        to scanning execution_log if the index cannot be queried.
+        """
+        try:
+            sessions, total = self._get_indexed_sessions(user_id, exercise_id, limit, offset)
+        except Exception as e:
+            logger.warning(f"exercise_set_index query failed, scanning completions instead: {e}")
+            return self._get_exercise_history_from_completions(
+                user_id, exercise_id, limit=limit, offset=offset
+            )
+
+        return {
+            "sessions": sessions,
+            "total": total,
+            "exercise": {"id": exercise_id},
+        }
+
+    def _get_indexed_sessions(
+        self,
+        user_id: str,
+        exercise_id: str,
+        limit: int,
+        offset: int,
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """Page of sessions from exercise_set_index, newest first."""
+        # One row per session: the first indexed set of each completion
+        page = self._client.table(EXERCISE_SET_INDEX_TABLE) \
+            .select("completion_id, workout_date, exercise_name", count="exact") \
+            .eq("user_id", user_id) \
+            .eq("exercise_id", exercise_id) \
+            .eq("is_session_start", True) \
+            .order("started_at", desc=True) \
+            .order("completion_id") \
+            .range(offset, offset + limit - 1) \
+            .execute()
+
+        total = page.count if page.count is not None else len(page.data or [])
+        heads = page.data or []
+        if not heads:
+            return [], total
+
+        completion_ids = [head["completion_id"] for head in heads]
+        sets_result = self._client.table(EXERCISE_SET_INDEX_TABLE) \
+            .select(
+                "completion_id, set_number, weight, weight_unit, "
+                "reps_completed, reps_planned, status"
+            ) \
+            .eq("user_id", user_id) \
+            .eq("exercise_id", exercise_id) \
+            .in_("completion_id", completion_ids) \
+            .order("interval_index") \
+            .order("set_index") \
+            .execute()
+
+        sets_by_completion: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for row in sets_result.data or []:
+            sets_by_completion[row["completion_id"]].append({
+                "set_number": row.get("set_number", 1),
+                "weight": row.get("weight"),
+                "weight_unit": row.get("weight_unit") or "lbs",
+                "reps_completed": row.get("reps_completed"),
+                "reps_planned": row.get("reps_planned"),
+                "status": row.get("status") or "completed",
+            })
+
+        workout_names = self._get_workout_names(user_id, completion_ids)
+
+        sessions = [
+            {
+                "completion_id": head["completion_id"],
+                "workout_date": head.get("workout_date") or "",
+                "workout_name": workout_names.get(head["completion_id"]),
+                "exercise_id": exercise_id,
+                "exercise_name": head.get("exercise_name") or exercise_id,
+                "sets": sets_by_completion.get(head["completion_id"], []),
+            }
+            for head in heads
+        ]
+        return sessions, total
+
+    def _get_exercise_history_from_completions(
+        self,
+        user_id: str,
+        exercise_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Legacy history query scanning every completion's execution_log.
+
+        Only used when exercise_set_index is unavailable.
         """
         try:
             # Query completions that have execution_log with this exercise
@@ -77,18 +186,7 @@ class SupabaseProgressionRepository:
 
                     # Extract sets from this interval
                     for set_data in interval.get("sets", []):
-                        weight = None
-                        weight_unit = "lbs"
-
-                        # Parse weight from structured format
-                        weight_obj = set_data.get("weight")
-                        if weight_obj and isinstance(weight_obj, dict):
-                            components = weight_obj.get("components", [])
-                            if components:
-                                weight = components[0].get("value")
-                                weight_unit = components[0].get("unit", "lbs")
-                        elif isinstance(weight_obj, (int, float)):
-                            weight = weight_obj
+                        weight, weight_unit = parse_set_weight(set_data)
 
                         matching_sets.append({
                             "set_number": set_data.get("set_number", 1),
@@ -145,6 +243,85 @@ class SupabaseProgressionRepository:
         exercise_id: str,
     ) -> Optional[Dict[str, Any]]:
         """Get the last weight used for an exercise."""
+        return self.get_last_weights(user_id, [exercise_id]).get(exercise_id)
+
+    def get_last_weights(
+        self,
+        user_id: str,
+        exercise_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the last weight used for several exercises.
+
+        Reads the exercise_last_weights store in one query. Exercises missing
+        from the store (history saved before it existed) are looked up
+        together in exercise_set_index.
+        """
+        exercise_ids = list(dict.fromkeys(exercise_ids))
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            for exercise_id, row in get_stored_last_weights(self._client, user_id, exercise_ids).items():
+                results[exercise_id] = self._last_weight_result(exercise_id, row)
+        except Exception as e:
+            logger.warning(f"exercise_last_weights query failed, using set index instead: {e}")
+
+        missing = [exercise_id for exercise_id in exercise_ids if exercise_id not in results]
+        if missing:
+            results.update(self._get_last_weights_from_index(user_id, missing))
+        return results
+
+    def _get_last_weights_from_index(
+        self,
+        user_id: str,
+        exercise_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Most recent completed weighted set per exercise from exercise_set_index.
+
+        One query for all exercises, newest first; further pages are read
+        only while some exercise has not been seen yet.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            offset = 0
+            while True:
+                page = self._client.table(EXERCISE_SET_INDEX_TABLE) \
+                    .select("exercise_id, completion_id, workout_date, weight, weight_unit, reps_completed") \
+                    .eq("user_id", user_id) \
+                    .in_("exercise_id", exercise_ids) \
+                    .eq("status", "completed") \
+                    .not_.is_("weight", "null") \
+                    .order("started_at", desc=True) \
+                    .order("completion_id") \
+                    .order("interval_index") \
+                    .order("set_index") \
+                    .range(offset, offset + ALL_SETS_PAGE_SIZE - 1) \
+                    .execute()
+                data = page.data or []
+                for row in data:
+                    exercise_id = row.get("exercise_id")
+                    if exercise_id not in results:
+                        results[exercise_id] = self._last_weight_result(exercise_id, row)
+                if len(results) == len(exercise_ids) or len(data) < ALL_SETS_PAGE_SIZE:
+                    return results
+                offset += len(data)
+        except Exception as e:
+            logger.warning(f"exercise_set_index query failed, scanning completions instead: {e}")
+
+        for exercise_id in exercise_ids:
+            if exercise_id in results:
+                continue
+            result = self._get_last_weight_from_history(user_id, exercise_id)
+            if result is not None:
+                results[exercise_id] = result
+        return results
+
+    def _get_last_weight_from_history(
+        self,
+        user_id: str,
+        exercise_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Legacy lookup through recent exercise history."""
         try:
             # Get the most recent session
             sessions = self.get_exercise_history(
@@ -173,6 +350,17 @@ class SupabaseProgressionRepository:
             logger.exception(f"Error fetching last weight: {e}")
             return None
 
+    @staticmethod
+    def _last_weight_result(exercise_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "exercise_id": exercise_id,
+            "weight": row["weight"],
+            "weight_unit": row.get("weight_unit") or "lbs",
+            "reps_completed": row.get("reps_completed") or 0,
+            "workout_date": row.get("workout_date") or "",
+            "completion_id": row.get("completion_id", ""),
+        }
+
     def get_volume_by_muscle_group(
         self,
         user_id: str,
@@ -189,99 +377,29 @@ class SupabaseProgressionRepository:
             start_date = end_date - timedelta(days=30)
 
         try:
-            # Query completions in date range
-            result = self._client.table("workout_completions") \
-                .select("id, started_at, execution_log") \
-                .eq("user_id", user_id) \
-                .gte("started_at", start_date.isoformat()) \
-                .lte("started_at", (end_date + timedelta(days=1)).isoformat()) \
-                .not_.is_("execution_log", "null") \
-                .execute()
+            completions = self._get_completions_in_range(user_id, start_date, end_date)
 
             # Load exercises to get muscle group mapping
             exercises_result = self._client.table("exercises") \
                 .select("id, primary_muscles") \
                 .execute()
 
-            exercise_muscles = {}
-            for ex in exercises_result.data or []:
-                exercise_muscles[ex["id"]] = ex.get("primary_muscles", [])
+            exercise_muscles = {
+                ex["id"]: ex.get("primary_muscles", [])
+                for ex in exercises_result.data or []
+            }
 
             # Aggregate volume by muscle group and period
-            volume_data: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(
-                lambda: defaultdict(lambda: {"volume": 0.0, "sets": 0, "reps": 0})
-            )
-            summary: Dict[str, Dict[str, float]] = defaultdict(
-                lambda: {"total_volume": 0.0, "total_sets": 0, "total_reps": 0}
+            volume = volume_by_muscle_group(
+                flatten_execution_logs(completions),
+                exercise_muscles,
+                granularity=granularity,
+                muscle_groups=muscle_groups,
             )
 
-            for record in result.data or []:
-                execution_log = record.get("execution_log", {})
-                started_at = record.get("started_at", "")[:10]
-
-                if not started_at:
-                    continue
-
-                # Determine period key based on granularity
-                period_key = started_at
-                if granularity == "weekly":
-                    d = date.fromisoformat(started_at)
-                    week_start = d - timedelta(days=d.weekday())
-                    period_key = week_start.isoformat()
-                elif granularity == "monthly":
-                    period_key = started_at[:7]
-
-                for interval in execution_log.get("intervals", []):
-                    canonical_id = interval.get("canonical_exercise_id")
-                    if not canonical_id:
-                        continue
-
-                    muscles = exercise_muscles.get(canonical_id, ["other"])
-
-                    # Filter by muscle groups if specified
-                    if muscle_groups:
-                        if not any(m in muscles for m in muscle_groups):
-                            continue
-
-                    for set_data in interval.get("sets", []):
-                        if set_data.get("status") != "completed":
-                            continue
-
-                        weight = 0
-                        weight_obj = set_data.get("weight")
-                        if weight_obj and isinstance(weight_obj, dict):
-                            components = weight_obj.get("components", [])
-                            if components:
-                                weight = components[0].get("value", 0) or 0
-                        elif isinstance(weight_obj, (int, float)):
-                            weight = weight_obj
-
-                        reps = set_data.get("reps_completed", 0) or 0
-                        volume = weight * reps
-
-                        for muscle in muscles:
-                            volume_data[muscle][period_key]["volume"] += volume
-                            volume_data[muscle][period_key]["sets"] += 1
-                            volume_data[muscle][period_key]["reps"] += reps
-                            summary[muscle]["total_volume"] += volume
-                            summary[muscle]["total_sets"] += 1
-                            summary[muscle]["total_reps"] += reps
-
-            # Convert to list format
-            data_list = []
-            for muscle, periods in volume_data.items():
-                for period, totals in sorted(periods.items()):
-                    data_list.append({
-                        "period": period,
-                        "muscle_group": muscle,
-                        "total_volume": round(totals["volume"], 1),
-                        "total_sets": totals["sets"],
-                        "total_reps": totals["reps"],
-                    })
-
             return {
-                "data": data_list,
-                "summary": {k: dict(v) for k, v in summary.items()},
+                "data": volume["data"],
+                "summary": volume["summary"],
                 "period": {
                     "start_date": start_date.isoformat(),
                     "end_date": end_date.isoformat(),
@@ -299,6 +417,54 @@ class SupabaseProgressionRepository:
                 },
             }
 
+    def get_1rm_trend(
+        self,
+        user_id: str,
+        exercise_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        granularity: str = "weekly",
+        formula: str = "brzycki",
+    ) -> List[Dict[str, Any]]:
+        """Get the best estimated 1RM per period for an exercise."""
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=90)
+
+        try:
+            completions = self._get_completions_in_range(user_id, start_date, end_date)
+        except Exception as e:
+            logger.exception(f"Error fetching 1RM trend: {e}")
+            return []
+
+        trend = best_1rm_by_period(
+            flatten_execution_logs(completions),
+            granularity=granularity,
+            formula=formula,
+        )
+        return [
+            {"period": period, "estimated_1rm": estimate}
+            for period, estimate in trend.get(exercise_id, [])
+        ]
+
+    def _get_completions_in_range(
+        self,
+        user_id: str,
+        start_date: date,
+        end_date: date,
+    ) -> List[Dict[str, Any]]:
+        """Completions with an execution log started within the date range."""
+        result = self._client.table("workout_completions") \
+            .select("id, started_at, execution_log") \
+            .eq("user_id", user_id) \
+            .gte("started_at", start_date.isoformat()) \
+            .lte("started_at", (end_date + timedelta(days=1)).isoformat()) \
+            .not_.is_("execution_log", "null") \
+            .execute()
+        return result.data or []
+
     def get_exercises_with_history(
         self,
         user_id: str,
@@ -346,6 +512,104 @@ class SupabaseProgressionRepository:
             logger.exception(f"Error fetching exercises with history: {e}")
             return []
 
+    def get_all_sets(
+        self,
+        user_id: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every indexed set for a user, newest workout first.
+
+        Reads exercise_set_index in pages; falls back to flattening each
+        completion's execution_log if the index cannot be queried.
+        """
+        rows: List[Dict[str, Any]] = []
+        try:
+            offset = 0
+            while True:
+                page = self._client.table(EXERCISE_SET_INDEX_TABLE) \
+                    .select(
+                        "exercise_id, exercise_name, completion_id, workout_date, "
+                        "weight, weight_unit, reps_completed, status"
+                    ) \
+                    .eq("user_id", user_id) \
+                    .order("started_at", desc=True) \
+                    .order("completion_id") \
+                    .order("interval_index") \
+                    .order("set_index") \
+                    .range(offset, offset + ALL_SETS_PAGE_SIZE - 1) \
+                    .execute()
+                data = page.data or []
+                rows.extend(data)
+                if len(data) < ALL_SETS_PAGE_SIZE:
+                    return rows
+                offset += len(data)
+        except Exception as e:
+            logger.warning(f"exercise_set_index query failed, scanning completions instead: {e}")
+
+        try:
+            result = self._client.table("workout_completions") \
+                .select("id, started_at, execution_log") \
+                .eq("user_id", user_id) \
+                .not_.is_("execution_log", "null") \
+                .order("started_at", desc=True) \
+                .execute()
+
+            rows = []
+            for record in result.data or []:
+                rows.extend(build_exercise_set_rows(
+                    user_id,
+                    record["id"],
+                    record.get("started_at"),
+                    record.get("execution_log"),
+                ))
+            return rows
+
+        except Exception as e:
+            logger.exception(f"Error fetching sets: {e}")
+            return []
+
+    def _get_workout_names(self, user_id: str, completion_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Workout names for a page of completions, one query per linked table."""
+        names: Dict[str, Optional[str]] = {}
+        try:
+            result = self._client.table("workout_completions") \
+                .select("id, workout_id, follow_along_workout_id, workout_event_id") \
+                .eq("user_id", user_id) \
+                .in_("id", completion_ids) \
+                .execute()
+
+            # Same precedence as _get_workout_name: workout, follow-along, event
+            links: Dict[str, tuple] = {}
+            for record in result.data or []:
+                for table, column in (
+                    ("workouts", "workout_id"),
+                    ("follow_along_workouts", "follow_along_workout_id"),
+                    ("workout_events", "workout_event_id"),
+                ):
+                    if record.get(column):
+                        links[record["id"]] = (table, record[column])
+                        break
+
+            titles: Dict[tuple, Optional[str]] = {}
+            for table in ("workouts", "follow_along_workouts", "workout_events"):
+                ids = sorted({ref for t, ref in links.values() if t == table})
+                if not ids:
+                    continue
+                rows = self._client.table(table) \
+                    .select("id, title") \
+                    .in_("id", ids) \
+                    .execute()
+                for row in rows.data or []:
+                    titles[(table, row["id"])] = row.get("title")
+
+            for completion_id, link in links.items():
+                names[completion_id] = titles.get(link)
+
+        except Exception as e:
+            logger.warning(f"Error fetching workout names: {e}")
+
+        return names
+
     def _get_workout_name(self, record: Dict[str, Any]) -> Optional[str]:
         """Get workout name from linked workout/event."""
         try:
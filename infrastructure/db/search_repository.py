@@ -12,9 +12,12 @@ from typing import Any
 
 from supabase import Client
 
+from backend.core.spans import span_methods
+
 logger = logging.getLogger(__name__)
 
 
+@span_methods("db.search")
 class SupabaseSearchRepository:
     """Supabase-backed implementation of SearchRepository."""
 
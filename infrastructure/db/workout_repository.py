@@ -9,13 +9,96 @@ Logic moved from backend/database.py with constructor-injected client.
 """
 import logging
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from supabase import Client
 
+from backend.core.spans import span_methods
+from backend.services.sync_events import SYNC_CONFIRMED, SYNC_FAILED, SYNC_QUEUED, publish_sync_event
+
 logger = logging.getLogger(__name__)
 
+# Workouts per dedup lookup and per insert/upsert request
+SAVE_BATCH_SIZE = 50
+
+
+def _workout_row(
+    profile_id: str,
+    workout_data: Dict[str, Any],
+    sources: List[str],
+    device: str,
+    *,
+    exports: Optional[Dict[str, Any]] = None,
+    validation: Optional[Dict[str, Any]] = None,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the workouts row written by save() and save_many()."""
+    data = {
+        "profile_id": profile_id,
+        "workout_data": workout_data,
+        "sources": sources,
+        "device": device,
+        "is_exported": False,
+    }
+
+    if exports:
+        data["exports"] = exports
+    if validation:
+        data["validation"] = validation
+    if title:
+        data["title"] = title
+    if description:
+        data["description"] = description
+    return data
+
+
+def find_existing_workouts(
+    client: Client,
+    profile_id: str,
+    titles: List[str],
+) -> Dict[Tuple[str, str], str]:
+    """
+    Look up the workouts a save would deduplicate against, in one query.
+
+    Returns the newest workout id for each (title, device) pair among the
+    profile's workouts with one of the given titles. Query errors propagate.
+    """
+    found = client.table("workouts").select("id, title, device, created_at") \
+        .eq("profile_id", profile_id) \
+        .in_("title", titles) \
+        .order("created_at", desc=True) \
+        .execute()
+    existing: Dict[Tuple[str, str], str] = {}
+    for record in found.data or []:
+        existing.setdefault((record.get("title"), record.get("device")), record["id"])
+    return existing
+
+
+def _log_save_error(e: Exception) -> None:
+    error_msg = str(e)
+    if "PGRST" in error_msg or "permission" in error_msg.lower() or "row-level security" in error_msg.lower():
+        logger.error("RLS/Permissions error: Consider using SUPABASE_SERVICE_ROLE_KEY instead of SUPABASE_ANON_KEY for backend API")
+
+
+def _batches_by_columns(rows: List[Tuple[Dict[str, Any], Any]]) -> List[List[Tuple[Dict[str, Any], Any]]]:
+    """
+    Split (row, tag) pairs into write batches whose rows share the same columns.
 
+    A multi-row PostgREST write sends one column list for all rows; grouping
+    keeps a row without e.g. a description from nulling out the stored one.
+    """
+    groups: Dict[frozenset, List[Tuple[Dict[str, Any], Any]]] = {}
+    for pair in rows:
+        groups.setdefault(frozenset(pair[0]), []).append(pair)
+    return [
+        group[start:start + SAVE_BATCH_SIZE]
+        for group in groups.values()
+        for start in range(0, len(group), SAVE_BATCH_SIZE)
+    ]
+
+
+@span_methods("db.workouts")
 class SupabaseWorkoutRepository:
     """
     Supabase implementation of WorkoutRepository protocol.
@@ -71,22 +154,16 @@ class SupabaseWorkoutRepository:
                     existing_workout = check_result.data[0]
                     logger.info(f"Found existing workout with same title/device: {existing_workout['id']}")
 
-            data = {
-                "profile_id": profile_id,
-                "workout_data": workout_data,
-                "sources": sources,
-                "device": device,
-                "is_exported": False,
-            }
-
-            if exports:
-                data["exports"] = exports
-            if validation:
-                data["validation"] = validation
-            if effective_title:
-                data["title"] = effective_title
-            if description:
-                data["description"] = description
+            data = _workout_row(
+                profile_id,
+                workout_data,
+                sources,
+                device,
+                exports=exports,
+                validation=validation,
+                title=effective_title,
+                description=description,
+            )
 
             if existing_workout:
                 # Update existing workout instead of creating duplicate
@@ -107,12 +184,103 @@ class SupabaseWorkoutRepository:
                     return result.data[0]
                 return None
         except Exception as e:
-            error_msg = str(e)
             logger.error(f"Failed to save workout: {e}")
-            if "PGRST" in error_msg or "permission" in error_msg.lower() or "row-level security" in error_msg.lower():
-                logger.error("RLS/Permissions error: Consider using SUPABASE_SERVICE_ROLE_KEY instead of SUPABASE_ANON_KEY for backend API")
+            _log_save_error(e)
             return None
 
+    def save_many(
+        self,
+        profile_id: str,
+        workouts: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Save several workouts with batched writes.
+
+        Titled workouts are deduplicated like save(), but with one lookup
+        per batch of titles instead of one per workout: matches are updated
+        with a single upsert on id, the rest are inserted together. Untitled
+        workouts are inserted in batches. Workouts with an explicit
+        workout_id (rare, edits) go through save() one by one.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(workouts)
+        now = datetime.now(timezone.utc).isoformat()
+
+        # Dedup key -> (row, input indexes); later duplicates replace the row
+        titled: Dict[tuple, Tuple[Dict[str, Any], List[int]]] = {}
+        inserts: List[Tuple[Dict[str, Any], List[int]]] = []
+
+        for index, item in enumerate(workouts):
+            workout_data = item["workout_data"]
+            if item.get("workout_id"):
+                results[index] = self.save(profile_id, **item)
+                continue
+
+            row = _workout_row(
+                profile_id,
+                workout_data,
+                item.get("sources") or [],
+                item["device"],
+                exports=item.get("exports"),
+                validation=item.get("validation"),
+                title=item.get("title") or workout_data.get("title"),
+                description=item.get("description"),
+            )
+            if "title" not in row:
+                inserts.append((row, [index]))
+                continue
+
+            key = (row["title"], row["device"])
+            indexes = titled[key][1] if key in titled else []
+            indexes.append(index)
+            titled[key] = (row, indexes)
+
+        # Look up existing workouts for each batch of titles, newest first
+        updates: List[Tuple[Dict[str, Any], List[int]]] = []
+        pending = list(titled.items())
+        for start in range(0, len(pending), SAVE_BATCH_SIZE):
+            chunk = pending[start:start + SAVE_BATCH_SIZE]
+            try:
+                existing = find_existing_workouts(
+                    self._client, profile_id, list({title for (title, _), _ in chunk})
+                )
+            except Exception as e:
+                logger.error(f"Failed to look up {len(chunk)} workouts for dedup: {e}")
+                _log_save_error(e)
+                continue
+
+            for key, (row, indexes) in chunk:
+                if key in existing:
+                    updates.append(({"id": existing[key], **row, "updated_at": now}, indexes))
+                else:
+                    inserts.append((row, indexes))
+
+        for batch in _batches_by_columns(updates):
+            try:
+                result = self._client.table("workouts").upsert([row for row, _ in batch]).execute()
+            except Exception as e:
+                logger.error(f"Failed to update {len(batch)} workouts: {e}")
+                _log_save_error(e)
+                continue
+            saved = {record.get("id"): record for record in result.data or []}
+            for row, indexes in batch:
+                for index in indexes:
+                    results[index] = saved.get(row["id"])
+
+        for batch in _batches_by_columns(inserts):
+            try:
+                result = self._client.table("workouts").insert([row for row, _ in batch]).execute()
+            except Exception as e:
+                logger.error(f"Failed to insert {len(batch)} workouts: {e}")
+                _log_save_error(e)
+                continue
+            for (_, indexes), record in zip(batch, result.data or []):
+                for index in indexes:
+                    results[index] = record
+
+        saved_count = sum(1 for r in results if r)
+        logger.info(f"Saved {saved_count}/{len(workouts)} workouts for profile {profile_id}")
+        return results
+
     def get(
         self,
         workout_id: str,
@@ -292,7 +460,7 @@ class SupabaseWorkoutRepository:
         """Get incoming workouts pending completion."""
         try:
             result = self._client.table("workouts") \
-                .select("id, title, description, workout_data, device, ios_companion_synced_at, created_at") \
+                .select("id, title, description, workout_data, device, ios_companion_synced_at, created_at, updated_at") \
                 .eq("profile_id", profile_id) \
                 .not_.is_("ios_companion_synced_at", "null") \
                 .order("ios_companion_synced_at", desc=True) \
@@ -303,7 +471,9 @@ class SupabaseWorkoutRepository:
 
             # Filter out completed workouts
             if workouts:
-                completed_ids = self._get_completed_workout_ids(profile_id)
+                completed_ids = self._get_completed_workout_ids(
+                    profile_id, [w["id"] for w in workouts]
+                )
                 workouts = [w for w in workouts if w["id"] not in completed_ids]
 
             return workouts
@@ -311,14 +481,20 @@ class SupabaseWorkoutRepository:
             logger.error(f"Failed to get incoming workouts for {profile_id}: {e}")
             return []
 
-    def _get_completed_workout_ids(self, profile_id: str) -> set:
-        """Get IDs of workouts that the user has completed."""
+    def _get_completed_workout_ids(
+        self,
+        profile_id: str,
+        workout_ids: Optional[List[str]] = None,
+    ) -> set:
+        """Get IDs of workouts that the user has completed, optionally limited to ``workout_ids``."""
         try:
-            result = self._client.table("workout_completions") \
+            query = self._client.table("workout_completions") \
                 .select("workout_id") \
                 .eq("user_id", profile_id) \
-                .not_.is_("workout_id", "null") \
-                .execute()
+                .not_.is_("workout_id", "null")
+            if workout_ids is not None:
+                query = query.in_("workout_id", list(workout_ids))
+            result = query.execute()
 
             if result.data:
                 return {r["workout_id"] for r in result.data if r.get("workout_id")}
@@ -327,6 +503,22 @@ class SupabaseWorkoutRepository:
             logger.error(f"Failed to get completed workout IDs for {profile_id}: {e}")
             return set()
 
+    def get_sync_version(self, profile_id: str) -> Optional[int]:
+        """Get the user's sync version counter (bumped by DB triggers)."""
+        try:
+            result = self._client.table("user_sync_versions") \
+                .select("version") \
+                .eq("user_id", profile_id) \
+                .limit(1) \
+                .execute()
+
+            if result.data:
+                return int(result.data[0]["version"])
+            return 0
+        except Exception as e:
+            logger.error(f"Failed to get sync version for {profile_id}: {e}")
+            return None
+
     def get_sync_status(
         self,
         workout_id: str,
@@ -471,9 +663,16 @@ class SupabaseWorkoutRepository:
             }, on_conflict="workout_id,device_type,device_id").execute()
 
             if result.data and len(result.data) > 0:
+                queued_at = result.data[0].get("queued_at")
+                publish_sync_event(user_id, SYNC_QUEUED, {
+                    "workout_id": workout_id,
+                    "device_type": device_type,
+                    "device_id": device_id or "",
+                    "queued_at": queued_at,
+                })
                 return {
                     "status": "pending",
-                    "queued_at": result.data[0].get("queued_at")
+                    "queued_at": queued_at
                 }
 
             logger.warning(f"No data returned from sync queue upsert for workout {workout_id}")
@@ -528,9 +727,16 @@ class SupabaseWorkoutRepository:
             ).execute()
 
             if result.data and len(result.data) > 0:
+                synced_at = result.data[0].get("synced_at")
+                publish_sync_event(user_id, SYNC_CONFIRMED, {
+                    "workout_id": workout_id,
+                    "device_type": device_type,
+                    "device_id": device_id or "",
+                    "synced_at": synced_at,
+                })
                 return {
                     "status": "synced",
-                    "synced_at": result.data[0].get("synced_at")
+                    "synced_at": synced_at
                 }
 
             logger.warning(f"No sync queue entry found for workout {workout_id}")
@@ -562,9 +768,17 @@ class SupabaseWorkoutRepository:
             ).execute()
 
             if result.data and len(result.data) > 0:
+                failed_at = result.data[0].get("failed_at")
+                publish_sync_event(user_id, SYNC_FAILED, {
+                    "workout_id": workout_id,
+                    "device_type": device_type,
+                    "device_id": device_id or "",
+                    "failed_at": failed_at,
+                    "error_message": error_message,
+                })
                 return {
                     "status": "failed",
-                    "failed_at": result.data[0].get("failed_at"),
+                    "failed_at": failed_at,
                     "error_message": error_message
                 }
 
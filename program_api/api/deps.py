@@ -7,7 +7,8 @@ This module provides FastAPI dependency injection functions that return
 interface types (Protocols) rather than concrete implementations.
 
 Architecture:
-- Settings and Supabase client are cached per-process (lru_cache)
+- Settings, Supabase client, exercise catalog and program tree cache are cached
+  per-process (lru_cache)
 - Repository providers create new instances per-request
 - Auth providers extract user from headers
 
@@ -36,6 +37,9 @@ from supabase import Client, create_client
 
 from application.ports import ExerciseRepository, ProgramRepository, TemplateRepository
 from infrastructure.db import (
+    CatalogExerciseRepository,
+    ExerciseCatalog,
+    ProgramTreeCache,
     SupabaseExerciseRepository,
     SupabaseProgramRepository,
     SupabaseTemplateRepository,
@@ -113,13 +117,29 @@ def get_supabase_client_required() -> Client:
 # =============================================================================
 
 
+@lru_cache
+def get_program_tree_cache() -> ProgramTreeCache:
+    """
+    Get the process-wide cache of program trees.
+
+    Returns:
+        ProgramTreeCache: Cache shared by every SupabaseProgramRepository
+    """
+    settings = get_settings()
+    return ProgramTreeCache(
+        max_entries=settings.program_tree_cache_max_entries,
+        ttl_seconds=settings.program_tree_cache_ttl_seconds,
+    )
+
+
 def get_program_repo(
     client: Client = Depends(get_supabase_client_required),
 ) -> ProgramRepository:
     """
     Get ProgramRepository implementation.
 
-    Returns a SupabaseProgramRepository instance with injected client.
+    Returns a SupabaseProgramRepository instance with injected client and
+    the shared program tree cache.
     The return type is the Protocol to enable easy mocking.
 
     Args:
@@ -128,7 +148,7 @@ def get_program_repo(
     Returns:
         ProgramRepository: Repository for program persistence
     """
-    return SupabaseProgramRepository(client)
+    return SupabaseProgramRepository(client, cache=get_program_tree_cache())
 
 
 def get_template_repo(
@@ -149,13 +169,33 @@ def get_template_repo(
     return SupabaseTemplateRepository(client)
 
 
+@lru_cache
+def get_exercise_catalog(client: Client) -> ExerciseCatalog:
+    """
+    Get the process-wide exercise catalog replica for a Supabase client.
+
+    Cached per client so every request shares one in-memory catalog.
+
+    Args:
+        client: Supabase client used to load and version-check the catalog
+
+    Returns:
+        ExerciseCatalog: Periodically refreshed exercise catalog
+    """
+    return ExerciseCatalog.from_client(
+        client,
+        refresh_interval=get_settings().exercise_catalog_refresh_seconds,
+    )
+
+
 def get_exercise_repo(
     client: Client = Depends(get_supabase_client_required),
 ) -> ExerciseRepository:
     """
     Get ExerciseRepository implementation.
 
-    Returns a SupabaseExerciseRepository instance with injected client.
+    Returns a CatalogExerciseRepository served from the in-process catalog
+    replica, falling back to SupabaseExerciseRepository until it loads.
     The return type is the Protocol to enable easy mocking.
 
     Args:
@@ -164,7 +204,10 @@ def get_exercise_repo(
     Returns:
         ExerciseRepository: Repository for exercise data access
     """
-    return SupabaseExerciseRepository(client)
+    return CatalogExerciseRepository(
+        get_exercise_catalog(client),
+        fallback=SupabaseExerciseRepository(client),
+    )
 
 
 # =============================================================================
@@ -178,7 +221,8 @@ def get_calendar_client(
     """
     Get CalendarClient instance for Calendar-API communication.
 
-    Returns a CalendarClient configured with the Calendar-API URL from settings.
+    Returns the process-wide CalendarClient for the configured Calendar-API
+    URL, so requests share its connection pool and circuit breaker.
 
     Args:
         settings: Application settings (injected)
@@ -186,7 +230,25 @@ def get_calendar_client(
     Returns:
         CalendarClient: Client for calendar event operations
     """
-    return CalendarClient(base_url=settings.calendar_api_url)
+    return _calendar_client_for(settings.calendar_api_url)
+
+
+_calendar_clients: dict[str, CalendarClient] = {}
+
+
+def _calendar_client_for(base_url: str) -> CalendarClient:
+    client = _calendar_clients.get(base_url)
+    if client is None:
+        client = _calendar_clients.setdefault(base_url, CalendarClient(base_url=base_url))
+    return client
+
+
+async def close_calendar_clients() -> None:
+    """Close pooled Calendar-API connections (called on app shutdown)."""
+    clients = list(_calendar_clients.values())
+    _calendar_clients.clear()
+    for client in clients:
+        await client.aclose()
 
 
 # =============================================================================
@@ -336,11 +398,14 @@ __all__ = [
     "get_supabase_client",
     "get_supabase_client_required",
     # Repositories
+    "get_exercise_catalog",
     "get_exercise_repo",
     "get_program_repo",
+    "get_program_tree_cache",
     "get_template_repo",
     # Calendar
     "get_calendar_client",
+    "close_calendar_clients",
     # Authentication
     "get_current_user",
     "get_optional_user",
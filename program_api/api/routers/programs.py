@@ -230,10 +230,14 @@ async def get_program(
     """
     logger.info(f"Getting program {program_id} for user {user_id}")
 
-    program = _get_program_or_404(program_id, user_id, program_repo)
+    # Program, weeks and workouts in a single read
+    program = program_repo.get_program_tree(str(program_id))
+    if not program:
+        raise ProgramNotFoundError(program_id)
+    if program.get("user_id") != user_id:
+        raise ProgramAccessDeniedError(program_id)
 
-    # Get weeks with workouts
-    weeks = program_repo.get_weeks(str(program_id))
+    weeks = program.pop("weeks", [])
 
     return _build_training_program(program, weeks)
 
@@ -79,6 +79,19 @@ class ProgramRepository(Protocol):
         """
         ...
 
+    def get_program_tree(self, program_id: str) -> Optional[Dict]:
+        """
+        Get a program with its weeks and workouts.
+
+        Args:
+            program_id: The program's UUID as string
+
+        Returns:
+            Program dictionary with nested "weeks" (each with "workouts"),
+            or None if not found
+        """
+        ...
+
     def get_weeks(self, program_id: str) -> List[Dict]:
         """
         Get all weeks for a program.
@@ -22,7 +22,8 @@ Usage:
 """
 
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import sentry_sdk
 from fastapi import FastAPI
@@ -55,6 +56,7 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
         title="AmakaFlow Program API",
         description="Training program generation and management API",
         version="1.0.0",
+        lifespan=_lifespan,
     )
 
     # Configure CORS middleware
@@ -66,6 +68,15 @@ def create_app(settings: Optional[Settings] = None) -> FastAPI:
     return app
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Shutdown hook closing pooled outbound connections."""
+    yield
+
+    from api.deps import close_calendar_clients
+    await close_calendar_clients()
+
+
 def _init_sentry(settings: Settings) -> None:
     """Initialize Sentry SDK if DSN is configured."""
     if settings.sentry_dsn:
@@ -105,6 +105,26 @@ class Settings(BaseSettings):
         description="Shared secret for service-to-service authentication",
     )
 
+    # -------------------------------------------------------------------------
+    # Exercise Catalog Replica
+    # -------------------------------------------------------------------------
+    exercise_catalog_refresh_seconds: float = Field(
+        default=300.0,
+        description="Seconds between version checks of the in-process exercise catalog",
+    )
+
+    # -------------------------------------------------------------------------
+    # Program Tree Cache
+    # -------------------------------------------------------------------------
+    program_tree_cache_ttl_seconds: float = Field(
+        default=60.0,
+        description="Seconds a cached program/weeks/workouts tree is served before refetching",
+    )
+    program_tree_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum number of program trees kept in the per-process cache",
+    )
+
     # -------------------------------------------------------------------------
     # Validators
     # -------------------------------------------------------------------------
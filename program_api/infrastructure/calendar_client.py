@@ -6,11 +6,17 @@ AMA-469: Calendar Integration for Program Workouts
 This client handles communication with the Calendar-API service for
 creating, retrieving, and deleting program workout events on the user's
 calendar.
+
+Requests share one pooled keep-alive connection pool per client instance
+(HTTP/2 when the h2 package is installed), and a circuit breaker fails
+calls fast with CalendarAPIUnavailable while Calendar-API is down.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import date, time
+from time import monotonic
 from typing import Any, Optional
 from uuid import UUID
 
@@ -18,6 +24,12 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+try:  # HTTP/2 needs the optional h2 package
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    HTTP2_AVAILABLE = False
+
 
 @dataclass
 class ProgramEventData:
@@ -109,6 +121,9 @@ class CalendarClient:
         self,
         base_url: str,
         timeout: float = 30.0,
+        max_connections: int = 20,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
     ):
         """
         Initialize the calendar client.
@@ -116,9 +131,60 @@ class CalendarClient:
         Args:
             base_url: Base URL of the Calendar-API (e.g., "http://calendar-api:8001")
             timeout: Request timeout in seconds
+            max_connections: Connection pool size
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds before an open circuit allows a trial request
         """
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._max_connections = max_connections
+        self._failure_threshold = max(1, failure_threshold)
+        self._reset_timeout = reset_timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Pooled client for the running event loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                http2=HTTP2_AVAILABLE,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool, tracking Calendar-API health."""
+        if self._opened_at is not None:
+            if monotonic() - self._opened_at < self._reset_timeout:
+                raise CalendarAPIUnavailable("Calendar-API is unavailable (circuit open)")
+            # Half-open: this request is the trial
+            self._opened_at = None
+            self._failures = self._failure_threshold - 1
+
+        try:
+            response = await getattr(self._get_client(), method)(url, **kwargs)
+        except httpx.TransportError:
+            self._failures += 1
+            if self._failures >= self._failure_threshold:
+                self._opened_at = monotonic()
+            raise
+        self._failures = 0
+        return response
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        self._client_loop = None
 
     async def bulk_create_program_events(
         self,
@@ -154,25 +220,24 @@ class CalendarClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(url, json=payload, headers=headers)
-
-                if response.status_code == 201:
-                    data = response.json()
-                    return BulkCreateResult(
-                        program_id=UUID(data["program_id"]),
-                        events_created=data["events_created"],
-                        event_ids=[UUID(eid) for eid in data["event_ids"]],
-                        event_mapping=data.get("event_mapping", {}),
-                    )
-                else:
-                    logger.error(
-                        f"Calendar-API error: {response.status_code} - {response.text}"
-                    )
-                    raise CalendarAPIError(
-                        f"Failed to create program events: {response.text}",
-                        response.status_code,
-                    )
+            response = await self._request("post", url, json=payload, headers=headers)
+
+            if response.status_code == 201:
+                data = response.json()
+                return BulkCreateResult(
+                    program_id=UUID(data["program_id"]),
+                    events_created=data["events_created"],
+                    event_ids=[UUID(eid) for eid in data["event_ids"]],
+                    event_mapping=data.get("event_mapping", {}),
+                )
+            else:
+                logger.error(
+                    f"Calendar-API error: {response.status_code} - {response.text}"
+                )
+                raise CalendarAPIError(
+                    f"Failed to create program events: {response.text}",
+                    response.status_code,
+                )
 
         except httpx.ConnectError as e:
             logger.error(f"Calendar-API unavailable: {e}")
@@ -211,24 +276,23 @@ class CalendarClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url, headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return ProgramEventsResult(
-                        program_id=UUID(data["program_id"]),
-                        events=data["events"],
-                        total=data["total"],
-                    )
-                else:
-                    logger.error(
-                        f"Calendar-API error: {response.status_code} - {response.text}"
-                    )
-                    raise CalendarAPIError(
-                        f"Failed to get program events: {response.text}",
-                        response.status_code,
-                    )
+            response = await self._request("get", url, headers=headers)
+
+            if response.status_code == 200:
+                data = response.json()
+                return ProgramEventsResult(
+                    program_id=UUID(data["program_id"]),
+                    events=data["events"],
+                    total=data["total"],
+                )
+            else:
+                logger.error(
+                    f"Calendar-API error: {response.status_code} - {response.text}"
+                )
+                raise CalendarAPIError(
+                    f"Failed to get program events: {response.text}",
+                    response.status_code,
+                )
 
         except httpx.ConnectError as e:
             logger.error(f"Calendar-API unavailable: {e}")
@@ -267,20 +331,19 @@ class CalendarClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.delete(url, headers=headers)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("events_deleted", 0)
-                else:
-                    logger.error(
-                        f"Calendar-API error: {response.status_code} - {response.text}"
-                    )
-                    raise CalendarAPIError(
-                        f"Failed to delete program events: {response.text}",
-                        response.status_code,
-                    )
+            response = await self._request("delete", url, headers=headers)
+
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("events_deleted", 0)
+            else:
+                logger.error(
+                    f"Calendar-API error: {response.status_code} - {response.text}"
+                )
+                raise CalendarAPIError(
+                    f"Failed to delete program events: {response.text}",
+                    response.status_code,
+                )
 
         except httpx.ConnectError as e:
             logger.error(f"Calendar-API unavailable: {e}")
@@ -0,0 +1,429 @@
+"""
+In-process replica of the exercises catalog.
+
+Part of AMA-462: Implement ProgramGenerator Service
+
+Program generation queries the exercise catalog once or more per workout
+slot. The catalog is a few hundred rows of reference data that rarely
+changes, so instead of a remote query per lookup the whole table is held in
+memory with inverted indexes, stored as integer bitsets over catalog
+positions, for muscles, equipment, movement pattern and category. Filters
+become bitwise ANDs/ORs and generation makes no network calls per slot.
+
+The replica re-checks a cheap version probe (row count and latest
+``updated_at``) every ``refresh_interval`` seconds and reloads only when it
+changed. If the catalog has never loaded, CatalogExerciseRepository falls
+back to SupabaseExerciseRepository so requests still succeed.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from supabase import Client
+
+from infrastructure.db.exercise_repository import (
+    WORKOUT_TYPE_MAPPINGS,
+    SupabaseExerciseRepository,
+    similarity_score,
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds between version checks against the database
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Rows per request when loading the catalog
+LOAD_PAGE_SIZE = 1000
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Positions of the set bits in ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class ExerciseIndex:
+    """
+    Immutable, indexed snapshot of the exercise catalog.
+
+    Query methods mirror SupabaseExerciseRepository, including its filter
+    semantics (array overlap/containment, equality), and return copies so
+    callers cannot mutate the shared snapshot.
+    """
+
+    def __init__(self, exercises: Iterable[Dict], version: Any = None):
+        self.version = version
+        self._exercises: List[Dict] = sorted(exercises, key=lambda ex: ex.get("id") or "")
+        self._all = (1 << len(self._exercises)) - 1
+
+        self._by_id: Dict[str, int] = {}
+        self._by_name: Dict[str, int] = {}
+        self._by_name_lower: Dict[str, int] = {}
+        self._by_alias: Dict[str, int] = defaultdict(int)
+        self._by_alias_lower: Dict[str, int] = defaultdict(int)
+        self._primary: Dict[str, int] = defaultdict(int)
+        self._secondary: Dict[str, int] = defaultdict(int)
+        self._equipment: Dict[str, int] = defaultdict(int)
+        self._pattern: Dict[Any, int] = defaultdict(int)
+        self._category: Dict[Any, int] = defaultdict(int)
+        self._supports_1rm: Dict[Any, int] = defaultdict(int)
+
+        for position, ex in enumerate(self._exercises):
+            bit = 1 << position
+            self._by_id.setdefault(ex.get("id"), position)
+            name = ex.get("name") or ""
+            self._by_name.setdefault(name, position)
+            self._by_name_lower.setdefault(name.lower(), position)
+            for alias in ex.get("aliases") or []:
+                self._by_alias[alias] |= bit
+                self._by_alias_lower[alias.lower()] |= bit
+            for muscle in ex.get("primary_muscles") or []:
+                self._primary[muscle] |= bit
+            for muscle in ex.get("secondary_muscles") or []:
+                self._secondary[muscle] |= bit
+            for item in ex.get("equipment") or []:
+                self._equipment[item] |= bit
+            self._pattern[ex.get("movement_pattern")] |= bit
+            self._category[ex.get("category")] |= bit
+            self._supports_1rm[ex.get("supports_1rm")] |= bit
+
+    def __len__(self) -> int:
+        return len(self._exercises)
+
+    # -------------------------------------------------------------------------
+    # Bitset helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _any(index: Dict[str, int], keys: Iterable[str]) -> int:
+        mask = 0
+        for key in keys:
+            mask |= index.get(key, 0)
+        return mask
+
+    def _all_of(self, index: Dict[str, int], keys: Iterable[str]) -> int:
+        mask = self._all
+        for key in keys:
+            mask &= index.get(key, 0)
+        return mask
+
+    def _rows(self, mask: int, limit: Optional[int] = None) -> List[Dict]:
+        rows = []
+        for position in _bits(mask):
+            if limit is not None and len(rows) >= limit:
+                break
+            rows.append(dict(self._exercises[position]))
+        return rows
+
+    # -------------------------------------------------------------------------
+    # ExerciseRepository queries
+    # -------------------------------------------------------------------------
+
+    def get_by_id(self, exercise_id: str) -> Optional[Dict]:
+        position = self._by_id.get(exercise_id)
+        return dict(self._exercises[position]) if position is not None else None
+
+    def get_by_name(self, name: str) -> Optional[Dict]:
+        position = self._by_name.get(name)
+        return dict(self._exercises[position]) if position is not None else None
+
+    def search_by_alias(self, alias: str) -> List[Dict]:
+        return self._rows(self._by_alias.get(alias, 0))
+
+    def get_by_muscle_groups(
+        self,
+        primary_muscles: List[str],
+        include_secondary: bool = False,
+    ) -> List[Dict]:
+        primary = self._any(self._primary, primary_muscles)
+        rows = self._rows(primary)
+        if include_secondary:
+            # Primary matches first, then secondary-only matches
+            rows.extend(self._rows(self._any(self._secondary, primary_muscles) & ~primary))
+        return rows
+
+    def get_by_equipment(
+        self,
+        equipment: List[str],
+        require_all: bool = False,
+    ) -> List[Dict]:
+        if require_all:
+            return self._rows(self._all_of(self._equipment, equipment))
+        return self._rows(self._any(self._equipment, equipment))
+
+    def get_by_movement_pattern(self, pattern: str) -> List[Dict]:
+        return self._rows(self._pattern.get(pattern, 0))
+
+    def get_by_category(self, category: str) -> List[Dict]:
+        return self._rows(self._category.get(category, 0))
+
+    def search(
+        self,
+        muscle_groups: Optional[List[str]] = None,
+        equipment: Optional[List[str]] = None,
+        movement_pattern: Optional[str] = None,
+        category: Optional[str] = None,
+        supports_1rm: Optional[bool] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        mask = self._all
+        if muscle_groups:
+            mask &= self._any(self._primary, muscle_groups)
+        if equipment:
+            mask &= self._any(self._equipment, equipment)
+        if movement_pattern:
+            mask &= self._pattern.get(movement_pattern, 0)
+        if category:
+            mask &= self._category.get(category, 0)
+        if supports_1rm is not None:
+            mask &= self._supports_1rm.get(supports_1rm, 0)
+        return self._rows(mask, limit)
+
+    def get_all(self, limit: int = 500) -> List[Dict]:
+        return self._rows(self._all, limit)
+
+    def get_for_workout_type(
+        self,
+        workout_type: str,
+        equipment: List[str],
+        limit: int = 30,
+    ) -> List[Dict]:
+        mapping = WORKOUT_TYPE_MAPPINGS.get(workout_type.lower(), WORKOUT_TYPE_MAPPINGS["full_body"])
+        mask = self._any(self._primary, mapping["muscles"])
+        if equipment:
+            mask &= self._any(self._equipment, equipment)
+        return self._rows(mask, limit)
+
+    def get_similar_exercises(
+        self,
+        exercise_id: str,
+        limit: int = 5,
+    ) -> List[Dict]:
+        position = self._by_id.get(exercise_id)
+        if position is None:
+            return []
+        source = self._exercises[position]
+        movement_pattern = source.get("movement_pattern")
+        if not movement_pattern or not source.get("primary_muscles"):
+            return []
+
+        candidates = self._rows(self._pattern.get(movement_pattern, 0) & ~(1 << position))
+        scored = [(ex, similarity_score(source, ex)) for ex in candidates]
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return [ex for ex, score in scored[:limit]]
+
+    def validate_exercise_name(self, name: str) -> Optional[Dict]:
+        if not name or not name.strip():
+            return None
+        name = name.strip()
+
+        position = self._by_name_lower.get(name.lower())
+        if position is not None:
+            return dict(self._exercises[position])
+
+        for mask in (self._by_alias.get(name, 0), self._by_alias_lower.get(name.lower(), 0)):
+            if mask:
+                return self._rows(mask, 1)[0]
+        return None
+
+
+def load_exercises(client: Client) -> List[Dict]:
+    """Read the full exercises table in pages."""
+    exercises: List[Dict] = []
+    offset = 0
+    while True:
+        response = (
+            client.table("exercises")
+            .select("*")
+            .order("id")
+            .range(offset, offset + LOAD_PAGE_SIZE - 1)
+            .execute()
+        )
+        page = response.data or []
+        exercises.extend(page)
+        if len(page) < LOAD_PAGE_SIZE:
+            return exercises
+        offset += len(page)
+
+
+def probe_version(client: Client) -> Tuple[Optional[int], Optional[str]]:
+    """Cheap catalog version: (row count, latest updated_at)."""
+    response = (
+        client.table("exercises")
+        .select("updated_at", count="exact")
+        .order("updated_at", desc=True)
+        .limit(1)
+        .execute()
+    )
+    latest = response.data[0].get("updated_at") if response.data else None
+    return response.count, latest
+
+
+class ExerciseCatalog:
+    """
+    Periodically refreshed, process-wide ExerciseIndex.
+
+    ``index()`` returns the current snapshot, loading it on first use and
+    re-checking the version once per ``refresh_interval``. Refresh failures
+    keep serving the previous snapshot.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], List[Dict]],
+        version_probe: Optional[Callable[[], Any]] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self._version_probe = version_probe
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Optional[ExerciseIndex] = None
+        self._checked_at = 0.0
+
+    @classmethod
+    def from_client(
+        cls,
+        client: Client,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> "ExerciseCatalog":
+        return cls(
+            loader=lambda: load_exercises(client),
+            version_probe=lambda: probe_version(client),
+            refresh_interval=refresh_interval,
+        )
+
+    def index(self) -> Optional[ExerciseIndex]:
+        """Current snapshot, or None if the catalog could not be loaded."""
+        index = self._index
+        if index is not None and self._clock() - self._checked_at < self._refresh_interval:
+            return index
+
+        with self._lock:
+            if self._index is not None and self._clock() - self._checked_at < self._refresh_interval:
+                return self._index
+            self._refresh()
+            return self._index
+
+    def invalidate(self) -> None:
+        """Force a version check on the next access."""
+        self._checked_at = float("-inf")
+
+    def _refresh(self) -> None:
+        version = None
+        if self._version_probe is not None:
+            try:
+                version = self._version_probe()
+            except Exception as e:
+                logger.warning(f"Exercise catalog version check failed, reloading: {e}")
+            else:
+                if self._index is not None and version == self._index.version:
+                    self._checked_at = self._clock()
+                    return
+
+        try:
+            exercises = self._loader()
+        except Exception as e:
+            if self._index is None:
+                logger.error(f"Failed to load exercise catalog: {e}")
+            else:
+                logger.warning(f"Failed to refresh exercise catalog, keeping previous snapshot: {e}")
+            self._checked_at = self._clock()
+            return
+
+        self._index = ExerciseIndex(exercises, version=version)
+        self._checked_at = self._clock()
+        logger.info(f"Loaded {len(self._index)} exercises into catalog (version {version})")
+
+
+class CatalogExerciseRepository:
+    """
+    ExerciseRepository served from the in-process ExerciseCatalog.
+
+    Falls back to the Supabase repository while the catalog is unavailable.
+    """
+
+    def __init__(self, catalog: ExerciseCatalog, fallback: SupabaseExerciseRepository):
+        self._catalog = catalog
+        self._fallback = fallback
+
+    def _query(self, method: str, *args, **kwargs):
+        index = self._catalog.index()
+        target = index if index is not None else self._fallback
+        return getattr(target, method)(*args, **kwargs)
+
+    def get_by_id(self, exercise_id: str) -> Optional[Dict]:
+        return self._query("get_by_id", exercise_id)
+
+    def get_by_name(self, name: str) -> Optional[Dict]:
+        return self._query("get_by_name", name)
+
+    def search_by_alias(self, alias: str) -> List[Dict]:
+        return self._query("search_by_alias", alias)
+
+    def get_by_muscle_groups(
+        self,
+        primary_muscles: List[str],
+        include_secondary: bool = False,
+    ) -> List[Dict]:
+        return self._query("get_by_muscle_groups", primary_muscles, include_secondary)
+
+    def get_by_equipment(
+        self,
+        equipment: List[str],
+        require_all: bool = False,
+    ) -> List[Dict]:
+        return self._query("get_by_equipment", equipment, require_all)
+
+    def get_by_movement_pattern(self, pattern: str) -> List[Dict]:
+        return self._query("get_by_movement_pattern", pattern)
+
+    def get_by_category(self, category: str) -> List[Dict]:
+        return self._query("get_by_category", category)
+
+    def search(
+        self,
+        muscle_groups: Optional[List[str]] = None,
+        equipment: Optional[List[str]] = None,
+        movement_pattern: Optional[str] = None,
+        category: Optional[str] = None,
+        supports_1rm: Optional[bool] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        return self._query(
+            "search",
+            muscle_groups=muscle_groups,
+            equipment=equipment,
+            movement_pattern=movement_pattern,
+            category=category,
+            supports_1rm=supports_1rm,
+            limit=limit,
+        )
+
+    def get_all(self, limit: int = 500) -> List[Dict]:
+        return self._query("get_all", limit)
+
+    def get_for_workout_type(
+        self,
+        workout_type: str,
+        equipment: List[str],
+        limit: int = 30,
+    ) -> List[Dict]:
+        return self._query("get_for_workout_type", workout_type, equipment, limit)
+
+    def get_similar_exercises(
+        self,
+        exercise_id: str,
+        limit: int = 5,
+    ) -> List[Dict]:
+        return self._query("get_similar_exercises", exercise_id, limit)
+
+    def validate_exercise_name(self, name: str) -> Optional[Dict]:
+        return self._query("validate_exercise_name", name)
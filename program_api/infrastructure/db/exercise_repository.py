@@ -14,6 +14,80 @@ from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+# Workout types mapped to the muscle groups and movement patterns they train
+WORKOUT_TYPE_MAPPINGS: Dict[str, Dict[str, List[str]]] = {
+    "push": {
+        "muscles": ["chest", "anterior_deltoid", "triceps"],
+        "patterns": ["push"],
+    },
+    "pull": {
+        "muscles": ["lats", "rhomboids", "biceps", "rear_deltoid"],
+        "patterns": ["pull"],
+    },
+    "legs": {
+        "muscles": ["quadriceps", "hamstrings", "glutes", "calves"],
+        "patterns": ["squat", "hinge"],
+    },
+    "upper": {
+        "muscles": [
+            "chest",
+            "lats",
+            "anterior_deltoid",
+            "rear_deltoid",
+            "triceps",
+            "biceps",
+        ],
+        "patterns": ["push", "pull"],
+    },
+    "lower": {
+        "muscles": ["quadriceps", "hamstrings", "glutes", "calves", "hip_flexors"],
+        "patterns": ["squat", "hinge"],
+    },
+    "full_body": {
+        "muscles": [
+            "chest",
+            "lats",
+            "quadriceps",
+            "hamstrings",
+            "glutes",
+            "anterior_deltoid",
+        ],
+        "patterns": ["push", "pull", "squat", "hinge"],
+    },
+}
+
+
+def similarity_score(source: Dict, ex: Dict) -> float:
+    """
+    Score how well ``ex`` substitutes for ``source``.
+
+    Weighted as 60% primary-muscle overlap, 30% same category and 10%
+    equipment overlap.
+    """
+    score = 0.0
+    ex_muscles = set(ex.get("primary_muscles") or [])
+    source_muscles = set(source.get("primary_muscles") or [])
+
+    # Muscle overlap (0-1)
+    if source_muscles:
+        overlap = len(ex_muscles & source_muscles) / len(source_muscles)
+        score += overlap * 0.6  # 60% weight for muscle overlap
+
+    # Same category bonus
+    if ex.get("category") == source.get("category"):
+        score += 0.3  # 30% weight for same category
+
+    # Same equipment type bonus
+    ex_equipment = set(ex.get("equipment") or [])
+    source_equipment = set(source.get("equipment") or [])
+    if ex_equipment and source_equipment:
+        equipment_overlap = len(ex_equipment & source_equipment) / max(
+            len(source_equipment), 1
+        )
+        score += equipment_overlap * 0.1  # 10% weight for equipment similarity
+
+    return score
+
 
 class SupabaseExerciseRepository:
     """
@@ -280,49 +354,7 @@ class SupabaseExerciseRepository:
         Returns:
             List of matching exercise dictionaries
         """
-        # Map workout types to muscle groups and patterns
-        workout_mappings = {
-            "push": {
-                "muscles": ["chest", "anterior_deltoid", "triceps"],
-                "patterns": ["push"],
-            },
-            "pull": {
-                "muscles": ["lats", "rhomboids", "biceps", "rear_deltoid"],
-                "patterns": ["pull"],
-            },
-            "legs": {
-                "muscles": ["quadriceps", "hamstrings", "glutes", "calves"],
-                "patterns": ["squat", "hinge"],
-            },
-            "upper": {
-                "muscles": [
-                    "chest",
-                    "lats",
-                    "anterior_deltoid",
-                    "rear_deltoid",
-                    "triceps",
-                    "biceps",
-                ],
-                "patterns": ["push", "pull"],
-            },
-            "lower": {
-                "muscles": ["quadriceps", "hamstrings", "glutes", "calves", "hip_flexors"],
-                "patterns": ["squat", "hinge"],
-            },
-            "full_body": {
-                "muscles": [
-                    "chest",
-                    "lats",
-                    "quadriceps",
-                    "hamstrings",
-                    "glutes",
-                    "anterior_deltoid",
-                ],
-                "patterns": ["push", "pull", "squat", "hinge"],
-            },
-        }
-
-        mapping = workout_mappings.get(workout_type.lower(), workout_mappings["full_body"])
+        mapping = WORKOUT_TYPE_MAPPINGS.get(workout_type.lower(), WORKOUT_TYPE_MAPPINGS["full_body"])
 
         # Build query with equipment filter and muscle group filter
         query = (
@@ -366,7 +398,6 @@ class SupabaseExerciseRepository:
 
             movement_pattern = source.get("movement_pattern")
             primary_muscles = source.get("primary_muscles", [])
-            category = source.get("category")
 
             if not movement_pattern or not primary_muscles:
                 return []
@@ -382,34 +413,8 @@ class SupabaseExerciseRepository:
             response = query.execute()
             candidates = response.data or []
 
-            # Score candidates by similarity
-            def score_exercise(ex: Dict) -> float:
-                score = 0.0
-                ex_muscles = set(ex.get("primary_muscles") or [])
-                source_muscles = set(primary_muscles)
-
-                # Muscle overlap (0-1)
-                if source_muscles:
-                    overlap = len(ex_muscles & source_muscles) / len(source_muscles)
-                    score += overlap * 0.6  # 60% weight for muscle overlap
-
-                # Same category bonus
-                if ex.get("category") == category:
-                    score += 0.3  # 30% weight for same category
-
-                # Same equipment type bonus
-                ex_equipment = set(ex.get("equipment") or [])
-                source_equipment = set(source.get("equipment") or [])
-                if ex_equipment and source_equipment:
-                    equipment_overlap = len(ex_equipment & source_equipment) / max(
-                        len(source_equipment), 1
-                    )
-                    score += equipment_overlap * 0.1  # 10% weight for equipment similarity
-
-                return score
-
             # Score and sort candidates
-            scored = [(ex, score_exercise(ex)) for ex in candidates]
+            scored = [(ex, similarity_score(source, ex)) for ex in candidates]
             scored.sort(key=lambda x: x[1], reverse=True)
 
             return [ex for ex, score in scored[:limit]]
@@ -6,15 +6,109 @@ Part of AMA-461: Create program-api service scaffold
 This implementation uses the Supabase Python client to interact with
 the training_programs, program_weeks, and program_workouts tables
 defined in AMA-460.
+
+Program reads fetch the whole program -> weeks -> workouts tree with a
+single embedded-resource select and keep it in a per-program cache that is
+invalidated by every write going through the repository.
 """
 
+import copy
 import json
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 
 from supabase import Client
 
 from application.exceptions import ProgramCreationError
 
+# Embedded selects: PostgREST resolves the FKs and returns nested rows
+PROGRAM_TREE_SELECT = "*, weeks:program_weeks(*, workouts:program_workouts(*))"
+
+DEFAULT_TREE_CACHE_SIZE = 1024
+DEFAULT_TREE_CACHE_TTL_SECONDS = 60.0
+
+
+def _sort_tree(program: Dict) -> Dict:
+    """Order embedded weeks by week_number and their workouts by order_index."""
+    weeks = sorted(program.get("weeks") or [], key=lambda w: w.get("week_number", 0))
+    for week in weeks:
+        week["workouts"] = sorted(
+            week.get("workouts") or [], key=lambda wo: wo.get("order_index", 0)
+        )
+    program["weeks"] = weeks
+    return program
+
+
+class ProgramTreeCache:
+    """
+    Bounded per-program cache of program trees.
+
+    Least recently used programs are evicted past ``max_entries``; entries
+    older than ``ttl_seconds`` are treated as missing, which bounds staleness
+    from writes made by other processes. Callers get deep copies so the
+    cached tree cannot be mutated through a response.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_TREE_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_TREE_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._trees: "OrderedDict[str, tuple]" = OrderedDict()
+        self._week_programs: Dict[str, str] = {}
+
+    def get(self, program_id: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._trees.get(program_id)
+            if entry is None:
+                return None
+            stored_at, tree = entry
+            if self._clock() - stored_at > self._ttl_seconds:
+                self._remove(program_id)
+                return None
+            self._trees.move_to_end(program_id)
+            return copy.deepcopy(tree)
+
+    def put(self, program_id: str, tree: Dict) -> None:
+        with self._lock:
+            self._remove(program_id)
+            self._trees[program_id] = (self._clock(), copy.deepcopy(tree))
+            for week in tree.get("weeks", []):
+                if week.get("id"):
+                    self._week_programs[str(week["id"])] = program_id
+            while len(self._trees) > self._max_entries:
+                self._remove(next(iter(self._trees)))
+
+    def invalidate(self, program_id: str) -> None:
+        with self._lock:
+            self._remove(program_id)
+
+    def invalidate_week(self, week_id: str) -> None:
+        """Drop the cached tree that contains ``week_id``, if any."""
+        with self._lock:
+            program_id = self._week_programs.get(week_id)
+            if program_id is not None:
+                self._remove(program_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._trees.clear()
+            self._week_programs.clear()
+
+    def _remove(self, program_id: str) -> None:
+        entry = self._trees.pop(program_id, None)
+        if entry is None:
+            return
+        for week in entry[1].get("weeks", []):
+            self._week_programs.pop(str(week.get("id")), None)
+
 
 class SupabaseProgramRepository:
     """
@@ -26,14 +120,16 @@ class SupabaseProgramRepository:
     - program_workouts: Individual workouts within weeks
     """
 
-    def __init__(self, client: Client):
+    def __init__(self, client: Client, cache: Optional[ProgramTreeCache] = None):
         """
         Initialize repository with Supabase client.
 
         Args:
             client: Authenticated Supabase client
+            cache: Optional process-wide cache of program trees
         """
         self._client = client
+        self._cache = cache
 
     def get_by_user(self, user_id: str) -> List[Dict]:
         """
@@ -64,6 +160,12 @@ class SupabaseProgramRepository:
         Returns:
             Program dictionary if found, None otherwise
         """
+        if self._cache is not None:
+            tree = self._cache.get(program_id)
+            if tree is not None:
+                tree.pop("weeks", None)
+                return tree
+
         response = (
             self._client.table("training_programs")
             .select("*")
@@ -107,6 +209,7 @@ class SupabaseProgramRepository:
             .eq("id", program_id)
             .execute()
         )
+        self._invalidate(program_id)
         return response.data[0]
 
     def delete(self, program_id: str) -> bool:
@@ -127,40 +230,51 @@ class SupabaseProgramRepository:
             .eq("id", program_id)
             .execute()
         )
+        self._invalidate(program_id)
         return len(response.data) > 0
 
-    def get_weeks(self, program_id: str) -> List[Dict]:
+    def get_program_tree(self, program_id: str) -> Optional[Dict]:
         """
-        Get all weeks for a program with their workouts.
+        Get a program with its weeks and workouts in one round trip.
 
         Args:
             program_id: The program's UUID as string
 
         Returns:
-            List of week dictionaries with nested workouts
+            Program dictionary with a "weeks" list (each week carrying its
+            "workouts"), or None if the program doesn't exist
         """
-        # Get weeks
-        weeks_response = (
-            self._client.table("program_weeks")
-            .select("*")
-            .eq("program_id", program_id)
-            .order("week_number")
+        if self._cache is not None:
+            tree = self._cache.get(program_id)
+            if tree is not None:
+                return tree
+
+        response = (
+            self._client.table("training_programs")
+            .select(PROGRAM_TREE_SELECT)
+            .eq("id", program_id)
             .execute()
         )
-        weeks = weeks_response.data
+        if not response.data:
+            return None
 
-        # Get workouts for each week
-        for week in weeks:
-            workouts_response = (
-                self._client.table("program_workouts")
-                .select("*")
-                .eq("program_week_id", week["id"])
-                .order("order_index")
-                .execute()
-            )
-            week["workouts"] = workouts_response.data
+        tree = _sort_tree(response.data[0])
+        if self._cache is not None:
+            self._cache.put(program_id, tree)
+        return tree
 
-        return weeks
+    def get_weeks(self, program_id: str) -> List[Dict]:
+        """
+        Get all weeks for a program with their workouts.
+
+        Args:
+            program_id: The program's UUID as string
+
+        Returns:
+            List of week dictionaries with nested workouts
+        """
+        tree = self.get_program_tree(program_id)
+        return tree["weeks"] if tree else []
 
     def create_week(self, program_id: str, data: Dict) -> Dict:
         """
@@ -179,6 +293,7 @@ class SupabaseProgramRepository:
             .insert(data)
             .execute()
         )
+        self._invalidate(program_id)
         return response.data[0]
 
     def create_workout(self, week_id: str, data: Dict) -> Dict:
@@ -198,6 +313,8 @@ class SupabaseProgramRepository:
             .insert(data)
             .execute()
         )
+        if self._cache is not None:
+            self._cache.invalidate_week(week_id)
         return response.data[0]
 
     def create_program_atomic(
@@ -239,3 +356,7 @@ class SupabaseProgramRepository:
             if isinstance(e, ProgramCreationError):
                 raise
             raise ProgramCreationError(f"Atomic program creation failed: {e}") from e
+
+    def _invalidate(self, program_id: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(program_id)
@@ -175,6 +175,21 @@ class FakeProgramRepository:
             return True
         return False
 
+    def get_program_tree(self, program_id: str) -> Optional[Dict]:
+        """
+        Get a program with its weeks and workouts.
+
+        Args:
+            program_id: The program's UUID as string
+
+        Returns:
+            Program dictionary with nested weeks, or None if not found
+        """
+        program = self._programs.get(program_id)
+        if program is None:
+            return None
+        return {**program, "weeks": self.get_weeks(program_id)}
+
     def get_weeks(self, program_id: str) -> List[Dict]:
         """
         Get all weeks for a program with their workouts.
@@ -439,3 +439,42 @@ class TestCalendarClientConfiguration:
         """Default timeout is 30 seconds."""
         client = CalendarClient(base_url="http://calendar-api:8001")
         assert client._timeout == 30.0
+
+
+# ---------------------------------------------------------------------------
+# Connection Pooling and Circuit Breaker Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestCalendarClientPooling:
+    """Tests for the shared connection pool and circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_pooled_client(self, auth_token, program_id):
+        client = CalendarClient(base_url="http://calendar-api:8001")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"events_deleted": 1}
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value.delete = AsyncMock(return_value=mock_response)
+
+            await client.delete_program_events(program_id=program_id, auth_token=auth_token)
+            await client.delete_program_events(program_id=program_id, auth_token=auth_token)
+
+        assert mock_client_class.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_repeated_connect_errors(self, auth_token, program_id):
+        client = CalendarClient(base_url="http://calendar-api:8001", failure_threshold=2)
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+            mock_client_class.return_value.get = mock_get
+
+            for _ in range(3):
+                with pytest.raises(CalendarAPIUnavailable):
+                    await client.get_program_events(program_id=program_id, auth_token=auth_token)
+
+        assert mock_get.call_count == 2
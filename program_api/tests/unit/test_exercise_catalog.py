@@ -0,0 +1,209 @@
+"""
+Unit tests for the in-process exercise catalog replica.
+
+Part of AMA-462: Implement ProgramGenerator Service
+
+Tests cover:
+- Bitset-indexed queries matching the Supabase repository semantics
+- Version-checked refresh and failure handling
+- Fallback to the remote repository while the catalog is unavailable
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.db.exercise_catalog import (
+    CatalogExerciseRepository,
+    ExerciseCatalog,
+    ExerciseIndex,
+)
+
+
+EXERCISES = [
+    {
+        "id": "bench-press",
+        "name": "Barbell Bench Press",
+        "aliases": ["Flat Bench"],
+        "primary_muscles": ["chest"],
+        "secondary_muscles": ["triceps", "anterior_deltoid"],
+        "equipment": ["barbell", "bench"],
+        "category": "compound",
+        "movement_pattern": "push",
+        "supports_1rm": True,
+    },
+    {
+        "id": "dumbbell-bench-press",
+        "name": "Dumbbell Bench Press",
+        "aliases": [],
+        "primary_muscles": ["chest"],
+        "secondary_muscles": ["triceps"],
+        "equipment": ["dumbbells", "bench"],
+        "category": "compound",
+        "movement_pattern": "push",
+        "supports_1rm": False,
+    },
+    {
+        "id": "push-up",
+        "name": "Push-Up",
+        "aliases": ["Press Up"],
+        "primary_muscles": ["chest", "triceps"],
+        "secondary_muscles": [],
+        "equipment": [],
+        "category": "compound",
+        "movement_pattern": "push",
+        "supports_1rm": False,
+    },
+    {
+        "id": "tricep-pushdown",
+        "name": "Tricep Pushdown",
+        "aliases": [],
+        "primary_muscles": ["triceps"],
+        "secondary_muscles": [],
+        "equipment": ["cable"],
+        "category": "isolation",
+        "movement_pattern": "push",
+        "supports_1rm": False,
+    },
+    {
+        "id": "barbell-squat",
+        "name": "Barbell Back Squat",
+        "aliases": [],
+        "primary_muscles": ["quadriceps", "glutes"],
+        "secondary_muscles": ["hamstrings"],
+        "equipment": ["barbell", "squat_rack"],
+        "category": "compound",
+        "movement_pattern": "squat",
+        "supports_1rm": True,
+    },
+]
+
+
+def _ids(rows):
+    return [row["id"] for row in rows]
+
+
+@pytest.fixture
+def index():
+    return ExerciseIndex(EXERCISES, version=(5, "2025-01-01"))
+
+
+@pytest.mark.unit
+class TestExerciseIndex:
+    """Queries answered from the bitset indexes."""
+
+    def test_lookups_by_id_name_and_alias(self, index):
+        assert index.get_by_id("push-up")["name"] == "Push-Up"
+        assert index.get_by_id("missing") is None
+        assert index.get_by_name("Barbell Back Squat")["id"] == "barbell-squat"
+        assert _ids(index.search_by_alias("Flat Bench")) == ["bench-press"]
+
+    def test_muscle_groups_list_primary_before_secondary(self, index):
+        assert _ids(index.get_by_muscle_groups(["triceps"])) == ["push-up", "tricep-pushdown"]
+        assert _ids(index.get_by_muscle_groups(["triceps"], include_secondary=True)) == [
+            "push-up", "tricep-pushdown", "bench-press", "dumbbell-bench-press",
+        ]
+
+    def test_equipment_overlap_and_containment(self, index):
+        assert _ids(index.get_by_equipment(["barbell"])) == ["barbell-squat", "bench-press"]
+        assert _ids(index.get_by_equipment(["barbell", "bench"], require_all=True)) == ["bench-press"]
+
+    def test_search_combines_filters(self, index):
+        results = index.search(
+            muscle_groups=["chest"],
+            equipment=["barbell", "dumbbells"],
+            movement_pattern="push",
+            supports_1rm=False,
+        )
+
+        assert _ids(results) == ["dumbbell-bench-press"]
+        assert len(index.search(limit=2)) == 2
+
+    def test_workout_type_filters_muscles_and_equipment(self, index):
+        assert _ids(index.get_for_workout_type("push", ["cable"])) == ["tricep-pushdown"]
+        assert "barbell-squat" in _ids(index.get_for_workout_type("legs", []))
+
+    def test_similar_exercises_scored(self, index):
+        similar = _ids(index.get_similar_exercises("bench-press", limit=2))
+
+        assert similar == ["dumbbell-bench-press", "push-up"]
+
+    def test_validate_name_is_case_insensitive(self, index):
+        assert index.validate_exercise_name("barbell bench press")["id"] == "bench-press"
+        assert index.validate_exercise_name("press up")["id"] == "push-up"
+        assert index.validate_exercise_name("  ") is None
+
+    def test_results_are_copies(self, index):
+        index.get_by_id("push-up")["name"] = "changed"
+
+        assert index.get_by_id("push-up")["name"] == "Push-Up"
+
+
+@pytest.mark.unit
+class TestExerciseCatalog:
+    """Version-checked refresh of the replica."""
+
+    @pytest.fixture
+    def clock(self):
+        now = [0.0]
+        clock = lambda: now[0]
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    def test_loads_once_within_refresh_interval(self, clock):
+        loader = MagicMock(return_value=EXERCISES)
+        catalog = ExerciseCatalog(loader, refresh_interval=60, clock=clock)
+
+        catalog.index()
+        clock.advance(30)
+        catalog.index()
+
+        assert loader.call_count == 1
+
+    def test_reloads_only_when_version_changes(self, clock):
+        loader = MagicMock(return_value=EXERCISES)
+        versions = iter([(5, "a"), (5, "a"), (6, "b")])
+        catalog = ExerciseCatalog(
+            loader, version_probe=lambda: next(versions), refresh_interval=60, clock=clock,
+        )
+
+        catalog.index()
+        clock.advance(61)
+        catalog.index()
+        assert loader.call_count == 1
+
+        clock.advance(61)
+        assert catalog.index().version == (6, "b")
+        assert loader.call_count == 2
+
+    def test_keeps_previous_snapshot_when_refresh_fails(self, clock):
+        loader = MagicMock(side_effect=[EXERCISES, Exception("network down")])
+        catalog = ExerciseCatalog(loader, refresh_interval=60, clock=clock)
+
+        first = catalog.index()
+        clock.advance(61)
+
+        assert catalog.index() is first
+
+
+@pytest.mark.unit
+class TestCatalogExerciseRepository:
+    """The port implementation served from the catalog."""
+
+    def test_serves_queries_from_catalog(self):
+        fallback = MagicMock()
+        repo = CatalogExerciseRepository(ExerciseCatalog(lambda: EXERCISES), fallback)
+
+        assert _ids(repo.search(muscle_groups=["quadriceps"])) == ["barbell-squat"]
+        fallback.search.assert_not_called()
+
+    def test_falls_back_when_catalog_unavailable(self):
+        fallback = MagicMock()
+        fallback.get_by_id.return_value = {"id": "remote"}
+
+        def fail():
+            raise Exception("network down")
+
+        repo = CatalogExerciseRepository(ExerciseCatalog(fail), fallback)
+
+        assert repo.get_by_id("bench-press") == {"id": "remote"}
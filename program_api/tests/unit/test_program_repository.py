@@ -0,0 +1,146 @@
+"""
+Unit tests for SupabaseProgramRepository program tree reads.
+
+Part of AMA-461: Create program-api service scaffold
+
+Tests cover:
+- Single embedded select for the program -> weeks -> workouts tree
+- Per-program cache hits and invalidation on writes
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from infrastructure.db.program_repository import (
+    PROGRAM_TREE_SELECT,
+    ProgramTreeCache,
+    SupabaseProgramRepository,
+)
+
+
+PROGRAM_ROW = {
+    "id": "prog-1",
+    "user_id": "user-1",
+    "name": "Strength Block",
+    "weeks": [
+        {
+            "id": "week-2",
+            "week_number": 2,
+            "workouts": [],
+        },
+        {
+            "id": "week-1",
+            "week_number": 1,
+            "workouts": [
+                {"id": "wo-b", "order_index": 1},
+                {"id": "wo-a", "order_index": 0},
+            ],
+        },
+    ],
+}
+
+
+def _client(rows):
+    """Supabase client mock whose every query returns ``rows``."""
+    client = MagicMock()
+    query = client.table.return_value
+    for method in ("select", "eq", "order", "insert", "update", "delete", "single"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = lambda: MagicMock(data=[dict(r) for r in rows])
+    return client
+
+
+@pytest.fixture
+def cache():
+    return ProgramTreeCache(max_entries=2, ttl_seconds=60)
+
+
+@pytest.mark.unit
+class TestProgramTreeReads:
+    """Program trees fetched in one round trip."""
+
+    def test_tree_uses_single_embedded_select(self):
+        client = _client([PROGRAM_ROW])
+        repo = SupabaseProgramRepository(client)
+
+        tree = repo.get_program_tree("prog-1")
+
+        client.table.assert_called_once_with("training_programs")
+        client.table.return_value.select.assert_called_once_with(PROGRAM_TREE_SELECT)
+        assert [w["week_number"] for w in tree["weeks"]] == [1, 2]
+        assert [wo["id"] for wo in tree["weeks"][0]["workouts"]] == ["wo-a", "wo-b"]
+
+    def test_get_weeks_returns_nested_workouts(self):
+        repo = SupabaseProgramRepository(_client([PROGRAM_ROW]))
+
+        weeks = repo.get_weeks("prog-1")
+
+        assert [w["id"] for w in weeks] == ["week-1", "week-2"]
+        assert len(weeks[0]["workouts"]) == 2
+
+    def test_missing_program(self):
+        repo = SupabaseProgramRepository(_client([]))
+
+        assert repo.get_program_tree("missing") is None
+        assert repo.get_weeks("missing") == []
+
+
+@pytest.mark.unit
+class TestProgramTreeCache:
+    """Cached trees and their invalidation."""
+
+    def test_repeat_reads_hit_cache(self, cache):
+        client = _client([PROGRAM_ROW])
+        repo = SupabaseProgramRepository(client, cache=cache)
+
+        repo.get_program_tree("prog-1")
+        repo.get_weeks("prog-1")
+        program = repo.get_by_id("prog-1")
+
+        assert client.table.call_count == 1
+        assert program["name"] == "Strength Block"
+        assert "weeks" not in program
+
+    def test_cached_tree_is_not_mutated_by_callers(self, cache):
+        repo = SupabaseProgramRepository(_client([PROGRAM_ROW]), cache=cache)
+
+        repo.get_weeks("prog-1")[0]["workouts"].clear()
+
+        assert len(repo.get_weeks("prog-1")[0]["workouts"]) == 2
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda repo: repo.update("prog-1", {"name": "Renamed"}),
+            lambda repo: repo.delete("prog-1"),
+            lambda repo: repo.create_week("prog-1", {"week_number": 3}),
+            lambda repo: repo.create_workout("week-1", {"name": "Extra"}),
+        ],
+    )
+    def test_writes_invalidate_cached_tree(self, cache, write):
+        client = _client([PROGRAM_ROW])
+        repo = SupabaseProgramRepository(client, cache=cache)
+        repo.get_program_tree("prog-1")
+
+        write(repo)
+
+        assert cache.get("prog-1") is None
+
+    def test_expired_entries_are_refetched(self):
+        now = [0.0]
+        cache = ProgramTreeCache(ttl_seconds=60, clock=lambda: now[0])
+        cache.put("prog-1", {"id": "prog-1", "weeks": []})
+
+        now[0] = 61.0
+
+        assert cache.get("prog-1") is None
+
+    def test_least_recently_used_program_evicted(self, cache):
+        cache.put("a", {"id": "a", "weeks": []})
+        cache.put("b", {"id": "b", "weeks": []})
+        cache.get("a")
+        cache.put("c", {"id": "c", "weeks": []})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Backfill exercise_set_index for existing workout completions.
+
+New completions are indexed when they are saved. This script flattens the
+execution_log of older completions into exercise_set_index rows so exercise
+history can be filtered and paginated in the database. Upserts are keyed on
+(completion_id, interval_index, set_index), so re-running is safe.
+
+Usage:
+    python scripts/backfill_exercise_set_index.py [--dry-run] [--user-id ID] [--page-size N] [--limit N]
+
+Options:
+    --dry-run      Preview row counts without writing
+    --user-id ID   Only backfill completions for one user
+    --page-size N  Completions fetched per request (default: 100)
+    --limit N      Process only N completions (for testing)
+"""
+import os
+import sys
+import argparse
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from supabase import create_client
+from infrastructure.db.exercise_set_index import build_exercise_set_rows, write_exercise_set_rows
+
+
+def get_supabase_client():
+    """Create Supabase client with service role key."""
+    url = os.environ.get("SUPABASE_URL")
+    key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+
+    if not url or not key:
+        print("ERROR: SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set")
+        sys.exit(1)
+
+    return create_client(url, key)
+
+
+def backfill_exercise_set_index(
+    dry_run: bool = False,
+    user_id: str = None,
+    page_size: int = 100,
+    limit: int = None,
+):
+    """
+    Index the sets of every completion that has an execution_log.
+
+    Args:
+        dry_run: If True, count rows without writing
+        user_id: Restrict to one user's completions
+        page_size: Completions fetched per request
+        limit: Maximum number of completions to process
+    """
+    supabase = get_supabase_client()
+
+    processed = 0
+    indexed_rows = 0
+    error_count = 0
+    offset = 0
+
+    while limit is None or processed < limit:
+        batch = page_size if limit is None else min(page_size, limit - processed)
+        query = supabase.table("workout_completions") \
+            .select("id, user_id, started_at, execution_log") \
+            .not_.is_("execution_log", "null") \
+            .order("id")
+        if user_id:
+            query = query.eq("user_id", user_id)
+        result = query.range(offset, offset + batch - 1).execute()
+
+        records = result.data or []
+        if not records:
+            break
+
+        rows = []
+        for record in records:
+            rows.extend(build_exercise_set_rows(
+                record["user_id"],
+                record["id"],
+                record.get("started_at"),
+                record.get("execution_log"),
+            ))
+
+        if dry_run:
+            print(f"  [DRY RUN] {len(records)} completions -> {len(rows)} set rows")
+        elif rows:
+            try:
+                write_exercise_set_rows(supabase, rows)
+                print(f"  Indexed {len(records)} completions ({len(rows)} set rows)")
+            except Exception as e:
+                print(f"  ERROR writing rows for completions {records[0]['id']}..{records[-1]['id']}: {e}")
+                error_count += 1
+
+        processed += len(records)
+        indexed_rows += len(rows)
+        offset += len(records)
+
+        if len(records) < batch:
+            break
+
+    print()
+    print("=" * 50)
+    print("Backfill complete:")
+    print(f"  Completions processed: {processed}")
+    if dry_run:
+        print(f"  Set rows that would be written: {indexed_rows}")
+    else:
+        print(f"  Set rows written: {indexed_rows}")
+    print(f"  Failed batches: {error_count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill exercise_set_index from workout completions"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Preview changes without updating database"
+    )
+    parser.add_argument(
+        "--user-id",
+        help="Only backfill completions for this user"
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=100,
+        help="Completions fetched per request"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="Process only N completions"
+    )
+
+    args = parser.parse_args()
+
+    print("Backfill exercise_set_index for workout completions")
+    print("=" * 50)
+
+    if args.dry_run:
+        print("DRY RUN MODE - No changes will be made")
+
+    backfill_exercise_set_index(
+        dry_run=args.dry_run,
+        user_id=args.user_id,
+        page_size=args.page_size,
+        limit=args.limit,
+    )
+
+
+if __name__ == "__main__":
+    main()
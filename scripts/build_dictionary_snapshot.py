@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Compile shared/dictionaries into the precompiled dictionary snapshot.
+
+Run as part of the image build (and after editing any dictionary source) so
+that cold starts load one pickle instead of parsing YAML/JSON. A stale or
+missing snapshot is still handled at runtime, it is just slower.
+
+Usage:
+    python scripts/build_dictionary_snapshot.py [--benchmark] [--runs N]
+
+Options:
+    --benchmark  Compare cold-start dictionary load time from sources vs. snapshot
+    --runs N     Number of fresh interpreter runs per mode (default: 5)
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Add parent directory to path for imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.core.dictionary_snapshot import SNAPSHOT_FILE, SOURCES, build_snapshot
+
+# Imports the modules that used to parse dictionaries at import time, then
+# touches every dictionary once. Prints "<import seconds> <load seconds>".
+BENCHMARK_SNIPPET = """
+import time
+t0 = time.perf_counter()
+from backend.core import catalog, exercise_categories, normalize
+from backend.adapters import cir_to_garmin_yaml
+from backend.adapters.garmin_lookup import GarminExerciseLookup
+t1 = time.perf_counter()
+exercise_categories.RAW, catalog.CAT, normalize.DICT, cir_to_garmin_yaml.GARMIN
+GarminExerciseLookup()
+print(t1 - t0, time.perf_counter() - t1)
+"""
+
+
+def _time_cold_start(disabled: bool) -> tuple[float, float]:
+    env = dict(os.environ)
+    env["DICTIONARY_SNAPSHOT_DISABLED"] = "1" if disabled else ""
+    out = subprocess.run(
+        [sys.executable, "-c", BENCHMARK_SNIPPET],
+        cwd=ROOT, env=env, check=True, capture_output=True, text=True,
+    )
+    import_s, load_s = out.stdout.strip().splitlines()[-1].split()
+    return float(import_s), float(load_s)
+
+
+def benchmark(runs: int) -> None:
+    print(f"Cold start, median of {runs} fresh interpreters:")
+    for label, disabled in (("sources", True), ("snapshot", False)):
+        timings = [_time_cold_start(disabled) for _ in range(runs)]
+        import_ms = statistics.median(t[0] for t in timings) * 1000
+        load_ms = statistics.median(t[1] for t in timings) * 1000
+        print(
+            f"  {label:<10} import {import_ms:7.1f} ms   dictionaries {load_ms:7.1f} ms"
+            f"   total {import_ms + load_ms:7.1f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the dictionary snapshot")
+    parser.add_argument("--benchmark", action="store_true", help="Time cold-start loads")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per benchmark mode")
+    args = parser.parse_args()
+
+    snapshot = build_snapshot()
+    size_kb = SNAPSHOT_FILE.stat().st_size / 1024
+    print(f"Wrote {SNAPSHOT_FILE} ({size_kb:.0f} KB, version {snapshot['version']})")
+    for name, filename in SOURCES.items():
+        print(f"  {filename:<28} {snapshot['sources'][name][:12]}")
+
+    if args.benchmark:
+        benchmark(args.runs)
+
+
+if __name__ == "__main__":
+    main()
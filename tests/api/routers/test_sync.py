@@ -319,7 +319,8 @@ class TestIOSCompanionEndpoints:
         self, mock_run, mock_update, mock_queue, client
     ):
         """Successfully get pending iOS workouts."""
-        mock_run.return_value = [
+        # sync version lookup, then the pending workouts
+        mock_run.side_effect = [3, [
             {
                 "id": TEST_WORKOUT_ID,
                 "title": "Test Workout",
@@ -327,7 +328,7 @@ class TestIOSCompanionEndpoints:
                 "ios_companion_synced_at": "2024-01-01T00:00:00Z",
                 "created_at": "2024-01-01T00:00:00Z",
             }
-        ]
+        ]]
 
         response = client.get("/ios-companion/pending")
 
@@ -342,7 +343,7 @@ class TestIOSCompanionEndpoints:
         self, mock_run, mock_update, mock_queue, client
     ):
         """Return empty list when no pending workouts."""
-        mock_run.return_value = []
+        mock_run.side_effect = [3, []]
 
         response = client.get("/ios-companion/pending")
 
@@ -351,6 +352,58 @@ class TestIOSCompanionEndpoints:
         assert data["count"] == 0
         assert data["workouts"] == []
 
+    @pytest.mark.unit
+    def test_get_ios_pending_returns_etag_and_304(
+        self, mock_run, mock_update, mock_queue, client
+    ):
+        """An unchanged sync version is answered with 304 without reading workouts."""
+        mock_run.side_effect = [3, []]
+        etag = client.get("/ios-companion/pending").headers["ETag"]
+
+        mock_run.side_effect = [3]
+        response = client.get("/ios-companion/pending", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.unit
+    def test_get_ios_pending_changed_version_returns_feed(
+        self, mock_run, mock_update, mock_queue, client
+    ):
+        """A bumped sync version invalidates the previous ETag."""
+        mock_run.side_effect = [3, []]
+        etag = client.get("/ios-companion/pending").headers["ETag"]
+
+        mock_run.side_effect = [4, []]
+        response = client.get("/ios-companion/pending", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.unit
+    def test_get_ios_pending_delta_since_cursor(
+        self, mock_run, mock_update, mock_queue, client
+    ):
+        """With a cursor only changed workouts are returned, plus pending IDs."""
+        old = {
+            "id": "w-old",
+            "title": "Old",
+            "workout_data": SAMPLE_WORKOUT_DATA,
+            "ios_companion_synced_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+        mock_run.side_effect = [3, [old]]
+        cursor = client.get("/ios-companion/pending").json()["cursor"]
+
+        new = {**old, "id": "w-new", "title": "New", "updated_at": "2024-01-02T00:00:00Z"}
+        mock_run.side_effect = [4, [new, old]]
+        data = client.get("/ios-companion/pending", params={"since": cursor}).json()
+
+        assert data["delta"] is True
+        assert [w["id"] for w in data["workouts"]] == ["w-new"]
+        assert data["ids"] == ["w-new", "w-old"]
+
 
 # =============================================================================
 # Android Companion Endpoint Tests
@@ -386,7 +439,8 @@ class TestAndroidCompanionEndpoints:
         self, mock_run, mock_update, mock_queue, client
     ):
         """Successfully get pending Android workouts."""
-        mock_run.return_value = [
+        # sync version lookup, then the pending workouts
+        mock_run.side_effect = [3, [
             {
                 "id": TEST_WORKOUT_ID,
                 "title": "Test Workout",
@@ -394,7 +448,7 @@ class TestAndroidCompanionEndpoints:
                 "android_companion_synced_at": "2024-01-01T00:00:00Z",
                 "created_at": "2024-01-01T00:00:00Z",
             }
-        ]
+        ]]
 
         response = client.get("/android-companion/pending")
 
@@ -409,16 +463,15 @@ class TestAndroidCompanionEndpoints:
 # =============================================================================
 
 @patch.dict("os.environ", {"GARMIN_UNOFFICIAL_SYNC_ENABLED": "true", "GARMIN_EMAIL": "test@test.com", "GARMIN_PASSWORD": "password"})
-@patch("api.routers.sync.httpx.AsyncClient")
+@patch("api.routers.sync.get_upstream_client")
 class TestGarminSyncEndpoint:
     """Tests for Garmin sync endpoint."""
 
     @pytest.mark.unit
-    def test_sync_to_garmin_success(self, mock_client_class, client):
+    def test_sync_to_garmin_success(self, mock_get_client, client):
         """Successfully sync workout to Garmin."""
         mock_client = MagicMock()
-        mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
@@ -445,11 +498,10 @@ class TestGarminSyncEndpoint:
         assert "garminWorkoutId" in data
 
     @pytest.mark.unit
-    def test_sync_to_garmin_with_schedule_date(self, mock_client_class, client):
+    def test_sync_to_garmin_with_schedule_date(self, mock_get_client, client):
         """Sync workout with schedule date."""
         mock_client = MagicMock()
-        mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+        mock_get_client.return_value = mock_client
 
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
@@ -784,5 +836,21 @@ class TestSyncRouterIntegration:
             assert data["count"] == 1
 
 
+
+# =============================================================================
+# Sync Event Stream Tests
+# =============================================================================
+
+class TestSyncEventsEndpoint:
+    """Tests for GET /sync/events."""
+
+    @pytest.mark.unit
+    def test_invalid_device_type_rejected(self, client):
+        """Unknown device types are rejected before the stream opens."""
+        response = client.get("/sync/events?device_type=invalid")
+
+        assert response.status_code == 400
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
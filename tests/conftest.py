@@ -148,6 +148,16 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("SUPABASE_KEY", "test-supabase-key")
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """Start every test with fresh AI rate-limit budgets (all tests share one user)."""
+    from backend.services.rate_limiter import shutdown_rate_limiter
+
+    shutdown_rate_limiter()
+    yield
+    shutdown_rate_limiter()
+
+
 # NOTE: Legacy CLI utilities in tests/integration/ (test_api_full.py, test_full_conversion.py)
 # have been renamed from test_* to run_* to avoid pytest collection.
 # They are CLI scripts meant to be run directly, not pytest test functions.
@@ -175,6 +175,11 @@ class FakeExercisesRepository:
                 return ex
         return None
 
+    def get_by_ids(self, exercise_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get exercises by ID, keyed by ID."""
+        wanted = set(exercise_ids)
+        return {ex["id"]: ex for ex in self._exercises if ex["id"] in wanted}
+
     def find_by_exact_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find by exact name (case-insensitive)."""
         name_lower = name.lower()
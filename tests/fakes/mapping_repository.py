@@ -7,7 +7,7 @@ Phase 2 - Dependency Injection
 This module provides in-memory implementations of UserMappingRepository,
 GlobalMappingRepository, and ExerciseMatchRepository for fast, isolated testing.
 """
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterable
 import copy
 
 
@@ -78,6 +78,13 @@ class FakeUserMappingRepository:
         normalized = exercise_name.lower().strip()
         return self._mappings.get(normalized)
 
+    def get_many(
+        self,
+        exercise_names: Iterable[str],
+    ) -> Dict[str, Optional[str]]:
+        """Get the mapped Garmin names for several exercises at once."""
+        return {name: self.get(name) for name in exercise_names}
+
     def get_all(self) -> Dict[str, str]:
         """Get all user-defined mappings."""
         return copy.deepcopy(self._mappings)
@@ -266,6 +273,18 @@ class FakeExerciseMatchRepository:
                 return (garmin_name, confidence)
         return (None, 0.0)
 
+    def find_matches(
+        self,
+        exercise_names: Iterable[str],
+        *,
+        threshold: float = 0.3,
+    ) -> Dict[str, Tuple[Optional[str], float]]:
+        """Find the best matching Garmin exercise for several names at once."""
+        return {
+            name: self.find_match(name, threshold=threshold)
+            for name in exercise_names
+        }
+
     def get_suggestions(
         self,
         exercise_name: str,
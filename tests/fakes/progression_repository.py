@@ -10,6 +10,8 @@ from typing import Optional, List, Dict, Any
 from datetime import date, timedelta
 from collections import defaultdict
 
+from backend.core.progression_service import calculate_1rm
+
 
 class FakeProgressionRepository:
     """
@@ -132,6 +134,19 @@ class FakeProgressionRepository:
 
         return None
 
+    def get_last_weights(
+        self,
+        user_id: str,
+        exercise_ids: List[str],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get the last weight used for several exercises."""
+        results = {}
+        for exercise_id in exercise_ids:
+            result = self.get_last_weight_used(user_id, exercise_id)
+            if result is not None:
+                results[exercise_id] = result
+        return results
+
     def get_volume_by_muscle_group(
         self,
         user_id: str,
@@ -224,6 +239,49 @@ class FakeProgressionRepository:
             },
         }
 
+    def get_1rm_trend(
+        self,
+        user_id: str,
+        exercise_id: str,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        granularity: str = "weekly",
+        formula: str = "brzycki",
+    ) -> List[Dict[str, Any]]:
+        """Get the best estimated 1RM per period for an exercise."""
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=90)
+
+        best: Dict[str, float] = {}
+        for session in self._sessions.get(user_id, []):
+            if session.get("exercise_id") != exercise_id:
+                continue
+            workout_date = date.fromisoformat(session.get("workout_date", "")[:10])
+            if not start_date <= workout_date <= end_date:
+                continue
+
+            period_key = workout_date.isoformat()  # daily
+            if granularity == "weekly":
+                period_key = (workout_date - timedelta(days=workout_date.weekday())).isoformat()
+            elif granularity == "monthly":
+                period_key = period_key[:7]  # YYYY-MM
+
+            for set_data in session.get("sets", []):
+                weight = set_data.get("weight") or 0
+                reps = set_data.get("reps_completed") or 0
+                if set_data.get("status") != "completed" or weight <= 0 or reps <= 0:
+                    continue
+                estimate = calculate_1rm(weight, reps, formula)
+                best[period_key] = max(best.get(period_key, 0.0), estimate)
+
+        return [
+            {"period": period, "estimated_1rm": estimate}
+            for period, estimate in sorted(best.items())
+        ]
+
     def get_exercises_with_history(
         self,
         user_id: str,
@@ -259,6 +317,26 @@ class FakeProgressionRepository:
 
         return result[:limit]
 
+    def get_all_sets(
+        self,
+        user_id: str,
+    ) -> List[Dict[str, Any]]:
+        """Get every set as flat rows, newest session first."""
+        rows = []
+        for session in self._sessions.get(user_id, []):  # Already sorted by date desc
+            for set_data in session.get("sets", []):
+                rows.append({
+                    "exercise_id": session.get("exercise_id"),
+                    "exercise_name": session.get("exercise_name", ""),
+                    "completion_id": session.get("completion_id", ""),
+                    "workout_date": session.get("workout_date", ""),
+                    "weight": set_data.get("weight"),
+                    "weight_unit": set_data.get("weight_unit", "lbs"),
+                    "reps_completed": set_data.get("reps_completed"),
+                    "status": set_data.get("status", "completed"),
+                })
+        return rows
+
 
 # =============================================================================
 # Default Test Data
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
 import uuid
 import copy
+import hashlib
 
 
 class FakeWorkoutRepository:
@@ -99,6 +100,28 @@ class FakeWorkoutRepository:
         self._workouts[wid] = workout
         return copy.deepcopy(workout)
 
+    def save_many(
+        self,
+        profile_id: str,
+        workouts: List[Dict[str, Any]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Save workouts, updating existing ones with the same title and device."""
+        results = []
+        for item in workouts:
+            item = dict(item)
+            title = item.get("title") or item["workout_data"].get("title")
+            if not item.get("workout_id") and title:
+                for existing in self._workouts.values():
+                    if (
+                        existing.get("profile_id") == profile_id
+                        and existing.get("title") == title
+                        and existing.get("device") == item["device"]
+                    ):
+                        item["workout_id"] = existing["id"]
+                        break
+            results.append(self.save(profile_id, **item))
+        return results
+
     def get(
         self,
         workout_id: str,
@@ -133,6 +156,15 @@ class FakeWorkoutRepository:
         results.sort(key=lambda w: w.get("created_at", ""), reverse=True)
         return results[:limit]
 
+    def get_sync_version(self, profile_id: str) -> Optional[int]:
+        """Get a version that changes whenever the user's workouts change."""
+        state = sorted(
+            (w["id"], str(w.get("updated_at")), w.get("times_completed", 0))
+            for w in self._workouts.values()
+            if w.get("profile_id") == profile_id
+        )
+        return int.from_bytes(hashlib.sha256(repr(state).encode()).digest()[:6], "big")
+
     def delete(
         self,
         workout_id: str,
@@ -224,6 +256,15 @@ class FakeWorkoutRepository:
         results.sort(key=lambda w: w.get("created_at", ""), reverse=True)
         return results[:limit]
 
+    def get_sync_version(self, profile_id: str) -> Optional[int]:
+        """Get a version that changes whenever the user's workouts change."""
+        state = sorted(
+            (w["id"], str(w.get("updated_at")), w.get("times_completed", 0))
+            for w in self._workouts.values()
+            if w.get("profile_id") == profile_id
+        )
+        return int.from_bytes(hashlib.sha256(repr(state).encode()).digest()[:6], "big")
+
     def get_sync_status(
         self,
         workout_id: str,
@@ -9,6 +9,7 @@ Tests cover:
 - Last weight endpoint
 - Personal records endpoint
 - Volume analytics endpoint
+- 1RM trend endpoint
 """
 import pytest
 from datetime import date, timedelta
@@ -260,6 +261,38 @@ class TestLastWeightEndpoint:
         assert response.status_code == 404
 
 
+@pytest.mark.integration
+class TestLastWeightsBatchEndpoint:
+    """Tests for GET /progression/last-weights."""
+
+    def test_returns_last_weight_per_exercise(self, client):
+        """Returns last weights for all requested exercises in one call."""
+        response = client.get(
+            "/progression/last-weights",
+            params=[
+                ("exercise_ids", "barbell-squat"),
+                ("exercise_ids", "barbell-bench-press"),
+                ("exercise_ids", "unknown-exercise"),
+            ],
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [w["exercise_id"] for w in data["last_weights"]] == [
+            "barbell-squat", "barbell-bench-press",
+        ]
+        assert data["last_weights"][1]["weight"] == 185
+        assert data["missing"] == ["unknown-exercise"]
+
+    def test_validates_exercise_ids(self, client):
+        """Rejects malformed exercise IDs."""
+        response = client.get(
+            "/progression/last-weights", params={"exercise_ids": "Bad_ID"}
+        )
+
+        assert response.status_code == 400
+
+
 # =============================================================================
 # Personal Records Tests
 # =============================================================================
@@ -354,6 +387,51 @@ class TestVolumeAnalyticsEndpoint:
         assert response.status_code == 200
 
 
+# =============================================================================
+# 1RM Trend Tests
+# =============================================================================
+
+
+@pytest.mark.integration
+class TestOneRepMaxTrendEndpoint:
+    """Tests for GET /progression/exercises/{exercise_id}/1rm-trend."""
+
+    def test_returns_trend(self, client):
+        """Returns the best estimated 1RM per week."""
+        response = client.get(
+            "/progression/exercises/barbell-bench-press/1rm-trend"
+            "?start_date=2024-01-01&end_date=2024-01-31"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["granularity"] == "weekly"
+        assert [d["period"] for d in data["data"]] == ["2024-01-08", "2024-01-15"]
+        assert data["data"][1]["estimated_1rm"] > data["data"][0]["estimated_1rm"]
+
+    def test_respects_granularity(self, client):
+        """Changes aggregation granularity."""
+        response = client.get(
+            "/progression/exercises/barbell-bench-press/1rm-trend"
+            "?start_date=2024-01-01&end_date=2024-01-31&granularity=monthly"
+        )
+
+        data = response.json()
+        assert [d["period"] for d in data["data"]] == ["2024-01"]
+
+    def test_returns_404_for_unknown_exercise(self, client):
+        """Returns 404 for unknown exercise."""
+        response = client.get("/progression/exercises/unknown-exercise/1rm-trend")
+
+        assert response.status_code == 404
+
+    def test_validates_exercise_id_format(self, client):
+        """Rejects invalid exercise ID formats."""
+        response = client.get("/progression/exercises/Bad_ID/1rm-trend")
+
+        assert response.status_code == 400
+
+
 # =============================================================================
 # Exercises With History Tests
 # =============================================================================
@@ -190,7 +190,7 @@ class TestProtocolCompliance:
         """SupabaseUserMappingRepository should have all Protocol methods."""
         from infrastructure.db.mapping_repository import SupabaseUserMappingRepository
 
-        required_methods = ["add", "remove", "get", "get_all", "clear_all"]
+        required_methods = ["add", "remove", "get", "get_many", "get_all", "clear_all"]
 
         for method in required_methods:
             assert hasattr(SupabaseUserMappingRepository, method), f"Missing method: {method}"
@@ -209,7 +209,8 @@ class TestProtocolCompliance:
         from infrastructure.db.mapping_repository import InMemoryExerciseMatchRepository
 
         required_methods = [
-            "find_match", "get_suggestions", "find_similar", "find_by_type", "categorize"
+            "find_match", "find_matches", "get_suggestions", "find_similar", "find_by_type",
+            "categorize",
         ]
 
         for method in required_methods:
@@ -296,6 +297,706 @@ class TestExerciseMatchRepository:
         assert repo.categorize("xyz unknown exercise") is None
 
 
+class TestGlobalMappingCounters:
+    """Tests for buffered global mapping increments and summary stats."""
+
+    def _repo(self, client):
+        from infrastructure.db.mapping_repository import (
+            GlobalMappingCounterBuffer,
+            SupabaseGlobalMappingRepository,
+        )
+        buffer = GlobalMappingCounterBuffer(client, flush_interval=60)
+        return SupabaseGlobalMappingRepository(client, counter_buffer=buffer), buffer
+
+    def test_record_choice_does_not_hit_database(self):
+        """record_choice should only buffer the increment."""
+        client = MagicMock()
+        repo, buffer = self._repo(client)
+
+        repo.record_choice("RDLs", "Romanian Deadlift")
+
+        client.table.assert_not_called()
+        client.rpc.assert_not_called()
+        buffer.close()
+
+    def test_flush_sends_one_batched_increment(self):
+        """Repeated choices are coalesced into one RPC row with a delta."""
+        client = MagicMock()
+        repo, buffer = self._repo(client)
+
+        repo.record_choice("RDLs", "Romanian Deadlift")
+        repo.record_choice("rdls", "Romanian Deadlift")
+        repo.record_choice("Front Squat", "Barbell Front Squat")
+        flushed = buffer.flush()
+
+        assert flushed == 2
+        client.rpc.assert_called_once()
+        name, params = client.rpc.call_args[0]
+        assert name == "increment_global_mapping_counts"
+        rows = {(r["exercise_name"], r["garmin_name"]): r["delta"] for r in params["p_increments"]}
+        assert rows == {
+            ("rdls", "Romanian Deadlift"): 2,
+            ("front squat", "Barbell Front Squat"): 1,
+        }
+        assert buffer.flush() == 0
+
+    def test_failed_flush_keeps_increments(self):
+        """Increments are re-queued when the RPC fails."""
+        client = MagicMock()
+        client.rpc.return_value.execute.side_effect = [Exception("network"), MagicMock()]
+        repo, buffer = self._repo(client)
+
+        repo.record_choice("RDLs", "Romanian Deadlift")
+        assert buffer.flush() == 0
+        assert buffer.pending_for("rdls") == {"Romanian Deadlift": 1}
+        assert buffer.flush() == 1
+
+    def test_requeue_is_capped(self):
+        """A failing database cannot grow the buffer past max_buffered keys."""
+        from infrastructure.db.mapping_repository import GlobalMappingCounterBuffer
+        client = MagicMock()
+        client.rpc.return_value.execute.side_effect = Exception("down")
+        buffer = GlobalMappingCounterBuffer(client, flush_interval=60, max_pending=2, max_buffered=2)
+
+        buffer.add("rdls", "Romanian Deadlift")
+        buffer.add("squat", "Back Squat")
+        assert buffer.flush() == 0
+        buffer.add("rdls", "Romanian Deadlift")
+        buffer.add("lunge", "Walking Lunge")
+
+        assert buffer.pending_for("rdls") == {"Romanian Deadlift": 2}
+        assert buffer.pending_for("lunge") == {}
+        assert buffer.dropped == 1
+        buffer.close()
+
+    def test_get_popular_includes_unflushed_choices(self):
+        """Buffered choices are merged into popularity results."""
+        client = MagicMock()
+        client.table.return_value.select.return_value.eq.return_value.order.return_value \
+            .limit.return_value.execute.return_value.data = [
+                {"garmin_name": "Deadlift", "count": 2},
+                {"garmin_name": "Romanian Deadlift", "count": 2},
+            ]
+        repo, buffer = self._repo(client)
+
+        repo.record_choice("RDLs", "Romanian Deadlift")
+
+        assert repo.get_popular("RDLs") == [("Romanian Deadlift", 3), ("Deadlift", 2)]
+        buffer.close()
+
+    def test_get_stats_reads_summary_row(self):
+        """Stats come from the summary row plus a top-10 query."""
+        client = MagicMock()
+        summary_table = MagicMock()
+        summary_table.select.return_value.eq.return_value.execute.return_value.data = [
+            {"total_choices": 7, "unique_exercises": 2, "unique_mappings": 3}
+        ]
+        mappings_table = MagicMock()
+        mappings_table.select.return_value.order.return_value.limit.return_value \
+            .execute.return_value.data = [
+                {"exercise_name": "rdls", "garmin_name": "Romanian Deadlift", "count": 5},
+            ]
+        client.table.side_effect = lambda name: {
+            "global_exercise_mapping_stats": summary_table,
+            "global_exercise_mappings": mappings_table,
+        }[name]
+        repo, buffer = self._repo(client)
+
+        stats = repo.get_stats()
+
+        assert stats["total_choices"] == 7
+        assert stats["unique_mappings"] == 3
+        assert stats["most_popular"] == [
+            {"exercise": "rdls", "garmin_name": "Romanian Deadlift", "count": 5}
+        ]
+        mappings_table.select.return_value.order.return_value.limit.assert_called_once_with(10)
+
+
+class TestUserMappingSnapshots:
+    """Tests for snapshot-backed user mapping lookups."""
+
+    def _client(self, rows):
+        client = MagicMock()
+        client.table.return_value.select.return_value.eq.return_value \
+            .execute.return_value.data = rows
+        return client
+
+    def _repo(self, client, cache):
+        from infrastructure.db.mapping_repository import SupabaseUserMappingRepository
+        return SupabaseUserMappingRepository(client, user_id="user-1", snapshot_cache=cache)
+
+    def test_get_many_loads_mappings_once(self):
+        """All lookups in a request are served from one query."""
+        from infrastructure.db.mapping_repository import UserMappingSnapshotCache
+        client = self._client([{"exercise_name": "rdls", "garmin_name": "Romanian Deadlift"}])
+        repo = self._repo(client, UserMappingSnapshotCache())
+
+        assert repo.get_many(["RDLs", "Front Squat"]) == {
+            "RDLs": "Romanian Deadlift",
+            "Front Squat": None,
+        }
+        assert repo.get("rdls") == "Romanian Deadlift"
+        assert client.table.return_value.select.call_count == 1
+
+    def test_snapshot_is_shared_until_invalidated(self):
+        """Later requests reuse the snapshot until the user's mappings change."""
+        from infrastructure.db.mapping_repository import UserMappingSnapshotCache
+        cache = UserMappingSnapshotCache()
+        client = self._client([{"exercise_name": "rdls", "garmin_name": "Romanian Deadlift"}])
+
+        self._repo(client, cache).get("RDLs")
+        self._repo(client, cache).get("RDLs")
+        assert client.table.return_value.select.call_count == 1
+
+        self._repo(client, cache).add("Front Squat", "Barbell Front Squat")
+        self._repo(client, cache).get("RDLs")
+        assert client.table.return_value.select.call_count == 2
+
+    def test_snapshot_loaded_before_a_write_is_not_cached(self):
+        """A snapshot read while a write was in flight is discarded."""
+        from infrastructure.db.mapping_repository import UserMappingSnapshotCache
+        cache = UserMappingSnapshotCache()
+
+        version = cache.version("user-1")
+        cache.invalidate("user-1")
+
+        assert cache.put("user-1", {"rdls": "Deadlift"}, version) is False
+        assert cache.get("user-1") is None
+
+    def test_snapshot_expires(self):
+        """Writes from other processes are picked up after the TTL."""
+        from infrastructure.db.mapping_repository import UserMappingSnapshotCache
+        now = [0.0]
+        cache = UserMappingSnapshotCache(ttl_seconds=60, clock=lambda: now[0])
+        cache.put("user-1", {"rdls": "Deadlift"}, cache.version("user-1"))
+
+        now[0] = 61.0
+
+        assert cache.get("user-1") is None
+
+    def test_load_failure_is_not_cached(self):
+        """A failed load returns no mappings without poisoning the cache."""
+        from infrastructure.db.mapping_repository import UserMappingSnapshotCache
+        cache = UserMappingSnapshotCache()
+        client = MagicMock()
+        client.table.return_value.select.return_value.eq.return_value \
+            .execute.side_effect = Exception("network")
+
+        assert self._repo(client, cache).get_many(["RDLs"]) == {"RDLs": None}
+        assert cache.get("user-1") is None
+
+    def test_find_matches_agrees_with_find_match(self):
+        """Batched fuzzy matching gives the same answers as per-name matching."""
+        from infrastructure.db.mapping_repository import InMemoryExerciseMatchRepository
+        repo = InMemoryExerciseMatchRepository()
+        names = ["squat", "db bench press", "kb swing", "squat", "xyzzy"]
+
+        matches = repo.find_matches(names, threshold=0.5)
+
+        assert set(matches) == set(names)
+        for name in names:
+            assert matches[name] == repo.find_match(name, threshold=0.5)
+
+
+class TestWorkoutSaveMany:
+    """Tests for batched workout saves."""
+
+    def _client(self, existing=()):
+        client = MagicMock()
+        table = client.table.return_value
+        lookup = table.select.return_value.eq.return_value.in_.return_value.order.return_value
+        lookup.execute.return_value = MagicMock(data=list(existing))
+        table.upsert.return_value.execute.side_effect = lambda: MagicMock(data=[
+            dict(row) for row in table.upsert.call_args[0][0]
+        ])
+        table.insert.return_value.execute.side_effect = lambda: MagicMock(data=[
+            {"id": f"new-{i}", **row} for i, row in enumerate(table.insert.call_args[0][0])
+        ])
+        return client
+
+    def _item(self, title=None, device="garmin"):
+        return {"workout_data": {"title": title, "blocks": []}, "sources": ["ai"], "device": device}
+
+    def test_new_titled_workouts_take_one_lookup_and_one_insert(self):
+        """Dedup is one SELECT per batch of titles instead of one per workout."""
+        from infrastructure.db.workout_repository import SupabaseWorkoutRepository
+        client = self._client()
+        repo = SupabaseWorkoutRepository(client)
+
+        results = repo.save_many("user-1", [self._item(f"Day {i}") for i in range(30)])
+
+        table = client.table.return_value
+        assert table.select.call_count == 1
+        assert table.insert.call_count == 1
+        table.upsert.assert_not_called()
+        assert [r["title"] for r in results] == [f"Day {i}" for i in range(30)]
+
+    def test_existing_workouts_are_updated_by_id(self):
+        """Matches on title and device (newest first) are upserted on their id."""
+        from infrastructure.db.workout_repository import SupabaseWorkoutRepository
+        client = self._client(existing=[
+            {"id": "w-new", "title": "Day 1", "device": "garmin"},
+            {"id": "w-old", "title": "Day 1", "device": "garmin"},
+            {"id": "w-apple", "title": "Day 2", "device": "apple"},
+        ])
+
+        results = SupabaseWorkoutRepository(client).save_many(
+            "user-1", [self._item("Day 1"), self._item("Day 2")]
+        )
+
+        table = client.table.return_value
+        upserted = table.upsert.call_args[0][0]
+        assert [row["id"] for row in upserted] == ["w-new"]
+        assert "updated_at" in upserted[0]
+        assert results[0]["id"] == "w-new"
+        # Same title on another device is a different workout
+        assert results[1]["id"] == "new-0"
+
+    def test_duplicates_in_a_batch_collapse_to_last(self):
+        """Rows with the same title and device are sent once (last wins)."""
+        from infrastructure.db.workout_repository import SupabaseWorkoutRepository
+        client = self._client()
+        first = self._item("Day 1")
+        last = self._item("Day 1")
+        last["workout_data"]["blocks"] = [{"label": "new"}]
+
+        results = SupabaseWorkoutRepository(client).save_many("user-1", [first, last])
+
+        rows = client.table.return_value.insert.call_args[0][0]
+        assert len(rows) == 1
+        assert rows[0]["workout_data"]["blocks"] == [{"label": "new"}]
+        assert results[0] is results[1]
+
+    def test_untitled_workouts_are_inserted_in_batches(self):
+        """Workouts without a title cannot be deduplicated and are inserted."""
+        from infrastructure.db import workout_repository
+        client = self._client()
+        repo = workout_repository.SupabaseWorkoutRepository(client)
+        count = workout_repository.SAVE_BATCH_SIZE + 1
+
+        results = repo.save_many("user-1", [self._item() for _ in range(count)])
+
+        table = client.table.return_value
+        assert table.insert.call_count == 2
+        table.select.assert_not_called()
+        assert all(r is not None for r in results)
+
+    def test_failed_lookup_saves_nothing_for_that_batch(self):
+        """Without the dedup lookup a batch is not written (no blind duplicates)."""
+        from infrastructure.db.workout_repository import SupabaseWorkoutRepository
+        client = self._client()
+        lookup = client.table.return_value.select.return_value.eq.return_value.in_.return_value.order.return_value
+        lookup.execute.side_effect = Exception("timeout")
+
+        results = SupabaseWorkoutRepository(client).save_many("user-1", [self._item("Day 1")])
+
+        assert results == [None]
+        client.table.return_value.insert.assert_not_called()
+
+
+class _FakeResult:
+    def __init__(self, data, count=None):
+        self.data = data
+        self.count = count
+
+
+class _FakeTableQuery:
+    """Minimal PostgREST-style query over in-memory rows."""
+
+    def __init__(self, store, name):
+        self._store = store
+        self._name = name
+        self._filters = []
+        self._order = []
+        self._range = None
+        self._count = None
+        self._upsert = None
+
+    def select(self, columns, count=None):
+        self._count = count
+        return self
+
+    def eq(self, column, value):
+        self._filters.append(lambda r: r.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self._filters.append(lambda r: r.get(column) in values)
+        return self
+
+    def gte(self, column, value):
+        self._filters.append(lambda r: r.get(column) >= value)
+        return self
+
+    def lte(self, column, value):
+        self._filters.append(lambda r: r.get(column) <= value)
+        return self
+
+    @property
+    def not_(self):
+        query = self
+
+        class _Not:
+            def is_(self, column, value):
+                query._filters.append(lambda r: r.get(column) is not None)
+                return query
+
+        return _Not()
+
+    def order(self, column, desc=False):
+        self._order.append((column, desc))
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def limit(self, count):
+        self._range = (0, count - 1)
+        return self
+
+    def upsert(self, rows, on_conflict=None):
+        self._upsert = rows
+        return self
+
+    def execute(self):
+        self._store.calls.append(self._name)
+        if self._upsert is not None:
+            self._store.tables.setdefault(self._name, []).extend(self._upsert)
+            return _FakeResult(self._upsert)
+        rows = [r for r in self._store.tables.get(self._name, []) if all(f(r) for f in self._filters)]
+        for column, desc in reversed(self._order):
+            rows.sort(key=lambda r: r.get(column), reverse=desc)
+        total = len(rows)
+        if self._range:
+            rows = rows[self._range[0]:self._range[1] + 1]
+        return _FakeResult(rows, total if self._count else None)
+
+
+class _FakeSupabase:
+    def __init__(self, tables=None):
+        self.tables = tables or {}
+        self.calls = []
+
+    def table(self, name):
+        return _FakeTableQuery(self, name)
+
+
+def _execution_log(*intervals):
+    return {"intervals": list(intervals)}
+
+
+def _interval(exercise_id, *weights, name=None):
+    return {
+        "canonical_exercise_id": exercise_id,
+        "planned_name": name or exercise_id.title(),
+        "sets": [
+            {"set_number": i + 1, "weight": {"components": [{"value": w, "unit": "kg"}]},
+             "reps_completed": 5, "status": "completed"}
+            for i, w in enumerate(weights)
+        ],
+    }
+
+
+class TestExerciseSetIndex:
+    """Tests for the per-set exercise index and indexed history queries."""
+
+    def test_build_rows_flattens_indexed_intervals(self):
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+
+        rows = build_exercise_set_rows(
+            "user-1", "c1", "2025-01-10T08:00:00Z",
+            _execution_log(
+                _interval("squat", 100, 110),
+                {"planned_name": "Warmup", "sets": [{"set_number": 1}]},
+                _interval("squat", 120),
+            ),
+        )
+
+        assert [(r["interval_index"], r["set_index"]) for r in rows] == [(0, 0), (0, 1), (2, 0)]
+        assert [r["is_session_start"] for r in rows] == [True, False, False]
+        assert rows[0]["weight"] == 100 and rows[0]["weight_unit"] == "kg"
+        assert rows[0]["workout_date"] == "2025-01-10"
+
+    def test_build_rows_handles_missing_log(self):
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+
+        assert build_exercise_set_rows("user-1", "c1", None, None) == []
+
+    def test_completion_save_writes_index_rows(self):
+        from application.ports import HealthMetricsDTO
+        from infrastructure.db.completion_repository import SupabaseCompletionRepository
+
+        client = MagicMock()
+        completions = MagicMock()
+        completions.insert.return_value.execute.return_value.data = [{"id": "c1"}]
+        index = MagicMock()
+        client.table.side_effect = lambda name: {
+            "workout_completions": completions,
+            "exercise_set_index": index,
+        }[name]
+        repo = SupabaseCompletionRepository(client)
+
+        result = repo.save(
+            "user-1",
+            started_at="2025-01-10T08:00:00Z",
+            ended_at="2025-01-10T09:00:00Z",
+            health_metrics=HealthMetricsDTO(),
+            workout_id="w1",
+            execution_log=_execution_log(_interval("squat", 100, 110)),
+        )
+
+        assert result["success"] is True
+        rows = index.upsert.call_args[0][0]
+        assert [r["completion_id"] for r in rows] == ["c1", "c1"]
+        assert index.upsert.call_args[1]["on_conflict"] == "completion_id,interval_index,set_index"
+
+    def test_completion_save_succeeds_when_index_write_fails(self):
+        from application.ports import HealthMetricsDTO
+        from infrastructure.db.completion_repository import SupabaseCompletionRepository
+
+        client = MagicMock()
+        completions = MagicMock()
+        completions.insert.return_value.execute.return_value.data = [{"id": "c1"}]
+        index = MagicMock()
+        index.upsert.return_value.execute.side_effect = Exception("relation does not exist")
+        client.table.side_effect = lambda name: {
+            "workout_completions": completions,
+            "exercise_set_index": index,
+        }[name]
+
+        result = SupabaseCompletionRepository(client).save(
+            "user-1",
+            started_at="2025-01-10T08:00:00Z",
+            ended_at="2025-01-10T09:00:00Z",
+            health_metrics=HealthMetricsDTO(),
+            workout_id="w1",
+            execution_log=_execution_log(_interval("squat", 100)),
+        )
+
+        assert result["success"] is True
+
+    def _indexed_client(self):
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+
+        completions = [
+            {"id": f"c{i}", "user_id": "user-1", "started_at": f"2025-01-{i:02d}T08:00:00Z",
+             "workout_id": f"w{i}", "execution_log": _execution_log(
+                 _interval("squat", 100 + i, 105 + i), _interval("bench", 60))}
+            for i in range(1, 6)
+        ]
+        rows = []
+        for c in completions:
+            rows.extend(build_exercise_set_rows("user-1", c["id"], c["started_at"], c["execution_log"]))
+        return _FakeSupabase({
+            "workout_completions": completions,
+            "exercise_set_index": rows,
+            "workouts": [{"id": f"w{i}", "title": f"Workout {i}"} for i in range(1, 6)],
+        })
+
+    def test_history_paginates_in_database(self):
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        client = self._indexed_client()
+        repo = SupabaseProgressionRepository(client)
+
+        result = repo.get_exercise_history("user-1", "squat", limit=2, offset=1)
+
+        assert result["total"] == 5
+        assert [s["completion_id"] for s in result["sessions"]] == ["c4", "c3"]
+        session = result["sessions"][0]
+        assert session["workout_date"] == "2025-01-04"
+        assert session["workout_name"] == "Workout 4"
+        assert session["exercise_name"] == "Squat"
+        assert [st["weight"] for st in session["sets"]] == [104, 109]
+        # Page query, sets for the page, completion links, workout titles
+        assert client.calls == [
+            "exercise_set_index", "exercise_set_index", "workout_completions", "workouts",
+        ]
+
+    def test_history_falls_back_to_completion_scan(self, monkeypatch):
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        client = MagicMock()
+        client.table.return_value.select.side_effect = Exception("relation does not exist")
+        repo = SupabaseProgressionRepository(client)
+        monkeypatch.setattr(
+            repo, "_get_exercise_history_from_completions",
+            lambda *a, **k: {"sessions": ["legacy"], "total": 1, "exercise": {"id": "squat"}},
+        )
+
+        result = repo.get_exercise_history("user-1", "squat")
+
+        assert result["sessions"] == ["legacy"]
+
+    def test_all_sets_pages_through_index_newest_first(self, monkeypatch):
+        from infrastructure.db import progression_repository
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        monkeypatch.setattr(progression_repository, "ALL_SETS_PAGE_SIZE", 4)
+        client = self._indexed_client()
+
+        rows = SupabaseProgressionRepository(client).get_all_sets("user-1")
+
+        assert len(rows) == 15
+        assert [(r["completion_id"], r["exercise_id"], r["weight"]) for r in rows[:3]] == [
+            ("c5", "squat", 105), ("c5", "squat", 110), ("c5", "bench", 60),
+        ]
+        assert client.calls == ["exercise_set_index"] * 4
+
+    def test_all_sets_falls_back_to_completion_scan(self):
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        client = self._indexed_client()
+        client.tables["exercise_set_index"] = None  # index query raises
+
+        rows = SupabaseProgressionRepository(client).get_all_sets("user-1")
+
+        assert len(rows) == 15
+        assert rows[0]["completion_id"] == "c5"
+
+    def test_1rm_trend_takes_best_estimate_per_period(self):
+        from datetime import date
+
+        from backend.core.progression_service import calculate_1rm
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        client = self._indexed_client()
+
+        trend = SupabaseProgressionRepository(client).get_1rm_trend(
+            "user-1", "squat",
+            start_date=date(2025, 1, 2), end_date=date(2025, 1, 4), granularity="daily",
+        )
+
+        assert trend == [
+            {"period": f"2025-01-0{i}", "estimated_1rm": calculate_1rm(105 + i, 5)}
+            for i in (2, 3, 4)
+        ]
+        assert client.calls == ["workout_completions"]
+
+    @pytest.mark.parametrize("method", ["delete_account", "reset_data"])
+    def test_deleting_completions_invalidates_cached_personal_records(self, monkeypatch, method):
+        from backend.core.personal_records import PersonalRecordsCache
+        from infrastructure.db import device_repository
+        from infrastructure.db.device_repository import SupabaseUserProfileRepository
+
+        cache = PersonalRecordsCache()
+        cache.put("user-1", {})
+        monkeypatch.setattr(device_repository, "get_personal_records_cache", lambda: cache)
+
+        result = getattr(SupabaseUserProfileRepository(MagicMock()), method)("user-1")
+
+        assert result["success"] is True
+        assert cache.get("user-1") is None
+
+    def test_completion_save_updates_cached_personal_records(self, monkeypatch):
+        from application.ports import HealthMetricsDTO
+        from backend.core import personal_records
+        from backend.core.personal_records import PersonalRecordsCache
+        from infrastructure.db import completion_repository
+        from infrastructure.db.completion_repository import SupabaseCompletionRepository
+
+        cache = PersonalRecordsCache()
+        cache.put("user-1", {})
+        monkeypatch.setattr(completion_repository, "get_personal_records_cache", lambda: cache)
+        client = MagicMock()
+        client.table.return_value.insert.return_value.execute.return_value.data = [{"id": "c1"}]
+
+        SupabaseCompletionRepository(client).save(
+            "user-1",
+            started_at="2025-01-10T08:00:00Z",
+            ended_at="2025-01-10T09:00:00Z",
+            health_metrics=HealthMetricsDTO(),
+            workout_id="w1",
+            execution_log=_execution_log(_interval("squat", 100, 110)),
+        )
+
+        assert cache.get("user-1")["squat"].max_weight.value == 110
+
+    def test_last_weight_rows_take_first_completed_weighted_set(self):
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+        from infrastructure.db.last_weight_store import build_last_weight_rows
+
+        squat = _interval("squat", 100, 110)
+        squat["sets"][0]["status"] = "skipped"
+        set_rows = build_exercise_set_rows(
+            "user-1", "c1", "2025-01-10T08:00:00Z",
+            _execution_log(squat, _interval("bench", 60)),
+        )
+
+        rows = build_last_weight_rows(set_rows)
+
+        assert [(r["exercise_id"], r["weight"]) for r in rows] == [("squat", 110), ("bench", 60)]
+
+    def test_last_weight_write_through_keeps_newer_rows(self):
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+        from infrastructure.db.last_weight_store import update_last_weights
+
+        client = _FakeSupabase({"exercise_last_weights": [
+            {"user_id": "user-1", "exercise_id": "squat", "weight": 140,
+             "started_at": "2025-02-01T08:00:00+00:00"},
+        ]})
+        set_rows = build_exercise_set_rows(
+            "user-1", "c1", "2025-01-10T08:00:00Z",
+            _execution_log(_interval("squat", 100), _interval("bench", 60)),
+        )
+
+        assert update_last_weights(client, "user-1", set_rows) == 1
+        assert [r["exercise_id"] for r in client.tables["exercise_last_weights"]] == ["squat", "bench"]
+
+    def test_last_weights_read_store_then_index(self):
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        client = self._indexed_client()
+        client.tables["exercise_last_weights"] = [
+            {"user_id": "user-1", "exercise_id": "squat", "weight": 200, "weight_unit": "kg",
+             "reps_completed": 3, "workout_date": "2025-01-06", "completion_id": "c6"},
+        ]
+
+        result = SupabaseProgressionRepository(client).get_last_weights(
+            "user-1", ["squat", "bench", "deadlift"]
+        )
+
+        assert result["squat"]["weight"] == 200
+        assert result["bench"]["completion_id"] == "c5"
+        assert "deadlift" not in result
+        # Store lookup, then one index query for every exercise missing from it
+        assert client.calls == ["exercise_last_weights", "exercise_set_index"]
+
+    def test_last_weights_index_pages_until_every_exercise_is_seen(self, monkeypatch):
+        from infrastructure.db import progression_repository
+        from infrastructure.db.progression_repository import SupabaseProgressionRepository
+
+        from infrastructure.db.exercise_set_index import build_exercise_set_rows
+
+        monkeypatch.setattr(progression_repository, "ALL_SETS_PAGE_SIZE", 4)
+        client = self._indexed_client()
+        client.tables["exercise_set_index"].extend(build_exercise_set_rows(
+            "user-1", "c0", "2024-12-01T08:00:00Z", _execution_log(_interval("deadlift", 150)),
+        ))
+
+        result = SupabaseProgressionRepository(client).get_last_weights("user-1", ["squat", "deadlift"])
+
+        assert result["squat"]["weight"] == 105
+        assert result["deadlift"]["completion_id"] == "c0"
+        # 10 squat sets are newer than the only deadlift set: three pages of 4
+        assert client.calls == ["exercise_last_weights"] + ["exercise_set_index"] * 3
+
+    def test_exercises_get_by_ids_queries_cache_misses_once(self):
+        from infrastructure.db.exercises_repository import SupabaseExercisesRepository
+
+        client = _FakeSupabase({"exercises": [{"id": "squat", "name": "Squat"}, {"id": "bench", "name": "Bench"}]})
+        repo = SupabaseExercisesRepository(client)
+        repo._cache_loaded = True
+
+        found = repo.get_by_ids(["squat", "bench", "unknown", "squat"])
+
+        assert sorted(found) == ["bench", "squat"]
+        assert client.calls == ["exercises"]
+        assert repo.get_by_ids(["bench"]) == {"bench": {"id": "bench", "name": "Bench"}}
+        assert client.calls == ["exercises"]
+
+
 # ============================================================================
 # E2E Tests (require real database connection - nightly runs only)
 # ============================================================================
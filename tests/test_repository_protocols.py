@@ -174,7 +174,7 @@ class TestMappingRepositoriesProtocols:
         """UserMappingRepository should define all required methods."""
         from application.ports import UserMappingRepository
 
-        required_methods = ["add", "remove", "get", "get_all", "clear_all"]
+        required_methods = ["add", "remove", "get", "get_many", "get_all", "clear_all"]
 
         for method_name in required_methods:
             assert hasattr(UserMappingRepository, method_name), \
@@ -196,6 +196,7 @@ class TestMappingRepositoriesProtocols:
 
         required_methods = [
             "find_match",
+            "find_matches",
             "get_suggestions",
             "find_similar",
             "find_by_type",
@@ -0,0 +1,138 @@
+"""
+Unit tests for the AIMD adaptive concurrency limiter.
+
+Tests cover:
+- Additive increase on healthy responses, capped at max_limit
+- Multiplicative decrease on 429/gateway errors, timeouts and latency spikes
+- Waiters being admitted as slots free up
+"""
+
+import asyncio
+
+import pytest
+
+from backend.services.adaptive_limiter import AdaptiveLimiter
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def _call(limiter, clock, status=200, latency=0.1):
+    async with limiter.slot() as slot:
+        clock.now += latency
+        slot.record(status)
+
+
+class TestAdaptiveLimiter:
+    async def test_healthy_responses_raise_limit(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=8, clock=clock)
+
+        for _ in range(10):
+            await _call(limiter, clock)
+
+        assert limiter.limit > 2
+
+    async def test_limit_is_capped(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=3, clock=clock)
+
+        for _ in range(100):
+            await _call(limiter, clock)
+
+        assert limiter.limit == 3
+
+    async def test_429_halves_limit_once_per_round(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=16, clock=clock)
+        await _call(limiter, clock)
+
+        await _call(limiter, clock, status=429)
+        await _call(limiter, clock, status=503, latency=0.0)
+
+        assert limiter.limit == 8
+        assert limiter.metrics()["decreases"] == 1
+
+    async def test_plain_500_does_not_shrink_limit(self):
+        """Per-request server errors (bad URLs in a link dump) are not overload."""
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=8, clock=clock)
+
+        for _ in range(5):
+            await _call(limiter, clock, status=500)
+
+        assert limiter.limit >= 8
+        assert limiter.metrics()["decreases"] == 0
+
+    async def test_timeout_counts_as_overload(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=8, clock=clock)
+
+        with pytest.raises(asyncio.TimeoutError):
+            async with limiter.slot():
+                raise asyncio.TimeoutError()
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    async def test_latency_spike_counts_as_overload(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2.0, clock=clock)
+        for _ in range(5):
+            await _call(limiter, clock, latency=0.1)
+        limit = limiter.limit
+
+        for _ in range(5):
+            await _call(limiter, clock, latency=2.0)
+
+        assert limiter.limit < limit
+
+    async def test_latency_signal_can_be_disabled(self):
+        clock = _Clock()
+        limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=None, clock=clock)
+        await _call(limiter, clock, latency=0.1)
+
+        await _call(limiter, clock, latency=5.0)
+
+        assert limiter.limit == 8
+
+    async def test_waiters_are_admitted_in_order(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        first = await limiter.acquire()
+        order = []
+
+        async def wait(name):
+            async with limiter.slot() as slot:
+                order.append(name)
+                slot.record(200)
+
+        tasks = [asyncio.create_task(wait(n)) for n in ("a", "b")]
+        await asyncio.sleep(0)
+        assert limiter.metrics()["waiting"] == 2
+
+        first._close(None)
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b"]
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_is_removed(self):
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+        held = await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        held._close(None)
+
+        assert limiter.metrics()["waiting"] == 0
+        assert limiter.in_flight == 0
@@ -175,6 +175,62 @@ class TestAIClientFactory:
             AIClientFactory.create_anthropic_client()
 
 
+class TestAsyncAnthropicClient:
+    """Tests for the shared AsyncAnthropic client."""
+
+    @staticmethod
+    def _settings(helicone=False):
+        settings = MagicMock()
+        settings.ANTHROPIC_API_KEY = "sk-test"
+        settings.helicone_enabled = helicone
+        settings.helicone_api_key = "hk-test" if helicone else None
+        settings.environment = "test"
+        return settings
+
+    @patch("backend.ai.client_factory.get_settings")
+    async def test_clients_share_one_connection_pool(self, mock_get_settings):
+        """Per-request clients are views on one pooled client per loop."""
+        from backend.ai import AIClientFactory, AIRequestContext
+        from backend.ai.client_factory import close_async_ai_clients
+
+        mock_get_settings.return_value = self._settings()
+
+        first = AIClientFactory.create_async_anthropic_client(AIRequestContext(user_id="a"))
+        second = AIClientFactory.create_async_anthropic_client(AIRequestContext(user_id="b"))
+
+        assert first is not second
+        assert first._client is second._client
+        await close_async_ai_clients()
+
+    @patch("backend.ai.client_factory.get_settings")
+    async def test_tracking_headers_are_per_request(self, mock_get_settings):
+        """Helicone tracking headers are set on each request's view only."""
+        from backend.ai import AIClientFactory, AIRequestContext
+        from backend.ai.client_factory import close_async_ai_clients
+
+        mock_get_settings.return_value = self._settings(helicone=True)
+
+        client = AIClientFactory.create_async_anthropic_client(AIRequestContext(user_id="user-1"))
+        other = AIClientFactory.create_async_anthropic_client(AIRequestContext(user_id="user-2"))
+
+        assert client.default_headers["Helicone-User-Id"] == "user-1"
+        assert other.default_headers["Helicone-User-Id"] == "user-2"
+        assert client.default_headers["Helicone-Auth"] == "Bearer hk-test"
+        await close_async_ai_clients()
+
+    @patch("backend.ai.client_factory.get_settings")
+    async def test_missing_api_key(self, mock_get_settings):
+        """Missing API key raises ValueError."""
+        from backend.ai import AIClientFactory
+
+        settings = self._settings()
+        settings.ANTHROPIC_API_KEY = None
+        mock_get_settings.return_value = settings
+
+        with pytest.raises(ValueError, match="Anthropic API key not configured"):
+            AIClientFactory.create_async_anthropic_client()
+
+
 class TestHeaderSanitization:
     """Tests for header sanitization functions."""
 
@@ -0,0 +1,152 @@
+"""
+Unit tests for the background task runner.
+
+Tests for:
+- Running, retrying and failing fire-and-forget tasks
+- Bounded queue rejection
+- Priority order and round-robin between keys
+- Draining on shutdown
+- PatchWorkoutUseCase queuing its audit trail write
+"""
+
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from application.use_cases.patch_workout import PatchWorkoutUseCase
+from backend.services.background_tasks import BackgroundTaskRunner, TaskPriority
+from domain.models.patch_operation import PatchOperation
+
+
+@pytest.fixture
+def runner():
+    runner = BackgroundTaskRunner(workers=2, max_queue_size=10, max_attempts=3, retry_base_seconds=0)
+    yield runner
+    runner.shutdown(timeout=1)
+
+
+def _blocked_runner(**kwargs):
+    """Single-worker runner whose worker is parked until the returned event is set."""
+    runner = BackgroundTaskRunner(workers=1, retry_base_seconds=0, **kwargs)
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    runner.submit("block", block)
+    assert started.wait(5)
+    return runner, release
+
+
+class TestBackgroundTaskRunner:
+    def test_runs_task(self, runner):
+        done = []
+        assert runner.submit("append", done.append, 1, key="user-1")
+        assert runner.wait_idle(5)
+        assert done == [1]
+        metrics = runner.metrics()
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0
+
+    def test_retries_until_success(self, runner):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+
+        runner.submit("flaky", flaky)
+        assert runner.wait_idle(5)
+        assert len(calls) == 3
+        metrics = runner.metrics()
+        assert (metrics["retried"], metrics["completed"], metrics["failed"]) == (2, 1, 0)
+
+    def test_gives_up_after_max_attempts(self, runner):
+        calls = []
+
+        def broken():
+            calls.append(1)
+            raise RuntimeError("down")
+
+        runner.submit("broken", broken)
+        assert runner.wait_idle(5)
+        assert len(calls) == 3
+        assert runner.metrics()["failures_by_task"] == {"broken": 1}
+
+    def test_rejects_when_queue_full(self):
+        runner, release = _blocked_runner(max_queue_size=2)
+        assert runner.submit("a", lambda: None)
+        assert runner.submit("b", lambda: None)
+        assert not runner.submit("c", lambda: None)
+        assert runner.metrics()["dropped"] == 1
+        release.set()
+        runner.shutdown(timeout=5)
+
+    def test_priority_then_round_robin_between_keys(self):
+        runner, release = _blocked_runner()
+        order = []
+        for i in range(3):
+            runner.submit("low", order.append, f"a{i}", key="a", priority=TaskPriority.LOW)
+        runner.submit("low", order.append, "b0", key="b", priority=TaskPriority.LOW)
+        runner.submit("high", order.append, "high", key="a", priority=TaskPriority.HIGH)
+
+        release.set()
+        assert runner.wait_idle(5)
+        assert order == ["high", "a0", "b0", "a1", "a2"]
+        runner.shutdown(timeout=1)
+
+    def test_shutdown_drains_queue_and_rejects_new_work(self):
+        runner, release = _blocked_runner()
+        done = []
+        for i in range(5):
+            runner.submit("append", done.append, i)
+        release.set()
+        assert runner.shutdown(timeout=5) == 0
+        assert done == [0, 1, 2, 3, 4]
+        assert not runner.submit("late", done.append, 5)
+
+    def test_shutdown_timeout_drops_remaining(self):
+        runner, release = _blocked_runner()
+        runner.submit("never", lambda: None)
+        assert runner.shutdown(timeout=0.05) == 1
+        release.set()
+
+
+class TestPatchAuditInBackground:
+    @pytest.fixture
+    def repo(self):
+        from tests.unit.test_patch_workout import MockWorkoutRepository, setup_mock_workout
+
+        repo = MockWorkoutRepository()
+        setup_mock_workout(repo, "w-1", "user-1", {
+            "title": "Test",
+            "blocks": [{"exercises": [{"name": "Squat", "sets": 3}]}],
+        })
+        return repo
+
+    def _patch(self, use_case):
+        return use_case.execute(
+            workout_id="w-1",
+            user_id="user-1",
+            operations=[PatchOperation(op="replace", path="/title", value="New")],
+        )
+
+    def test_audit_is_queued(self, repo, runner):
+        result = self._patch(PatchWorkoutUseCase(workout_repo=repo, task_runner=runner))
+        assert result.success
+        assert runner.wait_idle(5)
+        assert runner.metrics()["completed"] == 1
+        assert repo._audit_logs[0]["operations"] == [{"op": "replace", "path": "/title", "value": "New"}]
+
+    def test_audit_runs_inline_when_queue_full(self, repo):
+        runner, release = _blocked_runner(max_queue_size=1)
+        runner.submit("filler", lambda: None)
+
+        assert self._patch(PatchWorkoutUseCase(workout_repo=repo, task_runner=runner)).success
+        assert len(repo._audit_logs) == 1
+        release.set()
+        runner.shutdown(timeout=5)
@@ -0,0 +1,541 @@
+"""
+Unit tests for the bulk import worker pools.
+
+Tests for:
+- FairSlotScheduler round-robin slot hand-off between users
+- BulkImportExecutor running I/O and CPU work off the event loop
+- ImportJob per-job concurrency limit
+- BulkImportService detect/match/preview running through the executor
+- URL detection pipelined per source and streamed into the job
+- Batched, deduplicated import execution with coalesced progress and cancellation checks
+"""
+
+import asyncio
+import base64
+import operator
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from backend.services.bulk_import_executor import (
+    BulkImportExecutor,
+    FairSlotScheduler,
+    match_exercise_names,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def thread_executor():
+    """Executor that runs CPU work on threads (no worker processes)."""
+    executor = BulkImportExecutor(io_workers=2, cpu_workers=0, job_concurrency=2)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def bulk_service(thread_executor, monkeypatch):
+    """BulkImportService with no database, wired to the thread executor."""
+    import backend.bulk_import as bulk_import
+
+    monkeypatch.setattr(bulk_import, "get_bulk_import_executor", lambda: thread_executor)
+    service = bulk_import.BulkImportService.__new__(bulk_import.BulkImportService)
+    service.supabase = None
+    return service
+
+
+# =============================================================================
+# FairSlotScheduler Tests
+# =============================================================================
+
+
+class TestFairSlotScheduler:
+    """Tests for round-robin slot scheduling."""
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            FairSlotScheduler(0)
+
+    async def test_acquire_within_capacity_does_not_wait(self):
+        scheduler = FairSlotScheduler(2)
+        await scheduler.acquire("a")
+        await scheduler.acquire("b")
+
+        assert scheduler.in_use == 2
+        assert scheduler.waiting == 0
+
+    async def test_release_alternates_between_users(self):
+        scheduler = FairSlotScheduler(1)
+        await scheduler.acquire("holder")
+        order = []
+
+        async def worker(user: str, tag: str):
+            await scheduler.acquire(user)
+            order.append(tag)
+            scheduler.release()
+
+        # User "a" queues three tasks before "b" queues one
+        tasks = [asyncio.create_task(worker("a", f"a{i}")) for i in range(3)]
+        tasks.append(asyncio.create_task(worker("b", "b0")))
+        await asyncio.sleep(0)
+        assert scheduler.waiting == 4
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a0", "b0", "a1", "a2"]
+        assert scheduler.in_use == 0
+
+    async def test_cancelled_waiter_is_removed(self):
+        scheduler = FairSlotScheduler(1)
+        await scheduler.acquire("a")
+
+        task = asyncio.create_task(scheduler.acquire("b"))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert scheduler.waiting == 0
+        scheduler.release()
+        assert scheduler.in_use == 0
+
+
+# =============================================================================
+# BulkImportExecutor Tests
+# =============================================================================
+
+
+class TestBulkImportExecutor:
+    """Tests for running work on the pools."""
+
+    async def test_run_io_runs_off_event_loop_thread(self, thread_executor):
+        loop_thread = threading.get_ident()
+
+        worker_thread = await thread_executor.run_io("user", threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    async def test_run_io_passes_kwargs(self, thread_executor):
+        result = await thread_executor.run_io("user", dict, a=1, b=2)
+
+        assert result == {"a": 1, "b": 2}
+
+    async def test_run_cpu_falls_back_to_threads_when_disabled(self, thread_executor):
+        result = await thread_executor.run_cpu("user", operator.mul, 6, 7)
+
+        assert result == 42
+
+    async def test_run_cpu_uses_process_pool(self):
+        executor = BulkImportExecutor(io_workers=1, cpu_workers=1)
+        try:
+            result = await executor.run_cpu("user", operator.mul, 6, 7)
+        finally:
+            executor.shutdown()
+
+        assert result == 42
+
+    async def test_job_limits_in_flight_tasks(self):
+        executor = BulkImportExecutor(io_workers=8, cpu_workers=0, job_concurrency=2)
+        job = executor.job("user", "job-1")
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def work():
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            threading.Event().wait(0.02)
+            with lock:
+                in_flight -= 1
+
+        try:
+            await asyncio.gather(*(job.run_io(work) for _ in range(6)))
+        finally:
+            executor.shutdown()
+
+        assert peak <= 2
+
+    def test_match_exercise_names_returns_match_and_suggestions(self):
+        results = match_exercise_names(["Push Up"])
+
+        matched_name, confidence, suggestions = results["Push Up"]
+        assert matched_name is not None
+        assert 0 < confidence <= 1
+        assert all("name" in s and "confidence" in s for s in suggestions)
+
+
+# =============================================================================
+# BulkImportService Integration
+# =============================================================================
+
+
+class TestBulkImportServiceOffLoop:
+    """BulkImportService steps running through the executor."""
+
+    async def test_detect_files_parses_and_preserves_order(self, bulk_service):
+        csv_a = base64.b64encode(b"Exercise,Sets,Reps\nSquat,3,10\n").decode()
+        csv_b = base64.b64encode(b"Exercise,Sets,Reps\nBench Press,3,8\n").decode()
+
+        response = await bulk_service.detect_items(
+            profile_id="user-1",
+            source_type="file",
+            sources=[f"a.csv:{csv_a}", f"b.csv:{csv_b}"],
+        )
+
+        assert [item.source_ref for item in response.items] == ["a.csv", "b.csv"]
+        assert response.success_count + response.error_count == 2
+
+    async def test_detect_urls_streams_items_as_they_finish(self, bulk_service, monkeypatch):
+        import backend.bulk_import as bulk_import
+        from backend.parsers import URLMetadata
+
+        urls = [f"https://example.com/{i}" for i in range(60)]
+        stored = []
+
+        async def fetch_metadata(url):
+            # Later URLs finish first
+            index = int(url.rsplit("/", 1)[1])
+            await asyncio.sleep((60 - index) * 0.0005)
+            if index == 3:
+                return URLMetadata(url=url, platform="unknown", error="Not found")
+            return URLMetadata(url=url, platform="unknown", title=f"Video {index}")
+
+        monkeypatch.setattr(bulk_import.URLParser, "fetch_metadata", fetch_metadata)
+        monkeypatch.setattr(
+            bulk_service, "_store_detected_items",
+            lambda job_id, profile_id, items: stored.append([i["source_index"] for i in items]),
+        )
+        monkeypatch.setattr(bulk_service, "_update_job_progress", lambda *a: None)
+
+        response = await bulk_service.detect_items(
+            profile_id="user-1", source_type="urls", sources=urls,
+        )
+
+        assert [item.source_ref for item in response.items] == urls
+        assert response.error_count == 1
+        assert response.items[3].errors == ["Not found"]
+        assert len(stored) == 2
+        assert stored[0][0] == 59
+        assert sorted(sum(stored, [])) == list(range(60))
+
+    async def test_detect_urls_turns_a_raising_source_into_an_error_item(self, bulk_service, monkeypatch):
+        import backend.bulk_import as bulk_import
+        from backend.parsers import URLMetadata
+
+        urls = [f"https://example.com/{i}" for i in range(3)]
+        stored = []
+
+        async def fetch_metadata(url):
+            if url.endswith("/1"):
+                raise RuntimeError("oEmbed exploded")
+            return URLMetadata(url=url, platform="unknown", title="Video")
+
+        monkeypatch.setattr(bulk_import.URLParser, "fetch_metadata", fetch_metadata)
+        monkeypatch.setattr(
+            bulk_service, "_store_detected_items",
+            lambda job_id, profile_id, items: stored.extend(i["source_index"] for i in items),
+        )
+        monkeypatch.setattr(bulk_service, "_update_job_progress", lambda *a: None)
+
+        response = await bulk_service.detect_items(
+            profile_id="user-1", source_type="urls", sources=urls,
+        )
+
+        assert [item.source_ref for item in response.items] == urls
+        assert response.items[1].errors == ["oEmbed exploded"]
+        assert response.error_count == 1
+        assert sorted(stored) == [0, 1, 2]
+
+    async def test_detect_urls_charges_classification_budget(self, bulk_service, monkeypatch):
+        import backend.bulk_import as bulk_import
+        from backend.parsers import URLMetadata
+        from backend.services.content_classifier import (
+            ClassificationConfidence,
+            ClassificationResult,
+            ContentCategory,
+        )
+        from backend.services.rate_limiter import FEATURE_CLASSIFICATION, RateBudget, RateLimiter
+
+        urls = [f"https://youtube.com/watch?v={i}" for i in range(3)]
+        llm_calls = []
+
+        async def fetch_metadata(url):
+            return URLMetadata(url=url, platform="youtube", video_id=url[-1], title="Video")
+
+        async def classify_content(video_id, platform, title, description, llm_allowed=None):
+            llm_calls.append(llm_allowed())
+            return ClassificationResult(
+                category=ContentCategory.UNCERTAIN,
+                confidence=ClassificationConfidence.LOW,
+                reason="keywords only",
+            )
+
+        limiter = RateLimiter(budgets={FEATURE_CLASSIFICATION: RateBudget(requests_per_minute=1, burst=2)})
+        monkeypatch.setattr(bulk_import.URLParser, "fetch_metadata", fetch_metadata)
+        monkeypatch.setattr(bulk_import, "classify_content", classify_content)
+        monkeypatch.setattr(bulk_import, "get_rate_limiter", lambda: limiter)
+        monkeypatch.setattr(bulk_service, "_store_detected_items", lambda *a: None)
+        monkeypatch.setattr(bulk_service, "_update_job_progress", lambda *a: None)
+
+        response = await bulk_service.detect_items(
+            profile_id="user-1", source_type="urls", sources=urls,
+        )
+
+        assert sorted(llm_calls) == [False, True, True]
+        assert response.error_count == 0
+        assert not limiter.check("user-1", FEATURE_CLASSIFICATION).allowed
+        assert limiter.check("user-2", FEATURE_CLASSIFICATION).allowed
+
+    async def test_detect_images_turns_a_raising_source_into_an_error_item(self, bulk_service, monkeypatch):
+        import backend.bulk_import as bulk_import
+
+        async def parse_image(image_data, filename, mode):
+            raise RuntimeError("vision timeout")
+
+        monkeypatch.setattr(bulk_import.ImageParser, "parse_image", parse_image)
+        monkeypatch.setattr(bulk_service, "_store_detected_items", lambda *a: None)
+        monkeypatch.setattr(bulk_service, "_update_job_progress", lambda *a: None)
+
+        response = await bulk_service.detect_items(
+            profile_id="user-1",
+            source_type="images",
+            sources=[(base64.b64encode(b"img").decode(), "a.jpg")],
+        )
+
+        assert response.items[0].source_ref == "a.jpg"
+        assert response.items[0].errors == ["vision timeout"]
+
+    async def test_match_exercises_uses_user_mappings(self, bulk_service, monkeypatch):
+        monkeypatch.setattr(bulk_service, "_get_detected_items", lambda *a, **k: [
+            {
+                "id": "item-1",
+                "parsed_workout": {
+                    "blocks": [{"exercises": [{"name": "Push Up"}, {"name": "My Lift"}]}]
+                },
+            }
+        ])
+
+        response = await bulk_service.match_exercises(
+            "job-1", "user-1", user_mappings={"My Lift": "DEADLIFT"}
+        )
+
+        by_name = {e.original_name: e for e in response.exercises}
+        assert by_name["My Lift"].matched_garmin_name == "DEADLIFT"
+        assert by_name["My Lift"].status == "matched"
+        assert by_name["Push Up"].matched_garmin_name is not None
+
+    async def test_generate_preview_marks_selection(self, bulk_service, monkeypatch):
+        monkeypatch.setattr(bulk_service, "_get_detected_items", lambda *a, **k: [
+            {"id": "item-1", "source_index": 0, "parsed_title": "A", "parsed_workout": {}},
+            {"id": "item-2", "source_index": 1, "parsed_title": "B", "parsed_workout": {}},
+        ])
+
+        response = await bulk_service.generate_preview("job-1", "user-1", ["item-2"])
+
+        assert [w.selected for w in response.workouts] == [False, True]
+        assert response.stats.total_selected == 1
+        assert response.stats.total_skipped == 1
+
+
+# =============================================================================
+# Import Execution
+# =============================================================================
+
+
+
+
+class _FakeQuery:
+    def __init__(self, table: "_FakeTable", payload=None):
+        self._table = table
+        self._payload = payload
+        self._filters = []
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self._filters.append(lambda r: r.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        self._filters.append(lambda r: r.get(column) in values)
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def execute(self):
+        if self._payload is None:
+            self._table.lookups += 1
+            # Newest first
+            return SimpleNamespace(
+                data=[r for r in reversed(self._table.rows) if all(f(r) for f in self._filters)]
+            )
+        if self._table.fail(self._payload):
+            raise RuntimeError("upsert failed")
+        self._table.upserts.append(self._payload)
+        for row in self._payload if isinstance(self._payload, list) else [self._payload]:
+            self._table.rows = [r for r in self._table.rows if r["id"] != row["id"]] + [dict(row)]
+        return SimpleNamespace(data=self._payload)
+
+
+class _FakeTable:
+    def __init__(self, fail):
+        self.fail = fail
+        self.rows = []
+        self.upserts = []
+        self.lookups = 0
+
+    def select(self, columns):
+        return _FakeQuery(self)
+
+    def upsert(self, payload):
+        return _FakeQuery(self, payload)
+
+
+class _FakeSupabase:
+    def __init__(self, fail=lambda payload: False):
+        self.workouts = _FakeTable(fail)
+
+    def table(self, name):
+        assert name == "workouts"
+        return self.workouts
+
+
+class TestImportExecution:
+    """Tests for BulkImportService._process_import_sync."""
+
+    @pytest.fixture
+    def execution_service(self, bulk_service, monkeypatch):
+        """Service with 120 detected items and recorded DB calls."""
+        calls = {"progress": [], "get_job": 0, "cancel_at": None}
+        detected = [
+            {"id": f"item-{i}", "source_index": i, "source_ref": f"src-{i}", "parsed_title": f"W{i}"}
+            for i in range(120)
+        ]
+
+        def get_job(job_id, profile_id):
+            calls["get_job"] += 1
+            cancelled = calls["cancel_at"] is not None and calls["get_job"] >= calls["cancel_at"]
+            return {"status": "cancelled" if cancelled else "running"}
+
+        bulk_service.supabase = _FakeSupabase()
+        monkeypatch.setattr(bulk_service, "_get_detected_items", lambda *a, **k: detected)
+        monkeypatch.setattr(bulk_service, "_get_job", get_job)
+        monkeypatch.setattr(
+            bulk_service, "_update_job_progress",
+            lambda job_id, profile_id, processed, current: calls["progress"].append(processed),
+        )
+        return bulk_service, calls
+
+    async def test_batches_upserts_and_preserves_order(self, execution_service):
+        service, calls = execution_service
+        workout_ids = [f"item-{i}" for i in range(120)] + ["missing"]
+
+        results = await service._process_import_sync("job-1", "user-1", workout_ids, "garmin")
+
+        upserts = service.supabase.workouts.upserts
+        assert [r.workout_id for r in results] == workout_ids
+        assert results[-1].status == "failed"
+        assert results[-1].error == "Workout not found"
+        assert all(r.status == "success" and r.saved_workout_id for r in results[:-1])
+        assert sum(len(batch) for batch in upserts) == 120
+        assert max(len(batch) for batch in upserts) <= 25
+        # One dedup lookup per batch
+        assert service.supabase.workouts.lookups == len(upserts)
+
+    async def test_reimport_updates_instead_of_duplicating(self, execution_service):
+        service, calls = execution_service
+        workout_ids = [f"item-{i}" for i in range(120)]
+
+        first = await service._process_import_sync("job-1", "user-1", workout_ids, "garmin")
+        second = await service._process_import_sync("job-2", "user-1", workout_ids, "garmin")
+
+        assert len(service.supabase.workouts.rows) == 120
+        assert [r.saved_workout_id for r in second] == [r.saved_workout_id for r in first]
+
+    async def test_duplicate_titles_in_one_import_share_a_workout(self, execution_service, monkeypatch):
+        service, calls = execution_service
+        detected = [
+            {"id": f"item-{i}", "source_index": i, "parsed_title": "Leg Day"}
+            for i in range(30)
+        ]
+        monkeypatch.setattr(service, "_get_detected_items", lambda *a, **k: detected)
+
+        results = await service._process_import_sync(
+            "job-1", "user-1", [item["id"] for item in detected], "garmin"
+        )
+
+        assert all(r.status == "success" for r in results)
+        assert len({r.saved_workout_id for r in results}) == 1
+        assert len(service.supabase.workouts.rows) == 1
+
+    async def test_coalesces_progress_writes(self, execution_service):
+        service, calls = execution_service
+        workout_ids = [f"item-{i}" for i in range(120)]
+
+        await service._process_import_sync("job-1", "user-1", workout_ids, "garmin")
+
+        assert calls["progress"][-1] == 120
+        assert len(calls["progress"]) <= 3
+        # Initial cancellation check, then one per coalesced progress write
+        assert calls["get_job"] <= 3
+
+    async def test_cancelled_job_writes_nothing(self, execution_service):
+        service, calls = execution_service
+        calls["cancel_at"] = 1
+        workout_ids = [f"item-{i}" for i in range(120)]
+
+        results = await service._process_import_sync("job-1", "user-1", workout_ids, "garmin")
+
+        assert results == []
+        assert service.supabase.workouts.upserts == []
+
+    async def test_stops_when_cancelled(self, execution_service):
+        service, calls = execution_service
+        calls["cancel_at"] = 2
+        workout_ids = [f"item-{i}" for i in range(120)]
+
+        results = await service._process_import_sync("job-1", "user-1", workout_ids, "garmin")
+
+        assert len(results) == 50
+
+    def test_upsert_workouts_retries_rows_individually(self, bulk_service):
+        bulk_service.supabase = _FakeSupabase(
+            fail=lambda payload: isinstance(payload, list) or payload["title"] == "bad"
+        )
+        records = [{"id": "1", "title": "ok-1"}, {"id": "2", "title": "bad"}, {"id": "3", "title": "ok-2"}]
+
+        errors = bulk_service._upsert_workouts(records)
+
+        assert errors[0] is None
+        assert errors[1] == "upsert failed"
+        assert errors[2] is None
+        assert len(bulk_service.supabase.workouts.upserts) == 2
+
+    def test_save_workouts_single_lookup_and_request_for_batch(self, bulk_service):
+        bulk_service.supabase = _FakeSupabase()
+        bulk_service.supabase.workouts.rows = [
+            {"id": "old", "profile_id": "user-1", "title": "a", "device": "garmin"},
+        ]
+        records = [
+            {"id": "new-a", "profile_id": "user-1", "title": "a", "device": "garmin"},
+            {"id": "new-b", "profile_id": "user-1", "title": "b", "device": "garmin"},
+        ]
+
+        errors = bulk_service._save_workouts("user-1", records, {})
+
+        assert errors == [None, None]
+        assert [r["id"] for r in records] == ["old", "new-b"]
+        assert bulk_service.supabase.workouts.lookups == 1
+        assert len(bulk_service.supabase.workouts.upserts) == 1
@@ -0,0 +1,135 @@
+"""
+Unit tests for ChatService streaming.
+
+Tests cover:
+- Text deltas and tool calls streamed from the async Anthropic client
+- Tool execution running off the event loop thread
+- Upstream errors reported as SSE error events
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.chat_service import ChatService
+
+pytestmark = pytest.mark.unit
+
+
+def _text(text):
+    return SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=text))
+
+
+def _tool_use(name, tool_input):
+    block = SimpleNamespace(type="tool_use", name=name, input=tool_input)
+    return SimpleNamespace(type="content_block_stop", content_block=block)
+
+
+class _FakeStream:
+    def __init__(self, events):
+        self._events = events
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self._events:
+            yield event
+
+
+class _FakeClient:
+    def __init__(self, events=None, error=None):
+        def stream(**kwargs):
+            if error:
+                raise error
+            return _FakeStream(events)
+
+        self.messages = SimpleNamespace(stream=stream)
+
+
+class _SlowToolExecutor:
+    def __init__(self):
+        self.thread = None
+
+    def execute_tool(self, tool_name, parameters, profile_id=""):
+        self.thread = threading.current_thread()
+        time.sleep(0.05)
+        return {"success": True, "query": parameters["query"]}
+
+
+async def _collect(service, monkeypatch, client):
+    monkeypatch.setattr(service, "create_anthropic_client", lambda user_id, session_id: client)
+    monkeypatch.setattr(service, "_persist_message", lambda *args: None)
+    return [event async for event in service.stream_chat("user-1", "session-1", "hi", None)]
+
+
+class TestStreamChat:
+    async def test_streams_text_and_tool_results(self, monkeypatch):
+        executor = _SlowToolExecutor()
+        service = ChatService(tool_executor=executor)
+        client = _FakeClient([
+            _text("Here "),
+            _text("you go"),
+            _tool_use("search_workouts", {"query": "legs"}),
+            SimpleNamespace(type="message_stop"),
+        ])
+
+        events = await _collect(service, monkeypatch, client)
+
+        assert [e[0] for e in events] == [
+            "message_start", "content_delta", "content_delta",
+            "function_call", "function_result", "message_end",
+        ]
+        assert events[4][1]["result"] == {"success": True, "query": "legs"}
+
+    async def test_tool_runs_off_the_event_loop(self, monkeypatch):
+        import asyncio
+
+        executor = _SlowToolExecutor()
+        service = ChatService(tool_executor=executor)
+        client = _FakeClient([_tool_use("search_workouts", {"query": "legs"})])
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await _collect(service, monkeypatch, client)
+        task.cancel()
+
+        assert executor.thread is not threading.current_thread()
+        assert ticks >= 3
+
+    async def test_tool_failure_is_reported(self, monkeypatch):
+        class _Failing:
+            def execute_tool(self, **kwargs):
+                raise RuntimeError("db down")
+
+        service = ChatService(tool_executor=_Failing())
+        client = _FakeClient([_tool_use("search_workouts", {"query": "legs"})])
+
+        events = await _collect(service, monkeypatch, client)
+
+        result = dict(events)["function_result"]["result"]
+        assert result == {"success": False, "error": "Tool execution failed"}
+
+    async def test_upstream_rate_limit_becomes_error_event(self, monkeypatch):
+        service = ChatService()
+        client = _FakeClient(error=RuntimeError("429 rate limit"))
+
+        events = await _collect(service, monkeypatch, client)
+
+        assert events[1][0] == "error"
+        assert events[1][1]["error_type"] == "rate_limit_exceeded"
+        assert events[-1][0] == "message_end"
@@ -0,0 +1,171 @@
+"""
+Unit tests for companion feed polling helpers.
+
+Tests cover:
+- Companion payloads cached by workout_data hash
+- ETag generation and If-None-Match matching
+- Delta cursors, including workouts entering the limit window
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from backend.services.companion_feed import (
+    CompanionPayloadCache,
+    build_companion_feed,
+    decode_cursor,
+    encode_cursor,
+    etag_matches,
+    feed_etag,
+    workout_data_hash,
+)
+
+
+WORKOUT_DATA = {
+    "title": "Push Day",
+    "blocks": [
+        {"label": "Main", "exercises": [{"name": "Push-ups", "reps": 10, "sets": 3}]},
+    ],
+}
+
+
+def _record(workout_id, updated_at, synced_at="2025-01-01T08:00:00+00:00"):
+    return {
+        "id": workout_id,
+        "title": workout_id,
+        "workout_data": WORKOUT_DATA,
+        "ios_companion_synced_at": synced_at,
+        "updated_at": updated_at,
+        "created_at": "2025-01-01T00:00:00+00:00",
+    }
+
+
+@pytest.mark.unit
+class TestCompanionPayloadCache:
+    def test_hash_ignores_key_order(self):
+        reordered = {"blocks": WORKOUT_DATA["blocks"], "title": "Push Day"}
+
+        assert workout_data_hash(reordered) == workout_data_hash(WORKOUT_DATA)
+
+    def test_transforms_each_content_once(self):
+        cache = CompanionPayloadCache()
+
+        with patch(
+            "backend.services.companion_feed.to_workoutkit",
+            side_effect=ValueError("unsupported"),
+        ) as mock_transform:
+            first = cache.get_payload(WORKOUT_DATA, "w-1")
+            second = cache.get_payload(dict(WORKOUT_DATA), "w-2")
+
+        assert mock_transform.call_count == 1
+        assert first == second
+        assert first["sport"] == "strengthTraining"
+
+    def test_changed_content_is_retransformed(self):
+        cache = CompanionPayloadCache()
+        cache.get_payload(WORKOUT_DATA)
+
+        cache.get_payload({**WORKOUT_DATA, "title": "Pull Day"})
+
+        assert len(cache) == 2
+
+    def test_returned_payloads_are_copies(self):
+        cache = CompanionPayloadCache()
+        cache.get_payload(WORKOUT_DATA)["intervals"].clear()
+
+        assert cache.get_payload(WORKOUT_DATA)["intervals"]
+
+
+@pytest.mark.unit
+class TestFeedEtag:
+    def test_no_version_means_no_etag(self):
+        assert feed_etag("user-1", None, "ios") is None
+
+    def test_etag_depends_on_version_and_params(self):
+        etag = feed_etag("user-1", 3, "ios", 50)
+
+        assert etag == feed_etag("user-1", 3, "ios", 50)
+        assert etag != feed_etag("user-1", 4, "ios", 50)
+        assert etag != feed_etag("user-1", 3, "android", 50)
+
+    def test_if_none_match_comparison(self):
+        etag = feed_etag("user-1", 3, "ios")
+
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag[2:]}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+@pytest.mark.unit
+class TestCompanionFeedDelta:
+    def test_full_feed_returns_cursor(self):
+        feed = build_companion_feed([_record("w-1", "2025-01-02T00:00:00+00:00")], "ios_companion_synced_at")
+
+        assert feed["count"] == 1
+        assert "ids" not in feed
+        assert decode_cursor(feed["cursor"]).isoformat() == "2025-01-02T00:00:00+00:00"
+
+    def test_delta_returns_only_changed_workouts(self):
+        cursor = build_companion_feed(
+            [_record("w-1", "2025-01-02T00:00:00Z")], "ios_companion_synced_at"
+        )["cursor"]
+
+        feed = build_companion_feed(
+            [_record("w-2", "2025-01-03T00:00:00Z"), _record("w-1", "2025-01-02T00:00:00Z")],
+            "ios_companion_synced_at",
+            since=cursor,
+        )
+
+        assert [w["id"] for w in feed["workouts"]] == ["w-2"]
+        assert feed["ids"] == ["w-2", "w-1"]
+
+    def test_empty_delta_keeps_cursor(self):
+        cursor = build_companion_feed(
+            [_record("w-1", "2025-01-02T00:00:00Z")], "ios_companion_synced_at"
+        )["cursor"]
+
+        feed = build_companion_feed([], "ios_companion_synced_at", since=cursor)
+
+        assert feed["workouts"] == []
+        assert feed["ids"] == []
+        assert decode_cursor(feed["cursor"]) == decode_cursor(cursor)
+
+    def test_unchanged_workout_entering_window_is_sent_in_full(self):
+        """An older workout the client never received is not just listed in ids."""
+        newest = _record("w-3", "2025-01-03T00:00:00Z")
+        middle = _record("w-2", "2025-01-02T00:00:00Z")
+        oldest = _record("w-1", "2025-01-01T00:00:00Z")
+        # limit=2: the client holds w-3 and w-2
+        cursor = build_companion_feed([newest, middle], "ios_companion_synced_at")["cursor"]
+
+        # w-3 was completed, so w-1 moves into the window without changing
+        feed = build_companion_feed([middle, oldest], "ios_companion_synced_at", since=cursor)
+
+        assert [w["id"] for w in feed["workouts"]] == ["w-1"]
+        assert feed["ids"] == ["w-2", "w-1"]
+
+        # Next poll: the client now holds w-1 too
+        feed = build_companion_feed([middle, oldest], "ios_companion_synced_at", since=feed["cursor"])
+        assert feed["workouts"] == []
+
+    def test_cursor_without_ids_sends_full_records(self):
+        """Cursors issued before ID tracking cannot tell what the client holds."""
+        cursor = encode_cursor(datetime(2025, 1, 5, tzinfo=timezone.utc))
+        feed = build_companion_feed(
+            [_record("w-1", "2025-01-01T00:00:00Z")], "ios_companion_synced_at", since=cursor
+        )
+
+        assert feed["delta"] is True
+        assert [w["id"] for w in feed["workouts"]] == ["w-1"]
+
+    def test_malformed_cursor_returns_full_feed(self):
+        feed = build_companion_feed(
+            [_record("w-1", "2025-01-02T00:00:00Z")], "ios_companion_synced_at", since="%%%"
+        )
+
+        assert feed["count"] == 1
+        assert "delta" not in feed
@@ -201,6 +201,66 @@ class TestClassificationFlow:
         assert result2.cached == False
 
 
+class TestLLMConcurrency:
+    """LLM calls share one adaptive limiter."""
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_are_limited(self, monkeypatch):
+        import asyncio
+        import openai
+        from types import SimpleNamespace
+        from backend.services import content_classifier
+
+        class KeyedSettings(TestSettings):
+            openai_api_key = "sk-test"
+
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            message = SimpleNamespace(content="workout")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(openai, "AsyncOpenAI", lambda api_key: client)
+        classifier = ContentClassifier(settings=KeyedSettings())
+
+        results = await asyncio.gather(*(
+            classifier.classify(video_id=f"v{i}", platform="youtube") for i in range(20)
+        ))
+
+        assert all(r.used_llm for r in results)
+        assert peak <= content_classifier.LLM_MAX_CONCURRENCY
+        assert peak < 20
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_keeps_keyword_result(self, monkeypatch):
+        import openai
+
+        class KeyedSettings(TestSettings):
+            openai_api_key = "sk-test"
+
+        def no_client(api_key):
+            raise AssertionError("LLM must not be called")
+
+        monkeypatch.setattr(openai, "AsyncOpenAI", no_client)
+        classifier = ContentClassifier(settings=KeyedSettings())
+
+        result = await classifier.classify(
+            video_id="v1", platform="youtube", llm_allowed=lambda: False,
+        )
+
+        assert result.used_llm is False
+        assert result.category == ContentCategory.UNCERTAIN
+        # Not cached, so a later call with budget can still use the LLM
+        assert classifier._get_from_cache("v1", "youtube") is None
+
+
 class TestContentClassifierEdgeCases:
     """Tests for edge cases in content classification."""
 
@@ -8,21 +8,38 @@ Tests for:
 - blocks_to_workout
 - db_row_to_workout
 - workout_to_db_row
+- blocks_to_record / db_row_to_record
 """
 
+import json
 from datetime import datetime, timezone
+from pathlib import Path
 
 import pytest
 
 from backend.parsers.models import ParsedExercise, ParsedWorkout
 from backend.adapters.blocks_to_workoutkit import to_workoutkit
 from domain.converters import (
+    blocks_to_record,
     blocks_to_workout,
+    db_row_to_record,
     db_row_to_workout,
     ingest_to_workout,
     workout_to_db_row,
 )
-from domain.models import Block, BlockType, Exercise, Load, Workout, WorkoutMetadata, WorkoutSource
+from domain.converters.db_converters import _workout_to_blocks_format
+from domain.models import (
+    Block,
+    BlockType,
+    Exercise,
+    Load,
+    Workout,
+    WorkoutMetadata,
+    WorkoutRecord,
+    WorkoutSource,
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 # =============================================================================
@@ -1069,3 +1086,194 @@ class TestRoundTrip:
                 all_steps.append(interval)
         reps_steps = [s for s in all_steps if s.kind == "reps"]
         assert len(reps_steps) == 2
+
+
+# =============================================================================
+# WorkoutRecord conversion tests
+# =============================================================================
+
+
+def _fixture_rows():
+    """DB rows built from the sample and scenario fixtures."""
+    rows = []
+    for name in ("blocks_example.json", "blocks_week7.json"):
+        data = json.loads((REPO_ROOT / "sample" / name).read_text())
+        rows.append({
+            "id": name,
+            "title": data["title"],
+            "workout_data": data,
+            "sources": ["ai"],
+            "device": "garmin",
+            "tags": ["Strength", "strength "],
+        })
+    for name in ("baseline-workout.json", "modified-workout.json"):
+        scenario = json.loads((REPO_ROOT / "scenarios" / name).read_text())
+        rows.append({
+            "id": scenario["id"],
+            "title": scenario["name"],
+            "workout_data": {
+                "title": scenario["data"]["title"],
+                "blocks": [{"exercises": scenario["data"]["exercises"]}],
+            },
+            "tags": scenario["tags"],
+            "times_completed": 2,
+        })
+    return rows
+
+
+@pytest.mark.unit
+class TestWorkoutRecord:
+    """Tests for the lightweight WorkoutRecord conversions."""
+
+    @pytest.mark.parametrize("row", _fixture_rows(), ids=lambda row: row["id"])
+    def test_db_row_to_record_matches_workout_path(self, row):
+        """Record and model paths serialize fixtures identically."""
+        workout = db_row_to_workout(row)
+        record = db_row_to_record(row)
+
+        assert _workout_to_blocks_format(record) == _workout_to_blocks_format(workout)
+        assert record == WorkoutRecord.from_workout(workout)
+
+    def test_blocks_to_record_legacy_supersets(self):
+        """Legacy supersets split into blocks the same way as blocks_to_workout."""
+        blocks_json = {
+            "title": "Legacy",
+            "blocks": [
+                {
+                    "structure": "3 rounds",
+                    "rest_between_rounds_sec": 60,
+                    "supersets": [
+                        {"exercises": [{"name": "A", "reps": "10"}, {"name": "B", "reps": "30s"}]},
+                        {"exercises": [{"name": "C", "weight": "95", "weight_unit": "kg"}]},
+                    ],
+                }
+            ],
+        }
+
+        record = blocks_to_record(blocks_json)
+
+        assert _workout_to_blocks_format(record) == _workout_to_blocks_format(
+            blocks_to_workout(blocks_json)
+        )
+        assert record.blocks[0].exercises[1].duration_seconds == 30
+        assert record.blocks[1].exercises[0].load == Load(value=95, unit="kg")
+
+    @pytest.mark.parametrize(
+        "exercise",
+        [
+            {"name": ""},
+            {"name": "Squat", "sets": 0},
+            {"name": "Squat", "sets": 2.5},
+            {"name": "Squat", "rest_sec": -10},
+            {"name": "Squat", "rest_sec": "long"},
+        ],
+    )
+    def test_blocks_to_record_rejects_what_the_model_rejects(self, exercise):
+        """Invalid exercises raise for both the model and the record path."""
+        blocks_json = {"title": "Bad", "blocks": [{"exercises": [exercise]}]}
+
+        with pytest.raises(ValueError):
+            blocks_to_workout(blocks_json)
+        with pytest.raises(ValueError):
+            blocks_to_record(blocks_json)
+
+    def test_blocks_to_record_coerces_like_the_model(self):
+        """Whole floats and numeric strings are accepted as ints."""
+        blocks_json = {
+            "title": "Coerced",
+            "blocks": [{"rounds": 3.0, "exercises": [{"name": "Row", "sets": "4", "rest_sec": 60.0}]}],
+        }
+
+        record = blocks_to_record(blocks_json)
+
+        assert record.blocks[0].rounds == 3
+        assert record.blocks[0].exercises[0].sets == 4
+        assert record.blocks[0].exercises[0].rest_seconds == 60
+
+    def test_title_length_checked(self):
+        with pytest.raises(ValueError):
+            blocks_to_record({"title": "x" * 201, "blocks": [{"exercises": [{"name": "A"}]}]})
+
+    @pytest.mark.parametrize("value", ["no", "false", "0", "off", 0, "yes", "true", 1, True, None])
+    def test_is_favorite_coerced_like_the_model(self, value):
+        """Boolean strings parse the way pydantic parses them (bool("no") is True)."""
+        blocks_json = {"title": "T", "blocks": [{"exercises": [{"name": "A"}]}]}
+        if value is not None:
+            blocks_json["is_favorite"] = value
+
+        assert blocks_to_record(blocks_json).is_favorite == blocks_to_workout(blocks_json).is_favorite
+
+    def test_is_favorite_rejected_like_the_model(self):
+        blocks_json = {"title": "T", "is_favorite": "maybe", "blocks": [{"exercises": [{"name": "A"}]}]}
+
+        with pytest.raises(ValueError):
+            blocks_to_workout(blocks_json)
+        with pytest.raises(ValueError):
+            blocks_to_record(blocks_json)
+
+    @pytest.mark.parametrize(
+        "workout_fields, exercise",
+        [
+            ({}, {"name": "Row", "sets": "3.0", "rest_sec": "60.0"}),
+            ({"times_completed": "3.0"}, {"name": "Row"}),
+            ({"times_completed": None}, {"name": "Row"}),
+            ({"times_completed": -1}, {"name": "Row"}),
+            ({"times_completed": "2"}, {"name": "Row"}),
+            ({"id": 123}, {"name": "Row"}),
+            ({"description": "x" * 2001}, {"name": "Row"}),
+            ({"tags": ["b", "a", 1]}, {"name": "Row"}),
+            ({"tags": [" Legs ", "legs"]}, {"name": "Row"}),
+            ({}, {"name": "Row", "sets": "3.5"}),
+            ({}, {"name": "Row", "tempo": 3010}),
+            ({}, {"name": "Row", "canonical_name": None, "notes": ["slow"]}),
+            ({}, {"name": "Row", "reps": "8-10", "duration_sec": "45"}),
+            ({}, {"name": 7}),
+        ],
+    )
+    def test_blocks_to_record_matches_the_model_path(self, workout_fields, exercise):
+        """The same input either fails on both paths or gives equal results."""
+        blocks_json = {
+            "title": "T",
+            "blocks": [{"label": "Main", "rounds": 2.0, "exercises": [exercise]}],
+            **workout_fields,
+        }
+
+        try:
+            workout = blocks_to_workout(blocks_json)
+        except ValueError:
+            with pytest.raises(ValueError):
+                blocks_to_record(blocks_json)
+        else:
+            assert blocks_to_record(blocks_json) == WorkoutRecord.from_workout(workout)
+
+    def test_from_workout_shares_values(self):
+        """from_workout does not copy lists, loads or metadata."""
+        workout = blocks_to_workout({
+            "title": "Shared",
+            "tags": ["a"],
+            "blocks": [{"exercises": [{"name": "Squat", "weight": 100}]}],
+        })
+
+        record = WorkoutRecord.from_workout(workout)
+
+        assert record.tags is workout.tags
+        assert record.metadata is workout.metadata
+        assert record.blocks[0].exercises[0].load is workout.blocks[0].exercises[0].load
+
+    def test_to_workout_roundtrip(self):
+        """to_workout rebuilds an equal Workout with or without validation."""
+        workout = db_row_to_workout(_fixture_rows()[0])
+        record = WorkoutRecord.from_workout(workout)
+
+        assert record.to_workout() == workout
+        assert record.to_workout(validate=False).model_dump() == workout.model_dump()
+
+    def test_to_workout_validates_by_default(self):
+        record = WorkoutRecord.from_workout(
+            blocks_to_workout({"title": "T", "blocks": [{"exercises": [{"name": "A", "sets": 3}]}]})
+        )
+        record.blocks[0].exercises[0].sets = 0
+
+        with pytest.raises(ValueError):
+            record.to_workout()
+        assert record.to_workout(validate=False).blocks[0].exercises[0].sets == 0
@@ -0,0 +1,87 @@
+"""
+Unit tests for program reads in backend.database.
+
+Tests cover:
+- get_program reading the program and its members in one embedded select
+- Per-program caching and invalidation on program writes
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend import database
+
+
+PROFILE_ID = "user-1"
+
+
+def _program_row():
+    return {
+        "id": "prog-1",
+        "profile_id": PROFILE_ID,
+        "name": "Morning Routine",
+        "members": [
+            {"id": "m-2", "day_order": 1},
+            {"id": "m-1", "day_order": 0},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    database.invalidate_program_cache()
+    yield
+    database.invalidate_program_cache()
+
+
+@pytest.fixture
+def supabase():
+    client = MagicMock()
+    query = client.table.return_value
+    for method in ("select", "eq", "update", "delete"):
+        getattr(query, method).return_value = query
+    query.execute.side_effect = lambda: MagicMock(data=[_program_row()])
+    with patch("backend.database.get_supabase_client", return_value=client):
+        yield client
+
+
+@pytest.mark.unit
+class TestGetProgram:
+    def test_single_embedded_select_with_ordered_members(self, supabase):
+        program = database.get_program("prog-1", PROFILE_ID)
+
+        supabase.table.assert_called_once_with("workout_programs")
+        supabase.table.return_value.select.assert_called_once_with("*, members:program_members(*)")
+        assert [m["id"] for m in program["members"]] == ["m-1", "m-2"]
+
+    def test_repeat_reads_served_from_cache(self, supabase):
+        database.get_program("prog-1", PROFILE_ID)
+        program = database.get_program("prog-1", PROFILE_ID)
+
+        assert supabase.table.call_count == 1
+        assert program["name"] == "Morning Routine"
+
+    def test_cache_checks_owner(self, supabase):
+        database.get_program("prog-1", PROFILE_ID)
+
+        database.get_program("prog-1", "someone-else")
+
+        assert supabase.table.call_count == 2
+
+    def test_update_invalidates_cached_program(self, supabase):
+        database.get_program("prog-1", PROFILE_ID)
+
+        database.update_program("prog-1", PROFILE_ID, name="Evening Routine")
+        database.get_program("prog-1", PROFILE_ID)
+
+        # read, update, re-read
+        assert supabase.table.call_count == 3
+
+    def test_delete_invalidates_cached_program(self, supabase):
+        database.get_program("prog-1", PROFILE_ID)
+
+        database.delete_program("prog-1", PROFILE_ID)
+        database.get_program("prog-1", PROFILE_ID)
+
+        assert supabase.table.call_count == 3
@@ -0,0 +1,154 @@
+"""
+Unit tests for the precompiled dictionary snapshot.
+
+Tests for:
+- Snapshot contents match parsing the sources directly
+- Lazy loading and source-hash validation (stale entries are recompiled)
+- Version mismatch and corrupt snapshot handling
+- Consumers (RAW, CAT, DICT, GARMIN, GarminExerciseLookup) served from the snapshot
+"""
+
+import json
+import pickle
+
+import pytest
+import yaml
+
+pytestmark = pytest.mark.unit
+
+from backend.core import dictionary_snapshot as ds
+from backend.core.dictionary_snapshot import DictionarySnapshot, SOURCES, build_snapshot
+
+
+def _fail_compile(text):
+    pytest.fail("source was compiled instead of read from the snapshot")
+
+
+@pytest.fixture
+def dictionaries_dir(tmp_path, monkeypatch):
+    """Copy of shared/dictionaries the tests can edit."""
+    for filename in SOURCES.values():
+        (tmp_path / filename).write_bytes((ds.DICTIONARIES_DIR / filename).read_bytes())
+    monkeypatch.setattr(ds, "DICTIONARIES_DIR", tmp_path)
+    monkeypatch.delenv("DICTIONARY_SNAPSHOT_DISABLED", raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def snapshot_path(dictionaries_dir):
+    return dictionaries_dir / "snapshot.pickle"
+
+
+class TestBuildSnapshot:
+    """Tests for compiling the sources."""
+
+    def test_writes_versioned_snapshot_with_hashes(self, snapshot_path):
+        build_snapshot(snapshot_path)
+
+        with open(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+        assert snapshot["version"] == ds.SNAPSHOT_VERSION
+        assert set(snapshot["sources"]) == set(SOURCES)
+        assert set(snapshot["data"]) == set(SOURCES)
+
+    def test_raw_keys_are_lowercased_with_category_index(self, snapshot_path):
+        snapshot = build_snapshot(snapshot_path)
+        raw = yaml.safe_load((ds.DICTIONARIES_DIR / SOURCES["garmin_exercises_raw"]).read_text())
+
+        compiled = snapshot["data"]["garmin_exercises_raw"]
+        assert compiled["entries"] == {str(k).lower(): v for k, v in raw.items()}
+        assert all(c == c.upper() and " " not in c for c in compiled["categories"].values())
+
+    def test_garmin_exercises_matches_json(self, snapshot_path):
+        snapshot = build_snapshot(snapshot_path)
+        data = json.loads((ds.DICTIONARIES_DIR / SOURCES["garmin_exercises"]).read_text())
+
+        compiled = snapshot["data"]["garmin_exercises"]
+        assert compiled["exercises"] == data["exercises"]
+        assert compiled["category_ids"] == {v["name"]: v["id"] for v in data["categories"].values()}
+
+
+class TestDictionarySnapshot:
+    """Tests for lazy, hash-validated loading."""
+
+    def test_loads_from_snapshot_without_parsing(self, snapshot_path, monkeypatch):
+        build_snapshot(snapshot_path)
+        monkeypatch.setitem(ds._COMPILERS, "garmin_map", _fail_compile)
+
+        assert DictionarySnapshot(snapshot_path).get("garmin_map")
+
+    def test_stale_entry_is_recompiled_and_persisted(self, dictionaries_dir, snapshot_path):
+        build_snapshot(snapshot_path)
+        (dictionaries_dir / "garmin_map.yaml").write_text("squat:\n  name: Back Squat\n")
+
+        assert DictionarySnapshot(snapshot_path).get("garmin_map") == {"squat": {"name": "Back Squat"}}
+        with open(snapshot_path, "rb") as f:
+            assert pickle.load(f)["data"]["garmin_map"] == {"squat": {"name": "Back Squat"}}
+
+    def test_missing_snapshot_compiles_only_requested_entry(self, snapshot_path, monkeypatch):
+        monkeypatch.setitem(ds._COMPILERS, "garmin_exercises_raw", _fail_compile)
+
+        assert DictionarySnapshot(snapshot_path).get("normalization")["stopwords"]
+        assert snapshot_path.exists()
+
+    @pytest.mark.parametrize("payload", [b"not a pickle", pickle.dumps({"version": -1})])
+    def test_ignores_corrupt_or_old_snapshot(self, snapshot_path, payload):
+        snapshot_path.write_bytes(payload)
+
+        assert "expand" in DictionarySnapshot(snapshot_path).get("normalization")
+
+    def test_disabled_parses_sources(self, snapshot_path, monkeypatch):
+        monkeypatch.setenv("DICTIONARY_SNAPSHOT_DISABLED", "1")
+
+        assert DictionarySnapshot(snapshot_path).get("garmin_map")
+        assert not snapshot_path.exists()
+
+    def test_unknown_dictionary_raises(self, snapshot_path):
+        with pytest.raises(KeyError):
+            DictionarySnapshot(snapshot_path).get("user_mappings")
+
+
+class TestConsumers:
+    """Module-level dictionaries are resolved lazily from the snapshot."""
+
+    def test_module_attributes_resolve(self):
+        from backend.adapters import cir_to_garmin_yaml
+        from backend.core import catalog, exercise_categories, normalize
+
+        assert exercise_categories.RAW
+        assert isinstance(catalog.CAT, list)
+        assert "stopwords" in normalize.DICT
+        assert isinstance(cir_to_garmin_yaml.GARMIN, dict)
+
+    def test_official_category_uses_normalized_index(self):
+        from backend.core import exercise_categories
+
+        key, entry = next(
+            (k, v) for k, v in exercise_categories.RAW.items() if v.get("category")
+        )
+        assert exercise_categories._official_category(key.upper()) == (
+            str(entry["category"]).strip().upper().replace(" ", "_")
+        )
+
+    def test_garmin_lookup_shares_snapshot_data(self):
+        from backend.adapters.garmin_lookup import SNAPSHOT_DATA_PATH, GarminExerciseLookup
+
+        first = GarminExerciseLookup()
+        second = GarminExerciseLookup(str(SNAPSHOT_DATA_PATH))
+
+        assert first.exercises is second.exercises
+        assert first.find("Push Ups")["category_name"]
+
+    def test_garmin_lookup_custom_path_reads_file(self, tmp_path):
+        from backend.adapters.garmin_lookup import GarminExerciseLookup
+
+        data_path = tmp_path / "exercises.json"
+        data_path.write_text(json.dumps({
+            "categories": {"0": {"id": 0, "name": "Bench Press"}},
+            "exercises": {"bench press": {"category_id": 0, "category_name": "Bench Press"}},
+        }))
+
+        lookup = GarminExerciseLookup(str(data_path))
+
+        assert list(lookup.exercises) == ["bench press"]
+        assert lookup.get_category_id("Bench Press") == 0
@@ -0,0 +1,89 @@
+import pytest
+
+from backend.adapters import blocks_to_hyrox_yaml, blocks_to_workoutkit, ingest_to_cir
+from backend.adapters.blocks_to_fit import _is_user_confirmed_name
+from backend.core.exercise_name import lookup_key, split_exercise_name
+
+
+@pytest.mark.unit
+class TestSplitExerciseName:
+    """Tests for the shared exercise-name parser."""
+
+    def test_label_and_trailing_reps(self):
+        parts = split_exercise_name("B1: DB INCLINE BENCH PRESS X8")
+        assert parts.label == "B1"
+        assert parts.name == "DB INCLINE BENCH PRESS X8"
+        assert parts.name_without_reps == "DB INCLINE BENCH PRESS"
+        assert parts.base_name == "DB INCLINE BENCH PRESS"
+        assert (parts.reps, parts.reps_style) == (8, "x")
+        assert parts.has_rep_count
+
+    def test_each_side(self):
+        parts = split_exercise_name("A2; KB SINGLE ARM ROW X10 EACH SIDE")
+        assert (parts.reps, parts.reps_style) == (10, "each_side")
+        assert parts.each_side
+        assert parts.each_side_reps == 10
+
+    def test_xi_and_wb_suffixes(self):
+        assert split_exercise_name("C1: BOX STEP Xi2").reps_style == "xi"
+        assert split_exercise_name("Wall Ball X4 wb").base_name == "Wall Ball"
+        assert split_exercise_name("Wall Ball wb").base_name == "Wall Ball"
+
+    def test_leading_count_and_distance(self):
+        count = split_exercise_name("100 Wall Balls")
+        assert count.leading_count == 100
+        assert count.count_stripped == "Wall Balls"
+        assert count.distance is None
+
+        distance = split_exercise_name("1.5 KM Run")
+        assert distance.distance == (1.5, "km")
+        assert distance.has_distance_prefix
+
+    def test_plain_name(self):
+        parts = split_exercise_name("Push Up")
+        assert parts.label is None
+        assert parts.name == parts.base_name == "Push Up"
+        assert parts.reps is None
+        assert not parts.has_rep_count
+
+    def test_memoized(self):
+        assert split_exercise_name("A1: Squat X5") is split_exercise_name("A1: Squat X5")
+
+    def test_lookup_key(self):
+        assert lookup_key("A1: DB Bench Press X10") == "bench press"
+        assert lookup_key("Lunge each leg") == "lunge"
+        assert lookup_key("500m Row") == "row"
+        assert lookup_key("Ski 1.5 km |") == "ski"
+
+
+@pytest.mark.unit
+class TestAdaptersShareParser:
+    """The adapters' name helpers are views over split_exercise_name."""
+
+    def test_hyrox_parse_exercise_name(self):
+        assert blocks_to_hyrox_yaml.parse_exercise_name("D2: 200M SKI") == ("SKI", "", "200m")
+        assert blocks_to_hyrox_yaml.parse_exercise_name("A1; KB RDL INTO GOBLET SQUAT X10") == (
+            "KB RDL INTO GOBLET SQUAT",
+            "x10",
+            "Kb Rdl into Goblet Squat x10",
+        )
+        assert blocks_to_hyrox_yaml.parse_exercise_name("A2: OB/KB PRESS X5 EACH SIDE") == (
+            "OB/KB PRESS",
+            "x5 each side",
+            "Press x5 each side",
+        )
+
+    def test_workoutkit_parse_exercise_name(self):
+        assert blocks_to_workoutkit.parse_exercise_name("A1: GOBLET SQUAT X6-10 0") == "GOBLET SQUAT"
+        assert blocks_to_workoutkit.parse_exercise_name("") == ""
+
+    def test_fit_user_confirmed_name(self):
+        assert _is_user_confirmed_name("Burpee Box Jump")
+        assert not _is_user_confirmed_name("500m Row")
+        assert not _is_user_confirmed_name("Squat 3x10")
+
+    def test_ingest_to_cir_helpers(self):
+        assert ingest_to_cir._extract_reps_from_name("100 wall balls") == 100
+        assert ingest_to_cir._extract_distance_from_name("1000m Ski") == (1000.0, "m")
+        assert ingest_to_cir._clean_name_of_numeric_prefix("100 wall balls") == "wall balls"
+        assert ingest_to_cir._clean_name_of_numeric_prefix("wall balls") == "wall balls"
@@ -8,13 +8,27 @@ Tests for:
 - ExportQueue.get_status() returns job details
 - ExportQueue.get_status() with unknown ID returns None
 - Job completes successfully
+- Dedup, priority/fairness, worker pool, result TTL and SQLite durability (AMA-611)
 """
 
+import asyncio
+import base64
+import io
+import time
+import zipfile
+from unittest.mock import patch
+
 import pytest
 
 pytestmark = pytest.mark.unit
 
-from backend.services.export_queue import ExportQueue, ExportStatus
+from backend.services.export_queue import (
+    ExportPriority,
+    ExportQueue,
+    ExportStatus,
+    InMemoryExportJobStore,
+    SQLiteExportJobStore,
+)
 
 
 # =============================================================================
@@ -111,3 +125,250 @@ class TestJobCompletion:
         # Result and error should be None initially
         assert final_status["result"] is None
         assert final_status["error"] is None
+
+
+# =============================================================================
+# Job Engine Tests (AMA-611)
+# =============================================================================
+
+
+
+def _recording_queue(store=None, **kwargs):
+    """Queue whose 'record' handler appends payloads to a list."""
+    seen = []
+    queue = ExportQueue(store=store, **kwargs)
+    queue.register_handler("record", lambda payload: seen.append(payload["n"]) or payload["n"])
+    return queue, seen
+
+
+class TestDedup:
+    """Tests for payload-hash deduplication."""
+
+    def test_identical_requests_share_a_job(self) -> None:
+        queue, _ = _recording_queue()
+
+        first = queue.enqueue(kind="record", user_id="u1", payload={"n": 1})
+        second = queue.enqueue(kind="record", user_id="u1", payload={"n": 1})
+        other_user = queue.enqueue(kind="record", user_id="u2", payload={"n": 1})
+
+        assert first == second
+        assert other_user != first
+
+    async def test_failed_job_is_not_reused(self) -> None:
+        queue = ExportQueue()
+        queue.register_handler("boom", lambda payload: 1 / 0)
+        first = queue.enqueue(kind="boom", user_id="u1")
+        await queue.drain()
+
+        assert queue.get_status(first)["status"] == ExportStatus.FAILED.value
+        assert queue.enqueue(kind="boom", user_id="u1") != first
+
+    def test_unknown_kind_is_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            ExportQueue().enqueue(kind="nope")
+
+
+class TestScheduling:
+    """Tests for priority and per-user fairness."""
+
+    async def test_priority_then_least_recently_served_user(self) -> None:
+        queue, seen = _recording_queue()
+        for n in (1, 2, 3):
+            queue.enqueue(kind="record", user_id="bulk", payload={"n": n})
+        queue.enqueue(kind="record", user_id="other", payload={"n": 10})
+        queue.enqueue(kind="record", user_id="bulk", payload={"n": 99}, priority=ExportPriority.HIGH)
+
+        await queue.drain()
+
+        assert seen == [99, 10, 1, 2, 3]
+
+    async def test_sqlite_store_uses_same_order(self, tmp_path) -> None:
+        queue, seen = _recording_queue(store=SQLiteExportJobStore(str(tmp_path / "jobs.db")))
+        for n in (1, 2):
+            queue.enqueue(kind="record", user_id="bulk", payload={"n": n})
+        queue.enqueue(kind="record", user_id="other", payload={"n": 10})
+
+        await queue.drain()
+
+        assert seen == [1, 10, 2]
+
+
+class TestWorkers:
+    """Tests for the asyncio worker pool."""
+
+    async def test_workers_complete_enqueued_jobs(self) -> None:
+        queue, _ = _recording_queue(concurrency=2, poll_interval_seconds=0.01)
+        await queue.start()
+        try:
+            job_ids = [queue.enqueue(kind="record", user_id="u1", payload={"n": n}) for n in range(4)]
+            for _ in range(200):
+                if all(queue.get_status(j)["status"] == "completed" for j in job_ids):
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.shutdown()
+
+        assert [queue.get_status(j)["result"] for j in job_ids] == [0, 1, 2, 3]
+        assert not queue.running
+
+    async def test_start_survives_requeue_failure(self, caplog) -> None:
+        store = InMemoryExportJobStore()
+        queue, _ = _recording_queue(store=store, poll_interval_seconds=0.01)
+        job_id = queue.enqueue(kind="record", user_id="u1", payload={"n": 1})
+
+        def requeue_stale(started_before, max_attempts):
+            raise RuntimeError("store unavailable")
+
+        with patch.object(store, "requeue_stale", requeue_stale):
+            await queue.start()
+        try:
+            for _ in range(200):
+                if queue.get_status(job_id)["status"] == "completed":
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await queue.shutdown()
+
+        assert queue.get_status(job_id)["result"] == 1
+        assert "startup requeue failed" in caplog.text
+
+    async def test_legacy_workout_export_job(self, export_queue: ExportQueue) -> None:
+        job_id = export_queue.enqueue(job_id="w-1", user_id="u1", payload={"workout_id": "w-1", "device": "ios"})
+
+        await export_queue.drain()
+
+        status = export_queue.get_status(job_id)
+        assert status["status"] == ExportStatus.COMPLETED.value
+        assert status["result"] == {"status": "exported", "workout_id": "w-1", "device": "ios"}
+
+
+class TestExpiryAndDurability:
+    """Tests for result TTL and the SQLite store."""
+
+    async def test_expired_results_are_hidden_and_evicted(self) -> None:
+        store = InMemoryExportJobStore()
+        queue, _ = _recording_queue(store=store, result_ttl_seconds=60)
+        job_id = queue.enqueue(kind="record", user_id="u1", payload={"n": 1})
+        await queue.drain()
+        store.get(job_id).finished_at = time.time() - 120
+
+        assert queue.get_status(job_id) is None
+        assert queue.evict_expired() == 1
+        assert len(store) == 0
+
+    async def test_sqlite_jobs_survive_restart(self, tmp_path) -> None:
+        path = str(tmp_path / "jobs.db")
+        first, _ = _recording_queue(store=SQLiteExportJobStore(path))
+        job_id = first.enqueue(kind="record", user_id="u1", payload={"n": 7})
+        first.store.close()
+
+        second, seen = _recording_queue(store=SQLiteExportJobStore(path))
+        await second.drain()
+
+        assert seen == [7]
+        assert second.get_status(job_id)["result"] == 7
+
+    def test_sqlite_abandoned_jobs_are_requeued(self, tmp_path) -> None:
+        store = SQLiteExportJobStore(str(tmp_path / "jobs.db"))
+        queue, _ = _recording_queue(store=store)
+        job_id = queue.enqueue(kind="record", user_id="u1", payload={"n": 1})
+        store.claim("crashed-worker")
+
+        assert store.requeue_stale(time.time() + 1, max_attempts=3) == 1
+        assert store.get(job_id).status == ExportStatus.PENDING
+
+    async def test_running_job_renews_its_lease(self, tmp_path) -> None:
+        store = SQLiteExportJobStore(str(tmp_path / "jobs.db"))
+        queue = ExportQueue(store=store, lease_seconds=0.15)
+        requeued = []
+
+        def slow(payload):
+            # Outlive several leases while a sweep runs alongside
+            for _ in range(5):
+                time.sleep(0.1)
+                requeued.append(store.requeue_stale(time.time() - 0.15, max_attempts=3))
+            return "done"
+
+        queue.register_handler("slow", slow)
+        job_id = queue.enqueue(kind="slow", user_id="u1")
+        await queue.drain()
+
+        assert requeued == [0] * 5
+        status = queue.get_status(job_id)
+        assert (status["status"], status["attempts"]) == ("completed", 1)
+
+    def test_served_users_are_forgotten_with_expired_jobs(self) -> None:
+        store = InMemoryExportJobStore()
+        queue, _ = _recording_queue(store=store)
+        for user in ("u1", "u2"):
+            queue.enqueue(kind="record", user_id=user, payload={"n": 1})
+        store.claim("w")
+        store.claim("w")
+        queue.enqueue(kind="record", user_id="u3", payload={"n": 2})
+
+        store.evict(time.time())
+
+        assert store._served == {}
+
+
+class TestFileHandlers:
+    """Tests for FIT and FIT ZIP export jobs."""
+
+    async def test_fit_zip_bundles_one_file_per_workout(self) -> None:
+        queue = ExportQueue()
+        job_id = queue.enqueue(
+            kind="fit_zip",
+            user_id="u1",
+            payload={"workouts": [{"title": "Leg Day"}, {"title": "Push Day"}]},
+        )
+
+        with patch("backend.adapters.blocks_to_fit.to_fit", return_value=b"FIT") as mock_to_fit:
+            await queue.drain()
+
+        result = queue.get_status(job_id)["result"]
+        archive = zipfile.ZipFile(io.BytesIO(base64.b64decode(result["content_base64"])))
+        assert mock_to_fit.call_count == 2
+        assert archive.namelist() == ["01_Leg_Day.fit", "02_Push_Day.fit"]
+        assert result["media_type"] == "application/zip"
+
+
+class TestExportJobEndpoints:
+    """Tests for the /map/to-fit/jobs and /export/jobs endpoints."""
+
+    @pytest.fixture
+    def client_and_queue(self):
+        from fastapi.testclient import TestClient
+
+        from api.deps import get_current_user, get_export_queue
+        from backend.main import create_app
+        from backend.settings import Settings
+
+        queue = ExportQueue()
+        app = create_app(settings=Settings(environment="test", _env_file=None))
+        app.dependency_overrides[get_current_user] = lambda: "user-1"
+        app.dependency_overrides[get_export_queue] = lambda: queue
+        return TestClient(app), queue
+
+    def test_queue_poll_and_download_fit(self, client_and_queue) -> None:
+        client, queue = client_and_queue
+
+        resp = client.post("/map/to-fit/jobs", json={"blocks_json": {"title": "Leg Day"}})
+        assert resp.status_code == 202
+        job_id = resp.json()["job_id"]
+        assert client.get(f"/export/jobs/{job_id}/download").status_code == 409
+
+        with patch("backend.adapters.blocks_to_fit.to_fit", return_value=b"FITDATA"):
+            asyncio.run(queue.drain())
+
+        status = client.get(f"/export/jobs/{job_id}").json()
+        assert status["status"] == "completed"
+        assert "content_base64" not in status["result"]
+        download = client.get(status["download_url"])
+        assert download.content == b"FITDATA"
+        assert 'filename="Leg_Day.fit"' in download.headers["content-disposition"]
+
+    def test_other_users_jobs_are_hidden(self, client_and_queue) -> None:
+        client, queue = client_and_queue
+        job_id = queue.enqueue(kind="fit", user_id="user-2", payload={"blocks_json": {}})
+
+        assert client.get(f"/export/jobs/{job_id}").status_code == 404
@@ -0,0 +1,224 @@
+"""
+Unit tests for export tracing.
+
+Tests for:
+- ExportTracer disabled fast path, levels and sampling
+- Ring buffer retention and stage timings
+- Garmin YAML adapters recording mapping decisions without printing
+- /debug/export-traces admin endpoints
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+from backend.core import export_trace as export_trace_module
+from backend.core.export_trace import (
+    ExportTracer,
+    current_trace,
+    trace_event,
+    trace_stage,
+)
+from backend.settings import Settings, get_settings
+
+
+@pytest.fixture
+def tracer(monkeypatch):
+    """Process tracer replaced with a debug-level tracer for the test."""
+    tracer = ExportTracer(level="debug", buffer_size=5)
+    monkeypatch.setattr(export_trace_module, "_tracer", tracer)
+    return tracer
+
+
+SAMPLE_WORKOUT = {
+    "title": "Trace Test",
+    "blocks": [
+        {
+            "label": "Strength",
+            "structure": "3 rounds",
+            "exercises": [
+                {"name": "Push Ups", "reps": 10},
+                {"name": "Goblet Squat", "reps": 12},
+            ],
+        }
+    ],
+}
+
+
+class TestExportTracer:
+    """Tests for trace creation and recording."""
+
+    def test_disabled_records_nothing(self):
+        tracer = ExportTracer(level="off")
+
+        with tracer.export("hyrox_yaml") as trace:
+            assert trace is None
+            assert current_trace() is None
+            trace_event("ignored")
+
+        assert tracer.recent() == []
+
+    def test_records_events_and_stages(self):
+        tracer = ExportTracer(level="debug")
+
+        with tracer.export("hyrox_yaml", title="A") as trace:
+            with trace_stage("map_exercise"):
+                trace_event("exercise_mapped", garmin_name="Push Up")
+            with trace_stage("map_exercise"):
+                pass
+
+        [recorded] = tracer.recent()
+        assert recorded["trace_id"] == trace.trace_id
+        assert recorded["attrs"] == {"title": "A"}
+        assert recorded["events"][0]["name"] == "exercise_mapped"
+        assert recorded["events"][0]["garmin_name"] == "Push Up"
+        assert "map_exercise" in recorded["stages_ms"]
+        assert recorded["duration_ms"] >= recorded["stages_ms"]["map_exercise"]
+        assert current_trace() is None
+
+    def test_level_filters_events(self):
+        tracer = ExportTracer(level="warning")
+
+        with tracer.export("hyrox_yaml"):
+            trace_event("debug_detail")
+            trace_event("fallback", logging.WARNING)
+
+        assert [e["name"] for e in tracer.recent()[0]["events"]] == ["fallback"]
+
+    def test_sample_rate_zero_disables(self):
+        tracer = ExportTracer(level="debug", sample_rate=0.0)
+
+        with tracer.export("hyrox_yaml") as trace:
+            assert trace is None
+
+    def test_ring_buffer_keeps_most_recent(self):
+        tracer = ExportTracer(level="info", buffer_size=3)
+
+        for i in range(5):
+            with tracer.export("hyrox_yaml", n=i):
+                pass
+
+        assert [t["attrs"]["n"] for t in tracer.recent()] == [4, 3, 2]
+        assert [t["attrs"]["n"] for t in tracer.recent(limit=1)] == [4]
+
+    def test_nested_export_joins_outer_trace(self):
+        tracer = ExportTracer(level="debug")
+
+        with tracer.export("outer") as outer:
+            with tracer.export("inner") as inner:
+                assert inner is None
+                assert current_trace() is outer
+
+        assert len(tracer.recent()) == 1
+
+    def test_records_error(self):
+        tracer = ExportTracer(level="info")
+
+        with pytest.raises(RuntimeError):
+            with tracer.export("hyrox_yaml"):
+                raise RuntimeError("boom")
+
+        assert tracer.recent()[0]["error"] == "RuntimeError: boom"
+
+    def test_rejects_unknown_level(self):
+        with pytest.raises(ValueError):
+            ExportTracer(level="verbose")
+
+
+class TestAdapterTracing:
+    """Garmin YAML adapters emit trace events instead of printing."""
+
+    def test_hyrox_export_records_mapping_decisions(self, tracer, capsys):
+        from backend.adapters.blocks_to_hyrox_yaml import to_hyrox_yaml
+
+        to_hyrox_yaml(SAMPLE_WORKOUT)
+
+        assert capsys.readouterr().out == ""
+        [trace] = tracer.recent()
+        assert trace["kind"] == "hyrox_yaml"
+        assert trace["attrs"]["title"] == "Trace Test"
+        names = [e["name"] for e in trace["events"]]
+        assert names.count("exercise_mapped") == 2
+        assert names.count("category_assign") == 2
+        assert {"map_exercise", "yaml_dump"} <= set(trace["stages_ms"])
+
+    def test_export_without_tracing_prints_nothing(self, monkeypatch, capsys):
+        from backend.adapters.blocks_to_hyrox_yaml import to_hyrox_yaml
+
+        tracer = ExportTracer(level="off")
+        monkeypatch.setattr(export_trace_module, "_tracer", tracer)
+
+        to_hyrox_yaml(SAMPLE_WORKOUT)
+
+        assert capsys.readouterr().out == ""
+        assert tracer.recent() == []
+
+
+class TestExportTraceEndpoints:
+    """Tests for the /debug/export-traces admin endpoints."""
+
+    @pytest.fixture
+    def make_client(self, tracer):
+        from api.routers.health import router
+
+        def make(**settings_kwargs):
+            app = FastAPI()
+            app.include_router(router)
+            settings = Settings(_env_file=None, **settings_kwargs)
+            app.dependency_overrides[get_settings] = lambda: settings
+            return TestClient(app)
+
+        return make
+
+    def test_lists_traces_in_development(self, make_client, tracer):
+        with tracer.export("hyrox_yaml"):
+            pass
+        client = make_client(environment="development")
+
+        response = client.get("/debug/export-traces")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["config"]["level"] == "debug"
+        assert [t["kind"] for t in data["traces"]] == ["hyrox_yaml"]
+
+    def test_requires_admin_secret_outside_development(self, make_client):
+        client = make_client(environment="production", export_trace_admin_secret="s3cret")
+
+        assert client.get("/debug/export-traces").status_code == 403
+        assert client.get(
+            "/debug/export-traces", headers={"X-Admin-Secret": "wrong"}
+        ).status_code == 403
+        assert client.get(
+            "/debug/export-traces", headers={"X-Admin-Secret": "s3cret"}
+        ).status_code == 200
+
+    def test_denied_when_no_secret_configured(self, make_client):
+        client = make_client(environment="production")
+
+        response = client.get("/debug/export-traces", headers={"X-Admin-Secret": ""})
+
+        assert response.status_code == 403
+
+    def test_configure_and_clear(self, make_client, tracer):
+        client = make_client(environment="development")
+
+        response = client.put(
+            "/debug/export-traces/config", json={"level": "warning", "sample_rate": 0.5}
+        )
+        assert response.status_code == 200
+        assert response.json()["level"] == "warning"
+        assert tracer.sample_rate == 0.5
+
+        assert client.put(
+            "/debug/export-traces/config", json={"level": "verbose"}
+        ).status_code == 400
+
+        tracer.configure(sample_rate=1.0)
+        with tracer.export("hyrox_yaml"):
+            pass
+        assert client.delete("/debug/export-traces").json()["buffered"] == 0
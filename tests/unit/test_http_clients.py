@@ -0,0 +1,180 @@
+"""
+Unit tests for pooled upstream HTTP clients.
+
+Tests cover:
+- One pooled httpx client per upstream and event loop
+- Circuit breaker open / half-open / close transitions
+- Half-open trials released on every exit (response, error, cancellation)
+- Failure and short-circuit metrics
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.services.http_clients import (
+    CircuitBreaker,
+    HTTPClientRegistry,
+    UpstreamClient,
+    UpstreamConfig,
+    UpstreamUnavailableError,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _upstream(handler, **config):
+    """UpstreamClient whose pools use an in-process transport."""
+    client = UpstreamClient(UpstreamConfig(name="test", **config))
+    client._build_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_recovers_after_trial(self):
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+        clock.now = 10
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # only one trial at a time
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self):
+        clock = _FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.unit
+class TestUpstreamClient:
+    async def test_reuses_one_pool_per_loop(self):
+        client = _upstream(lambda request: httpx.Response(200))
+
+        await client.get("http://upstream/a")
+        first_pool = client._client()
+        await client.get("http://upstream/b")
+
+        assert client._client() is first_pool
+        assert client.metrics()["requests"] == 2
+        await client.aclose()
+
+    async def test_gateway_errors_open_the_circuit(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        client = _upstream(handler, failure_threshold=2)
+        for _ in range(2):
+            assert (await client.get("http://upstream/")).status_code == 503
+
+        with pytest.raises(httpx.ConnectError) as exc_info:
+            await client.get("http://upstream/")
+
+        assert isinstance(exc_info.value, UpstreamUnavailableError)
+        assert len(calls) == 2
+        metrics = client.metrics()
+        assert metrics["failures"] == 2
+        assert metrics["short_circuited"] == 1
+        assert metrics["circuit"] == CircuitBreaker.OPEN
+
+    async def test_transport_errors_count_as_failures(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = _upstream(handler, failure_threshold=1)
+        with pytest.raises(httpx.ConnectError):
+            await client.post("http://upstream/", json={})
+
+        assert client.breaker.state == CircuitBreaker.OPEN
+
+    def _half_open(self, client, clock):
+        client.breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        client.breaker.record_failure()
+        clock.now = 10
+        assert client.breaker.state == CircuitBreaker.HALF_OPEN
+
+    async def test_cancelled_trial_is_released(self):
+        async def handler(request):
+            await asyncio.Event().wait()  # never answers
+
+        clock = _FakeClock()
+        client = _upstream(handler)
+        self._half_open(client, clock)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get("http://upstream/"), timeout=0.01)
+
+        # The abandoned trial re-opens the circuit; the next period gets a new trial
+        assert client.breaker.state == CircuitBreaker.OPEN
+        clock.now = 20
+        assert client.breaker.allow_request()
+        await client.aclose()
+
+    async def test_trial_raising_any_error_is_a_failure(self):
+        def handler(request):
+            raise httpx.UnsupportedProtocol("bad scheme", request=request)
+
+        clock = _FakeClock()
+        client = _upstream(handler)
+        self._half_open(client, clock)
+
+        with pytest.raises(httpx.UnsupportedProtocol):
+            await client.get("http://upstream/")
+
+        assert client.breaker.state == CircuitBreaker.OPEN
+        clock.now = 20
+        assert client.breaker.allow_request()
+        await client.aclose()
+
+    async def test_healthy_trial_closes_the_circuit(self):
+        clock = _FakeClock()
+        client = _upstream(lambda request: httpx.Response(200))
+        self._half_open(client, clock)
+
+        await client.get("http://upstream/")
+
+        assert client.breaker.state == CircuitBreaker.CLOSED
+        await client.aclose()
+
+    def test_separate_loops_get_separate_pools(self):
+        client = _upstream(lambda request: httpx.Response(200))
+
+        async def pool():
+            await client.get("http://upstream/")
+            return client._client()
+
+        assert asyncio.run(pool()) is not asyncio.run(pool())
+
+
+@pytest.mark.unit
+class TestHTTPClientRegistry:
+    def test_clients_are_shared_per_upstream(self):
+        registry = HTTPClientRegistry()
+
+        assert registry.client("ingestor") is registry.client("ingestor")
+        assert registry.client("ingestor").config.timeout == 120.0
+        assert set(registry.metrics()) == {"ingestor"}
@@ -350,6 +350,54 @@ class TestUserMappingPriority:
         assert exercise.canonical_name == "Barbell Back Squat"
 
 
+    @pytest.mark.unit
+    def test_resolves_all_names_in_one_batch(
+        self,
+        use_case: MapWorkoutUseCase,
+        user_mapping_repo: FakeUserMappingRepository,
+        exercise_match_repo: FakeExerciseMatchRepository,
+        monkeypatch,
+    ):
+        """User mappings and fuzzy matches are each looked up once per workout."""
+        user_mapping_repo.add("squat", "Goblet Squat")
+        lookups = []
+        fuzzy_batches = []
+        get_many = user_mapping_repo.get_many
+        find_matches = exercise_match_repo.find_matches
+        monkeypatch.setattr(
+            user_mapping_repo, "get_many",
+            lambda names: lookups.append(list(names)) or get_many(names),
+        )
+        monkeypatch.setattr(
+            exercise_match_repo, "find_matches",
+            lambda names, **kw: fuzzy_batches.append(list(names)) or find_matches(names, **kw),
+        )
+
+        parsed = ParsedWorkout(
+            name="Batch Test",
+            exercises=[
+                ParsedExercise(raw_name="Squat", sets=3, reps="10"),
+                ParsedExercise(raw_name="Deadlift", sets=3, reps="5"),
+                ParsedExercise(raw_name="Squat", sets=2, reps="10"),
+                ParsedExercise(raw_name="Mystery Move", sets=1, reps="1"),
+            ],
+        )
+
+        result = use_case.execute(
+            parsed_workout=parsed,
+            user_id="test-user-123",
+            device="garmin",
+            save=False,
+        )
+
+        assert lookups == [["Squat", "Deadlift", "Mystery Move"]]
+        assert fuzzy_batches == [["Deadlift", "Mystery Move"]]
+        names = [e.canonical_name for e in result.workout.blocks[0].exercises]
+        assert names == ["Goblet Squat", "Barbell Deadlift", "Goblet Squat", None]
+        assert result.exercises_mapped == 3
+        assert result.exercises_unmapped == 1
+
+
 # =============================================================================
 # Unmapped Exercise Tests
 # =============================================================================
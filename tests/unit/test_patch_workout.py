@@ -23,6 +23,7 @@ from domain.models.patch_operation import (
     VALID_ROOT_PATHS,
     VALID_EXERCISE_FIELDS,
 )
+from domain.converters.blocks_to_workout import blocks_to_workout
 from application.use_cases.patch_workout import (
     PatchWorkoutUseCase,
     PatchWorkoutResult,
@@ -1395,3 +1396,136 @@ class TestMockRepositoryContract:
 
         workout = mock_repo.get_workout_by_id("w-123", "user-123")
         assert workout["embedding_content_hash"] == original_hash
+
+
+# =============================================================================
+# Copy-on-Write and Write Coalescing Tests
+# =============================================================================
+
+
+def _large_workout(blocks=20):
+    return {
+        "title": "Program",
+        "blocks": [
+            {"label": f"Day {i}", "exercises": [{"name": f"Lift {i}", "sets": 3, "reps": 5}]}
+            for i in range(blocks)
+        ],
+    }
+
+
+class TestCopyOnWrite:
+    """Patches copy only the path they touch."""
+
+    @pytest.mark.unit
+    def test_untouched_blocks_are_shared_and_input_unchanged(self):
+        """Only the edited block's spine is copied; the original is left intact."""
+        use_case = PatchWorkoutUseCase(workout_repo=MockWorkoutRepository())
+        workout_data = _large_workout()
+        original = copy.deepcopy(workout_data)
+        op = PatchOperation(op="replace", path="/blocks/3/exercises/0/sets", value=5)
+
+        new_data, *_ = use_case._apply_operation(op, workout_data, "Program", None, [])
+
+        assert workout_data == original
+        assert new_data["blocks"][3]["exercises"][0]["sets"] == 5
+        assert new_data["blocks"] is not workout_data["blocks"]
+        assert new_data["blocks"][3] is not workout_data["blocks"][3]
+        assert all(
+            new_data["blocks"][i] is workout_data["blocks"][i] for i in range(20) if i != 3
+        )
+
+    @pytest.mark.unit
+    def test_only_touched_blocks_are_revalidated(self):
+        """Validation converts the edited block, not the whole program."""
+        repo = MockWorkoutRepository()
+        setup_mock_workout(repo, "w-1", "user-1", _large_workout())
+        use_case = PatchWorkoutUseCase(workout_repo=repo)
+
+        with patch(
+            "application.use_cases.patch_workout.blocks_to_workout",
+            wraps=blocks_to_workout,
+        ) as convert:
+            result = use_case.execute(
+                "w-1", "user-1",
+                [PatchOperation(op="replace", path="/blocks/7/exercises/0/reps", value=8)],
+            )
+
+        assert result.success is True
+        validated = convert.call_args[0][0]["blocks"]
+        assert [b["label"] for b in validated] == ["Day 7"]
+        assert len(result.workout["workout_data"]["blocks"]) == 20
+
+    @pytest.mark.unit
+    def test_failed_request_leaves_stored_workout_untouched(self):
+        """A rejected patch never modifies the fetched row."""
+        repo = MockWorkoutRepository()
+        setup_mock_workout(repo, "w-1", "user-1", _large_workout(1))
+        before = copy.deepcopy(repo.get_workout_by_id("w-1", "user-1"))
+
+        result = PatchWorkoutUseCase(workout_repo=repo).execute(
+            "w-1", "user-1", [PatchOperation(op="remove", path="/exercises/0")],
+        )
+
+        assert result.success is False
+        assert repo.get_workout_by_id("w-1", "user-1") == before
+
+
+class TestWriteCoalescing:
+    """Concurrent patches to one workout share a write."""
+
+    @pytest.mark.unit
+    def test_patches_queued_behind_a_write_are_written_once(self):
+        import threading
+        import time
+        from application.use_cases import patch_workout
+
+        class SlowRepository(MockWorkoutRepository):
+            def __init__(self):
+                super().__init__()
+                self.writing = threading.Event()
+                self.release = threading.Event()
+                self.writes = []
+
+            def update_workout_data(self, workout_id, profile_id, workout_data, **kwargs):
+                if not self.writes:
+                    self.writing.set()
+                    self.release.wait(timeout=5)
+                self.writes.append(copy.deepcopy(workout_data))
+                return super().update_workout_data(workout_id, profile_id, workout_data, **kwargs)
+
+        repo = SlowRepository()
+        setup_mock_workout(repo, "w-1", "user-1", _large_workout(2))
+        results = {}
+
+        def patch_title(name, value, path="/title"):
+            use_case = PatchWorkoutUseCase(workout_repo=repo)
+            results[name] = use_case.execute(
+                "w-1", "user-1", [PatchOperation(op="replace", path=path, value=value)]
+            )
+
+        first = threading.Thread(target=patch_title, args=("first", "A"))
+        first.start()
+        assert repo.writing.wait(timeout=5)
+
+        # Queue two more edits (in order) while the first write is in flight
+        followers = [
+            threading.Thread(target=patch_title, args=("second", "B")),
+            threading.Thread(target=patch_title, args=("third", 6, "/blocks/1/exercises/0/sets")),
+        ]
+        deadline = time.monotonic() + 5
+        for queued, thread in enumerate(followers, start=1):
+            thread.start()
+            while len(patch_workout._write_coalescer._lanes.get(("user-1", "w-1"), [])) < queued:
+                assert time.monotonic() < deadline
+                time.sleep(0.001)
+
+        repo.release.set()
+        for thread in [first, *followers]:
+            thread.join(timeout=5)
+
+        assert all(r.success for r in results.values())
+        assert len(repo.writes) == 2
+        assert repo.writes[1]["title"] == "B"
+        assert repo.writes[1]["blocks"][1]["exercises"][0]["sets"] == 6
+        assert len(repo._audit_logs) == 3
+        assert patch_workout._write_coalescer._lanes == {}
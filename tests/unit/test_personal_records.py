@@ -0,0 +1,203 @@
+"""
+Unit tests for the single-pass personal-records engine.
+
+Tests for:
+- Vectorized 1RM matches the scalar formulas
+- Per-exercise records and newest-wins tie-breaking
+- Incremental merging and the per-user cache
+- ProgressionService serving records from the engine
+"""
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from backend.core.personal_records import (
+    PersonalRecordsCache,
+    compute_records,
+    estimate_1rm_array,
+    merge_records,
+)
+from backend.core.progression_service import ProgressionService, calculate_1rm
+from tests.fakes.exercises_repository import FakeExercisesRepository
+from tests.fakes.progression_repository import FakeProgressionRepository
+
+
+def _row(exercise_id, completion_id, workout_date, weight, reps):
+    return {
+        "exercise_id": exercise_id,
+        "exercise_name": exercise_id.title(),
+        "completion_id": completion_id,
+        "workout_date": workout_date,
+        "weight": weight,
+        "reps_completed": reps,
+    }
+
+
+class TestEstimate1RMArray:
+    """Vectorized estimates agree with calculate_1rm."""
+
+    @pytest.mark.parametrize("formula", ["brzycki", "epley"])
+    def test_matches_scalar_formula(self, formula):
+        weights = [100, 135.5, 225, 60, 80, 95]
+        reps = [0, 1, 5, 12, 37, 40]
+
+        estimates = estimate_1rm_array(weights, reps, formula)
+
+        assert estimates.tolist() == [calculate_1rm(w, r, formula) for w, r in zip(weights, reps)]
+
+
+class TestComputeRecords:
+    """Tests for building the PR table in one pass."""
+
+    def test_records_per_exercise(self):
+        table = compute_records([
+            _row("bench", "c2", "2024-01-15", 185, 8),
+            _row("bench", "c2", "2024-01-15", 200, 3),
+            _row("squat", "c2", "2024-01-15", 225, 5),
+            _row("bench", "c1", "2024-01-08", 135, 15),
+            _row("bench", "c1", "2024-01-08", None, 20),
+        ])
+
+        bench = table["bench"]
+        assert bench.session_count == 2
+        assert bench.max_weight.value == 200
+        assert bench.max_reps.value == 15
+        assert bench.max_reps.weight == 135
+        assert bench.best_1rm["brzycki"].value == calculate_1rm(185, 8)
+        assert bench.best_1rm["epley"].value == calculate_1rm(185, 8, "epley")
+        assert table["squat"].max_weight.completion_id == "c2"
+
+    def test_newest_set_wins_ties(self):
+        table = compute_records([
+            _row("bench", "c2", "2024-01-15", 185, 5),
+            _row("bench", "c1", "2024-01-08", 185, 5),
+        ])
+
+        assert table["bench"].max_weight.completion_id == "c2"
+        assert table["bench"].best_1rm["brzycki"].completion_id == "c2"
+
+    def test_sets_without_weight_or_reps_hold_no_records(self):
+        table = compute_records([
+            _row("plank", "c1", "2024-01-08", None, 1),
+            _row("plank", "c1", "2024-01-08", 20, 0),
+        ])
+
+        assert table["plank"].session_count == 1
+        assert table["plank"].max_weight is None
+        assert table["plank"].best_1rm == {}
+
+    def test_merge_adds_newer_completion(self):
+        table = compute_records([_row("bench", "c1", "2024-01-08", 185, 5)])
+
+        merged = merge_records(table, [
+            _row("bench", "c2", "2024-01-15", 185, 5),
+            _row("squat", "c2", "2024-01-15", 225, 5),
+        ])
+
+        assert merged["bench"].session_count == 2
+        assert merged["bench"].max_weight.completion_id == "c2"
+        assert merged["squat"].max_weight.value == 225
+        # Copy-on-write: the original table is untouched
+        assert table["bench"].session_count == 1
+        assert "squat" not in table
+
+
+class TestPersonalRecordsCache:
+    """Tests for the bounded per-user cache."""
+
+    def test_evicts_least_recently_used(self):
+        cache = PersonalRecordsCache(max_users=2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {}
+
+    def test_expired_entries_are_missing(self):
+        cache = PersonalRecordsCache(ttl_seconds=-1)
+        cache.put("a", {})
+
+        assert cache.get("a") is None
+
+    def test_completion_sets_merge_only_into_cached_tables(self):
+        cache = PersonalRecordsCache()
+        cache.put("a", {})
+
+        cache.record_completion_sets("a", [_row("bench", "c1", "2024-01-08", 185, 5)])
+        cache.record_completion_sets("b", [_row("bench", "c1", "2024-01-08", 185, 5)])
+
+        assert cache.get("a")["bench"].max_weight.value == 185
+        assert cache.get("b") is None
+
+    def test_tables_handed_out_are_not_modified(self):
+        cache = PersonalRecordsCache()
+        cache.put("a", compute_records([_row("bench", "c1", "2024-01-08", 185, 5)]))
+        reader_table = cache.get("a")
+
+        cache.record_completion_sets("a", [_row("bench", "c2", "2024-01-15", 205, 5)])
+
+        assert reader_table["bench"].max_weight.value == 185
+        assert cache.get("a")["bench"].max_weight.value == 205
+
+    def test_invalidate_drops_the_table(self):
+        cache = PersonalRecordsCache()
+        cache.put("a", {})
+
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+
+
+class TestProgressionServiceRecords:
+    """get_personal_records is served from one pass over all sets."""
+
+    @pytest.fixture
+    def progression_repo(self):
+        repo = FakeProgressionRepository()
+        repo.seed_sessions("test_user", [
+            {
+                "completion_id": "comp_1",
+                "workout_date": "2024-01-08",
+                "exercise_id": "barbell-bench-press",
+                "exercise_name": "Barbell Bench Press",
+                "sets": [
+                    {"set_number": 1, "weight": 175, "reps_completed": 10},
+                    {"set_number": 2, "weight": 185, "reps_completed": 6},
+                ],
+            },
+            {
+                "completion_id": "comp_2",
+                "workout_date": "2024-01-15",
+                "exercise_id": "barbell-bench-press",
+                "exercise_name": "Barbell Bench Press",
+                "sets": [{"set_number": 1, "weight": 185, "reps_completed": 8}],
+            },
+        ])
+        return repo
+
+    def test_matches_per_set_calculation(self, progression_repo):
+        service = ProgressionService(progression_repo, FakeExercisesRepository())
+
+        records = {
+            r["record_type"]: r
+            for r in service.get_personal_records("test_user", exercise_id="barbell-bench-press").records
+        }
+
+        assert records["1rm"]["value"] == calculate_1rm(175, 10)
+        assert records["1rm"]["details"] == {"weight": 175, "reps": 10}
+        assert records["max_weight"]["completion_id"] == "comp_2"
+        assert records["max_reps"]["value"] == 10
+        assert records["max_reps"]["details"] == {"weight": 175}
+
+    def test_uses_cached_table(self, progression_repo):
+        cache = PersonalRecordsCache()
+        service = ProgressionService(progression_repo, FakeExercisesRepository(), records_cache=cache)
+
+        first = service.get_personal_records("test_user")
+        progression_repo.reset()
+        second = service.get_personal_records("test_user")
+
+        assert first.records and second.records == first.records
@@ -397,6 +397,50 @@ class TestProgressionServiceVolume:
         assert result.granularity == "weekly"
 
 
+@pytest.mark.unit
+class TestProgressionServiceOneRepMaxTrend:
+    """Tests for get_1rm_trend."""
+
+    def test_returns_best_estimate_per_week(self, progression_service):
+        """Each week keeps its best estimated 1RM, oldest first."""
+        result = progression_service.get_1rm_trend(
+            "test_user",
+            "barbell-bench-press",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+        )
+
+        assert result.granularity == "weekly"
+        assert result.one_rm_formula == "brzycki"
+        assert result.data == [
+            {"period": "2024-01-08", "estimated_1rm": calculate_1rm(175, 8)},
+            {"period": "2024-01-15", "estimated_1rm": calculate_1rm(185, 8)},
+        ]
+
+    def test_respects_date_range(self, progression_service):
+        """Sessions outside the range are left out."""
+        result = progression_service.get_1rm_trend(
+            "test_user",
+            "barbell-bench-press",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 10),
+        )
+
+        assert [d["period"] for d in result.data] == ["2024-01-08"]
+        assert result.period == {"start_date": "2024-01-01", "end_date": "2024-01-10"}
+
+    def test_empty_for_exercise_without_1rm(self, progression_service):
+        """Exercises that don't support 1RM have no trend."""
+        result = progression_service.get_1rm_trend("test_user", "lateral-raise")
+
+        assert result.supports_1rm is False
+        assert result.data == []
+
+    def test_returns_none_for_unknown_exercise(self, progression_service):
+        """Returns None for an exercise that doesn't exist."""
+        assert progression_service.get_1rm_trend("test_user", "unknown-exercise") is None
+
+
 @pytest.mark.unit
 class TestExerciseNooneRM:
     """Tests for exercises that don't support 1RM."""
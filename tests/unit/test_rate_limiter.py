@@ -0,0 +1,156 @@
+"""
+Unit tests for the per-user AI rate limiter.
+
+Tests cover:
+- Burst allowance, denial and Retry-After values
+- Refill at the sustained rate
+- Isolation between users and features
+- Fail-open on backend errors and the disabled switch
+- The 429 raised by the API dependency
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from api.deps import get_current_user, get_rate_limiter, rate_limit
+from backend.services.rate_limiter import (
+    FEATURE_CHAT,
+    FEATURE_EMBEDDINGS,
+    InMemoryRateLimitBackend,
+    RateBudget,
+    RateLimitDecision,
+    RateLimiter,
+)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _limiter(clock, **budgets):
+    budgets = budgets or {FEATURE_CHAT: RateBudget(requests_per_minute=6, burst=3)}
+    return RateLimiter(budgets=budgets, clock=clock)
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    def test_burst_then_denied_with_retry_after(self):
+        clock = _Clock()
+        limiter = _limiter(clock)
+
+        decisions = [limiter.check("user-1", FEATURE_CHAT) for _ in range(3)]
+        denied = limiter.check("user-1", FEATURE_CHAT)
+
+        assert all(d.allowed for d in decisions)
+        assert [d.remaining for d in decisions] == [2, 1, 0]
+        assert denied.allowed is False
+        assert denied.retry_after == pytest.approx(10.0)
+        assert denied.retry_after_header == "10"
+
+    def test_budget_refills_at_sustained_rate(self):
+        clock = _Clock()
+        limiter = _limiter(clock)
+        for _ in range(3):
+            limiter.check("user-1", FEATURE_CHAT)
+
+        clock.now += 9.5
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is False
+        clock.now += 0.5
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is True
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is False
+
+    def test_users_and_features_are_isolated(self):
+        clock = _Clock()
+        limiter = _limiter(
+            clock,
+            **{
+                FEATURE_CHAT: RateBudget(requests_per_minute=6, burst=1),
+                FEATURE_EMBEDDINGS: RateBudget(requests_per_minute=6, burst=1),
+            },
+        )
+
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is True
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is False
+        assert limiter.check("user-2", FEATURE_CHAT).allowed is True
+        assert limiter.check("user-1", FEATURE_EMBEDDINGS).allowed is True
+
+    def test_unbudgeted_feature_and_disabled_limiter_allow(self):
+        clock = _Clock()
+        limiter = _limiter(clock)
+        disabled = RateLimiter(
+            budgets={FEATURE_CHAT: RateBudget(requests_per_minute=1)}, enabled=False
+        )
+
+        assert all(limiter.check("user-1", "unknown").allowed for _ in range(10))
+        assert all(disabled.check("user-1", FEATURE_CHAT).allowed for _ in range(10))
+
+    def test_cost_larger_than_burst_is_denied(self):
+        limiter = _limiter(_Clock())
+
+        assert limiter.check("user-1", FEATURE_CHAT, cost=4).allowed is False
+        assert limiter.check("user-1", FEATURE_CHAT, cost=3).allowed is True
+
+    def test_backend_failure_fails_open(self):
+        class _BrokenBackend(InMemoryRateLimitBackend):
+            def acquire(self, *args, **kwargs):
+                raise ConnectionError("redis down")
+
+        limiter = RateLimiter(
+            budgets={FEATURE_CHAT: RateBudget(requests_per_minute=1)},
+            backend=_BrokenBackend(),
+        )
+
+        assert all(limiter.check("user-1", FEATURE_CHAT).allowed for _ in range(5))
+
+    def test_reset_restores_budget(self):
+        limiter = _limiter(_Clock())
+        for _ in range(3):
+            limiter.check("user-1", FEATURE_CHAT)
+
+        limiter.reset("user-1", FEATURE_CHAT)
+
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is True
+
+    def test_backend_evicts_least_recently_used_keys(self):
+        backend = InMemoryRateLimitBackend(max_keys=2)
+        limiter = RateLimiter(
+            budgets={FEATURE_CHAT: RateBudget(requests_per_minute=1)},
+            backend=backend,
+            clock=_Clock(),
+        )
+        for user_id in ("user-1", "user-2", "user-3"):
+            limiter.check(user_id, FEATURE_CHAT)
+
+        assert limiter.check("user-1", FEATURE_CHAT).allowed is True
+        assert limiter.check("user-3", FEATURE_CHAT).allowed is False
+
+    def test_retry_after_header_rounds_up(self):
+        assert RateLimitDecision(allowed=False, retry_after=0.2).retry_after_header == "1"
+        assert RateLimitDecision(allowed=False, retry_after=4.01).retry_after_header == "5"
+
+
+@pytest.mark.unit
+class TestRateLimitDependency:
+    def test_exhausted_budget_returns_429_with_retry_after(self):
+        app = FastAPI()
+
+        @app.post("/classify", dependencies=[Depends(rate_limit(FEATURE_CHAT))])
+        def classify():
+            return {"ok": True}
+
+        limiter = _limiter(_Clock(), **{FEATURE_CHAT: RateBudget(requests_per_minute=2, burst=1)})
+        app.dependency_overrides[get_current_user] = lambda: "user-1"
+        app.dependency_overrides[get_rate_limiter] = lambda: limiter
+        client = TestClient(app)
+
+        assert client.post("/classify").status_code == 200
+        response = client.post("/classify")
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+        assert response.json()["detail"]["error"] == "rate_limit_exceeded"
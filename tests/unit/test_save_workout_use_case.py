@@ -452,6 +452,90 @@ class TestSaveWorkoutResult:
         assert len(result.validation_errors) == 2
 
 
+# =============================================================================
+# Batch Save Tests
+# =============================================================================
+
+
+class TestSaveWorkoutBatch:
+    """Tests for execute_many()."""
+
+    def _program(self, valid_workout: Workout, count: int):
+        return [
+            valid_workout.model_copy(update={"title": f"Week {i + 1}"})
+            for i in range(count)
+        ]
+
+    @pytest.mark.unit
+    def test_saves_all_workouts_in_chunks(
+        self,
+        use_case: SaveWorkoutUseCase,
+        workout_repo: FakeWorkoutRepository,
+        valid_workout: Workout,
+    ):
+        """Workouts are persisted with one save_many() call per chunk."""
+        workouts = self._program(valid_workout, 5)
+
+        with patch.object(workout_repo, "save_many", wraps=workout_repo.save_many) as save_many:
+            results = use_case.execute_many(workouts, "user-123", "garmin", batch_size=2)
+
+        assert save_many.call_count == 3
+        assert all(r.success for r in results)
+        assert [r.workout.title for r in results] == [w.title for w in workouts]
+        assert len({r.workout_id for r in results}) == 5
+        assert len(workout_repo.get_all()) == 5
+
+    @pytest.mark.unit
+    def test_one_invalid_workout_saves_nothing(
+        self,
+        use_case: SaveWorkoutUseCase,
+        workout_repo: FakeWorkoutRepository,
+        valid_workout: Workout,
+    ):
+        """All workouts are validated before any is written."""
+        workouts = self._program(valid_workout, 3)
+        workouts[1] = workouts[1].model_copy(update={"title": "  "})
+
+        results = use_case.execute_many(workouts, "user-123", "garmin")
+
+        assert [r.success for r in results] == [False, False, False]
+        assert "Workout title is required" in results[1].validation_errors
+        assert results[0].validation_errors == []
+        assert workout_repo.get_all() == []
+
+    @pytest.mark.unit
+    def test_resaving_updates_by_title_and_device(
+        self,
+        use_case: SaveWorkoutUseCase,
+        workout_repo: FakeWorkoutRepository,
+        valid_workout: Workout,
+    ):
+        """Saving the same program twice does not duplicate workouts."""
+        workouts = self._program(valid_workout, 2)
+
+        first = use_case.execute_many(workouts, "user-123", "garmin")
+        second = use_case.execute_many(workouts, "user-123", "garmin")
+
+        assert [r.workout_id for r in second] == [r.workout_id for r in first]
+        assert len(workout_repo.get_all()) == 2
+
+    @pytest.mark.unit
+    def test_failed_rows_are_reported(
+        self,
+        use_case: SaveWorkoutUseCase,
+        workout_repo: FakeWorkoutRepository,
+        valid_workout: Workout,
+    ):
+        """A workout the repository could not save gets a failed result."""
+        workouts = self._program(valid_workout, 2)
+
+        with patch.object(workout_repo, "save_many", return_value=[{"id": "w-1"}, None]):
+            results = use_case.execute_many(workouts, "user-123", "garmin")
+
+        assert [r.success for r in results] == [True, False]
+        assert results[0].workout_id == "w-1"
+
+
 # =============================================================================
 # Exception Tests
 # =============================================================================
@@ -479,3 +563,61 @@ class TestWorkoutValidationError:
 
         assert error.message == "Simple error"
         assert error.errors == []
+
+
+class TestSaveBatchEndpoint:
+    """Tests for POST /workouts/save-batch."""
+
+    def _client(self, workout_repo: FakeWorkoutRepository, export_queue):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from api.deps import get_current_user, get_export_queue, get_save_workout_use_case
+        from api.routers.workouts import router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_current_user] = lambda: "user-123"
+        app.dependency_overrides[get_save_workout_use_case] = lambda: SaveWorkoutUseCase(workout_repo=workout_repo)
+        app.dependency_overrides[get_export_queue] = lambda: export_queue
+        return TestClient(app)
+
+    def _item(self, title: str, device: str = "garmin"):
+        return {
+            "workout_data": {"title": title, "blocks": [{"exercises": [{"name": "Squat", "sets": 3}]}]},
+            "sources": ["ai"],
+            "device": device,
+        }
+
+    @pytest.mark.unit
+    def test_saves_program_in_one_batch(self, workout_repo: FakeWorkoutRepository):
+        from unittest.mock import MagicMock
+
+        export_queue = MagicMock()
+        client = self._client(workout_repo, export_queue)
+
+        with patch.object(workout_repo, "save", wraps=workout_repo.save) as save:
+            resp = client.post("/workouts/save-batch", json={
+                "workouts": [self._item(f"Week {i}") for i in range(3)],
+            })
+
+        body = resp.json()
+        assert resp.status_code == 200
+        assert body["success"] and body["saved"] == 3
+        assert len(workout_repo.get_all()) == 3
+        assert export_queue.enqueue.call_count == 3
+        # Fake save_many delegates to save(); the router never calls it per workout
+        assert save.call_count == 3
+
+    @pytest.mark.unit
+    def test_rejects_mixed_devices(self, workout_repo: FakeWorkoutRepository):
+        from unittest.mock import MagicMock
+
+        client = self._client(workout_repo, MagicMock())
+
+        resp = client.post("/workouts/save-batch", json={
+            "workouts": [self._item("Week 1"), self._item("Week 2", device="apple")],
+        })
+
+        assert resp.status_code == 422
+        assert workout_repo.get_all() == []
@@ -0,0 +1,185 @@
+"""
+Unit tests for timing spans.
+
+Tests for:
+- HDR-style bucket layout and percentile accuracy
+- span() as context manager and decorator (sync and async), errors
+- Disabled fast path
+- span_methods() class decorator and nested span paths
+- Prometheus rendering and the /metrics endpoint
+- Span path propagated into AI tracking headers
+"""
+
+import asyncio
+import random
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+from backend.core import spans as spans_module
+from backend.core.spans import (
+    LatencyHistogram,
+    SpanRecorder,
+    _bucket_bounds,
+    _bucket_index,
+    current_span_path,
+    record_span,
+    span,
+    span_methods,
+)
+from backend.settings import Settings, get_settings
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = SpanRecorder(enabled=True)
+    monkeypatch.setattr(spans_module, "_recorder", recorder)
+    return recorder
+
+
+class TestLatencyHistogram:
+    def test_buckets_cover_values_within_resolution(self):
+        previous_upper = 0
+        for index in range(600):
+            lower, upper = _bucket_bounds(index)
+            assert lower == previous_upper
+            previous_upper = upper
+        for value in [0, 1, 31, 32, 100, 999, 12345, 10**9]:
+            lower, upper = _bucket_bounds(_bucket_index(value))
+            assert lower <= value < upper
+            assert (upper - 1 - lower) <= max(1, value / 16)
+
+    def test_percentiles_match_exact_values(self):
+        rng = random.Random(3)
+        values = [int(rng.lognormvariate(7, 1.2)) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        for quantile in (0.5, 0.9, 0.99, 0.999):
+            exact = np.percentile(values, quantile * 100, method="inverted_cdf")
+            assert histogram.percentile(quantile) == pytest.approx(exact, rel=1 / 16)
+        assert histogram.percentile(1.0) == max(values)
+
+    def test_snapshot(self):
+        histogram = LatencyHistogram()
+        for value in (50, 150, 2_000_000):
+            histogram.record(value)
+        snap = histogram.snapshot()
+        assert snap["count"] == 3
+        assert snap["min_ms"] == 0.05
+        assert snap["max_ms"] == 2000.0
+        # le=0.0001s holds 50us, le=0.00025s adds 150us, 2s lands in le=2.5
+        assert snap["buckets"][:2] == [1, 2]
+        assert snap["buckets"][-1] == 3
+
+
+class TestSpan:
+    def test_context_manager_records(self, recorder):
+        with span("stage"):
+            assert current_span_path() == "stage"
+        assert current_span_path() is None
+        assert recorder.snapshot()["stage"]["count"] == 1
+
+    def test_error_is_counted_and_propagates(self, recorder):
+        with pytest.raises(ValueError):
+            with span("stage"):
+                raise ValueError("boom")
+        assert recorder.snapshot()["stage"]["errors"] == 1
+
+    def test_decorator_sync_and_async(self, recorder):
+        @span("sync")
+        def add(a, b):
+            return a + b
+
+        @span("async")
+        async def add_async(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        assert asyncio.run(add_async(1, 2)) == 3
+        assert add.__name__ == "add"
+        snap = recorder.snapshot()
+        assert snap["sync"]["count"] == snap["async"]["count"] == 1
+
+    def test_nested_path(self, recorder):
+        with span("outer"):
+            with span("inner"):
+                assert current_span_path() == "outer/inner"
+            assert current_span_path() == "outer"
+
+    def test_disabled_records_nothing(self, recorder):
+        recorder.configure(enabled=False)
+
+        @span("decorated")
+        def noop():
+            return 1
+
+        with span("stage"):
+            assert current_span_path() is None
+        noop()
+        record_span("manual", 0.1)
+        assert recorder.snapshot() == {}
+
+    def test_span_methods(self, recorder):
+        @span_methods("db.things")
+        class Repo:
+            def get(self):
+                return "row"
+
+            def _helper(self):
+                return None
+
+            @staticmethod
+            def build():
+                return "built"
+
+        repo = Repo()
+        assert repo.get() == "row"
+        repo._helper()
+        assert Repo.build() == "built"
+        assert list(recorder.snapshot()) == ["db.things.get"]
+
+
+class TestPrometheus:
+    def test_render(self, recorder):
+        record_span("match.exercise", 0.002)
+        record_span("match.exercise", 0.2, error=True)
+        text = recorder.render_prometheus()
+
+        assert "# TYPE mapper_span_duration_seconds histogram" in text
+        assert 'mapper_span_duration_seconds_bucket{span="match.exercise",le="0.0025"} 1' in text
+        assert 'mapper_span_duration_seconds_bucket{span="match.exercise",le="+Inf"} 2' in text
+        assert 'mapper_span_duration_seconds_count{span="match.exercise"} 2' in text
+        assert 'mapper_span_latency_seconds{span="match.exercise",quantile="0.5"}' in text
+        assert 'mapper_span_errors_total{span="match.exercise"} 1' in text
+
+    def test_metrics_endpoint(self, recorder):
+        from api.routers.health import router
+
+        app = FastAPI()
+        app.include_router(router)
+        settings = Settings(_env_file=None, environment="development")
+        app.dependency_overrides[get_settings] = lambda: settings
+        record_span("db.workouts.get", 0.01)
+
+        response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'span="db.workouts.get"' in response.text
+
+
+class TestTrackingHeaders:
+    def test_span_path_in_tracking_headers(self, recorder):
+        from backend.ai import AIRequestContext
+
+        context = AIRequestContext(user_id="user-1")
+        assert "Helicone-Property-Span" not in context.to_tracking_headers()
+        with span("chat.tool"):
+            with span("llm.embedding"):
+                headers = context.to_tracking_headers()
+        assert headers["Helicone-Property-Span"] == "chat.tool/llm.embedding"
@@ -0,0 +1,185 @@
+"""
+Unit tests for the sync-queue event hub and SSE stream.
+
+Tests cover:
+- Delivery to subscribed streams, including publishes from worker threads
+- Last-Event-ID replay and resync when events were lost
+- Heartbeats, device filtering and shutdown
+- Cross-node broker fan-out
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from backend.services.sync_events import (
+    RESYNC_EVENT,
+    SYNC_CONFIRMED,
+    SYNC_QUEUED,
+    SyncEventHub,
+    stream_sync_events,
+)
+
+
+async def _take(stream, count):
+    chunks = []
+    async for chunk in stream:
+        chunks.append(chunk)
+        if len(chunks) == count:
+            break
+    return chunks
+
+
+def _queued(workout_id, device_type="ios"):
+    return {"workout_id": workout_id, "device_type": device_type}
+
+
+@pytest.mark.unit
+class TestSyncEventHub:
+    async def test_subscriber_receives_published_events(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1")
+
+        hub.publish("user-1", SYNC_QUEUED, _queued("w-1"))
+        hub.publish("user-2", SYNC_QUEUED, _queued("w-2"))
+
+        event = await subscription.next_event(timeout=1)
+        assert event.type == SYNC_QUEUED
+        assert event.data["workout_id"] == "w-1"
+        with pytest.raises(asyncio.TimeoutError):
+            await subscription.next_event(timeout=0.05)
+
+    async def test_publish_from_worker_thread(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1")
+
+        thread = threading.Thread(
+            target=hub.publish, args=("user-1", SYNC_CONFIRMED, _queued("w-1"))
+        )
+        thread.start()
+        thread.join()
+
+        event = await subscription.next_event(timeout=1)
+        assert event.type == SYNC_CONFIRMED
+
+    async def test_resume_replays_missed_events(self):
+        hub = SyncEventHub()
+        first = hub.publish("user-1", SYNC_QUEUED, _queued("w-1"))
+        second = hub.publish("user-1", SYNC_QUEUED, _queued("w-2"))
+
+        subscription = hub.subscribe("user-1", last_event_id=first.id)
+
+        assert subscription.replay == [second]
+        assert subscription.needs_resync is False
+
+    async def test_resume_beyond_replay_window_requests_resync(self):
+        hub = SyncEventHub(replay_size=2)
+        first = hub.publish("user-1", SYNC_QUEUED, _queued("w-1"))
+        for workout_id in ("w-2", "w-3", "w-4"):
+            hub.publish("user-1", SYNC_QUEUED, _queued(workout_id))
+
+        subscription = hub.subscribe("user-1", last_event_id=first.id)
+
+        assert subscription.needs_resync is True
+        assert [e.data["workout_id"] for e in subscription.replay] == ["w-3", "w-4"]
+
+    async def test_resume_from_before_hub_started_requests_resync(self):
+        hub = SyncEventHub()
+
+        assert hub.subscribe("user-1", last_event_id=1).needs_resync is True
+
+    async def test_device_filter(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1", device_type="android")
+
+        hub.publish("user-1", SYNC_QUEUED, _queued("w-1", "ios"))
+        hub.publish("user-1", SYNC_QUEUED, _queued("w-2", "android"))
+
+        event = await subscription.next_event(timeout=1)
+        assert event.data["workout_id"] == "w-2"
+
+    async def test_slow_subscriber_is_told_to_resync(self):
+        hub = SyncEventHub(subscriber_queue_size=2)
+        subscription = hub.subscribe("user-1")
+        for workout_id in ("w-1", "w-2", "w-3"):
+            hub.publish("user-1", SYNC_QUEUED, _queued(workout_id))
+
+        chunks = await _take(stream_sync_events(subscription, heartbeat_seconds=1), 3)
+
+        assert chunks[1] == f"event: {RESYNC_EVENT}\ndata: {{}}\n\n"
+        assert '"workout_id": "w-3"' in chunks[2]
+
+    async def test_unsubscribe_and_close(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1")
+        assert hub.subscriber_count("user-1") == 1
+
+        hub.close()
+
+        assert hub.subscriber_count() == 0
+        assert await subscription.next_event(timeout=1) is None
+
+
+@pytest.mark.unit
+class TestSyncEventStream:
+    async def test_stream_renders_sse_with_ids(self):
+        hub = SyncEventHub()
+        event = hub.publish("user-1", SYNC_QUEUED, _queued("w-1"))
+        subscription = hub.subscribe("user-1", last_event_id=event.id - 1)
+
+        chunks = await _take(stream_sync_events(subscription, heartbeat_seconds=1), 2)
+
+        assert chunks[0] == "retry: 1000\n\n"
+        assert chunks[1].startswith(f"id: {event.id}\nevent: {SYNC_QUEUED}\n")
+
+    async def test_idle_stream_sends_heartbeat(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1")
+
+        chunks = await _take(stream_sync_events(subscription, heartbeat_seconds=0.01), 2)
+
+        assert chunks[1] == ": heartbeat\n\n"
+
+    async def test_stream_ends_when_hub_closes(self):
+        hub = SyncEventHub()
+        subscription = hub.subscribe("user-1")
+        hub.close()
+
+        chunks = [c async for c in stream_sync_events(subscription, heartbeat_seconds=1)]
+
+        assert chunks == ["retry: 1000\n\n"]
+
+
+class _LoopbackBroker:
+    """Broker connecting several hubs in one process."""
+
+    def __init__(self):
+        self.receivers = []
+
+    def publish(self, event):
+        for deliver in self.receivers:
+            deliver(event)
+
+    def start(self, deliver):
+        self.receivers.append(deliver)
+
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestSyncEventBroker:
+    async def test_events_fan_out_to_other_nodes_once(self):
+        broker = _LoopbackBroker()
+        node_a = SyncEventHub(broker=broker)
+        node_b = SyncEventHub(broker=broker)
+        on_a = node_a.subscribe("user-1")
+        on_b = node_b.subscribe("user-1")
+
+        node_a.publish("user-1", SYNC_QUEUED, _queued("w-1"))
+
+        assert (await on_b.next_event(timeout=1)).data["workout_id"] == "w-1"
+        assert (await on_a.next_event(timeout=1)).data["workout_id"] == "w-1"
+        with pytest.raises(asyncio.TimeoutError):
+            await on_a.next_event(timeout=0.05)
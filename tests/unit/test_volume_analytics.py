@@ -0,0 +1,138 @@
+"""
+Unit tests for the columnar volume analytics engine.
+
+Tests for:
+- Flattening execution logs into set columns
+- Daily, weekly and monthly period bucketing
+- Volume per muscle group, filters and unknown exercises
+- Estimated 1RM trend per period
+"""
+
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.unit
+
+from backend.core.personal_records import estimate_1rm_array
+from backend.core.volume_analytics import (
+    best_1rm_by_period,
+    flatten_execution_logs,
+    period_index,
+    volume_by_muscle_group,
+)
+
+
+def _set(weight, reps, status="completed"):
+    return {"status": status, "weight": weight, "reps_completed": reps}
+
+
+def _completion(started_at, *intervals):
+    return {
+        "started_at": started_at,
+        "execution_log": {
+            "intervals": [
+                {"canonical_exercise_id": exercise_id, "sets": sets}
+                for exercise_id, sets in intervals
+            ]
+        },
+    }
+
+
+COMPLETIONS = [
+    _completion(
+        "2025-01-06T10:00:00Z",  # Monday
+        ("squat", [_set({"components": [{"value": 100, "unit": "kg"}]}, 5), _set(100, 5, "skipped")]),
+        ("bench", [_set(60, 8), _set(60, 6)]),
+    ),
+    _completion(
+        "2025-01-08T10:00:00Z",  # Wednesday, same week
+        ("squat", [_set(110, 3)]),
+        (None, [_set(20, 10)]),
+    ),
+    _completion(
+        "2025-02-03T10:00:00Z",
+        ("mystery", [_set(None, 12)]),
+    ),
+    {"started_at": None, "execution_log": {"intervals": []}},
+]
+
+MUSCLES = {"squat": ["quads", "glutes"], "bench": ["chest"]}
+
+
+class TestFlattenExecutionLogs:
+    def test_keeps_completed_sets_with_exercise(self):
+        columns = flatten_execution_logs(COMPLETIONS)
+        assert len(columns) == 5
+        assert columns.exercise_ids == ["squat", "bench", "mystery"]
+        assert columns.exercise.tolist() == [0, 1, 1, 0, 2]
+        assert columns.weight.tolist() == [100.0, 60.0, 60.0, 110.0, 0.0]
+        assert columns.reps.tolist() == [5, 8, 6, 3, 12]
+        assert str(columns.day[0]) == "2025-01-06"
+
+    def test_empty(self):
+        columns = flatten_execution_logs([])
+        assert len(columns) == 0
+        assert volume_by_muscle_group(columns, MUSCLES) == {"data": [], "summary": {}}
+
+
+class TestPeriodIndex:
+    DAYS = np.array(["2025-01-05", "2025-01-06", "2025-01-12", "2025-02-01"], dtype="datetime64[D]")
+
+    def test_weekly_starts_monday(self):
+        codes, labels = period_index(self.DAYS, "weekly")
+        assert labels == ["2024-12-30", "2025-01-06", "2025-01-27"]
+        assert codes.tolist() == [0, 1, 1, 2]
+
+    def test_monthly(self):
+        codes, labels = period_index(self.DAYS, "monthly")
+        assert labels == ["2025-01", "2025-02"]
+        assert codes.tolist() == [0, 0, 0, 1]
+
+    def test_daily(self):
+        _, labels = period_index(self.DAYS, "daily")
+        assert labels == ["2025-01-05", "2025-01-06", "2025-01-12", "2025-02-01"]
+
+
+class TestVolumeByMuscleGroup:
+    def test_weekly_totals(self):
+        result = volume_by_muscle_group(
+            flatten_execution_logs(COMPLETIONS), MUSCLES, granularity="weekly"
+        )
+        assert result["data"] == [
+            {"period": "2025-01-06", "muscle_group": "quads", "total_volume": 830.0, "total_sets": 2, "total_reps": 8},
+            {"period": "2025-01-06", "muscle_group": "glutes", "total_volume": 830.0, "total_sets": 2, "total_reps": 8},
+            {"period": "2025-01-06", "muscle_group": "chest", "total_volume": 840.0, "total_sets": 2, "total_reps": 14},
+            {"period": "2025-02-03", "muscle_group": "other", "total_volume": 0.0, "total_sets": 1, "total_reps": 12},
+        ]
+        assert result["summary"]["chest"] == {"total_volume": 840.0, "total_sets": 2, "total_reps": 14}
+        assert list(result["summary"]) == ["quads", "glutes", "chest", "other"]
+
+    def test_daily_periods_sorted(self):
+        result = volume_by_muscle_group(flatten_execution_logs(COMPLETIONS), MUSCLES)
+        quads = [row for row in result["data"] if row["muscle_group"] == "quads"]
+        assert [row["period"] for row in quads] == ["2025-01-06", "2025-01-08"]
+        assert [row["total_volume"] for row in quads] == [500.0, 330.0]
+
+    def test_muscle_filter_counts_all_muscles_of_matching_exercises(self):
+        result = volume_by_muscle_group(
+            flatten_execution_logs(COMPLETIONS), MUSCLES, granularity="monthly", muscle_groups=["glutes"]
+        )
+        assert list(result["summary"]) == ["quads", "glutes"]
+        assert {row["period"] for row in result["data"]} == {"2025-01"}
+
+    def test_exercise_without_muscles_is_dropped(self):
+        result = volume_by_muscle_group(flatten_execution_logs(COMPLETIONS), {**MUSCLES, "mystery": None})
+        assert "other" not in result["summary"]
+
+
+class TestBest1rmByPeriod:
+    def test_best_estimate_per_week(self):
+        trend = best_1rm_by_period(flatten_execution_logs(COMPLETIONS))
+        expected_squat = estimate_1rm_array(np.array([100.0, 110.0]), np.array([5.0, 3.0]), "brzycki").max()
+        assert trend["squat"] == [("2025-01-06", pytest.approx(expected_squat))]
+        assert trend["bench"][0][0] == "2025-01-06"
+        # Sets without weight don't produce an estimate
+        assert "mystery" not in trend
+
+    def test_no_weighted_sets(self):
+        assert best_1rm_by_period(flatten_execution_logs(COMPLETIONS[2:])) == {}